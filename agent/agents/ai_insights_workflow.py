@@ -1,5 +1,6 @@
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
+from agent.utils.tracing import trace_graph
 from langchain_core.messages import HumanMessage, SystemMessage
 from typing import Dict, List, Any, TypedDict
 import json
@@ -15,131 +16,74 @@ class AIInsightsState(TypedDict):
     advanced_insights: Dict[str, Any]
     recommendations: List[Dict[str, Any]]
     interview_report: Dict[str, Any]
+    final_report: Dict[str, Any]
     error: str
+    start_time: float
 
 # LangChain 모델 초기화
-llm = ChatOpenAI(
+llm = get_llm(
     model="gpt-4o",
     temperature=0.1,
-    max_tokens=4000
+    max_tokens=4000,
+    tool="ai_insights_workflow"
 )
 
-def analyze_interview_patterns(state: AIInsightsState) -> AIInsightsState:
-    """면접 패턴 분석"""
-    try:
-        interview_data = state["interview_data"]
-        
-        # 면접 데이터 분석
-        ai_scores = interview_data.get("ai_scores", [])
-        practical_scores = interview_data.get("practical_scores", [])
-        executive_scores = interview_data.get("executive_scores", [])
-        
-        # 패턴 분석 프롬프트
-        pattern_prompt = f"""
-        다음 면접 데이터를 분석하여 패턴을 찾아주세요:
-        
-        AI 면접 점수: {ai_scores}
-        실무진 면접 점수: {practical_scores}
-        임원진 면접 점수: {executive_scores}
-        
-        다음 항목들을 분석해주세요:
-        1. 점수 분포 패턴
-        2. 단계별 점수 변화 추이
-        3. 이상치나 특이 패턴
-        4. 면접 단계별 난이도 분석
-        
-        JSON 형태로 응답해주세요.
-        """
-        
-        response = llm.invoke([HumanMessage(content=pattern_prompt)])
-        pattern_analysis = json.loads(response.content)
-        
-        state["basic_insights"] = {
-            "pattern_analysis": pattern_analysis,
-            "score_distribution": {
-                "ai": {"mean": sum(ai_scores)/len(ai_scores) if ai_scores else 0, "count": len(ai_scores)},
-                "practical": {"mean": sum(practical_scores)/len(practical_scores) if practical_scores else 0, "count": len(practical_scores)},
-                "executive": {"mean": sum(executive_scores)/len(executive_scores) if executive_scores else 0, "count": len(executive_scores)}
-            }
+# 세 단계(패턴 분석 → 고급 인사이트 → 추천사항)를 한 번의 구조화 응답으로 생성
+# (뒤 단계가 앞 단계 결과에 의존하므로 병렬화 대신 하나의 JSON 응답 안에서 순서대로 작성하게 한다)
+insights_llm = llm.bind(response_format={"type": "json_object"})
+
+def _score_distribution(score_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """SQL 집계 통계에서 단계별 평균/개수만 추림 (기존 score_distribution 형태 유지)"""
+    return {
+        stage: {
+            "mean": (score_stats.get(stage) or {}).get("mean", 0),
+            "count": (score_stats.get(stage) or {}).get("count", 0)
         }
-        state["analysis_stage"] = "pattern_analyzed"
-        
-    except Exception as e:
-        state["error"] = f"패턴 분석 중 오류: {str(e)}"
-    
-    return state
+        for stage in ("ai", "practical", "executive")
+    }
 
-def generate_advanced_insights(state: AIInsightsState) -> AIInsightsState:
-    """고급 인사이트 생성"""
+def analyze_interview_insights(state: AIInsightsState) -> AIInsightsState:
+    """면접 패턴 분석 + 고급 인사이트 + 추천사항 (LLM 1회)"""
     try:
-        basic_insights = state["basic_insights"]
         interview_data = state["interview_data"]
+        statistics = {
+            "total_applicants": interview_data.get("total_applicants", 0),
+            "applicant_score_mean": interview_data.get("applicant_score_mean"),
+            "score_stats": interview_data.get("score_stats", {}),
+            "status_counts": interview_data.get("status_counts", {}),
+            "evaluation_counts": interview_data.get("evaluation_counts", {})
+        }
         
-        # 고급 분석 프롬프트
-        advanced_prompt = f"""
-        다음 면접 데이터와 기본 분석 결과를 바탕으로 고급 인사이트를 생성해주세요:
-        
-        기본 분석: {json.dumps(basic_insights, ensure_ascii=False)}
-        면접 데이터: {json.dumps(interview_data, ensure_ascii=False)}
-        
-        다음 항목들을 분석해주세요:
-        1. 면접 프로세스 최적화 방안
-        2. 평가 기준 개선 제안
-        3. 지원자 품질 향상 전략
-        4. 리스크 요소 식별
-        5. 성과 예측 모델 제안
-        
-        JSON 형태로 응답해주세요.
-        """
-        
-        response = llm.invoke([HumanMessage(content=advanced_prompt)])
-        advanced_insights = json.loads(response.content)
-        
-        state["advanced_insights"] = advanced_insights
-        state["analysis_stage"] = "advanced_analyzed"
-        
-    except Exception as e:
-        state["error"] = f"고급 인사이트 생성 중 오류: {str(e)}"
-    
-    return state
-
-def generate_recommendations(state: AIInsightsState) -> AIInsightsState:
-    """AI 추천사항 생성"""
-    try:
-        basic_insights = state["basic_insights"]
-        advanced_insights = state["advanced_insights"]
+        insights_prompt = f"""
+        다음은 한 채용공고의 면접 단계별 집계 통계입니다 (점수 히스토그램은 10점 구간별 인원):
         
-        # 추천사항 생성 프롬프트
-        recommendation_prompt = f"""
-        다음 분석 결과를 바탕으로 구체적이고 실행 가능한 추천사항을 생성해주세요:
+        {json.dumps(statistics, ensure_ascii=False, sort_keys=True)}
         
-        기본 분석: {json.dumps(basic_insights, ensure_ascii=False)}
-        고급 분석: {json.dumps(advanced_insights, ensure_ascii=False)}
+        아래 세 가지를 순서대로 분석하고, 뒤 항목은 앞 항목의 결과를 근거로 작성해주세요.
         
-        다음 형식으로 추천사항을 생성해주세요:
-        [
-          {{
-            "type": "recommendation_type",
-            "priority": "high/medium/low",
-            "title": "추천사항 제목",
-            "description": "상세 설명",
-            "action": "구체적 실행 방안",
-            "expected_impact": "예상 효과",
-            "implementation_difficulty": "easy/medium/hard"
-          }}
-        ]
+        1. pattern_analysis: 점수 분포 패턴, 단계별 점수 변화 추이, 이상치나 특이 패턴, 면접 단계별 난이도 분석
+        2. advanced_insights: 면접 프로세스 최적화 방안, 평가 기준 개선 제안, 지원자 품질 향상 전략,
+           리스크 요소 식별(risk_assessment), 최적화 제안(optimization_suggestions), 성과 예측 모델 제안
+        3. recommendations: 구체적이고 실행 가능한 추천사항 3~7개, 각 항목은
+           {{"type", "priority"(high/medium/low), "title", "description", "action", "expected_impact", "implementation_difficulty"(easy/medium/hard)}}
         
-        최소 3개, 최대 7개의 추천사항을 생성해주세요.
+        다음 키를 가진 JSON 객체 하나로만 응답해주세요:
+        {{"pattern_analysis": {{...}}, "advanced_insights": {{...}}, "recommendations": [...]}}
         """
         
-        response = llm.invoke([HumanMessage(content=recommendation_prompt)])
-        recommendations = json.loads(response.content)
+        response = insights_llm.invoke([HumanMessage(content=insights_prompt)])
+        result = json.loads(response.content)
         
-        state["recommendations"] = recommendations
+        state["basic_insights"] = {
+            "pattern_analysis": result.get("pattern_analysis", {}),
+            "score_distribution": _score_distribution(statistics["score_stats"])
+        }
+        state["advanced_insights"] = result.get("advanced_insights", {})
+        state["recommendations"] = result.get("recommendations", [])
         state["analysis_stage"] = "recommendations_generated"
         
     except Exception as e:
-        state["error"] = f"추천사항 생성 중 오류: {str(e)}"
+        state["error"] = f"AI 인사이트 생성 중 오류: {str(e)}"
     
     return state
 
@@ -151,7 +95,7 @@ def create_interview_report(state: AIInsightsState) -> AIInsightsState:
             "job_post_id": state["job_post_id"],
             "analysis_date": datetime.now().isoformat(),
             "analysis_summary": {
-                "total_applicants": len(state["interview_data"].get("all_applicants", [])),
+                "total_applicants": state["interview_data"].get("total_applicants", 0),
                 "analysis_quality": "high" if not state.get("error") else "medium",
                 "key_findings": len(state["recommendations"])
             },
@@ -161,8 +105,8 @@ def create_interview_report(state: AIInsightsState) -> AIInsightsState:
             },
             "recommendations": state["recommendations"],
             "execution_metadata": {
-                "total_stages": 4,
-                "completed_stages": 4,
+                "total_stages": 2,
+                "completed_stages": 2,
                 "execution_time": time.time() - state.get("start_time", time.time())
             }
         }
@@ -191,39 +135,35 @@ def create_ai_insights_workflow():
     workflow = StateGraph(AIInsightsState)
     
     # 노드 추가
-    workflow.add_node("analyze_patterns", analyze_interview_patterns)
-    workflow.add_node("generate_advanced", generate_advanced_insights)
-    workflow.add_node("generate_recommendations", generate_recommendations)
+    workflow.add_node("analyze_insights", analyze_interview_insights)
     workflow.add_node("create_report", create_interview_report)
     workflow.add_node("handle_error", error_handler)
     
-    # 엣지 추가
-    workflow.add_edge("analyze_patterns", "generate_advanced")
-    workflow.add_edge("generate_advanced", "generate_recommendations")
-    workflow.add_edge("generate_recommendations", "create_report")
-    workflow.add_edge("create_report", END)
+    workflow.set_entry_point("analyze_insights")
     
     # 에러 처리
     workflow.add_conditional_edges(
-        "analyze_patterns",
-        lambda state: "handle_error" if state.get("error") else "generate_advanced"
-    )
-    workflow.add_conditional_edges(
-        "generate_advanced",
-        lambda state: "handle_error" if state.get("error") else "generate_recommendations"
-    )
-    workflow.add_conditional_edges(
-        "generate_recommendations",
+        "analyze_insights",
         lambda state: "handle_error" if state.get("error") else "create_report"
     )
+    workflow.add_edge("create_report", END)
     workflow.add_edge("handle_error", END)
     
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "ai_insights_workflow")
+
+_ai_insights_workflow = None
+
+def get_ai_insights_workflow():
+    """컴파일된 워크플로우 재사용"""
+    global _ai_insights_workflow
+    if _ai_insights_workflow is None:
+        _ai_insights_workflow = create_ai_insights_workflow()
+    return _ai_insights_workflow
 
 # 워크플로우 실행 함수
 def run_ai_insights_analysis(job_post_id: int, interview_data: Dict[str, Any]) -> Dict[str, Any]:
-    """AI 인사이트 분석 실행"""
-    workflow = create_ai_insights_workflow()
+    """AI 인사이트 분석 실행 (성공 시 면접 보고서, 실패 시 error 키를 가진 보고서 반환)"""
+    workflow = get_ai_insights_workflow()
     
     initial_state = AIInsightsState(
         job_post_id=job_post_id,
@@ -232,10 +172,13 @@ def run_ai_insights_analysis(job_post_id: int, interview_data: Dict[str, Any]) -
         basic_insights={},
         advanced_insights={},
         recommendations=[],
+        interview_report={},
         final_report={},
         error="",
         start_time=time.time()
     )
     
     result = workflow.invoke(initial_state)
-    return result["final_report"] 
\ No newline at end of file
+    if result.get("error"):
+        return result.get("final_report") or {"error": result["error"], "job_post_id": job_post_id}
+    return result["interview_report"]
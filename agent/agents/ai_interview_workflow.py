@@ -6,16 +6,18 @@ AI 면접 전용 LangGraph 워크플로우
 
 from typing import Dict, Any, List
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
+from agent.utils.tracing import trace_graph
 import json
 import logging
 from datetime import datetime
 
 # LLM 초기화
-llm = ChatOpenAI(
+llm = get_llm(
     model="gpt-4o",
     temperature=0.1,
-    api_key="sk-proj-..."
+    api_key="sk-proj-...",
+    tool="ai_interview_workflow"
 )
 
 def initialize_ai_interview_session(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -395,7 +397,7 @@ def build_ai_interview_workflow() -> StateGraph:
     workflow.add_edge("process_game_test", "calculate_final_score")
     workflow.add_edge("calculate_final_score", END)
     
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "ai_interview_workflow")
 
 # 워크플로우 인스턴스 생성
 ai_interview_workflow = build_ai_interview_workflow()
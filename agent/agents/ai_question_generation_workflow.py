@@ -8,7 +8,7 @@ import asyncio
 import json
 import logging
 from typing import Dict, List, Any, Optional
-from langchain.chat_models import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from langchain.prompts import ChatPromptTemplate
 from langchain.schema import HumanMessage, SystemMessage
 from langchain.output_parsers import PydanticOutputParser
@@ -47,10 +47,11 @@ class AIQuestionGenerationWorkflow:
     """AI 기반 시나리오 질문 생성 워크플로우"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
+        self.llm = get_llm(
             model="gpt-4o",
             temperature=0.7,
-            api_key=settings.OPENAI_API_KEY
+            api_key=settings.OPENAI_API_KEY,
+            tool="ai_question_generation_workflow"
         )
         self.parser = PydanticOutputParser(pydantic_object=QuestionSet)
     
@@ -7,6 +7,7 @@ from tools.pass_reason_tool import pass_reason_tool
 from tools.fail_reason_tool import fail_reason_tool
 from tools.application_decision_tool import application_decision_tool
 from agent.utils.llm_cache import redis_cache
+from agent.utils.tracing import trace_graph
 
 # 상태 정의
 class ApplicationState(TypedDict):
@@ -44,7 +45,7 @@ def build_application_evaluation_graph():
     workflow.add_edge("make_decision", END)
     
     # 그래프 컴파일
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "application_evaluation_agent")
 
 @redis_cache()
 def evaluate_application(job_posting: str, spec_data: dict, resume_data: dict, weight_data: dict = None):
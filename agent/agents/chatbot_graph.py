@@ -2,6 +2,7 @@ from langgraph.graph import Graph, StateGraph
 from langgraph.checkpoint.memory import MemorySaver
 from typing import Dict, Any, TypedDict
 from .chatbot_node import ChatbotNode
+from agent.utils.tracing import trace_graph
 import uuid
 
 # 상태 타입 정의
@@ -34,7 +35,7 @@ def create_chatbot_graph():
     # 종료 포인트 설정
     workflow.set_finish_point("chatbot")
     
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "chatbot_graph")
 
 def create_session_id() -> str:
     """새로운 세션 ID 생성"""
@@ -1,12 +1,8 @@
 from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from .memory_manager import ConversationMemory
-try:
-    from .rag_system import RAGSystem
-except ImportError:
-    RAGSystem = None
 import os
 import redis
 import json
@@ -53,13 +49,14 @@ def get_conversation_history(session_id, limit=10):
 class ChatbotNode:
     def __init__(self):
         """챗봇 노드 초기화"""
-        self.llm = ChatOpenAI(
+        self.llm = get_llm(
             model="gpt-4o-mini",
             temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY")
+            api_key=os.getenv("OPENAI_API_KEY"),
+            tool="chatbot_node",
+            priority="interactive"
         )
         self.memory = ConversationMemory()
-        self.rag_system = RAGSystem() if RAGSystem else None
         
         # 페이지별 시스템 프롬프트
         self.page_prompts = {
@@ -496,6 +493,15 @@ class ChatbotNode:
         
         return actions
     
+    @property
+    def rag_system(self):
+        """공용 RAG 시스템 (Chroma/임베딩은 지식을 처음 추가할 때 불러옴)"""
+        try:
+            from .rag_system import get_rag_system
+        except ImportError:
+            return None
+        return get_rag_system()
+
     def add_knowledge(self, documents: list, metadata: list = None):
         """지식 베이스에 문서 추가"""
         self.rag_system.add_documents(documents, metadata)
@@ -1,18 +1,21 @@
 from langgraph.graph import Graph, END
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from .interview_question_node import generate_company_questions, generate_common_question_bundle
 from ..tools.form_fill_tool import form_fill_tool, form_improve_tool
 from ..tools.form_edit_tool import form_edit_tool, form_status_check_tool
 from ..tools.spell_check_tool import spell_check_tool, apply_spell_corrections
 from ..tools.weight_extraction_tool import weight_extraction_tool
+from agent.utils.intent_router import VALID_TOOLS, get_intent_router
+from agent.utils.tracing import trace_graph
 import json
-import re
 import logging
+import threading
+import time
 from typing import Dict, Any
 
 def analyze_complex_command(message):
     """복합 명령을 분석하여 필요한 작업들을 추출"""
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.1, tool="graph_agent", priority="interactive")
     
     analysis_prompt = f"""
     사용자의 메시지를 분석하여 필요한 작업들을 추출해주세요.
@@ -81,7 +84,7 @@ def info_tool(state):
     print(f"🔍 info_tool 호출됨: message={message}")
     
     # LLM 프롬프트: 설명/가이드/FAQ만 반환, 행동 X
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="graph_agent", priority="interactive")
     prompt = f"""
     사용자의 질문에 대해 실제 행동(폼 작성, 수정 등) 없이, 정보성 안내/설명/가이드/FAQ만 제공하세요.
     - 예시: '공고 작성 방법 알려줘', '지원자 관리란?', '면접 일정 등록 방법 설명해줘' 등
@@ -112,52 +115,9 @@ def info_tool(state):
             "message": error_msg
         }
 
-def router(state):
-    """라우터: LLM을 사용하여 사용자 의도를 분석하고 적절한 도구로 분기"""
-    # state가 문자열인 경우 처리
-    if isinstance(state, str):
-        message = state
-        user_intent = ""
-    else:
-        message = state.get("message", "")
-        user_intent = state.get("user_intent", "")
-
-    # 맞춤법 검사 키워드 체크 (LLM 분석 전에 무조건 분기)
-    spell_check_keywords = ["맞춤법", "띄어쓰기", "문법", "어색한", "오타", "틀린", "고쳐줘", "수정해줘"]
-    if any(keyword in message for keyword in spell_check_keywords):
-        print(f"[강제 분기] 맞춤법 검사 감지: {message}")
-        return {"next": "spell_check_tool", **state}
-
-    # 복합 명령 분석
-    complex_analysis = analyze_complex_command(message)
-    
-    if complex_analysis and complex_analysis.get("complexity_level") == "complex":
-        print(f"복합 명령 감지: {complex_analysis}")
-        # 복합 명령의 경우 form_fill_tool로 라우팅하고 분석 결과를 state에 포함
-        return {
-            "next": "form_fill_tool", 
-            **state,
-            "complex_analysis": complex_analysis
-        }
-    
-    # 정보성 안내/설명/FAQ/기능 안내 패턴 우선 분기
-    info_patterns = [
-        "할 수 있나요", "할 수 있어", "가능해", "가능한가요", "방법", "어떻게 해", "어떻게 하면", "어떻게 변경", "어떻게 조정", "어떻게 수정", "어떻게 추가", "어떻게 삭제", "어떻게 바꿔", "어떻게 설정"
-    ]
-    # 명확한 값 지정 패턴 (예: '정규직으로 변경해줘', '3명으로 바꿔줘')
-    value_change_patterns = [
-        r"(을|를)?\s*([\w가-힣]+)\s*(으로|로)\s*(변경|바꿔|수정|설정)",
-        r"(을|를)?\s*([\w가-힣]+)\s*로\s*조정"
-    ]
-    is_info_pattern = any(p in message for p in info_patterns)
-    is_value_change = any(re.search(p, message) for p in value_change_patterns)
-    print(f"🔍 패턴 분석: info_pattern={is_info_pattern}, value_change={is_value_change}")
-    if is_info_pattern and not is_value_change:
-        print(f"✅ 기능 안내/설명 패턴 감지: {message}")
-        return {"next": "info_tool", **state}
-    
-    # LLM을 사용한 의도 분석
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+def _llm_intent(message, user_intent):
+    """LLM 의도 분석 (로컬 라우터가 확정하지 못한 메시지용). 도구 이름 문자열 반환"""
+    llm = get_llm(model="gpt-4o-mini", temperature=0.1, tool="graph_agent", priority="interactive")
     
     intent_analysis_prompt = f"""
     사용자의 메시지를 분석하여 어떤 도구를 사용해야 하는지 결정해주세요.
@@ -193,83 +153,81 @@ def router(state):
     응답은 정확히 다음 중 하나만 반환하세요:
     form_fill_tool, form_improve_tool, form_status_check_tool, form_edit_tool, spell_check_tool, apply_spell_corrections, company_question_generator, project_question_generator, info_tool
     """
-    
+    response = llm.invoke(intent_analysis_prompt)
+    return response.content.strip()
+
+def _default_tool(state):
+    """LLM 이 유효한 도구를 고르지 못했을 때: 사용 가능한 데이터에 따라 결정"""
+    if state.get("resume_text"):
+        return "project_question_generator"
+    elif state.get("company_name"):
+        return "company_question_generator"
+    return "form_fill_tool"  # 폼 관련 요청이므로 기본값을 form_fill_tool로 변경
+
+def _audit_local_route(message, user_intent, decision):
+    """로컬 라우팅 결과를 LLM 으로 재확인해 정확도 지표에 기록 (백그라운드)"""
     try:
-        # 먼저 키워드 기반으로 빠른 판단
-        message_lower = message.lower()
-        
-        # 맞춤법 검사 키워드 체크 (먼저 확인)
-        spell_check_keywords = ["맞춤법", "띄어쓰기", "문법", "어색한", "오타", "틀린", "고쳐줘", "수정해줘"]
-        if any(keyword in message for keyword in spell_check_keywords):
-            print(f"키워드 기반 맞춤법 검사 감지: {message}")
-            return {"next": "spell_check_tool", **state}
-        
-        # AI 개선 요청 키워드 체크 (먼저 확인)
-        ai_improve_keywords = ["더 상세하게", "더 구체적으로", "개선해줘", "보완해줘", "완성해줘", "작성해줘", "어떻게", "조언"]
-        field_names = ["제목", "부서", "부서명", "지원자격", "근무조건", "모집분야", "전형절차", "모집인원", "근무지역", "고용형태"]
-        
-        # AI 개선 요청인지 확인 (특정 필드 + AI 개선 키워드)
-        is_ai_improve = any(field in message for field in field_names) and any(keyword in message for keyword in ai_improve_keywords)
-        
-        if (is_ai_improve):
-            print(f"키워드 기반 AI 개선 감지: {message}")
-            return {"next": "form_improve_tool", **state}
-        
-        # 구체적인 필드 수정 키워드 체크
-        field_update_keywords = ["바꿔달라", "변경", "수정", "고쳐줘", "바꿔줘", "로 변경", "으로 변경"]
-        
-        is_field_update = any(keyword in message for keyword in field_update_keywords) and any(field in message for field in field_names)
-        
-        if is_field_update:
-            print(f"키워드 기반 필드 수정 감지: {message}")
-            return {"next": "form_edit_tool", **state}
-        
-        # 폼 작성 키워드 체크
-        form_fill_keywords = ["작성", "채워줘", "생성", "만들어줘", "공고 작성"]
-        if any(keyword in message for keyword in form_fill_keywords):
-            print(f"키워드 기반 폼 작성 감지: {message}")
-            return {"next": "form_fill_tool", **state}
-        
-        # 상태 확인 키워드 체크
-        status_keywords = ["현재", "상태", "확인", "어떻게 되어있어"]
-        if any(keyword in message for keyword in status_keywords):
-            print(f"키워드 기반 상태 확인 감지: {message}")
-            return {"next": "form_status_check_tool", **state}
-        
-        # LLM 기반 분석 (키워드로 판단되지 않은 경우)
-        response = llm.invoke(intent_analysis_prompt)
-        tool_choice = response.content.strip()
+        get_intent_router().record_audit(decision, _llm_intent(message, user_intent))
+    except Exception as e:
+        print(f"[INTENT-ROUTER] audit 실패: {e}")
+
+def router(state):
+    """라우터: 로컬 의도 라우터(키워드 오토마톤 + 최근접 중심)로 먼저 분기하고, 애매한 경우만 LLM 분석"""
+    # state가 문자열인 경우 처리
+    if isinstance(state, str):
+        state = {"message": state}
+    message = state.get("message", "")
+    user_intent = state.get("user_intent", "")
+
+    intent_router = get_intent_router()
+    decision = intent_router.classify(message)
+    print(f"🔍 로컬 라우팅: intent={decision.intent}, source={decision.source}, complex={decision.complex_candidate}, "
+          f"guess={decision.guess}({decision.similarity:.2f}/{decision.margin:.2f}), {decision.elapsed_us:.0f}us")
+
+    # 맞춤법 검사는 LLM 분석 전에 무조건 분기
+    if decision.intent == "spell_check_tool":
+        intent_router.record(message, decision, "spell_check_tool")
+        return {"next": "spell_check_tool", **state}
+
+    # 복합 명령 분석 (공고 생성 + 여러 필드/면접 설정이 함께 있는 후보만)
+    if decision.complex_candidate:
+        started = time.perf_counter()
+        complex_analysis = analyze_complex_command(message)
+        elapsed = time.perf_counter() - started
+        if complex_analysis and complex_analysis.get("complexity_level") == "complex":
+            print(f"복합 명령 감지: {complex_analysis}")
+            intent_router.record(message, decision, "form_fill_tool", complex_analysis=True, llm_seconds=elapsed)
+            # 복합 명령의 경우 form_fill_tool로 라우팅하고 분석 결과를 state에 포함
+            return {
+                "next": "form_fill_tool", 
+                **state,
+                "complex_analysis": complex_analysis
+            }
+
+    if decision.intent:
+        print(f"✅ 로컬 라우팅 확정({decision.source}): {decision.intent}")
+        intent_router.record(message, decision, decision.intent)
+        if intent_router.should_audit(decision):
+            threading.Thread(target=_audit_local_route, args=(message, user_intent, decision), daemon=True).start()
+        return {"next": decision.intent, **state}
+
+    # LLM 기반 분석 (로컬에서 확정하지 못한 경우)
+    started = time.perf_counter()
+    try:
+        tool_choice = _llm_intent(message, user_intent)
         print(f"LLM이 선택한 도구: {tool_choice}")
-        
-        # 응답 검증
-        valid_tools = [
-            "form_fill_tool", "form_improve_tool", "form_status_check_tool", 
-            "form_edit_tool", "spell_check_tool", "apply_spell_corrections", 
-            "company_question_generator", "project_question_generator", "info_tool"
-        ]
-        
-        if tool_choice in valid_tools:
-            print(f"유효한 도구 선택됨: {tool_choice}")
-            return {"next": tool_choice, **state}
-        else:
-            print(f"유효하지 않은 도구 선택됨: {tool_choice}, 기본값 사용")
-            # 기본값: 사용 가능한 데이터에 따라 결정
-            if state.get("resume_text"):
-                return {"next": "project_question_generator", **state}
-            elif state.get("company_name"):
-                return {"next": "company_question_generator", **state}
-            else:
-                return {"next": "form_fill_tool", **state}  # 폼 관련 요청이므로 기본값을 form_fill_tool로 변경
-                
     except Exception as e:
         print(f"의도 분석 중 오류: {e}")
         # 오류 시 기본값 반환
-        if state.get("resume_text"):
-            return {"next": "project_question_generator", **state}
-        elif state.get("company_name"):
-            return {"next": "company_question_generator", **state}
-        else:
-            return {"next": "form_fill_tool", **state}  # 폼 관련 요청이므로 기본값을 form_fill_tool로 변경
+        return {"next": _default_tool(state), **state}
+    elapsed = time.perf_counter() - started
+
+    if tool_choice in VALID_TOOLS:
+        print(f"유효한 도구 선택됨: {tool_choice}")
+        intent_router.record(message, decision, tool_choice, llm_seconds=elapsed)
+        return {"next": tool_choice, **state}
+    print(f"유효하지 않은 도구 선택됨: {tool_choice}, 기본값 사용")
+    return {"next": _default_tool(state), **state}
 
 def portfolio_analyzer(state):
     """포트폴리오 링크 수집 및 분석 노드 (단순화됨)"""
@@ -413,7 +371,7 @@ def build_graph():
     graph.add_edge("apply_spell_corrections", END)
     graph.add_edge("info_tool", END)
     
-    return graph.compile()
+    return trace_graph(graph.compile(), "graph_agent")
 
 
 def build_company_question_graph():
@@ -422,7 +380,7 @@ def build_company_question_graph():
     graph.add_node("company_question_generator", company_question_generator)
     graph.set_entry_point("company_question_generator")
     graph.set_finish_point("company_question_generator")
-    return graph.compile()
+    return trace_graph(graph.compile(), "company_question_graph")
 
 def build_project_question_graph():
     """프로젝트 질문 생성 전용 그래프"""
@@ -432,7 +390,7 @@ def build_project_question_graph():
     graph.set_entry_point("portfolio_analyzer")
     graph.add_edge("portfolio_analyzer", "project_question_generator")
     graph.set_finish_point("project_question_generator")
-    return graph.compile()
+    return trace_graph(graph.compile(), "project_question_graph")
 
 def build_form_graph():
     """폼 관련 작업 전용 그래프 (가중치 추출 통합)"""
@@ -450,7 +408,7 @@ def build_form_graph():
     graph.add_edge("form_edit_tool", "spell_check_tool")
     graph.add_edge("spell_check_tool", "weight_extraction_tool")
     graph.set_finish_point("weight_extraction_tool")
-    return graph.compile()
+    return trace_graph(graph.compile(), "form_graph")
 
 async def process_audio_chunk(audio_path: str, timestamp: float) -> Dict[str, Any]:
     try:
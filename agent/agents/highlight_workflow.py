@@ -1,42 +1,27 @@
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from typing import Dict, Any, List, Optional
 import json
 import re
 from agent.utils.llm_cache import redis_cache
+from agent.utils.tracing import trace_graph
+from agent.utils.transition_sentiment import TextAnnotator, annotate_document
 
 # LLM 초기화
-llm = ChatOpenAI(model="gpt-4o", temperature=0.1)
+llm = get_llm(model="gpt-4o", temperature=0.1, tool="highlight_workflow")
 
 # 임베딩 시스템 관련 코드 완전 제거
 
 def is_transition_word(text: str) -> bool:
     """전환어 감지 함수"""
-    transition_patterns = [
-        # 대조/반전 전환어
-        r'하지만|그럼에도\s*불구하고|그러나|다만|단|오히려|반면|반대로|대신|대신에|그런데|그렇지만',
-        # 시간/순서 전환어
-        r'그러다가|그\s*후|이후|그\s*다음|다음에는|그\s*때부터|그\s*때|그\s*이후|그\s*다음에',
-        # 조건/결과 전환어
-        r'만약|만약에|결과적으로|결국|마침내|드디어|그\s*결과|그\s*끝에',
-        # 추가/강조 전환어
-        r'또한|게다가|더욱이|무엇보다|특히|특별히|더구나|거기에|또\s*한편',
-        # 인과 전환어
-        r'그\s*이유로|그\s*때문에|그\s*래서|그\s*때문|그\s*결과로|그\s*덕분에',
-        # 예시 전환어
-        r'예를\s*들면|예시로|구체적으로|실제로|사실|실제로는'
-    ]
-    
-    for pattern in transition_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return TextAnnotator(text).has_transition(0, len(text))
 
 def filter_negative_highlights_with_transitions(highlights: List[Dict[str, Any]], full_text: str) -> List[Dict[str, Any]]:
-    """전환어를 고려하여 부정 하이라이팅을 필터링"""
+    """전환어를 고려하여 부정 하이라이팅을 필터링 (자기소개서 문장 주석 재사용)"""
     if not highlights:
         return highlights
     
+    document = annotate_document(full_text or "")
     filtered_highlights = []
     
     for highlight in highlights:
@@ -45,10 +30,11 @@ def filter_negative_highlights_with_transitions(highlights: List[Dict[str, Any]]
         
         # 부정 관련 카테고리만 필터링
         if category in ['negative_tone', 'mismatch']:
+            annotation = document.lookup(sentence)
             # 전환어가 포함된 문장인지 확인
-            if is_transition_word(sentence):
+            if annotation.is_transition:
                 # 전환어 중심 문맥 분석
-                context_analysis = analyze_transition_context(sentence)
+                context_analysis = annotation.context
                 
                 if context_analysis['has_context_change']:
                     if context_analysis['positive_after_negative']:
@@ -64,106 +50,13 @@ def filter_negative_highlights_with_transitions(highlights: List[Dict[str, Any]]
 
 def analyze_transition_context(sentence: str) -> Dict[str, Any]:
     """전환어를 중심으로 앞뒤 문맥을 분석"""
-    result = {
-        'has_context_change': False,
-        'positive_after_negative': False,
-        'negative_after_positive': False,
-        'transition_word': '',
-        'before_transition': '',
-        'after_transition': '',
-        'before_sentiment': 'neutral',
-        'after_sentiment': 'neutral'
-    }
-    
-    # 전환어 위치 찾기
-    transition_patterns = [
-        r'하지만|그러나|그런데|그렇지만|다만|단|오히려|반면|반대로|대신|대신에',
-        r'그러다가|그\s*후|이후|그\s*다음|다음에는|그\s*때부터',
-        r'만약|만약에|결과적으로|결국|마침내|드디어',
-        r'또한|게다가|더욱이|무엇보다|특히|특별히'
-    ]
-    
-    for pattern in transition_patterns:
-        match = re.search(pattern, sentence, re.IGNORECASE)
-        if match:
-            transition_word = match.group()
-            before_text = sentence[:match.start()].strip()
-            after_text = sentence[match.end():].strip()
-            
-            # 전환어 앞뒤 텍스트가 모두 있는 경우만 분석
-            if before_text and after_text:
-                before_sentiment = analyze_sentiment(before_text)
-                after_sentiment = analyze_sentiment(after_text)
-                
-                result.update({
-                    'has_context_change': True,
-                    'transition_word': transition_word,
-                    'before_transition': before_text,
-                    'after_transition': after_text,
-                    'before_sentiment': before_sentiment,
-                    'after_sentiment': after_sentiment
-                })
-                
-                # 문맥 변화 감지
-                if before_sentiment == 'negative' and after_sentiment == 'positive':
-                    result['positive_after_negative'] = True
-                elif before_sentiment == 'positive' and after_sentiment == 'negative':
-                    result['negative_after_positive'] = True
-                
-                break
-    
-    return result
+    return TextAnnotator(sentence).transition_context(0, len(sentence))
 
 def analyze_sentiment(text: str) -> str:
     """텍스트의 감정을 분석 (긍정/부정/중립)"""
     if not text or len(text.strip()) < 2:
         return 'neutral'
-    
-    # 긍정적 키워드 패턴
-    positive_patterns = [
-        r'성공|성과|개선|향상|증가|달성|완료|해결|극복|발전|성장|도약|혁신|창의|효율|최적화',
-        r'좋은|훌륭한|우수한|뛰어난|탁월한|최고의|최상의|완벽한|완전한|완성된',
-        r'만족|기쁨|희망|자신감|긍정|낙관|열정|의지|노력|성실|책임감|주도성',
-        r'배웠다|성장했다|개선했다|해결했다|달성했다|완료했다|극복했다|발전했다',
-        r'잘\s*했다|성공했다|완료했다|해결했다|개선했다|향상했다|증가했다|달성했다',
-        r'좋았다|훌륭했다|우수했다|뛰어났다|탁월했다|완벽했다|완전했다|완성했다'
-    ]
-    
-    # 부정적 키워드 패턴
-    negative_patterns = [
-        r'실패|실패했다|실패했고|실패했으며|실패했지만|실패했고|실패했으니|실패했으므로',
-        r'어려움|어려웠다|어려웠고|어려웠으며|어려웠지만|어려웠고|어려웠으니|어려웠으므로',
-        r'문제|문제가|문제를|문제에|문제로|문제와|문제는|문제도|문제만|문제까지',
-        r'실수|실수했다|실수했고|실수했으며|실수했지만|실수했고|실수했으니|실수했으므로',
-        r'부족|부족했다|부족했고|부족했으며|부족했지만|부족했고|부족했으니|부족했으므로',
-        r'미흡|미흡했다|미흡했고|미흡했으며|미흡했지만|미흡했고|미흡했으니|미흡했으므로',
-        r'부족함|부족함을|부족함에|부족함으로|부족함과|부족함은|부족함도|부족함만|부족함까지',
-        r'실망|실망했다|실망했고|실망했으며|실망했지만|실망했고|실망했으니|실망했으므로',
-        r'좌절|좌절했다|좌절했고|좌절했으며|좌절했지만|좌절했고|좌절했으니|좌절했으므로',
-        r'힘들었다|어려웠다|막막했다|당황했다|혼란스러웠다|불안했다|걱정했다',
-        r'나쁜|안좋은|부족한|미흡한|실패한|실패했다|실패했고|실패했으며|실패했지만',
-        r'어려웠다|힘들었다|막막했다|당황했다|혼란스러웠다|불안했다|걱정했다|실망했다|좌절했다'
-    ]
-    
-    # 긍정/부정 키워드 카운트
-    positive_count = 0
-    negative_count = 0
-    
-    for pattern in positive_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            positive_count += 1
-    
-    for pattern in negative_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            negative_count += 1
-    
-    # 감정 판단 (키워드 개수와 가중치 고려)
-    if positive_count > negative_count and positive_count > 0:
-        return 'positive'
-    elif negative_count > positive_count and negative_count > 0:
-        return 'negative'
-    else:
-        return 'neutral'
+    return TextAnnotator(text).sentiment(0, len(text))
 
 def has_positive_content_after_transition(sentence: str) -> bool:
     """전환어 뒤에 긍정적 내용이 있는지 확인 (기존 함수 - 호환성 유지)"""
@@ -533,6 +426,7 @@ def get_purple_prompt(experience_keywords: List[str], candidates: List[Dict[str,
     }}
     """
 
+@redis_cache(expire=60 * 60 * 6)
 async def analyze_category_with_llm(
     resume_content: str, 
     category: str, 
@@ -613,10 +507,16 @@ async def analyze_orange_with_sentiment(candidates: List[Dict[str, Any]], full_t
         except Exception as e:
             print(f"⚠️ 감정 모델 로드 실패: {e}")
         
-        # 감정 분석 수행
+        # 감정 분석 수행 (전환어 문맥 주석은 부정 하이라이트 필터링과 같은 것을 재사용)
+        document = annotate_document(full_text or "")
         negative_sentences = []
         for candidate in candidates:
             sentence = candidate['sentence']
+            annotation = document.lookup(sentence)
+            if annotation.context['positive_after_negative']:
+                # 부정→긍정 전환 문장은 필터링 단계에서 어차피 제외되므로 후보에서 뺌
+                print(f"🟠 전환어 문맥(부정→긍정) 제외: {sentence[:30]}...")
+                continue
             
             if sentiment_model and sentiment_tokenizer:
                 # 감정 모델로 분석
@@ -637,12 +537,13 @@ async def analyze_orange_with_sentiment(candidates: List[Dict[str, Any]], full_t
                     print(f"🟠 감정 분석 제외: {sentence[:30]}... (부정 확률: {sentiment_score:.3f})")
             else:
                 # 감정 모델이 없으면 프롬프트 기반 분석
-                # 모든 문장을 후보로 추가 (LLM이 판단하도록)
+                # 모든 문장을 후보로 추가 (LLM이 판단하도록), 부정 어휘가 많은 문장이 상위 후보가 되도록 점수 보정
+                sentiment_score = min(0.3 + 0.1 * annotation.negative_count, 0.9)
                 negative_sentences.append({
                     "sentence": sentence,
-                    "sentiment_score": 0.3  # 기본값 (더 낮게 설정)
+                    "sentiment_score": sentiment_score
                 })
-                print(f"🟠 기본 분석: {sentence[:30]}... (기본 점수: 0.3)")
+                print(f"🟠 기본 분석: {sentence[:30]}... (어휘 점수: {sentiment_score:.1f})")
         
         # 만약 감정 분석으로 후보가 없으면 모든 문장을 후보로 추가
         if not negative_sentences:
@@ -959,7 +860,7 @@ def build_highlight_workflow() -> StateGraph:
     workflow.add_edge("validate_highlights", "finalize_results")
     workflow.add_edge("finalize_results", END)
     
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "highlight_workflow")
 
 # 워크플로우 인스턴스 생성
 highlight_workflow = build_highlight_workflow()
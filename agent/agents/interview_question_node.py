@@ -1,9 +1,10 @@
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from dotenv import load_dotenv
 import os
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from langchain_community.tools.tavily_search.tool import TavilySearchResults
 from langchain.chains.summarize import load_summarize_chain
 from langchain_core.documents import Document
@@ -28,7 +29,7 @@ FIXED_QUESTIONS = {
     ]
 }
 
-llm = ChatOpenAI(model="gpt-4o")
+llm = get_llm(model="gpt-4o", tool="interview_question_node")
 
 # Tavily 검색 도구 초기화
 search_tool = TavilySearchResults()
@@ -138,6 +139,40 @@ job_prompt = PromptTemplate.from_template(
     """
 )
 
+# 독립적인 LLM/검색 호출을 동시에 실행할 최대 개수 (LLM 게이트웨이가 RPM/TPM 은 별도로 조절)
+FAN_OUT_CONCURRENCY = int(os.getenv("QUESTION_FAN_OUT_CONCURRENCY", 4))
+
+
+def _fan_out(calls: Dict[str, Callable[[], Any]], max_workers: int = FAN_OUT_CONCURRENCY) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """서로 독립적인 호출들을 제한된 동시성으로 실행
+
+    한 호출이 실패해도 나머지 결과는 그대로 돌려준다 (부분 결과).
+
+    Returns:
+        (이름 → 결과, 이름 → 오류 메시지)
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls)) or 1) as executor:
+        futures = {name: executor.submit(call) for name, call in calls.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"[{name}] 생성 실패: {str(e)}")
+                errors[name] = str(e)
+    return results, errors
+
+
+def _split_lines(result: Any) -> List[str]:
+    """LLM 응답(메시지/체인 결과/문자열) → 비어 있지 않은 줄 목록"""
+    if isinstance(result, dict):
+        text = result.get("text", "")
+    else:
+        text = result.content if hasattr(result, 'content') else str(result)
+    return [q.strip() for q in text.split("\n") if q.strip()]
+
+
 # LLM 체인 초기화 (RunnableSequence로 변경)
 generate_resume_summary = resume_summary_prompt | llm
 generate_project_questions = project_prompt | llm
@@ -145,26 +180,45 @@ generate_values_questions = values_prompt | llm
 generate_news_questions = news_prompt | llm
 generate_job_questions = job_prompt | llm
 
+def _is_complete(result: Dict[str, Any]) -> bool:
+    # 실패한 분기가 있거나 기본(fallback) 질문으로 채운 결과는 캐시하지 않아 다음 요청에서 다시 생성되도록 함
+    return bool(result.get("complete"))
+
+
 # 3. 전체 질문 통합 함수
-@redis_cache()
 def generate_personal_questions(resume_text: str, company_name: Optional[str] = None, portfolio_info: str = ""):
     """개인별 맞춤형 질문 생성 (이력서 기반) - 인성/동기 질문은 공통질문으로 이동"""
-    
-    # 자기소개서 요약
-    resume_summary_result = generate_resume_summary.invoke({"resume_text": resume_text})
-    resume_summary = resume_summary_result.content if hasattr(resume_summary_result, 'content') else str(resume_summary_result)
+    return _generate_personal_questions_result(resume_text, company_name, portfolio_info)["questions"]
 
-    # 프로젝트 질문 생성 (포트폴리오 정보 포함)
-    project_result = generate_project_questions.invoke({
-        "resume_summary": resume_summary,
-        "portfolio_info": portfolio_info or "포트폴리오 정보가 없습니다."
-    })
-    project_questions = [q.strip() for q in (project_result.content if hasattr(project_result, 'content') else str(project_result)).split("\n") if q.strip()]
 
-    # 회사 관련 질문 (인재상 + 뉴스 기반)
-    company_questions = []
+@redis_cache(cache_if=_is_complete)
+def _generate_personal_questions_result(resume_text: str, company_name: Optional[str] = None, portfolio_info: str = ""):
+    """generate_personal_questions 의 캐시 단위 ({"questions": ..., "complete": 모든 분기가 실제 생성 결과인지})
+
+    요약 → 프로젝트 질문은 서로 의존하고 회사 질문과는 프롬프트 접두부가 달라 공유할 캐시가 없으므로,
+    두 흐름을 동시에 실행만 한다.
+    """
+    
+    def project_branch():
+        # 자기소개서 요약 → 프로젝트 질문 생성 (포트폴리오 정보 포함)
+        resume_summary_result = generate_resume_summary.invoke({"resume_text": resume_text})
+        resume_summary = resume_summary_result.content if hasattr(resume_summary_result, 'content') else str(resume_summary_result)
+        project_result = generate_project_questions.invoke({
+            "resume_summary": resume_summary,
+            "portfolio_info": portfolio_info or "포트폴리오 정보가 없습니다."
+        })
+        return resume_summary, _split_lines(project_result)
+
+    # 프로젝트 질문과 회사 관련 질문(인재상 + 뉴스 기반)은 서로 독립적이므로 동시에 생성
+    calls = {"project": project_branch}
     if company_name:
-        company_questions = generate_company_questions(company_name)
+        calls["company"] = lambda: _generate_company_questions_result(company_name)
+    results, errors = _fan_out(calls)
+
+    resume_summary, project_questions = results.get("project", ("", []))
+    company_result = results.get("company", {"questions": [], "complete": not company_name})
+    company_questions = company_result["questions"]
+    complete = not errors and bool(project_questions) and company_result["complete"]
     
     # 상황 질문 템플릿
     scenario_questions = [
@@ -175,13 +229,15 @@ def generate_personal_questions(resume_text: str, company_name: Optional[str] =
     ]
 
     return {
-        "프로젝트 경험": project_questions,
-        "회사 관련": company_questions,
-        "상황 대처": scenario_questions,
-        "자기소개서 요약": resume_summary
+        "questions": {
+            "프로젝트 경험": project_questions,
+            "회사 관련": company_questions,
+            "상황 대처": scenario_questions,
+            "자기소개서 요약": resume_summary
+        },
+        "complete": complete
     }
 
-@redis_cache()
 def generate_common_questions(company_name: Optional[str] = None, job_info: str = ""):
     """모든 지원자에게 공통으로 적용할 수 있는 질문 생성"""
     
@@ -199,7 +255,7 @@ def generate_common_questions(company_name: Optional[str] = None, job_info: str
         "실패를 경험한 적이 있나요? 어떻게 극복하셨나요?"
     ]
     
-    # 회사 관련 공통 질문
+    # 회사 관련 공통 질문 (LLM 을 쓰는 부분은 generate_company_questions 가 완전한 결과만 캐시)
     common_company_questions = []
     if company_name:
         common_company_questions = generate_company_questions(company_name)
@@ -235,65 +291,75 @@ def generate_common_questions(company_name: Optional[str] = None, job_info: str
 # 하위 호환성을 위한 별칭
 generate_common_question_bundle = generate_personal_questions
 
-@redis_cache()
+def _default_company_questions(company_name: str) -> List[str]:
+    return [
+        f"{company_name}에 지원한 이유는 무엇인가요?",
+        f"{company_name}의 미래 비전에 대해 어떻게 생각하시나요?",
+        f"{company_name}에서 일하고 싶은 이유는 무엇인가요?"
+    ]
+
+
 def generate_company_questions(company_name: str):
-    """회사명을 기반으로 인재상과 뉴스를 모두 고려한 질문 생성"""
-    try:
-        # 1. 인재상/가치관 검색
-        values_search_results = search_tool.invoke({
-            "query": f"{company_name} 인재상 OR 핵심가치 OR 기업문화 OR 기업이념"
-        })
-        
-        # 검색 결과 처리 개선
-        values_docs = []
-        if isinstance(values_search_results, list):
-            for item in values_search_results:
-                if isinstance(item, dict):
-                    content = item.get("content") or item.get("snippet", "")
-                    if content:
-                        values_docs.append(Document(page_content=content))
-        
-        values_summary = ""
-        if values_docs:
-            values_summary = summarize_chain.run(values_docs)
-        else:
-            values_summary = f"{company_name}의 인재상과 기업문화에 대한 정보를 찾을 수 없습니다."
+    """회사명을 기반으로 인재상과 뉴스를 모두 고려한 질문 생성
+
+    인재상 (검색 → 요약 → 질문) 과 뉴스 (검색 → 요약 → 질문) 두 흐름을 동시에 실행하고,
+    한쪽이 실패하면 나머지 쪽 질문만 사용한다.
+    """
+    return _generate_company_questions_result(company_name)["questions"]
+
+
+@redis_cache(cache_if=_is_complete)
+def _generate_company_questions_result(company_name: str):
+    """generate_company_questions 의 캐시 단위
+
+    검색 결과가 없어 안내 문구로 요약했거나, 한쪽 분기가 실패했거나, 기본 질문으로 대체한 결과는
+    complete=False 로 돌려주어 캐시하지 않는다.
+    """
+    fallbacks = []
+
+    def search_summary(query: str, fallback: str) -> str:
+        search_results = search_tool.invoke({"query": query})
 
-        # 2. 뉴스/기술 동향 검색
-        news_search_results = search_tool.invoke({
-            "query": f"{company_name} 최신뉴스 OR 기술동향 OR 산업동향"
-        })
-        
         # 검색 결과 처리 개선
-        news_docs = []
-        if isinstance(news_search_results, list):
-            for item in news_search_results:
+        docs = []
+        if isinstance(search_results, list):
+            for item in search_results:
                 if isinstance(item, dict):
                     content = item.get("content") or item.get("snippet", "")
                     if content:
-                        news_docs.append(Document(page_content=content))
-        
-        news_summary = ""
-        if news_docs:
-            news_summary = summarize_chain.run(news_docs)
-        else:
-            news_summary = f"{company_name}의 최신 뉴스와 기술 동향에 대한 정보를 찾을 수 없습니다."
+                        docs.append(Document(page_content=content))
 
-        # 3. 인재상 기반 질문 생성
-        values_result = generate_values_questions.invoke({
+        if docs:
+            return summarize_chain.run(docs)
+        fallbacks.append(query)
+        return fallback
+
+    def values_branch():
+        # 1. 인재상/가치관 검색 → 3. 인재상 기반 질문 생성
+        values_summary = search_summary(
+            f"{company_name} 인재상 OR 핵심가치 OR 기업문화 OR 기업이념",
+            f"{company_name}의 인재상과 기업문화에 대한 정보를 찾을 수 없습니다."
+        )
+        return _split_lines(generate_values_questions.invoke({
             "company_name": company_name,
             "company_values": values_summary
-        })
-        values_text = values_result.content if hasattr(values_result, 'content') else str(values_result)
-        values_questions = [q.strip() for q in values_text.split("\n") if q.strip()]
+        }))
 
-        # 4. 뉴스 기반 질문 생성
-        news_result = generate_news_questions.invoke({
+    def news_branch():
+        # 2. 뉴스/기술 동향 검색 → 4. 뉴스 기반 질문 생성
+        news_summary = search_summary(
+            f"{company_name} 최신뉴스 OR 기술동향 OR 산업동향",
+            f"{company_name}의 최신 뉴스와 기술 동향에 대한 정보를 찾을 수 없습니다."
+        )
+        return _split_lines(generate_news_questions.invoke({
             "company_name": company_name,
             "company_news": news_summary
-        })
-        news_text = news_result.content if hasattr(news_result, 'content') else str(news_result)
-        news_questions = [q.strip() for q in news_text.split("\n") if q.strip()]
+        }))
+
+    try:
+        results, errors = _fan_out({"values": values_branch, "news": news_branch})
+        values_questions = results.get("values", [])
+        news_questions = results.get("news", [])
 
         # 5. 결과 통합
         all_company_questions = []
@@ -302,22 +368,15 @@ def generate_company_questions(company_name: str):
 
         # 질문이 없으면 기본 질문 추가
         if not all_company_questions:
-            all_company_questions = [
-                f"{company_name}에 지원한 이유는 무엇인가요?",
-                f"{company_name}의 미래 비전에 대해 어떻게 생각하시나요?",
-                f"{company_name}에서 일하고 싶은 이유는 무엇인가요?"
-            ]
+            return {"questions": _default_company_questions(company_name), "complete": False}
 
-        return all_company_questions
+        complete = not errors and not fallbacks and bool(values_questions) and bool(news_questions)
+        return {"questions": all_company_questions, "complete": complete}
 
     except Exception as e:
         print(f"회사 질문 생성 중 오류: {str(e)}")
         # 오류 시 기본 질문 반환
-        return [
-            f"{company_name}에 지원한 이유는 무엇인가요?",
-            f"{company_name}의 미래 비전에 대해 어떻게 생각하시나요?",
-            f"{company_name}에서 일하고 싶은 이유는 무엇인가요?"
-        ]
+        return {"questions": _default_company_questions(company_name), "complete": False}
 
 def company_info_scraping_tool(company_name):
     # 실제로는 requests/BeautifulSoup 등으로 스크래핑
@@ -1076,24 +1135,62 @@ technical_practical_understanding_prompt = PromptTemplate.from_template(
 technical_practical_understanding_chain = LLMChain(llm=llm, prompt=technical_practical_understanding_prompt)
 
 
-@redis_cache()
+# 7개 역량 프롬프트는 모두 "이력서 + 직무 정보" 로 시작하는 같은 접두부를 공유한다.
+# OpenAI 프롬프트 캐시는 PROMPT_CACHE_MIN_TOKENS 이상인 접두부를 먼저 처리한 요청이 끝난 뒤에야 재사용하므로,
+# QUESTION_PREFIX_CACHE_WARMUP=true 이면 접두부가 충분히 길 때 한 체인을 먼저 실행해 캐시를 채우고 나머지 여섯 개를 동시에 실행한다
+# (입력 토큰 비용은 줄지만 체인 하나만큼 지연이 늘어나므로 기본값은 false - 일곱 개를 한 번에 실행).
+PROMPT_CACHE_MIN_TOKENS = 1024
+PREFIX_CACHE_WARMUP = os.getenv("QUESTION_PREFIX_CACHE_WARMUP", "false").lower() == "true"
+
+
+def _has_cacheable_prefix(*texts: str) -> bool:
+    text = "\n".join(text for text in texts if text)
+    try:
+        tokens = llm.get_num_tokens(text)
+    except Exception:
+        tokens = len(text) // 2
+    return tokens >= PROMPT_CACHE_MIN_TOKENS
+
+
+ADVANCED_COMPETENCY_CHAINS = {
+    "실무역량": practical_competency_chain,
+    "문제해결능력": problem_solving_chain,
+    "커뮤니케이션": communication_chain,
+    "성장가능성": growth_potential_chain,
+    "협업태도": collaboration_attitude_chain,
+    "도메인적합성": domain_fit_chain,
+    "기술실무이해도": technical_practical_understanding_chain,
+}
+
+
+def _all_categories_filled(result: Dict[str, list]) -> bool:
+    # 일부 카테고리가 실패한 부분 결과는 캐시하지 않아 다음 요청에서 다시 생성되도록 함
+    return all(result.get(category) for category in ADVANCED_COMPETENCY_CHAINS)
+
+
+@redis_cache(cache_if=_all_categories_filled)
 def generate_advanced_competency_questions(resume_text: str, job_info: str = ""):
-    practical = practical_competency_chain.invoke({"resume_text": resume_text, "job_info": job_info})
-    problem = problem_solving_chain.invoke({"resume_text": resume_text, "job_info": job_info})
-    communication = communication_chain.invoke({"resume_text": resume_text, "job_info": job_info})
-    growth = growth_potential_chain.invoke({"resume_text": resume_text, "job_info": job_info})
-    collaboration = collaboration_attitude_chain.invoke({"resume_text": resume_text, "job_info": job_info})
-    domain = domain_fit_chain.invoke({"resume_text": resume_text, "job_info": job_info})
-    technical = technical_practical_understanding_chain.invoke({"resume_text": resume_text, "job_info": job_info})
+    """7개 역량 카테고리 질문을 동시에 생성 (실패한 카테고리는 빈 목록)"""
+    inputs = {"resume_text": resume_text, "job_info": job_info}
+    calls = {
+        category: (lambda chain=chain: chain.invoke(inputs))
+        for category, chain in ADVANCED_COMPETENCY_CHAINS.items()
+    }
+    results, errors = {}, {}
+    if PREFIX_CACHE_WARMUP and _has_cacheable_prefix(resume_text, job_info):
+        # 공유 접두부를 프롬프트 캐시에 올리는 첫 체인
+        first = next(iter(calls))
+        results, errors = _fan_out({first: calls.pop(first)})
+    # 체인 수만큼 동시에 실행해 한 번의 대기로 끝나게 함
+    rest_results, rest_errors = _fan_out(calls, max_workers=len(calls))
+    results.update(rest_results)
+    errors.update(rest_errors)
+    if errors and not results:
+        raise RuntimeError(f"역량 질문 생성 실패: {errors}")
 
     return {
-        "실무역량": [q.strip() for q in practical.get("text", "").split("\n") if q.strip()],
-        "문제해결능력": [q.strip() for q in problem.get("text", "").split("\n") if q.strip()],
-        "커뮤니케이션": [q.strip() for q in communication.get("text", "").split("\n") if q.strip()],
-        "성장가능성": [q.strip() for q in growth.get("text", "").split("\n") if q.strip()],
-        "협업태도": [q.strip() for q in collaboration.get("text", "").split("\n") if q.strip()],
-        "도메인적합성": [q.strip() for q in domain.get("text", "").split("\n") if q.strip()],
-        "기술실무이해도": [q.strip() for q in technical.get("text", "").split("\n") if q.strip()],
+        category: _split_lines(results[category]) if category in results else []
+        for category in ADVANCED_COMPETENCY_CHAINS
     }
 
 # === 임원면접 질문 생성 ===
@@ -1,5 +1,6 @@
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
+from agent.utils.tracing import trace_graph
 from typing import Dict, Any, List, Optional
 from agent.agents.interview_question_node import (
     generate_personal_questions,
@@ -19,7 +20,7 @@ from agent.tools.comprehensive_analysis_tool import generate_comprehensive_analy
 import json
 
 # LLM 초기화
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="interview_question_workflow")
 
 def analyze_interview_requirements(state: Dict[str, Any]) -> Dict[str, Any]:
     """면접 요구사항 분석 노드"""
@@ -410,7 +411,7 @@ def build_interview_question_workflow() -> StateGraph:
     
     workflow.add_edge("result_integrator", END)
     
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "interview_question_workflow")
 
 # 워크플로우 인스턴스 생성
 interview_workflow = build_interview_question_workflow()
@@ -527,7 +528,7 @@ def build_executive_interview_workflow() -> StateGraph:
     workflow.add_edge("question_generator", "result_integrator")
     workflow.add_edge("result_integrator", END)
     
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "executive_interview_workflow")
 
 def build_technical_interview_workflow() -> StateGraph:
     """기술면접 전용 워크플로우"""
@@ -544,7 +545,7 @@ def build_technical_interview_workflow() -> StateGraph:
     workflow.add_edge("question_generator", "result_integrator")
     workflow.add_edge("result_integrator", END)
     
-    return workflow.compile()
+    return trace_graph(workflow.compile(), "technical_interview_workflow")
 
 # 특화된 워크플로우 인스턴스들
 executive_workflow = build_executive_interview_workflow()
@@ -3,7 +3,8 @@ import json
 import hashlib
 from typing import Dict, Any, List, Optional
 from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
+from agent.utils.tracing import trace_graph
 from langgraph.graph import StateGraph, END
 import redis
 
@@ -18,7 +19,7 @@ class PatternSummaryNode:
             llm_model: 사용할 LLM 모델명
             redis_url: Redis 연결 URL
         """
-        self.llm = ChatOpenAI(model=llm_model, temperature=0.3)
+        self.llm = get_llm(model=llm_model, temperature=0.3, tool="pattern_summary_node")
         self.pattern_summary_prompt = self._create_pattern_summary_prompt()
         
         # Redis 클라이언트 초기화
@@ -267,7 +268,7 @@ class PatternSummaryNode:
         workflow.set_entry_point("summarize_patterns")
         workflow.add_edge("summarize_patterns", END)
         
-        return workflow.compile()
+        return trace_graph(workflow.compile(), "pattern_summary")
     
     def run_pattern_summary(self, cluster_patterns: List[Dict[str, Any]], use_cache: bool = True) -> Dict[str, Any]:
         """
@@ -9,6 +9,7 @@ try:
 except ImportError:
     HAS_CHROMA = False
 import os
+import threading
 
 class RAGSystem:
     def __init__(self, persist_directory: str = "./chroma_db"):
@@ -99,4 +100,18 @@ class RAGSystem:
                 shutil.rmtree(self.persist_directory)
             print("Vector database cleared")
         except Exception as e:
-            print(f"Error clearing database: {e}")
\ No newline at end of file
+            print(f"Error clearing database: {e}")
+
+
+_rag_system = None
+_rag_lock = threading.Lock()
+
+
+def get_rag_system() -> RAGSystem:
+    """프로세스 공용 RAGSystem (OpenAIEmbeddings + Chroma 를 요청마다 만들지 않도록)"""
+    global _rag_system
+    if _rag_system is None:
+        with _rag_lock:
+            if _rag_system is None:
+                _rag_system = RAGSystem()
+    return _rag_system
@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional
 import asyncio
 import time
 from agent.utils.llm_cache import redis_cache
+from agent.utils.tracing import span
 
 # 각 툴들 import
 from agent.tools.highlight_tool import highlight_resume_content
@@ -85,38 +86,40 @@ class ResumeOrchestrator:
                 print(f"📊 {tool_name} 분석 시작...")
                 tool_start = time.time()
                 
-                # 각 툴별로 적절한 파라미터 전달
-                if tool_name == 'highlight':
-                    result = self.tools[tool_name](
-                        resume_content=resume_text,
-                        jobpost_id=jobpost_id,
-                        company_id=company_id
-                    )
-                elif tool_name == 'comprehensive':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info,
-                        portfolio_info=portfolio_info,
-                        job_matching_info=job_matching_info
-                    )
-                elif tool_name == 'detailed':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info
-                    )
-                elif tool_name == 'competitiveness':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info,
-                        comparison_context="시장 평균 대비 경쟁력 분석"
-                    )
-                elif tool_name == 'impact_points':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info
-                    )
-                else:
-                    result = self.tools[tool_name](resume_text, job_info)
+                # 툴별 span (agent.utils.tracing) - 하위 LLM 호출이 이 span 아래에 기록됨
+                with span(f"resume_orchestrator.{tool_name}", kind="tool", application_id=application_id):
+                    # 각 툴별로 적절한 파라미터 전달
+                    if tool_name == 'highlight':
+                        result = self.tools[tool_name](
+                            resume_content=resume_text,
+                            jobpost_id=jobpost_id,
+                            company_id=company_id
+                        )
+                    elif tool_name == 'comprehensive':
+                        result = self.tools[tool_name](
+                            resume_text=resume_text,
+                            job_info=job_info,
+                            portfolio_info=portfolio_info,
+                            job_matching_info=job_matching_info
+                        )
+                    elif tool_name == 'detailed':
+                        result = self.tools[tool_name](
+                            resume_text=resume_text,
+                            job_info=job_info
+                        )
+                    elif tool_name == 'competitiveness':
+                        result = self.tools[tool_name](
+                            resume_text=resume_text,
+                            job_info=job_info,
+                            comparison_context="시장 평균 대비 경쟁력 분석"
+                        )
+                    elif tool_name == 'impact_points':
+                        result = self.tools[tool_name](
+                            resume_text=resume_text,
+                            job_info=job_info
+                        )
+                    else:
+                        result = self.tools[tool_name](resume_text, job_info)
                 
                 results['results'][tool_name] = result
                 tool_time = time.time() - tool_start
@@ -132,6 +135,8 @@ class ResumeOrchestrator:
         
         total_time = time.time() - start_time
         results['metadata']['total_processing_time'] = total_time
+        # 단계별 소요 시간은 응답 traceparent 헤더의 trace_id 로 에이전트 /traces/{trace_id} 에서 확인
+        # (결과는 캐시되므로 요청마다 다른 trace_id 를 결과에 넣지 않는다)
         print(f"🎯 이력서 종합 분석 완료 (총 소요시간: {total_time:.2f}초)")
         
         return results
@@ -1,37 +1,34 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+import importlib
+import re
 import sys
 import os
+import threading
+import time
 
-from .agents.graph_agent import build_graph
-from .agents.chatbot_graph import create_chatbot_graph, initialize_chat_state, create_session_id
-from .agents.chatbot_node import ChatbotNode
 from redis_monitor import RedisMonitor
 from scheduler import RedisScheduler
-from tools.weight_extraction_tool import weight_extraction_tool
-from tools.form_fill_tool import form_fill_tool, form_improve_tool
-from tools.form_edit_tool import form_edit_tool, form_status_check_tool
-from tools.form_improve_tool import form_improve_tool
-from .agents.application_evaluation_agent import evaluate_application
-from tools.speech_recognition_tool import speech_recognition_tool
-from tools.highlight_tool import highlight_resume_content
 # from tools.realtime_interview_evaluation_tool import realtime_interview_evaluation_tool, RealtimeInterviewEvaluationTool
 from dotenv import load_dotenv
 import uuid
 import os
 from fastapi import HTTPException
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_cache import get_cache_report
+from agent.utils.tracing import format_traceparent, get_trace, get_trace_metrics, span
 import json
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from fastapi import FastAPI, File, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
 import tempfile
 import os
-from tools.speech_recognition_tool import SpeechRecognitionTool
-from tools.realtime_interview_evaluation_tool import RealtimeInterviewEvaluationTool
-from tools.answer_grading_tool import grade_written_test_answer
+
+# 도구/그래프 모듈은 import 시점에 LangChain·Whisper·Chroma 등을 불러오고 LLM 클라이언트를 만들기 때문에
+# 엔드포인트 안에서 import 하고, 그래프는 get_graph_agent() / get_chatbot_graph() 로 첫 사용 시 만든다.
+# 서버는 바로 /health 에 응답하고, 자주 쓰는 구성요소는 startup 후 백그라운드 워밍업에서 미리 만든다.
 
 # Python 경로에 현재 디렉토리 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -51,8 +48,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["traceparent"],
 )
 
+# 요청마다 server span 시작 (백엔드가 보낸 traceparent 를 이어받아 그래프 노드/LLM span 의 부모가 됨)
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    route = _NUMERIC_SEGMENT.sub("/{id}", request.url.path)
+    with span(f"{request.method} {route}", kind="server", traceparent=request.headers.get("traceparent"),
+              **{"http.method": request.method, "http.route": route}) as server_span:
+        response = await call_next(request)
+        server_span.set(**{"http.status_code": response.status_code})
+        response.headers["traceparent"] = format_traceparent(server_span)
+        return response
+
 # Pydantic 모델 정의
 class HighlightResumeRequest(BaseModel):
     text: str
@@ -86,19 +98,95 @@ async def root():
         }
     }
 
-# OpenAI API 키가 있을 때만 그래프 초기화
-try:
-    if os.getenv("OPENAI_API_KEY"):
-        graph_agent = build_graph()
-        chatbot_graph = create_chatbot_graph()
-    else:
-        graph_agent = None
-        chatbot_graph = None
+# startup 후 백그라운드에서 미리 불러올 모듈 (/ai/route·폼 도구·서류 평가)
+WARM_UP_MODULES = (
+    ".agents.application_evaluation_agent",
+    "tools.weight_extraction_tool",
+    "tools.form_fill_tool",
+    "tools.form_edit_tool",
+    "tools.form_improve_tool",
+)
+
+# 지연 생성 구성요소 (이름별로 한 번만 생성, 실패하면 None)
+_components: Dict[str, Any] = {}
+_components_lock = threading.Lock()
+
+
+def _get_component(name: str, factory: Callable[[], Any]):
+    if name not in _components:
+        with _components_lock:
+            if name not in _components:
+                try:
+                    _components[name] = factory()
+                except Exception as e:
+                    print(f"Error initializing {name}: {e}")
+                    _components[name] = None
+    return _components[name]
+
+
+async def _aget_component(name: str, factory: Callable[[], Any]):
+    """async 엔드포인트용: 아직 만들어지지 않았으면 스레드풀에서 생성/대기 (워밍업 중에도 이벤트 루프와 /health 를 막지 않음)"""
+    if name in _components:
+        return _components[name]
+    return await run_in_threadpool(_get_component, name, factory)
+
+
+def _build_graph_agent():
+    # OpenAI API 키가 있을 때만 그래프 초기화
+    if not os.getenv("OPENAI_API_KEY"):
         print("Warning: OPENAI_API_KEY not found. Some features will be limited.")
-except Exception as e:
-    print(f"Error initializing agents: {e}")
-    graph_agent = None
-    chatbot_graph = None
+        return None
+    from .agents.graph_agent import build_graph
+    return build_graph()
+
+
+def _build_chatbot_graph():
+    if not os.getenv("OPENAI_API_KEY"):
+        return None
+    from .agents.chatbot_graph import create_chatbot_graph
+    return create_chatbot_graph()
+
+
+def get_graph_agent():
+    """/ai/route, /run/ 용 LangGraph 에이전트"""
+    return _get_component("graph_agent", _build_graph_agent)
+
+
+def get_chatbot_graph():
+    """/chat/ 용 챗봇 그래프"""
+    return _get_component("chatbot_graph", _build_chatbot_graph)
+
+
+async def aget_graph_agent():
+    return await _aget_component("graph_agent", _build_graph_agent)
+
+
+async def aget_chatbot_graph():
+    return await _aget_component("chatbot_graph", _build_chatbot_graph)
+
+
+def create_session_id() -> str:
+    # agents.chatbot_graph.create_session_id 와 같은 형식 (세션 생성만으로 챗봇 모듈을 불러오지 않도록)
+    return str(uuid.uuid4())
+
+
+def _warm_up():
+    """자주 쓰는 그래프/도구 모듈을 미리 불러온다 (Whisper 모델은 첫 음성 요청 때 로드)"""
+    started = time.perf_counter()
+    get_graph_agent()
+    get_chatbot_graph()
+    for module_name in WARM_UP_MODULES:
+        try:
+            importlib.import_module(module_name, __package__)
+        except Exception as e:
+            print(f"Warm-up import failed ({module_name}): {e}")
+    print(f"Agent warm-up completed in {time.perf_counter() - started:.1f}s")
+
+
+@app.on_event("startup")
+async def start_warm_up():
+    if os.getenv("AGENT_WARMUP", "1") != "0":
+        threading.Thread(target=_warm_up, name="agent-warm-up", daemon=True).start()
 
 # Redis 모니터링 시스템 초기화
 try:
@@ -171,6 +259,9 @@ async def run(request: Request):
         "job_posting": job_posting,
         "resume": resume
     }
+    graph_agent = await aget_graph_agent()
+    if graph_agent is None:
+        return {"error": "Graph agent not initialized"}
     result = graph_agent.invoke(state)
     if result is None:
         return {"error": "LangGraph returned None"}
@@ -195,6 +286,7 @@ async def chat(request: Request):
         session_id = create_session_id()
     
     # chatbot_graph가 초기화되지 않은 경우 기본 응답
+    chatbot_graph = await aget_chatbot_graph()
     if chatbot_graph is None:
         return {
             "session_id": session_id,
@@ -207,6 +299,7 @@ async def chat(request: Request):
         }
     
     # 챗봇 상태 초기화 (페이지 컨텍스트 포함)
+    from .agents.chatbot_graph import initialize_chat_state
     chat_state = initialize_chat_state(user_message, session_id, page_context)
     
     # 챗봇 그래프 실행
@@ -239,6 +332,7 @@ async def add_knowledge(request: Request):
         return {"error": "Documents are required"}
     
     try:
+        from .agents.chatbot_node import ChatbotNode
         chatbot_node = ChatbotNode()
         chatbot_node.add_knowledge(documents, metadata)
         return {"message": f"Added {len(documents)} documents to knowledge base"}
@@ -249,6 +343,7 @@ async def add_knowledge(request: Request):
 async def clear_conversation(session_id: str):
     """특정 세션의 대화 히스토리 삭제"""
     try:
+        from .agents.chatbot_node import ChatbotNode
         chatbot_node = ChatbotNode()
         chatbot_node.clear_conversation(session_id)
         return {"message": f"Cleared conversation history for session {session_id}"}
@@ -276,6 +371,36 @@ async def get_session_statistics():
         return {"error": "Redis monitor not initialized"}
     return redis_monitor.get_session_statistics()
 
+@app.get("/monitor/llm-gateway")
+async def get_llm_gateway_stats():
+    """LLM 게이트웨이 도구별 호출/토큰/지연시간 통계"""
+    from agent.utils.llm_gateway import get_llm_stats
+    return get_llm_stats()
+
+@app.get("/monitor/intent-router")
+async def get_intent_router_report():
+    """/ai/route 로컬 의도 라우터 경로별 건수/LLM fallback 비율/정확도(audit) 통계"""
+    from agent.utils.intent_router import get_intent_router_stats
+    return get_intent_router_stats()
+
+@app.get("/monitor/llm-cache")
+async def get_llm_cache_report():
+    """LLM 결과 캐시 namespace 별 hit/miss/bytes 통계"""
+    return get_cache_report()
+
+@app.get("/metrics")
+async def get_metrics():
+    """요청 / 그래프 / 노드 / 도구 / LLM span 이름별 p50·p95 지연시간과 토큰·캐시 집계"""
+    return get_trace_metrics()
+
+@app.get("/traces/{trace_id}")
+async def get_trace_spans(trace_id: str):
+    """최근 span 중 한 trace 에 속한 것 (응답 traceparent 헤더의 trace_id 로 조회)"""
+    spans = get_trace(trace_id)
+    if not spans:
+        raise HTTPException(status_code=404, detail="trace 를 찾을 수 없습니다 (이미 밀려났거나 잘못된 id)")
+    return {"trace_id": trace_id, "spans": spans}
+
 @app.post("/monitor/cleanup")
 async def cleanup_sessions():
     """만료된 세션 정리"""
@@ -426,6 +551,7 @@ async def extract_weights(request: Request):
     
     try:
         state = {"job_posting": job_posting_content}
+        from tools.weight_extraction_tool import weight_extraction_tool
         result = weight_extraction_tool(state)
         weights = result.get("weights", [])
         
@@ -467,6 +593,7 @@ async def evaluate_application_api(request: Request):
             "confidence": 0.0
         }
         
+        from .agents.application_evaluation_agent import evaluate_application
         result = evaluate_application(job_posting, spec_data, resume_data, weight_data)
         
         return {
@@ -507,6 +634,7 @@ async def ai_form_fill(request: Request):
             "description": description,
             "current_form_data": current_form_data
         }
+        from tools.form_fill_tool import form_fill_tool
         result = form_fill_tool(state)
         return result
     except Exception as e:
@@ -525,6 +653,7 @@ async def ai_form_improve(request: Request):
         state = {
             "current_form_data": current_form_data
         }
+        from tools.form_improve_tool import form_improve_tool
         result = form_improve_tool(state)
         return result
     except Exception as e:
@@ -547,6 +676,7 @@ async def ai_form_field_update(request: Request):
             "new_value": new_value,
             "current_form_data": current_form_data
         }
+        from tools.form_edit_tool import form_edit_tool
         result = form_edit_tool(state)
         return result
     except Exception as e:
@@ -562,6 +692,7 @@ async def ai_form_status_check(request: Request):
         state = {
             "current_form_data": current_form_data
         }
+        from tools.form_edit_tool import form_status_check_tool
         result = form_status_check_tool(state)
         return result
     except Exception as e:
@@ -586,6 +717,7 @@ async def ai_field_improve(request: Request):
             "user_request": user_request,
             "form_context": form_context
         }
+        from tools.form_improve_tool import form_improve_tool
         result = form_improve_tool(state)
         return result
     except Exception as e:
@@ -593,7 +725,7 @@ async def ai_field_improve(request: Request):
 
 @app.post("/ai/route")
 async def ai_route(request: Request):
-    """LLM 기반 라우팅 - 사용자 의도를 분석하여 적절한 도구로 분기"""
+    """의도 라우팅 - 로컬 의도 라우터로 먼저 분기하고 애매한 경우만 LLM 분석"""
     data = await request.json()
     message = data.get("message", "")
     current_form_data = data.get("current_form_data", {})
@@ -615,6 +747,7 @@ async def ai_route(request: Request):
         }
         
         # 그래프가 초기화되지 않은 경우
+        graph_agent = await aget_graph_agent()
         if graph_agent is None:
             return {"error": "Graph agent not initialized"}
         
@@ -712,7 +845,8 @@ async def suggest_questions(request: Request):
     ["지원자 목록 보여줘", "경력 우대 조건 추가", "면접 일정 추천해줘", "폼 개선 제안"]
     """
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.5)
+    from agent.utils.llm_gateway import get_llm
+    llm = get_llm(model="gpt-4o-mini", temperature=0.5, tool="suggest_questions", priority="interactive")
     try:
         response = llm.invoke(prompt)
         text = response.content.strip()
@@ -742,6 +876,7 @@ async def speech_recognition_api(request: Request):
             "audio_file_path": audio_file_path
         }
         
+        from tools.speech_recognition_tool import speech_recognition_tool
         result = speech_recognition_tool(state)
         
         return {
@@ -845,6 +980,10 @@ async def evaluate_audio(
         tmp_path = tmp.name
 
     try:
+        from tools.speech_recognition_tool import SpeechRecognitionTool
+        from tools.realtime_interview_evaluation_tool import RealtimeInterviewEvaluationTool
+        from tools.answer_grading_tool import grade_written_test_answer
+
         # 2. 오디오→텍스트(STT)
         speech_tool = SpeechRecognitionTool()
         trans_result = speech_tool.transcribe_audio(tmp_path)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+하이라이트 전환어/감정 사전 필터 벤치마크
+
+실제 자기소개서 말뭉치로 기존 방식(문장마다 패턴 목록을 순서대로 re.search)과
+결합 매처 방식(annotate_document: 문서 1회 스캔 + 문장별 주석)의 시간을 비교하고,
+두 방식의 문장별 판정(전환어 여부 / 감정 / 전환어 앞뒤 문맥)이 같은지도 확인한다.
+
+말뭉치 형식 (여러 개 지정 가능):
+- 시드 데이터 JSON (data/resume.json: [{"self_introduction": [...]}, ...])
+- resume.content 를 내보낸 JSON ([{"content": "..."}, ...]) 또는 문자열 목록
+- .txt 파일 또는 .txt 파일이 들어 있는 디렉토리 (파일 하나 = 자기소개서 하나)
+
+    cd <repo root> && python -m agent.scripts.benchmark_highlight_prefilter --corpus data/resume.json --repeat 5
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, List
+
+from agent.utils.transition_sentiment import (
+    CONTEXT_TRANSITION_PATTERNS,
+    NEGATIVE_PATTERNS,
+    POSITIVE_PATTERNS,
+    TRANSITION_PATTERNS,
+    DocumentAnnotation,
+)
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "..", "..", "data", "resume.json")
+
+
+# ---------------------------------------------------------------------------
+# 기존 방식 (highlight_workflow 의 이전 구현과 같은 알고리즘)
+# ---------------------------------------------------------------------------
+
+def legacy_sentiment(text: str) -> str:
+    if not text or len(text.strip()) < 2:
+        return 'neutral'
+    positive = sum(1 for pattern in POSITIVE_PATTERNS if re.search(pattern, text, re.IGNORECASE))
+    negative = sum(1 for pattern in NEGATIVE_PATTERNS if re.search(pattern, text, re.IGNORECASE))
+    if positive > negative and positive > 0:
+        return 'positive'
+    elif negative > positive and negative > 0:
+        return 'negative'
+    return 'neutral'
+
+
+def legacy_context(sentence: str):
+    for pattern in CONTEXT_TRANSITION_PATTERNS:
+        match = re.search(pattern, sentence, re.IGNORECASE)
+        if match:
+            before_text = sentence[:match.start()].strip()
+            after_text = sentence[match.end():].strip()
+            if before_text and after_text:
+                return match.group(), legacy_sentiment(before_text), legacy_sentiment(after_text)
+    return None
+
+
+def legacy_annotate(text: str) -> List[tuple]:
+    result = []
+    for sentence in re.split(r'[.!?]\s+', text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        is_transition = any(re.search(pattern, sentence, re.IGNORECASE) for pattern in TRANSITION_PATTERNS)
+        context = legacy_context(sentence) if is_transition else None
+        result.append((sentence, is_transition, legacy_sentiment(sentence), context))
+    return result
+
+
+def combined_annotate(text: str) -> List[tuple]:
+    result = []
+    for annotation in DocumentAnnotation(text).sentences:
+        context = annotation.context
+        result.append((
+            annotation.text,
+            annotation.is_transition,
+            annotation.sentiment,
+            (context['transition_word'], context['before_sentiment'], context['after_sentiment'])
+            if context['has_context_change'] else None,
+        ))
+    return result
+
+
+# ---------------------------------------------------------------------------
+# 말뭉치 로드
+# ---------------------------------------------------------------------------
+
+def _flatten(value: Any) -> str:
+    """self_introduction 항목(문자열 / {question, answer} dict / 중첩 목록) → 본문 텍스트"""
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped[:1] in "[{":
+            try:
+                return _flatten(json.loads(stripped))
+            except ValueError:
+                pass
+        return value
+    if isinstance(value, dict):
+        for key in ("self_introduction", "content", "answer", "text"):
+            if key in value:
+                return _flatten(value[key])
+        return "\n".join(_flatten(item) for item in value.values() if isinstance(item, (str, list, dict)))
+    if isinstance(value, list):
+        return "\n\n".join(text for text in (_flatten(item) for item in value) if text)
+    return ""
+
+
+def load_corpus(paths: List[str]) -> List[str]:
+    documents = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".txt"):
+                    with open(os.path.join(path, name), encoding="utf-8") as f:
+                        documents.append(f.read())
+        elif path.endswith(".txt"):
+            with open(path, encoding="utf-8") as f:
+                documents.append(f.read())
+        else:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            items = data if isinstance(data, list) else [data]
+            documents.extend(_flatten(item) for item in items)
+    return [document for document in documents if document.strip()]
+
+
+def timed(function, documents: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for document in documents:
+            function(document)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="하이라이트 전환어/감정 사전 필터 벤치마크")
+    parser.add_argument("--corpus", nargs="+", default=[DEFAULT_CORPUS])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    missing = [path for path in args.corpus if not os.path.exists(path)]
+    if missing:
+        print(f"말뭉치 파일이 없습니다: {missing}")
+        sys.exit(1)
+    documents = load_corpus(args.corpus)
+    if not documents:
+        print("말뭉치에 자기소개서가 없습니다.")
+        sys.exit(1)
+
+    mismatches = 0
+    sentence_count = 0
+    for document in documents:
+        legacy, combined = legacy_annotate(document), combined_annotate(document)
+        sentence_count += len(legacy)
+        mismatches += sum(1 for left, right in zip(legacy, combined) if left != right) + abs(len(legacy) - len(combined))
+
+    characters = sum(len(document) for document in documents)
+    print(f"자기소개서 {len(documents)}건, 문장 {sentence_count}개, 평균 {characters / len(documents):.0f}자")
+    print(f"판정 불일치 문장: {mismatches}")
+
+    legacy_seconds = timed(legacy_annotate, documents, args.repeat)
+    combined_seconds = timed(DocumentAnnotation, documents, args.repeat)
+    for label, seconds in (("기존 (문장별 re.search)", legacy_seconds), ("결합 매처 (문서 1회 스캔)", combined_seconds)):
+        print(
+            f"{label:<24} {seconds * 1000:9.1f}ms  "
+            f"{seconds / len(documents) * 1e6:8.0f}us/건  "
+            f"{seconds / max(sentence_count, 1) * 1e6:6.1f}us/문장"
+        )
+    print(f"속도 향상: {legacy_seconds / combined_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
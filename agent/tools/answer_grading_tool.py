@@ -1,7 +1,6 @@
 from langchain.tools import tool
-import os
 import re
-from openai import OpenAI
+from agent.utils.llm_gateway import get_llm
 
 @tool("grade_written_test_answer", return_direct=True)
 def grade_written_test_answer(question: str, answer: str) -> dict:
@@ -27,12 +26,8 @@ def grade_written_test_answer(question: str, answer: str) -> dict:
     이유: 답변이 일부 맞으나 구체성이 부족함
     """
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}]
-        )
-        ai_response = response.choices[0].message.content
+        llm = get_llm(model="gpt-3.5-turbo", tool="answer_grading_tool")
+        ai_response = llm.invoke(prompt).content
         score_match = re.search(r"점수\s*[:：]\s*([0-9]+(\.[0-9]+)?)", ai_response)
         feedback_match = re.search(r"이유\s*[:：]\s*(.*)", ai_response)
         score = float(score_match.group(1)) if score_match else None
@@ -1,4 +1,4 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 import json
 from agent.utils.llm_cache import redis_cache
 
@@ -14,7 +14,7 @@ def application_decision_tool(state):
     # 기본 합격 기준: 70점 이상
     PASS_THRESHOLD = 70
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.1, tool="application_decision_tool")
     
     prompt = f"""
     아래의 정보를 바탕으로 지원자의 최종 서류 합격/불합격을 판별해주세요.
@@ -1,6 +1,6 @@
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from dotenv import load_dotenv
 import os
 from typing import Optional, Dict, Any, List
@@ -79,7 +79,7 @@ except ImportError as e:
 
 load_dotenv()
 
-llm = ChatOpenAI(model="gpt-4o-mini")
+llm = get_llm(model="gpt-4o-mini", tool="competitiveness_comparison_tool")
 
 def get_job_applicants_data(job_post_id: int, db: Session, current_application_id: Optional[int] = None, limit: int = 10) -> List[Dict]:
     """해당 공고의 지원자 데이터를 가져오는 함수"""
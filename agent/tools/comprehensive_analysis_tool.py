@@ -1,6 +1,6 @@
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from dotenv import load_dotenv
 import os
 from typing import Optional, Dict, Any, List
@@ -28,7 +28,7 @@ from agent.utils.resume_utils import combine_resume_and_specs
 
 load_dotenv()
 
-llm = ChatOpenAI(model="gpt-4o")
+llm = get_llm(model="gpt-4o", tool="comprehensive_analysis_tool")
 
 def parse_job_post_data(job_post: JobPost) -> str:
     """JobPost 데이터를 파싱하여 직무 정보 텍스트 생성"""
@@ -1,6 +1,6 @@
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from dotenv import load_dotenv
 import os
 from typing import Optional, Dict, Any, List
@@ -10,7 +10,7 @@ from agent.utils.llm_cache import redis_cache
 
 load_dotenv()
 
-llm = ChatOpenAI(model="gpt-4o")
+llm = get_llm(model="gpt-4o", tool="detailed_analysis_tool")
 
 def analyze_experience_depth_breadth(resume_text: str) -> Dict[str, Any]:
     """경험의 깊이와 폭을 객관적으로 분석"""
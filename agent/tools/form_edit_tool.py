@@ -1,4 +1,4 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 import json
 
 def form_edit_tool(state):
@@ -12,7 +12,7 @@ def form_edit_tool(state):
     
     # field_name과 new_value가 없으면 메시지에서 추출
     if not field_name or not new_value:
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.1)
+        llm = get_llm(model="gpt-4o", temperature=0.1, tool="form_edit_tool", priority="interactive")
         
         extract_prompt = f"""
         사용자의 메시지에서 수정하려는 필드명과 새로운 값을 추출해주세요.
@@ -133,7 +133,7 @@ def form_status_check_tool(state):
     if not current_form_data:
         return {**state, "status": "폼 데이터가 없습니다."}
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="form_edit_tool", priority="interactive")
     
     prompt = f"""
     아래의 채용공고 폼 데이터를 분석하여 현재 상태를 요약해주세요.
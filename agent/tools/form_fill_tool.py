@@ -1,4 +1,4 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 import json
 from datetime import datetime, timedelta
 
@@ -18,7 +18,7 @@ def form_fill_tool(state):
         print("설명이 제공되지 않음")
         return {**state, "form_data": current_form_data, "message": "설명이 제공되지 않았습니다."}
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="form_fill_tool", priority="interactive")
     
     # 현재 날짜 기준으로 모집 기간과 면접 일정 설정
     current_date = datetime.now()
@@ -347,7 +347,7 @@ def form_improve_tool(state):
             target_field = english_name
             break
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="form_fill_tool", priority="interactive")
     
     # 특정 필드 개선 요청인 경우
     if target_field:
@@ -1,4 +1,4 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 
 def form_improve_tool(state):
     """
@@ -12,7 +12,7 @@ def form_improve_tool(state):
     if not field_name:
         return {**state, "improved_content": current_content, "message": "필드명이 필요합니다."}
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="form_improve_tool", priority="interactive")
     
     # 필드별 개선 프롬프트
     field_prompts = {
@@ -1,6 +1,6 @@
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from dotenv import load_dotenv
 import os
 from typing import Optional, Dict, Any, List
@@ -10,7 +10,7 @@ from agent.utils.llm_cache import redis_cache
 
 load_dotenv()
 
-llm = ChatOpenAI(model="gpt-4o-mini")
+llm = get_llm(model="gpt-4o-mini", tool="keyword_matching_tool")
 
 # 키워드 매칭 분석 프롬프트
 keyword_matching_prompt = PromptTemplate.from_template(
@@ -1,4 +1,4 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 import json
 from agent.utils.llm_cache import redis_cache
 
@@ -16,7 +16,7 @@ def pass_reason_tool(state):
     if ai_score == 0:
         return {**state, "pass_reason": ""}
     
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="pass_reason_tool")
     
     # prompt = f"""
     # 아래의 정보를 바탕으로 지원자의 합격 이유를 작성해주세요.
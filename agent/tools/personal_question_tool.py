@@ -5,17 +5,18 @@
 
 import json
 from typing import Dict, List, Any
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from dotenv import load_dotenv
 import os
 
 load_dotenv()
 
 # LLM 초기화
-llm = ChatOpenAI(
+llm = get_llm(
     model="gpt-4o-mini",
     temperature=0.7,
-    api_key=os.getenv("OPENAI_API_KEY")
+    api_key=os.getenv("OPENAI_API_KEY"),
+    tool="personal_question_tool"
 )
 
 
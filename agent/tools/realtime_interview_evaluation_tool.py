@@ -1,23 +1,28 @@
-import whisper
-import torch
 import numpy as np
 from typing import Dict, List, Any, Optional
 import json
-import tempfile
-import os
 from datetime import datetime
 import logging
 from .speech_recognition_tool import SpeechRecognitionTool
 from .speaker_diarization_tool import SpeakerDiarizationTool
+from .streaming_transcription import StreamingTranscriber, decode_audio_bytes, SAMPLE_RATE
 
 class RealtimeInterviewEvaluationTool:
     def __init__(self):
         """실시간 면접 평가 도구 초기화"""
         self.speech_tool = SpeechRecognitionTool()
         self.diarization_tool = SpeakerDiarizationTool()
+        self._transcriber = None
         self.evaluation_history = []
         self.current_session = None
         
+    @property
+    def transcriber(self) -> StreamingTranscriber:
+        # Whisper 모델이 필요한 시점(세션 시작/첫 청크)에 만든다
+        if self._transcriber is None:
+            self._transcriber = StreamingTranscriber(self.speech_tool.model)
+        return self._transcriber
+
     def initialize_session(self, session_id: str, participants: List[Dict]) -> bool:
         """면접 세션 초기화
         
@@ -34,6 +39,7 @@ class RealtimeInterviewEvaluationTool:
                 "speaker_notes": {},
                 "real_time_transcript": []
             }
+            self.transcriber.reset()
             
             # 화자 분리 파이프라인 초기화
             self.diarization_tool.initialize_pipeline()
@@ -46,10 +52,13 @@ class RealtimeInterviewEvaluationTool:
             return False
     
     def process_audio_chunk(self, audio_chunk: bytes, timestamp: float) -> Dict[str, Any]:
-        """실시간 오디오 청크 처리
+        """실시간 오디오 청크 처리 (스트리밍 전사)
+        
+        청크를 메모리 상의 슬라이딩 윈도우에 이어 붙이고, VAD 로 끊긴 발화 구간만
+        디코딩한다. 발화 진행 중에는 partial, 발화가 끝나면 final 전사를 반환한다.
         
         Args:
-            audio_chunk: 오디오 데이터
+            audio_chunk: 오디오 데이터 (WAV 등 컨테이너 또는 16kHz mono PCM16)
             timestamp: 타임스탬프
         
         Returns:
@@ -66,78 +75,91 @@ class RealtimeInterviewEvaluationTool:
                     "speaker_notes": {},
                     "real_time_transcript": []
                 }
+                self.transcriber.reset()
                 logging.info("기본 세션 자동 생성")
             
-            # 임시 파일에 오디오 저장
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(audio_chunk)
-                temp_audio_path = temp_file.name
-            
-            # 음성 인식 (실제 Whisper 모델 사용)
+            # 스트리밍 음성 인식 (partial/final 이벤트)
             try:
-                logging.info(f"음성 인식 시작: {temp_audio_path}")
-                transcription_result = self.speech_tool.transcribe_audio(temp_audio_path)
-                logging.info(f"음성 인식 결과: {transcription_result.get('text', '')}")
+                audio = decode_audio_bytes(audio_chunk)
+                events = self.transcriber.feed(audio)
             except Exception as e:
                 logging.error(f"음성 인식 실패: {e}")
-                transcription_result = {"text": f"음성 인식 오류: {str(e)}", "success": False}
+                return {
+                    "timestamp": timestamp,
+                    "transcription": {"text": f"음성 인식 오류: {str(e)}", "success": False},
+                    "diarization": {"current_speaker": "unknown", "confidence": 0.0, "error": str(e)},
+                    "evaluation": {"score": 0, "feedback": [f"평가 오류: {str(e)}"], "success": False},
+                    "success": False
+                }
             
-            # 화자 분리 (실시간 버전)
+            return self._handle_transcription_events(events, timestamp)
+            
+        except Exception as e:
+            logging.error(f"실시간 오디오 처리 실패: {e}")
+            return {"error": str(e), "success": False}
+    
+    def flush_audio(self, timestamp: float) -> Dict[str, Any]:
+        """진행 중인 발화를 final 로 확정 (세션 종료 직전 호출)"""
+        return self._handle_transcription_events(self.transcriber.flush(), timestamp)
+    
+    def _handle_transcription_events(self, events: List[Dict[str, Any]], timestamp: float) -> Dict[str, Any]:
+        """전사 이벤트를 화자 식별/평가 결과로 변환하고 세션 데이터 갱신"""
+        finals = [event for event in events if event["type"] == "final"]
+        partials = [event for event in events if event["type"] == "partial"]
+        final_text = " ".join(event["text"] for event in finals).strip()
+        
+        transcription_result = {
+            "text": final_text,
+            "partial": partials[-1]["text"] if partials else "",
+            "segments": events,
+            "success": True
+        }
+        
+        # 화자 분리 / 평가는 확정된 발화에 대해서만 수행
+        if finals:
             try:
-                logging.info("화자 분리 시작")
-                diarization_result = self._process_realtime_diarization(temp_audio_path, timestamp)
-                logging.info(f"화자 분리 결과: {diarization_result.get('current_speaker', 'unknown')}")
+                diarization_result = self._process_realtime_diarization(self.transcriber.last_segment_audio, timestamp)
             except Exception as e:
                 logging.error(f"화자 분리 실패: {e}")
                 diarization_result = {"current_speaker": "unknown", "confidence": 0.0, "error": str(e)}
             
-            # 실시간 평가
             try:
-                logging.info("실시간 평가 시작")
                 evaluation_result = self._evaluate_realtime_content(
-                    transcription_result.get("text", ""),
+                    final_text,
                     diarization_result.get("current_speaker", "unknown"),
                     timestamp
                 )
-                logging.info(f"평가 결과: {evaluation_result.get('score', 0)}점")
             except Exception as e:
                 logging.error(f"평가 실패: {e}")
                 evaluation_result = {"score": 0, "feedback": [f"평가 오류: {str(e)}"], "success": False}
-            
-            # 결과 저장
-            result = {
-                "timestamp": timestamp,
-                "transcription": transcription_result,
-                "diarization": diarization_result,
-                "evaluation": evaluation_result,
-                "success": True
-            }
-            
+        else:
+            diarization_result = {"current_speaker": "unknown", "confidence": 0.0}
+            evaluation_result = {"score": 0, "feedback": [], "success": False}
+        
+        result = {
+            "timestamp": timestamp,
+            "transcription": transcription_result,
+            "diarization": diarization_result,
+            "evaluation": evaluation_result,
+            "success": True
+        }
+        
+        if finals:
             self._update_session_data(result)
-            
-            # 임시 파일 삭제
-            try:
-                os.unlink(temp_audio_path)
-            except Exception as e:
-                logging.warning(f"임시 파일 삭제 실패: {e}")
-            
-            logging.info("오디오 청크 처리 완료")
-            return result
-            
-        except Exception as e:
-            logging.error(f"실시간 오디오 처리 실패: {e}")
-            return {"error": str(e), "success": False}
+        
+        return result
     
-    def _process_realtime_diarization(self, audio_path: str, timestamp: float) -> Dict[str, Any]:
-        """실시간 화자 분리 처리"""
+    def _process_realtime_diarization(self, audio: np.ndarray, timestamp: float) -> Dict[str, Any]:
+        """실시간 화자 분리 처리 (확정된 발화 구간 오디오 사용)"""
         try:
             # 간단한 실시간 화자 분리 (음성 특성 기반)
             # 실제 구현에서는 더 정교한 방법 사용
-            y, sr = self.speech_tool.model.transcribe(audio_path)
+            if len(audio) == 0:
+                return {"current_speaker": "unknown", "confidence": 0.0}
             
             # 음성 특성 분석
-            volume = np.mean(np.abs(y))
-            pitch = self._extract_pitch(y, sr)
+            volume = np.mean(np.abs(audio))
+            pitch = self._extract_pitch(audio, SAMPLE_RATE)
             
             # 화자 구분 (간단한 휴리스틱)
             current_speaker = self._identify_speaker(volume, pitch, timestamp)
@@ -301,6 +323,9 @@ class RealtimeInterviewEvaluationTool:
             return {"error": "세션이 없습니다", "success": False}
         
         try:
+            # 마지막 발화 확정
+            self.flush_audio(datetime.now().timestamp())
+            
             summary = self.get_session_summary()
             final_result = {
                 "session_summary": summary,
@@ -312,6 +337,7 @@ class RealtimeInterviewEvaluationTool:
             
             # 세션 초기화
             self.current_session = None
+            self.transcriber.reset()
             
             return final_result
             
@@ -1,8 +1,8 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 import json
 from agent.utils.llm_cache import redis_cache
 
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="resume_scoring_tool")
 
 @redis_cache()
 def resume_scoring_tool(state):
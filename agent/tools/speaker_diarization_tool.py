@@ -1,7 +1,3 @@
-import torch
-import torchaudio
-from pyannote.audio import Pipeline
-from pyannote.audio.pipelines.utils.hook import ProgressHook
 import numpy as np
 from typing import Dict, List, Any, Optional
 import os
@@ -20,6 +16,10 @@ class SpeakerDiarizationTool:
     def initialize_pipeline(self, auth_token: str = None):
         """pyannote.audio 파이프라인 초기화"""
         try:
+            # pyannote/torch 는 파이프라인을 처음 만들 때 import
+            import torch
+            from pyannote.audio import Pipeline
+
             # HuggingFace 토큰이 있으면 사용, 없으면 로컬 모델 사용
             if auth_token:
                 self.pipeline = Pipeline.from_pretrained(
@@ -57,6 +57,7 @@ class SpeakerDiarizationTool:
                 return {"error": "파이프라인이 초기화되지 않았습니다", "success": False}
             
             # 화자 분리 수행
+            from pyannote.audio.pipelines.utils.hook import ProgressHook
             with ProgressHook() as hook:
                 diarization = self.pipeline(audio_file_path, hook=hook)
             
@@ -1,21 +1,39 @@
-import whisper
-import torch
-import torchaudio
-import librosa
-import soundfile as sf
 from pydub import AudioSegment
 import numpy as np
 from typing import Dict, List, Any, Optional
 import os
 import tempfile
 import json
+import threading
 from datetime import datetime
 
+WHISPER_MODEL_NAME = "base"
+
+# whisper(torch) import 와 모델 로드는 수 초가 걸리므로 첫 음성 요청 때 한 번만 하고 도구 인스턴스끼리 공유
+_whisper_models: Dict[str, Any] = {}
+_whisper_lock = threading.Lock()
+
+
+def get_whisper_model(name: str = WHISPER_MODEL_NAME):
+    """프로세스 공용 Whisper 모델 (첫 호출 시 로드)"""
+    model = _whisper_models.get(name)
+    if model is None:
+        with _whisper_lock:
+            model = _whisper_models.get(name)
+            if model is None:
+                import whisper
+                model = _whisper_models[name] = whisper.load_model(name)
+    return model
+
+
 class SpeechRecognitionTool:
     def __init__(self):
-        """도구 초기화"""
-        self.model = whisper.load_model("base")
+        """도구 초기화 (모델은 처음 사용할 때 로드)"""
         self.sample_rate = 16000
+
+    @property
+    def model(self):
+        return get_whisper_model()
     
     def transcribe_audio(self, audio_file_path: str) -> Dict[str, Any]:
         """MP3 파일을 텍스트로 변환
@@ -64,6 +82,7 @@ class SpeechRecognitionTool:
         """
         try:
             # 오디오 로드
+            import librosa
             y, sr = librosa.load(audio_file_path, sr=self.sample_rate)
             
             # 간단한 화자 분리 (음성 특성 기반)
@@ -1,4 +1,4 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 import json
 import re
 
@@ -36,7 +36,7 @@ def spell_check_tool(state):
                 "errors": []
             }
     try:
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+        llm = get_llm(model="gpt-4o-mini", temperature=0.1, tool="spell_check_tool", priority="interactive")
         prompt = f"""
         아래의 한국어 텍스트에서 맞춤법상 명백한 오류(띄어쓰기, 철자, 조사, 어미, 오타 등)만 간단명료하게 짚어주세요.
         - 오류가 있는 부분만 원본과 수정안을 한 줄씩 나란히 보여주세요.
@@ -0,0 +1,204 @@
+import io
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import soundfile as sf
+
+
+SAMPLE_RATE = 16000  # whisper.audio.SAMPLE_RATE (whisper 는 디코딩할 때 import)
+FRAME_MS = 30
+
+
+def decode_audio_bytes(audio_chunk: bytes, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """오디오 청크 바이트 → 16kHz mono float32 배열
+
+    - WAV/FLAC 등 soundfile 이 읽을 수 있는 컨테이너는 헤더를 해석해서 변환
+    - 그 외 컨테이너(webm, mp3 등)는 pydub(ffmpeg)로 변환
+    - 헤더 없는 바이트는 16kHz mono PCM16 으로 간주
+    """
+    if not audio_chunk:
+        return np.zeros(0, dtype=np.float32)
+
+    if audio_chunk[:4] in (b"RIFF", b"fLaC", b"OggS"):
+        audio, sr = sf.read(io.BytesIO(audio_chunk), dtype="float32", always_2d=True)
+        audio = audio.mean(axis=1)
+        if sr != sample_rate:
+            import librosa
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=sample_rate)
+        return audio.astype(np.float32)
+
+    if audio_chunk[:4] == b"\x1aE\xdf\xa3" or audio_chunk[:3] == b"ID3":
+        from pydub import AudioSegment
+        segment = AudioSegment.from_file(io.BytesIO(audio_chunk))
+        segment = segment.set_frame_rate(sample_rate).set_channels(1).set_sample_width(2)
+        return np.frombuffer(segment.raw_data, dtype=np.int16).astype(np.float32) / 32768.0
+
+    usable = len(audio_chunk) - (len(audio_chunk) % 2)
+    return np.frombuffer(audio_chunk[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+
+
+class StreamingTranscriber:
+    """슬라이딩 윈도우 기반 스트리밍 Whisper 전사기
+
+    청크마다 전체 오디오를 다시 인식하지 않고, 에너지 기반 VAD 로 발화 구간을 나눈 뒤
+    - 발화 진행 중에는 일정 간격(partial_interval)마다 현재 구간만 디코딩해 partial 결과를,
+    - 발화가 끝나면(무음 min_silence 이상 또는 구간 길이 max_segment 초과) final 결과를
+    내보낸다. final 디코딩에는 직전 구간 텍스트를 prompt 로 넘겨 문맥을 이어간다.
+
+    Whisper 인코더는 항상 30초 mel 을 입력으로 받으므로 디코딩 1회 비용은 일정하고,
+    청크당 디코딩 횟수가 제한되어 청크 크기와 관계없이 처리 비용이 일정하다.
+    """
+
+    def __init__(
+        self,
+        model,
+        language: str = "ko",
+        partial_interval: float = 1.0,
+        min_silence: float = 0.6,
+        min_speech: float = 0.3,
+        max_segment: float = 15.0,
+        prompt_chars: int = 200,
+    ):
+        self.model = model
+        self.language = language
+        self.partial_interval = partial_interval
+        self.min_silence = min_silence
+        self.min_speech = min_speech
+        self.max_segment = max_segment
+        self.prompt_chars = prompt_chars
+        self.frame_size = SAMPLE_RATE * FRAME_MS // 1000
+        self.reset()
+
+    def reset(self):
+        """스트림 상태 초기화"""
+        self._window = np.zeros(0, dtype=np.float32)  # 아직 확정되지 않은 오디오 (현재 발화 + 미처리 꼬리)
+        self._window_offset = 0                       # 스트림 시작 기준 window[0] 의 샘플 위치
+        self._pending_tail = np.zeros(0, dtype=np.float32)  # 프레임 단위로 나누고 남은 샘플
+        self._segment_start: Optional[int] = None     # 현재 발화 시작 (스트림 샘플 위치)
+        self._silence_frames = 0
+        self._samples_since_partial = 0
+        self._noise_floor = 1e-3
+        self._segment_id = 0
+        self._context = ""
+        self.last_segment_audio = np.zeros(0, dtype=np.float32)
+
+    @property
+    def stream_seconds(self) -> float:
+        return (self._window_offset + len(self._window)) / SAMPLE_RATE
+
+    def feed(self, audio: np.ndarray) -> List[Dict[str, Any]]:
+        """오디오 샘플을 추가하고 새로 확정된 partial/final 이벤트 반환"""
+        events: List[Dict[str, Any]] = []
+        audio = np.concatenate([self._pending_tail, audio.astype(np.float32)])
+        usable = len(audio) - (len(audio) % self.frame_size)
+        self._pending_tail = audio[usable:]
+
+        base_pos = self._window_offset + len(self._window)
+        self._window = np.concatenate([self._window, audio[:usable]])
+        for start in range(0, usable, self.frame_size):
+            frame = audio[start:start + self.frame_size]
+            event = self._process_frame(frame, base_pos + start)
+            if event:
+                events.append(event)
+
+        if self._segment_start is not None and self._samples_since_partial >= self.partial_interval * SAMPLE_RATE:
+            self._samples_since_partial = 0
+            partial = self._decode(self._segment_audio(), final=False)
+            if partial:
+                events.append(self._event("partial", partial, self._segment_start, self._window_offset + len(self._window)))
+        return events
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """스트림 종료 시 진행 중인 발화를 final 로 확정"""
+        if self._segment_start is None:
+            return []
+        event = self._finalize(self._window_offset + len(self._window))
+        return [event] if event else []
+
+    def _process_frame(self, frame: np.ndarray, frame_pos: int) -> Optional[Dict[str, Any]]:
+        rms = float(np.sqrt(np.mean(frame * frame)) + 1e-9)
+        is_speech = rms > max(self._noise_floor * 3.0, 0.01)
+        if not is_speech:
+            # 무음 구간으로 노이즈 레벨 추정 (천천히 추종)
+            self._noise_floor = 0.95 * self._noise_floor + 0.05 * rms
+
+        if self._segment_start is None:
+            if is_speech:
+                self._segment_start = frame_pos
+                self._silence_frames = 0
+                self._samples_since_partial = len(frame)
+            else:
+                # 발화 밖의 무음은 버려서 윈도우가 커지지 않도록 유지
+                self._drop_until(frame_pos + len(frame))
+            return None
+
+        self._samples_since_partial += len(frame)
+        self._silence_frames = 0 if is_speech else self._silence_frames + 1
+        segment_end = frame_pos + len(frame)
+        silence_seconds = self._silence_frames * FRAME_MS / 1000
+        segment_seconds = (segment_end - self._segment_start) / SAMPLE_RATE
+
+        if silence_seconds >= self.min_silence or segment_seconds >= self.max_segment:
+            return self._finalize(segment_end)
+        return None
+
+    def _finalize(self, segment_end: int) -> Optional[Dict[str, Any]]:
+        segment_start = self._segment_start
+        audio = self._window[segment_start - self._window_offset:segment_end - self._window_offset]
+        self._segment_start = None
+        self._silence_frames = 0
+        self._samples_since_partial = 0
+        self._drop_until(segment_end)
+
+        speech_seconds = len(audio) / SAMPLE_RATE
+        if speech_seconds < self.min_speech:
+            return None
+
+        self.last_segment_audio = audio
+        text = self._decode(audio, final=True)
+        if not text:
+            return None
+        self._context = (self._context + " " + text).strip()[-self.prompt_chars:]
+        event = self._event("final", text, segment_start, segment_end)
+        self._segment_id += 1
+        return event
+
+    def _segment_audio(self) -> np.ndarray:
+        return self._window[self._segment_start - self._window_offset:]
+
+    def _drop_until(self, stream_pos: int):
+        cut = stream_pos - self._window_offset
+        if cut > 0:
+            self._window = self._window[cut:]
+            self._window_offset = stream_pos
+
+    def _decode(self, audio: np.ndarray, final: bool) -> str:
+        if len(audio) == 0:
+            return ""
+        try:
+            import whisper
+            mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio)).to(self.model.device)
+            options = whisper.DecodingOptions(
+                language=self.language,
+                prompt=self._context or None,
+                without_timestamps=True,
+                fp16=False,
+                temperature=0.0,
+            )
+            result = whisper.decode(self.model, mel, options)
+            if final and result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+                return ""
+            return result.text.strip()
+        except Exception as e:
+            logging.error(f"스트리밍 디코딩 실패: {e}")
+            return ""
+
+    def _event(self, kind: str, text: str, start: int, end: int) -> Dict[str, Any]:
+        return {
+            "type": kind,
+            "segment_id": self._segment_id,
+            "text": text,
+            "start": round(start / SAMPLE_RATE, 2),
+            "end": round(end / SAMPLE_RATE, 2),
+        }
@@ -1,4 +1,4 @@
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 import json
 import sys
 import os
@@ -20,7 +20,7 @@ except ImportError as e:
     print(f"Database import failed: {e}")
     DB_AVAILABLE = False
 
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="weight_extraction_tool", priority="interactive")
 
 def get_company_profile(company_id: int) -> Dict[str, Any]:
     """
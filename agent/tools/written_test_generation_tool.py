@@ -1,10 +1,10 @@
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
-from langchain_openai import ChatOpenAI
+from agent.utils.llm_gateway import get_llm
 from langchain.tools import tool
 from typing import Dict, List
 
-llm = ChatOpenAI(model="gpt-4o-mini")
+llm = get_llm(model="gpt-4o-mini", tool="written_test_generation_tool")
 
 # 코딩테스트 문제 생성 프롬프트
 coding_prompt = PromptTemplate.from_template(
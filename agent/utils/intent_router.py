@@ -0,0 +1,467 @@
+"""
+/ai/route 로컬 의도 라우터
+
+LLM 호출 전에 메시지를 로컬에서 분류해, 확실한 경우는 바로 도구로 보내고
+애매한 메시지만 LLM 의도 분석으로 넘긴다.
+
+- 키워드 규칙: 기존 router 의 키워드 목록을 하나의 Aho-Corasick 오토마톤으로 컴파일해
+  메시지를 한 번만 훑어서 모든 그룹의 일치 여부를 구함 (규칙 우선순위는 기존 router 와 동일)
+- 최근접 중심(nearest-centroid): 문자 2/3-gram 해시 임베딩의 의도별 중심과 코사인 유사도 비교.
+  시드 문장 + LLM 이 결정한 과거 트래픽(JSONL)으로 학습하고, 새 LLM 결정이 들어올 때마다 갱신
+- 지표: 경로(keyword / centroid / llm)별 건수, LLM fallback 비율, 로컬 판정 지연,
+  일부 로컬 판정을 LLM 으로 재확인한 정확도(audit), fallback 시 중심 추정과 LLM 의 일치율
+
+사용 예:
+    from agent.utils.intent_router import get_intent_router
+    decision = get_intent_router().classify(message)
+    if decision.intent: ...  # 로컬 확정
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# 키워드 그룹 (기존 graph_agent.router 의 목록)
+KEYWORD_GROUPS: Dict[str, List[str]] = {
+    "spell_check": ["맞춤법", "띄어쓰기", "문법", "어색한", "오타", "틀린", "고쳐줘", "수정해줘"],
+    "info": [
+        "할 수 있나요", "할 수 있어", "가능해", "가능한가요", "방법", "어떻게 해", "어떻게 하면", "어떻게 변경",
+        "어떻게 조정", "어떻게 수정", "어떻게 추가", "어떻게 삭제", "어떻게 바꿔", "어떻게 설정"
+    ],
+    "ai_improve": ["더 상세하게", "더 구체적으로", "개선해줘", "보완해줘", "완성해줘", "작성해줘", "어떻게", "조언"],
+    "field": ["제목", "부서", "부서명", "지원자격", "근무조건", "모집분야", "전형절차", "모집인원", "근무지역", "고용형태"],
+    "field_update": ["바꿔달라", "변경", "수정", "고쳐줘", "바꿔줘", "로 변경", "으로 변경"],
+    "form_fill": ["작성", "채워줘", "생성", "만들어줘", "공고 작성"],
+    "status": ["현재", "상태", "확인", "어떻게 되어있어"],
+    # 복합 명령(공고 생성 + 여러 필드/면접 설정) 후보 판단용
+    "schedule": ["면접", "일정", "전형"],
+    "importance": ["중요", "우대", "했으면", "좋겠어"],
+}
+
+# 명확한 값 지정 패턴 (예: '정규직으로 변경해줘', '3명으로 바꿔줘') - 있으면 정보성 안내로 보지 않음
+VALUE_CHANGE_PATTERNS = [
+    re.compile(r"(을|를)?\s*([\w가-힣]+)\s*(으로|로)\s*(변경|바꿔|수정|설정)"),
+    re.compile(r"(을|를)?\s*([\w가-힣]+)\s*로\s*조정"),
+]
+
+VALID_TOOLS = [
+    "form_fill_tool", "form_improve_tool", "form_status_check_tool",
+    "form_edit_tool", "spell_check_tool", "apply_spell_corrections",
+    "company_question_generator", "project_question_generator", "info_tool"
+]
+
+# 의도별 시드 문장 (키워드 규칙에 걸리지 않는 표현을 중심 분류기가 처리하도록)
+SEED_EXAMPLES: Dict[str, List[str]] = {
+    "form_fill_tool": [
+        "백엔드 개발자 2명 뽑는 공고를 작성해줘", "프론트엔드 개발자 채용공고 만들어줘", "신입 개발자 채용 공고",
+        "데이터 엔지니어 경력직 한 명 뽑을 거야", "마케팅 담당자 모집 공고 부탁해", "공고 채워줘",
+    ],
+    "form_improve_tool": [
+        "공고 내용 개선해줘", "더 매력적으로 다듬어줘", "보완할 점 제안해줘", "지원자가 많이 오게 조언해줘",
+        "전체적으로 좀 더 좋게 해줘", "문구를 더 전문적으로 바꿔줘",
+    ],
+    "form_status_check_tool": [
+        "지금 폼 어떻게 되어있어", "입력된 내용 보여줘", "지금까지 작성한 내용 확인", "빠진 항목 있어?",
+        "현재 상태 알려줘", "채워진 필드 보여줘",
+    ],
+    "form_edit_tool": [
+        "제목을 백엔드 개발자로 바꿔줘", "부서명은 서버개발팀", "모집인원 3명으로", "근무지역 서울 강남",
+        "고용형태 정규직으로", "지원자격에 정보처리기사 추가",
+    ],
+    "spell_check_tool": [
+        "맞춤법 검사해줘", "띄어쓰기 봐줘", "오타 있는지 찾아줘", "문장이 어색한 곳 알려줘",
+    ],
+    "company_question_generator": [
+        "회사 관련 면접 질문 만들어줘", "우리 회사 인재상에 맞는 면접 질문", "회사 문화 관련 인터뷰 질문 추천",
+        "회사에 대해 물어볼 질문 뽑아줘",
+    ],
+    "project_question_generator": [
+        "이력서 프로젝트 기반 면접 질문 생성", "지원자 프로젝트 경험으로 질문 뽑아줘", "포트폴리오 관련 면접 질문",
+        "기술 스택 관련 인터뷰 질문 만들어줘",
+    ],
+    "info_tool": [
+        "공고 작성 방법 알려줘", "지원자 관리란?", "면접 일정 등록 방법 설명해줘", "이 기능은 뭐야",
+        "가중치는 무엇인가요", "서류 평가는 어떻게 진행돼",
+    ],
+}
+
+EMBED_DIM = 2048
+NGRAM_SIZES = (2, 3)
+# 중심 분류기 확정 조건: 최고 유사도와 1-2위 차이
+CENTROID_MIN_SIMILARITY = float(os.getenv("INTENT_ROUTER_MIN_SIMILARITY", 0.35))
+CENTROID_MIN_MARGIN = float(os.getenv("INTENT_ROUTER_MIN_MARGIN", 0.08))
+# 이 길이 이상이면서 공고 생성 키워드가 있으면 복합 명령 후보
+COMPLEX_MIN_CHARS = 40
+# 로컬 판정 중 LLM 으로 재확인(audit)할 비율
+AUDIT_RATE = float(os.getenv("INTENT_ROUTER_AUDIT_RATE", 0.02))
+TRAFFIC_LOG_PATH = os.getenv("INTENT_ROUTER_TRAFFIC_LOG", "./intent_router_traffic.jsonl")
+MAX_TRAFFIC_SAMPLES = 5000
+# 트래픽 로그가 이 줄 수를 넘으면 최근 MAX_TRAFFIC_SAMPLES 줄만 남기고 다시 씀 (학습에도 그만큼만 사용)
+MAX_TRAFFIC_LOG_LINES = MAX_TRAFFIC_SAMPLES * 2
+LATENCY_WINDOW = 1000
+
+
+class AhoCorasick:
+    """다중 키워드 오토마톤 (메시지를 한 번 훑어 모든 키워드 일치를 찾음)"""
+
+    def __init__(self, keywords: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[Tuple[str, str]]] = [set()]
+        for group, words in keywords.items():
+            for word in words:
+                self._add(word, group)
+        self._build()
+
+    def _add(self, word: str, group: str):
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            node = next_node
+        self._output[node].add((group, word))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] |= self._output[self._fail[child]]
+
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """그룹 → 일치한 키워드 집합"""
+        hits: Dict[str, Set[str]] = defaultdict(set)
+        node = 0
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for group, word in self._output[node]:
+                hits[group].add(word)
+        return hits
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def embed(text: str) -> np.ndarray:
+    """문자 n-gram 해시 임베딩 (부호 해싱, L2 정규화)"""
+    vector = np.zeros(EMBED_DIM, dtype=np.float32)
+    padded = f" {_normalize(text)} "
+    for size in NGRAM_SIZES:
+        for start in range(len(padded) - size + 1):
+            digest = zlib.crc32(padded[start:start + size].encode("utf-8"))
+            vector[digest % EMBED_DIM] += 1.0 if digest & 0x80000000 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@dataclass
+class RouteDecision:
+    intent: Optional[str]                  # 로컬 확정 도구 (None 이면 LLM 필요)
+    source: Optional[str]                  # keyword / centroid / None
+    complex_candidate: bool = False        # 복합 명령 분석(LLM) 필요 여부
+    guess: Optional[str] = None            # 중심 분류기 최선 추정 (확정 못 했어도 기록)
+    similarity: float = 0.0
+    margin: float = 0.0
+    elapsed_us: float = 0.0
+    hits: Dict[str, Set[str]] = field(default_factory=dict)
+
+
+class NearestCentroid:
+    """의도별 임베딩 합/개수를 유지하는 최근접 중심 분류기 (온라인 갱신)"""
+
+    def __init__(self):
+        self._sums: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._labels: List[str] = []
+        self._matrix = np.zeros((0, EMBED_DIM), dtype=np.float32)
+        self._lock = threading.Lock()
+
+    def add(self, text: str, label: str, rebuild: bool = True):
+        vector = embed(text)
+        with self._lock:
+            if label not in self._sums:
+                self._sums[label] = np.zeros(EMBED_DIM, dtype=np.float32)
+            self._sums[label] += vector
+            self._counts[label] += 1
+            if rebuild:
+                self._rebuild()
+
+    def rebuild(self):
+        with self._lock:
+            self._rebuild()
+
+    def _rebuild(self):
+        labels = sorted(self._sums)
+        matrix = np.stack([self._sums[label] for label in labels]) if labels else np.zeros((0, EMBED_DIM), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._labels, self._matrix = labels, matrix / norms
+
+    def predict(self, text: str) -> Tuple[Optional[str], float, float]:
+        """(최근접 의도, 유사도, 1-2위 차이)"""
+        with self._lock:
+            labels, matrix = self._labels, self._matrix
+        if not labels:
+            return None, 0.0, 0.0
+        scores = matrix @ embed(text)
+        order = np.argsort(scores)[::-1]
+        best = float(scores[order[0]])
+        second = float(scores[order[1]]) if len(order) > 1 else 0.0
+        return labels[order[0]], best, best - second
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+
+class IntentRouter:
+    def __init__(self, traffic_log_path: Optional[str] = TRAFFIC_LOG_PATH):
+        self._automaton = AhoCorasick(KEYWORD_GROUPS)
+        self._centroids = NearestCentroid()
+        self._traffic_log_path = traffic_log_path
+        self._log_lock = threading.Lock()
+        self._log_lines = 0
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        self._train()
+
+    # ------------------------------------------------------------------
+    # 학습
+    # ------------------------------------------------------------------
+
+    def _train(self):
+        for label, examples in SEED_EXAMPLES.items():
+            for example in examples:
+                self._centroids.add(example, label, rebuild=False)
+        for message, label in self._load_traffic():
+            self._centroids.add(message, label, rebuild=False)
+        self._centroids.rebuild()
+
+    def _load_traffic(self) -> List[Tuple[str, str]]:
+        if not self._traffic_log_path or not os.path.exists(self._traffic_log_path):
+            return []
+        samples: deque = deque(maxlen=MAX_TRAFFIC_SAMPLES)
+        try:
+            with open(self._traffic_log_path, encoding="utf-8") as f:
+                for line in f:
+                    self._log_lines += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("intent") in VALID_TOOLS and record.get("message"):
+                        samples.append((record["message"], record["intent"]))
+        except OSError as e:
+            print(f"[INTENT-ROUTER] 트래픽 로그 읽기 실패: {e}")
+        return list(samples)
+
+    def learn(self, message: str, intent: str):
+        """LLM 이 결정한 의도를 중심에 반영하고 트래픽 로그에 남김"""
+        if intent not in VALID_TOOLS or not message:
+            return
+        self._centroids.add(message, intent)
+        if not self._traffic_log_path:
+            return
+        try:
+            with self._log_lock:
+                with open(self._traffic_log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"ts": time.time(), "message": message, "intent": intent}, ensure_ascii=False) + "\n")
+                self._log_lines += 1
+                if self._log_lines > MAX_TRAFFIC_LOG_LINES:
+                    self._truncate_traffic_log()
+        except OSError as e:
+            print(f"[INTENT-ROUTER] 트래픽 로그 기록 실패: {e}")
+
+    def _truncate_traffic_log(self):
+        """최근 MAX_TRAFFIC_SAMPLES 줄만 남기고 로그를 교체 (_log_lock 안에서 호출)"""
+        with open(self._traffic_log_path, encoding="utf-8") as f:
+            recent = deque(f, maxlen=MAX_TRAFFIC_SAMPLES)
+        tmp_path = f"{self._traffic_log_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(recent)
+        os.replace(tmp_path, self._traffic_log_path)
+        self._log_lines = len(recent)
+
+    # ------------------------------------------------------------------
+    # 분류
+    # ------------------------------------------------------------------
+
+    def classify(self, message: str) -> RouteDecision:
+        """키워드 규칙 → 최근접 중심 순으로 로컬 판정 (LLM 호출 없음)"""
+        started = time.perf_counter()
+        hits = self._automaton.scan(message)
+        decision = self._apply_rules(message, hits)
+        if decision.intent is None:
+            guess, similarity, margin = self._centroids.predict(message)
+            if similarity <= 0:
+                guess = None
+            decision.guess, decision.similarity, decision.margin = guess, similarity, margin
+            if (guess and not decision.complex_candidate
+                    and similarity >= CENTROID_MIN_SIMILARITY and margin >= CENTROID_MIN_MARGIN):
+                decision.intent, decision.source = guess, "centroid"
+        decision.hits = hits
+        decision.elapsed_us = (time.perf_counter() - started) * 1e6
+        return decision
+
+    @staticmethod
+    def _apply_rules(message: str, hits: Dict[str, Set[str]]) -> RouteDecision:
+        # 맞춤법 검사는 무조건 우선
+        if hits.get("spell_check"):
+            return RouteDecision("spell_check_tool", "keyword")
+
+        # 공고 생성 + 여러 필드/면접 설정이 함께 있으면 복합 명령 분석을 거침
+        form_fill = bool(hits.get("form_fill"))
+        extra_requests = len(hits.get("field", ())) + bool(hits.get("schedule")) + bool(hits.get("importance"))
+        complex_candidate = form_fill and (extra_requests >= 2 or (extra_requests >= 1 and len(message) >= COMPLEX_MIN_CHARS))
+
+        is_info = bool(hits.get("info"))
+        is_value_change = any(pattern.search(message) for pattern in VALUE_CHANGE_PATTERNS)
+        if is_info and not is_value_change:
+            intent = "info_tool"
+        elif hits.get("field") and hits.get("ai_improve"):
+            intent = "form_improve_tool"
+        elif hits.get("field") and hits.get("field_update"):
+            intent = "form_edit_tool"
+        elif form_fill:
+            intent = "form_fill_tool"
+        elif hits.get("status"):
+            intent = "form_status_check_tool"
+        else:
+            intent = None
+        return RouteDecision(intent, "keyword" if intent else None, complex_candidate=complex_candidate)
+
+    def should_audit(self, decision: RouteDecision) -> bool:
+        return decision.source is not None and random.random() < AUDIT_RATE
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._routes: Dict[str, int] = defaultdict(int)
+            self._intents: Dict[str, int] = defaultdict(int)
+            self._total = 0
+            self._complex_analyses = 0
+            self._local_latency_us: deque = deque(maxlen=LATENCY_WINDOW)
+            self._llm_latency_ms: deque = deque(maxlen=LATENCY_WINDOW)
+            self._audited: Dict[str, int] = defaultdict(int)
+            self._audit_correct: Dict[str, int] = defaultdict(int)
+            self._shadow_compared = 0
+            self._shadow_agreed = 0
+
+    def record(self, message: str, decision: RouteDecision, intent: str,
+               complex_analysis: bool = False, llm_seconds: Optional[float] = None):
+        """요청 하나의 최종 라우팅 결과 기록 (LLM 이 결정한 경우 학습까지)"""
+        source = decision.source if decision.intent == intent and not complex_analysis else "llm"
+        with self._stats_lock:
+            self._total += 1
+            self._routes[source] += 1
+            self._intents[intent] += 1
+            self._local_latency_us.append(decision.elapsed_us)
+            if complex_analysis:
+                self._complex_analyses += 1
+            if llm_seconds is not None:
+                self._llm_latency_ms.append(llm_seconds * 1000)
+            if source == "llm" and not complex_analysis and decision.guess and intent in VALID_TOOLS:
+                self._shadow_compared += 1
+                self._shadow_agreed += decision.guess == intent
+        if source == "llm" and not complex_analysis:
+            self.learn(message, intent)
+
+    def record_audit(self, decision: RouteDecision, llm_intent: str):
+        """로컬 판정을 LLM 결과와 비교한 audit 기록"""
+        if llm_intent not in VALID_TOOLS or decision.source is None:
+            return
+        with self._stats_lock:
+            self._audited[decision.source] += 1
+            self._audit_correct[decision.source] += decision.intent == llm_intent
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            total = self._total
+            local = list(self._local_latency_us)
+            llm = list(self._llm_latency_ms)
+            audited = sum(self._audited.values())
+            correct = sum(self._audit_correct.values())
+            return {
+                "total": total,
+                "routes": dict(self._routes),
+                "intents": dict(self._intents),
+                "fallback_rate": round(self._routes.get("llm", 0) / total, 4) if total else 0.0,
+                "complex_analysis_rate": round(self._complex_analyses / total, 4) if total else 0.0,
+                "local_latency_us": {
+                    "avg": round(float(np.mean(local)), 1) if local else 0.0,
+                    "p95": round(float(np.percentile(local, 95)), 1) if local else 0.0,
+                },
+                "llm_latency_ms": {
+                    "avg": round(float(np.mean(llm)), 1) if llm else 0.0,
+                    "p95": round(float(np.percentile(llm, 95)), 1) if llm else 0.0,
+                },
+                "accuracy": {
+                    "audited": audited,
+                    "correct": correct,
+                    "rate": round(correct / audited, 4) if audited else None,
+                    "by_source": {
+                        source: round(self._audit_correct[source] / count, 4)
+                        for source, count in self._audited.items() if count
+                    },
+                },
+                "shadow_agreement": {
+                    "compared": self._shadow_compared,
+                    "rate": round(self._shadow_agreed / self._shadow_compared, 4) if self._shadow_compared else None,
+                },
+                "centroid_samples": self._centroids.counts(),
+            }
+
+    def evaluate(self, samples: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+        """정답이 있는 (메시지, 도구) 목록으로 로컬 판정 정확도/커버리지 측정"""
+        covered = correct = total = 0
+        for message, expected in samples:
+            total += 1
+            decision = self.classify(message)
+            if decision.intent is not None:
+                covered += 1
+                correct += decision.intent == expected
+        return {
+            "total": total,
+            "local_coverage": round(covered / total, 4) if total else 0.0,
+            "local_accuracy": round(correct / covered, 4) if covered else None,
+        }
+
+
+_router: Optional[IntentRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_intent_router() -> IntentRouter:
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = IntentRouter()
+    return _router
+
+
+def get_intent_router_stats() -> Dict[str, Any]:
+    return get_intent_router().get_stats()
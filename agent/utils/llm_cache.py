@@ -1,170 +1,591 @@
-import redis
-import json
-import hashlib
-from functools import wraps
-from typing import Any, Optional
+"""
+LLM 결과 캐시
+
+에이전트 도구의 LLM 호출 결과를 Redis 에 저장하는 공용 캐시.
+- 동기/비동기 함수 모두 같은 데코레이터(redis_cache)로 사용
+- 캐시 키에 도구(namespace) / 프롬프트 버전 / 모델명이 포함되어
+  프롬프트나 모델이 바뀌면 이전 결과를 자동으로 쓰지 않음
+- 같은 키의 동시 miss 는 한 번만 LLM 을 호출 (프로세스 내 + Redis 락으로 프로세스 간 single-flight)
+- 값은 zstd 로 압축 저장 (zstandard 미설치 시 zlib)
+- namespace 별 hit/miss/bytes 통계 (get_cache_report)
+- 호출마다 namespace 이름의 추적 span (kind="tool", cache=hit/miss/coalesced/bypass)
+
+사용 예:
+    @redis_cache(expire=1800, namespace="keyword_matching", version="v2", model="gpt-4o-mini")
+    def analyze_keyword_matching(...): ...
+
+    @redis_cache()
+    async def analyze_category_with_llm(...): ...
+"""
 import asyncio
+import functools
+import hashlib
+import inspect
+import json
 import os
-from aiocache import cached
-from aiocache.backends.redis import RedisCache
+import threading
+import time
+import weakref
+import zlib
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import redis
+import redis.asyncio as aioredis
+
+from agent.utils.tracing import annotate, span
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 zlib 사용
+    zstandard = None
 
 # Redis 연결 설정 (원래 설정으로 복원)
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
 
-# Redis 클라이언트 초기화 (연결 실패 시 None)
-redis_client = None
-try:
-    redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=0, socket_connect_timeout=5, socket_timeout=5)
-    # 연결 테스트
-    redis_client.ping()
-    print(f"Redis connected successfully to {REDIS_HOST}:{REDIS_PORT}")
-except Exception as e:
-    print(f"Redis connection failed: {e}")
-    redis_client = None
-
-def redis_cache(expire=60*60*24):
-    """
-    LLM 함수 결과를 Redis에 캐싱하는 데코레이터.
-    - 입력값(파라미터) 조합으로 캐시 키 생성
-    - 캐시 hit 시 바로 반환, miss 시 함수 실행 후 set
-    - expire: 만료(초), 기본 24시간
-    - Redis 연결 실패 시 캐싱 없이 함수 실행
-    """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Redis가 연결되지 않은 경우 캐싱 없이 함수 실행
-            if redis_client is None:
-                return func(*args, **kwargs)
-            
-            # 입력 파라미터로 캐시 키 생성 (함수명+파라미터 해시)
+KEY_PREFIX = "llm"
+DEFAULT_EXPIRE = 60 * 60 * 24
+# 다른 프로세스가 같은 키를 계산 중일 때 기다리는 최대 시간 (LLM 호출 시간보다 길게)
+LOCK_TTL_SECONDS = int(os.environ.get("LLM_CACHE_LOCK_TTL", 120))
+LOCK_POLL_SECONDS = 0.2
+# 연결 실패 후 이 시간 동안은 Redis 없이 함수만 실행 (동기/비동기 공통)
+REDIS_RETRY_SECONDS = 30
+# 이 크기 이상일 때만 압축 (작은 값은 헤더 비용이 더 큼)
+COMPRESS_MIN_BYTES = 256
+
+# 값 헤더 (1바이트) - 압축 방식 구분
+_RAW = b"\x00"
+_ZSTD = b"\x01"
+_ZLIB = b"\x02"
+
+_redis_client: Optional[redis.Redis] = None
+_redis_unavailable_until = 0.0
+_client_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[aioredis.Redis, Any]]" = weakref.WeakKeyDictionary()
+_REDIS_DOWN_ERRORS = (redis.ConnectionError, redis.TimeoutError)
+
+
+def _redis_available() -> bool:
+    return time.time() >= _redis_unavailable_until
+
+
+def _mark_unavailable(error: Exception):
+    """연결 오류 → REDIS_RETRY_SECONDS 동안 동기/비동기 경로 모두 Redis 를 건너뜀"""
+    global _redis_unavailable_until
+    _redis_unavailable_until = time.time() + REDIS_RETRY_SECONDS
+    print(f"Redis unavailable, bypassing cache for {REDIS_RETRY_SECONDS}s: {error}")
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """동기 Redis 클라이언트 (처음 사용할 때 연결, 실패 시 REDIS_RETRY_SECONDS 동안 재시도하지 않음)"""
+    global _redis_client
+    if not _redis_available():
+        return None
+    if _redis_client is not None:
+        return _redis_client
+    with _client_lock:
+        if _redis_client is None:
             try:
-                key_raw = f"{func.__name__}:{json.dumps(args, sort_keys=True, default=str)}:{json.dumps(kwargs, sort_keys=True, default=str)}"
-            except Exception:
-                key_raw = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            cache_key = "llm:" + hashlib.sha256(key_raw.encode()).hexdigest()
-            
+                client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=0, socket_connect_timeout=5, socket_timeout=5)
+                client.ping()
+                _redis_client = client
+                print(f"Redis connected successfully to {REDIS_HOST}:{REDIS_PORT}")
+            except Exception as e:
+                print(f"Redis connection failed: {e}")
+                _mark_unavailable(e)
+    return _redis_client
+
+
+async def _close_with_loop(client: aioredis.Redis):
+    """루프가 끝날 때(asyncio.run / loop.shutdown_asyncgens) 클라이언트 연결을 닫는 비동기 제너레이터"""
+    try:
+        yield
+    finally:
+        close = getattr(client, "aclose", None) or client.close
+        try:
+            await close()
+        except Exception:
+            pass
+
+
+async def get_async_redis_client() -> Optional[aioredis.Redis]:
+    """현재 이벤트 루프 전용 비동기 Redis 클라이언트 (연결 실패 후 쿨다운 동안은 None)
+
+    asyncio.run() 으로 매번 새 루프를 만드는 호출부가 있어 루프마다 클라이언트를 따로 두고,
+    루프 종료 시 닫히도록 루프의 async generator 정리에 연결해 둔다.
+    """
+    if not _redis_available():
+        return None
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        client = aioredis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=0, socket_connect_timeout=5, socket_timeout=5)
+        closer = _close_with_loop(client)
+        await closer.__anext__()
+        entry = _async_clients[loop] = (client, closer)
+    return entry[0]
+
+
+def __getattr__(name: str):
+    # 기존 스크립트 호환: `from agent.utils.llm_cache import redis_client`
+    if name == "redis_client":
+        return get_redis_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ---------------------------------------------------------------------------
+# 직렬화 / 압축
+# ---------------------------------------------------------------------------
+
+_zstd_local = threading.local()
+
+
+def _zstd_compressor():
+    if not hasattr(_zstd_local, "compressor"):
+        _zstd_local.compressor = zstandard.ZstdCompressor(level=6)
+        _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return _zstd_local.compressor, _zstd_local.decompressor
+
+
+def encode_value(value: Any) -> Tuple[bytes, int]:
+    """값 → (저장 바이트, 압축 전 바이트 수)"""
+    raw = json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES:
+        return _RAW + raw, len(raw)
+    if zstandard is not None:
+        compressor, _ = _zstd_compressor()
+        return _ZSTD + compressor.compress(raw), len(raw)
+    return _ZLIB + zlib.compress(raw, 6), len(raw)
+
+
+def decode_value(data: bytes) -> Any:
+    header, body = data[:1], data[1:]
+    if header == _ZSTD:
+        _, decompressor = _zstd_compressor()
+        body = decompressor.decompress(body)
+    elif header == _ZLIB:
+        body = zlib.decompress(body)
+    elif header != _RAW:
+        # 헤더 없는 이전 형식 (평문 JSON)
+        body = data
+    return json.loads(body.decode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# 통계
+# ---------------------------------------------------------------------------
+
+# 집계 필드 → 현재 추적 span 의 cache 속성값
+_TRACE_CACHE_RESULTS = {"hits": "hit", "misses": "miss", "coalesced": "coalesced"}
+
+
+class CacheStats:
+    """namespace 별 hit/miss/bytes 집계 (프로세스 단위)"""
+
+    FIELDS = ("hits", "misses", "coalesced", "stores", "errors", "raw_bytes", "stored_bytes", "read_bytes")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def incr(self, namespace: str, **values: int):
+        with self._lock:
+            entry = self._stats.setdefault(namespace, {field: 0 for field in self.FIELDS})
+            for field, value in values.items():
+                entry[field] += value
+        for field, result in _TRACE_CACHE_RESULTS.items():
+            if values.get(field):
+                annotate(cache=result)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {}
+            for namespace, entry in self._stats.items():
+                lookups = entry["hits"] + entry["misses"] + entry["coalesced"]
+                namespaces[namespace] = {
+                    **entry,
+                    "hit_rate": round((entry["hits"] + entry["coalesced"]) / lookups, 3) if lookups else 0.0,
+                    "compression_ratio": round(entry["stored_bytes"] / entry["raw_bytes"], 3) if entry["raw_bytes"] else None,
+                }
+        return {
+            "compression": "zstd" if zstandard is not None else "zlib",
+            "namespaces": namespaces,
+        }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+cache_stats = CacheStats()
+
+
+def get_cache_report() -> Dict[str, Any]:
+    return cache_stats.report()
+
+
+# ---------------------------------------------------------------------------
+# 캐시 키
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _module_fingerprint(source_file: Optional[str]) -> str:
+    """모듈 소스 해시 - 프롬프트 템플릿이 바뀌면 버전이 바뀐다"""
+    if not source_file:
+        return "v0"
+    try:
+        with open(source_file, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()[:10]
+    except OSError:
+        return "v0"
+
+
+def _resolve_model(func: Callable, args: tuple, model: Optional[str]) -> str:
+    """명시된 모델명 → 인스턴스의 self.llm → 모듈 전역 llm 순으로 모델명 결정"""
+    if model:
+        return model
+    candidates = []
+    if args and hasattr(args[0], "llm"):
+        candidates.append(getattr(args[0], "llm"))
+    candidates.append(func.__globals__.get("llm"))
+    for llm in candidates:
+        name = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+        if isinstance(name, str):
+            return name
+    return "none"
+
+
+class _KeyBuilder:
+    def __init__(
+        self,
+        func: Callable,
+        namespace: Optional[str],
+        version: Optional[str],
+        model: Optional[str],
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ):
+        self.func = func
+        self.cache_if = cache_if or _cacheable
+        module = func.__module__.rsplit(".", 1)[-1]
+        self.namespace = namespace or f"{module}.{func.__qualname__}"
+        try:
+            source_file = inspect.getsourcefile(func)
+        except TypeError:
+            source_file = None
+        self.version = version or _module_fingerprint(source_file)
+        self.model = model
+        params = list(inspect.signature(func).parameters)
+        # 메서드의 self/cls 는 키에서 제외 (인스턴스 주소가 들어가면 캐시가 항상 miss)
+        self.skip_first = bool(params) and params[0] in ("self", "cls")
+
+    def build(self, args: tuple, kwargs: dict) -> str:
+        model = _resolve_model(self.func, args, self.model)
+        key_args = args[1:] if self.skip_first else args
+        try:
+            key_raw = f"{json.dumps(key_args, sort_keys=True, default=str)}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+        except Exception:
+            key_raw = f"{str(key_args)}:{str(kwargs)}"
+        digest = hashlib.sha256(key_raw.encode()).hexdigest()
+        return f"{KEY_PREFIX}:{self.namespace}:{self.version}:{model}:{digest}"
+
+
+def _cacheable(result: Any) -> bool:
+    # 실패 시 빈 결과를 돌려주는 도구가 많아 None/빈 값은 저장하지 않음
+    return result is not None and result != [] and result != {} and result != ""
+
+
+# ---------------------------------------------------------------------------
+# 프로세스 내 single-flight
+# ---------------------------------------------------------------------------
+
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _join_or_lead(key: str):
+    """(future, is_leader) - 같은 키를 계산 중인 호출이 있으면 그 future 를 공유"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[key] = future
+        return future, True
+
+
+def _finish(key: str, future: Future, result: Any = None, error: Optional[BaseException] = None):
+    with _inflight_lock:
+        _inflight.pop(key, None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+# ---------------------------------------------------------------------------
+# 동기 / 비동기 프런트엔드
+# ---------------------------------------------------------------------------
+
+def _sync_lookup(client: redis.Redis, key: str, namespace: str):
+    data = client.get(key)
+    if data is None:
+        return False, None
+    cache_stats.incr(namespace, hits=1, read_bytes=len(data))
+    return True, decode_value(data)
+
+
+def _sync_call(builder: _KeyBuilder, expire: int, args: tuple, kwargs: dict):
+    func, namespace = builder.func, builder.namespace
+    client = get_redis_client()
+    if client is None:
+        annotate(cache="bypass")
+        return func(*args, **kwargs)
+
+    key = builder.build(args, kwargs)
+    try:
+        found, value = _sync_lookup(client, key, namespace)
+        if found:
+            return value
+    except Exception as e:
+        print(f"Redis get error: {e}")
+        cache_stats.incr(namespace, errors=1)
+        if isinstance(e, _REDIS_DOWN_ERRORS):
+            _mark_unavailable(e)
+        return func(*args, **kwargs)
+
+    future, is_leader = _join_or_lead(key)
+    if not is_leader:
+        cache_stats.incr(namespace, coalesced=1)
+        return future.result()
+
+    try:
+        result = _sync_compute(client, key, builder, expire, args, kwargs)
+    except BaseException as e:
+        _finish(key, future, error=e)
+        raise
+    _finish(key, future, result)
+    return result
+
+
+def _sync_compute(client, key, builder, expire, args, kwargs):
+    func, namespace = builder.func, builder.namespace
+    lock_key = f"{key}:lock"
+    locked = False
+    try:
+        locked = bool(client.set(lock_key, "1", nx=True, ex=LOCK_TTL_SECONDS))
+        if not locked:
+            # 다른 프로세스가 계산 중 - 결과가 저장될 때까지 대기
+            deadline = time.time() + LOCK_TTL_SECONDS
+            while time.time() < deadline:
+                time.sleep(LOCK_POLL_SECONDS)
+                found, value = _sync_lookup(client, key, namespace)
+                if found:
+                    return value
+                if not client.exists(lock_key):
+                    break
+    except Exception as e:
+        print(f"Redis lock error: {e}")
+        cache_stats.incr(namespace, errors=1)
+
+    cache_stats.incr(namespace, misses=1)
+    try:
+        result = func(*args, **kwargs)
+        if builder.cache_if(result):
             try:
-                cached = redis_client.get(cache_key)
-                if cached is not None:
-                    if isinstance(cached, bytes):
-                        try:
-                            return json.loads(cached.decode('utf-8'))
-                        except Exception:
-                            return cached.decode('utf-8')
-                    else:
-                        return cached
+                data, raw_size = encode_value(result)
+                client.set(key, data, ex=expire)
+                cache_stats.incr(namespace, stores=1, stored_bytes=len(data), raw_bytes=raw_size)
             except Exception as e:
-                print(f"Redis get error: {e}")
-                # Redis 오류 시 캐싱 없이 함수 실행
+                print(f"Redis set error: {e}")
+                cache_stats.incr(namespace, errors=1)
+        return result
+    finally:
+        if locked:
+            try:
+                client.delete(lock_key)
+            except Exception:
                 pass
-            
-            result = func(*args, **kwargs)
-            
+
+
+async def _async_lookup(client: aioredis.Redis, key: str, namespace: str):
+    data = await client.get(key)
+    if data is None:
+        return False, None
+    cache_stats.incr(namespace, hits=1, read_bytes=len(data))
+    return True, decode_value(data)
+
+
+async def _async_call(builder: _KeyBuilder, expire: int, args: tuple, kwargs: dict):
+    func, namespace = builder.func, builder.namespace
+    client = await get_async_redis_client()
+    if client is None:
+        annotate(cache="bypass")
+        return await func(*args, **kwargs)
+
+    key = builder.build(args, kwargs)
+    try:
+        found, value = await _async_lookup(client, key, namespace)
+        if found:
+            return value
+    except Exception as e:
+        print(f"Redis get error: {e}")
+        cache_stats.incr(namespace, errors=1)
+        if isinstance(e, _REDIS_DOWN_ERRORS):
+            _mark_unavailable(e)
+        return await func(*args, **kwargs)
+
+    future, is_leader = _join_or_lead(key)
+    if not is_leader:
+        cache_stats.incr(namespace, coalesced=1)
+        return await asyncio.wrap_future(future)
+
+    try:
+        result = await _async_compute(client, key, builder, expire, args, kwargs)
+    except BaseException as e:
+        _finish(key, future, error=e)
+        raise
+    _finish(key, future, result)
+    return result
+
+
+async def _async_compute(client, key, builder, expire, args, kwargs):
+    func, namespace = builder.func, builder.namespace
+    lock_key = f"{key}:lock"
+    locked = False
+    try:
+        locked = bool(await client.set(lock_key, "1", nx=True, ex=LOCK_TTL_SECONDS))
+        if not locked:
+            deadline = time.time() + LOCK_TTL_SECONDS
+            while time.time() < deadline:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+                found, value = await _async_lookup(client, key, namespace)
+                if found:
+                    return value
+                if not await client.exists(lock_key):
+                    break
+    except Exception as e:
+        print(f"Redis lock error: {e}")
+        cache_stats.incr(namespace, errors=1)
+
+    cache_stats.incr(namespace, misses=1)
+    try:
+        result = await func(*args, **kwargs)
+        if builder.cache_if(result):
             try:
-                if isinstance(result, (dict, list)):
-                    redis_client.set(cache_key, json.dumps(result), ex=expire)
-                else:
-                    redis_client.set(cache_key, result, ex=expire)
+                data, raw_size = encode_value(result)
+                await client.set(key, data, ex=expire)
+                cache_stats.incr(namespace, stores=1, stored_bytes=len(data), raw_bytes=raw_size)
             except Exception as e:
                 print(f"Redis set error: {e}")
-                # Redis 저장 실패 시 무시하고 결과 반환
-            
-            return result
+                cache_stats.incr(namespace, errors=1)
+        return result
+    finally:
+        if locked:
+            try:
+                await client.delete(lock_key)
+            except Exception:
+                pass
+
+
+def redis_cache(
+    expire: int = DEFAULT_EXPIRE,
+    namespace: Optional[str] = None,
+    version: Optional[str] = None,
+    model: Optional[str] = None,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+):
+    """
+    LLM 함수 결과를 Redis에 캐싱하는 데코레이터 (동기/비동기 함수 모두 지원).
+    - 키: llm:{namespace}:{version}:{model}:{입력값 해시}
+      - namespace: 기본값 "모듈명.함수명"
+      - version: 프롬프트 버전. 생략하면 모듈 소스 해시를 사용해 프롬프트가 바뀌면 자동으로 새 키 사용
+      - model: 생략하면 self.llm / 모듈 전역 llm 의 모델명
+    - 같은 키의 동시 miss 는 한 번만 실행 (single-flight)
+    - None / 빈 결과는 저장하지 않음 (cache_if 로 저장 조건 지정 가능 - 예: 일부 실패한 결과 제외)
+    - expire: 만료(초), 기본 24시간
+    - Redis 연결 실패 시 캐싱 없이 함수 실행
+    """
+    def decorator(func):
+        builder = _KeyBuilder(func, namespace, version, model, cache_if)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(builder.namespace, kind="tool"):
+                    return await _async_call(builder, expire, args, kwargs)
+            async_wrapper.cache_namespace = builder.namespace
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(builder.namespace, kind="tool"):
+                return _sync_call(builder, expire, args, kwargs)
+        wrapper.cache_namespace = builder.namespace
         return wrapper
     return decorator
 
+
+def async_redis_cache(ttl: int = 3600, **options):
+    """비동기 함수용 Redis 캐시 데코레이터 (redis_cache 와 동일)"""
+    return redis_cache(expire=ttl, **options)
+
+
 def clear_function_cache(function_name: str):
     """
-    특정 함수의 모든 캐시를 제거합니다.
-    
+    특정 함수(namespace)의 모든 캐시를 제거합니다.
+
     Args:
-        function_name: 캐시를 제거할 함수명
+        function_name: 캐시를 제거할 함수명 또는 namespace
     """
-    if redis_client is None:
+    client = get_redis_client()
+    if client is None:
         print(f"Redis not connected, cannot clear cache for function: {function_name}")
         return 0
-    
+
     try:
-        # 모든 키를 스캔하여 해당 함수명의 캐시를 찾아 제거
-        pattern = f"llm:*"
-        keys = redis_client.keys(pattern)
         removed_count = 0
-        
-        for key in keys:
-            key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-            # 키에서 함수명 추출 (간단한 방법)
-            if function_name in key_str:
-                redis_client.delete(key)
-                removed_count += 1
-        
+        batch = []
+        for key in client.scan_iter(match=f"{KEY_PREFIX}:*{function_name}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                removed_count += client.delete(*batch)
+                batch = []
+        if batch:
+            removed_count += client.delete(*batch)
+
         print(f"Removed {removed_count} cache entries for function: {function_name}")
         return removed_count
     except Exception as e:
         print(f"Error clearing cache for {function_name}: {e}")
         return 0
 
+
 def migrate_function_cache(old_function_name: str, new_function_name: str):
     """
     함수명 변경 시 캐시를 마이그레이션합니다.
-    
+
     Args:
         old_function_name: 이전 함수명
         new_function_name: 새로운 함수명
     """
-    if redis_client is None:
+    client = get_redis_client()
+    if client is None:
         print(f"Redis not connected, cannot migrate cache from {old_function_name} to {new_function_name}")
         return 0
-    
+
     try:
-        pattern = f"llm:*"
-        keys = redis_client.keys(pattern)
         migrated_count = 0
-        
-        for key in keys:
+        for key in client.scan_iter(match=f"{KEY_PREFIX}:*{old_function_name}*", count=500):
             key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-            if old_function_name in key_str:
-                # 기존 데이터 가져오기
-                cached_data = redis_client.get(key)
-                if cached_data:
-                    # 새로운 키 생성
-                    new_key = key_str.replace(old_function_name, new_function_name)
-                    # 새로운 키로 데이터 저장
-                    redis_client.set(new_key, cached_data, ex=60*60*24)  # 24시간
-                    # 기존 키 삭제
-                    redis_client.delete(key)
-                    migrated_count += 1
-        
+            new_key = key_str.replace(old_function_name, new_function_name)
+            # RENAME 은 TTL 을 유지한다
+            client.rename(key, new_key)
+            migrated_count += 1
+
         print(f"Migrated {migrated_count} cache entries from {old_function_name} to {new_function_name}")
         return migrated_count
     except Exception as e:
         print(f"Error migrating cache from {old_function_name} to {new_function_name}: {e}")
         return 0
-
-# 비동기 Redis 캐시 설정
-async def get_async_cache():
-    """비동기 Redis 캐시 인스턴스 반환"""
-    return RedisCache(
-        endpoint="redis",
-        port=6379,
-        db=0,
-        timeout=60
-    )
-
-def async_redis_cache(ttl: int = 3600):
-    """비동기 함수용 Redis 캐시 데코레이터"""
-    def decorator(func):
-        @cached(
-            ttl=ttl,
-            cache=RedisCache,
-            endpoint="redis",
-            port=6379,
-            db=0,
-            timeout=60
-        )
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        return wrapper
-    return decorator
@@ -0,0 +1,419 @@
+"""
+LLM 게이트웨이
+
+에이전트의 모든 ChatOpenAI 호출이 거쳐 가는 공용 관문.
+- 모델별 토큰 버킷 (RPM / TPM) 으로 429 발생 전에 호출 속도 조절
+- 동일한 프롬프트가 동시에 들어오면 한 번만 호출하고 결과 공유 (in-flight coalescing)
+- 우선순위 레인: interactive(챗봇/폼 등 사용자 대기) 요청이 batch(일괄 평가) 요청보다 먼저 토큰을 받음
+- 지터가 들어간 지수 백오프 재시도
+- 도구(tool)별 토큰/지연시간 집계
+- 호출마다 추적 span (agent.utils.tracing) 에 도구명 · 큐 대기 · 재시도 · coalescing 여부 기록
+
+사용 예:
+    from agent.utils.llm_gateway import get_llm
+    llm = get_llm(model="gpt-4o-mini", temperature=0.3, tool="resume_scoring_tool")
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from langchain_openai import ChatOpenAI
+
+from agent.utils.tracing import annotate, install_langchain_tracer
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+
+# 모델별 기본 한도 (OpenAI 계정 등급에 맞게 LLM_RATE_LIMITS 환경변수(JSON)로 덮어쓰기 가능)
+DEFAULT_RATE_LIMITS = {
+    "gpt-4o": {"rpm": 500, "tpm": 30000},
+    "gpt-4o-mini": {"rpm": 500, "tpm": 200000},
+    "default": {"rpm": 500, "tpm": 30000},
+}
+
+# batch 레인은 버킷에 이 비율 이상 남아 있을 때만 토큰을 가져감 (나머지는 interactive 몫)
+INTERACTIVE_RESERVE = float(os.getenv("LLM_INTERACTIVE_RESERVE", 0.2))
+MAX_ATTEMPTS = int(os.getenv("LLM_MAX_ATTEMPTS", 4))
+# 한도 대기 상한(초): 넘기면 더 기다리지 않고 호출 (429 는 재시도 백오프가 처리)
+MAX_QUEUE_WAIT = float(os.getenv("LLM_MAX_QUEUE_WAIT", 120))
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+DEFAULT_COMPLETION_TOKENS = 512
+
+
+def _load_rate_limits() -> Dict[str, Dict[str, int]]:
+    limits = {model: dict(values) for model, values in DEFAULT_RATE_LIMITS.items()}
+    raw = os.getenv("LLM_RATE_LIMITS")
+    if raw:
+        try:
+            for model, values in json.loads(raw).items():
+                limits.setdefault(model, {}).update(values)
+        except Exception as e:
+            print(f"[LLM-GATEWAY] LLM_RATE_LIMITS 파싱 실패: {e}")
+    return limits
+
+
+class TokenBucket:
+    """연속 보충형 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    def try_acquire(self, amount: float, reserve: float = 0.0) -> float:
+        """토큰 획득 시도. 성공하면 0, 실패하면 기다려야 할 초를 반환
+
+        버킷이 가득 차도 reserve 바닥을 남겨야 하므로, 요청량은 capacity - floor 로 자른다.
+        (그보다 큰 요청이 영원히 대기하지 않도록)
+        """
+        floor = self.capacity * reserve
+        amount = min(amount, self.capacity - floor)
+        with self.lock:
+            self._refill()
+            if self.tokens - amount >= floor:
+                self.tokens -= amount
+                return 0.0
+            return (amount + floor - self.tokens) / self.refill_per_second
+
+    def adjust(self, delta: float):
+        """사전 추정치와 실제 사용량 차이 보정 (양수: 추가 차감, 음수: 환불)"""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class ModelLimiter:
+    """모델 하나의 RPM/TPM 버킷 쌍"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.requests = TokenBucket(rpm, rpm / 60.0)
+        self.tokens = TokenBucket(tpm, tpm / 60.0)
+
+    def wait_time(self, estimated_tokens: int, priority: str) -> float:
+        reserve = 0.0 if priority == PRIORITY_INTERACTIVE else INTERACTIVE_RESERVE
+        wait = self.requests.try_acquire(1, reserve)
+        if wait:
+            return wait
+        wait = self.tokens.try_acquire(estimated_tokens, reserve)
+        if wait:
+            # 요청 토큰은 돌려놓고 다시 대기
+            self.requests.adjust(-1)
+        return wait
+
+
+class LLMGateway:
+    def __init__(self):
+        self.rate_limits = _load_rate_limits()
+        self.limiters: Dict[str, ModelLimiter] = {}
+        self.inflight: Dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    # ---------- 한도 ----------
+
+    def _limiter(self, model: str) -> ModelLimiter:
+        with self.lock:
+            limiter = self.limiters.get(model)
+            if limiter is None:
+                limits = self.rate_limits.get(model, self.rate_limits["default"])
+                limiter = ModelLimiter(limits["rpm"], limits["tpm"])
+                self.limiters[model] = limiter
+            return limiter
+
+    def _acquire(self, model: str, estimated_tokens: int, priority: str) -> float:
+        limiter = self._limiter(model)
+        waited = 0.0
+        while True:
+            wait = limiter.wait_time(estimated_tokens, priority)
+            if not wait:
+                return waited
+            if waited >= MAX_QUEUE_WAIT:
+                print(f"[LLM-GATEWAY] {model} 한도 대기 {waited:.1f}초 초과 - 대기 없이 호출")
+                return waited
+            wait = min(wait, 5.0, MAX_QUEUE_WAIT - waited)
+            time.sleep(wait)
+            waited += wait
+
+    async def _aacquire(self, model: str, estimated_tokens: int, priority: str) -> float:
+        limiter = self._limiter(model)
+        waited = 0.0
+        while True:
+            wait = limiter.wait_time(estimated_tokens, priority)
+            if not wait:
+                return waited
+            if waited >= MAX_QUEUE_WAIT:
+                print(f"[LLM-GATEWAY] {model} 한도 대기 {waited:.1f}초 초과 - 대기 없이 호출")
+                return waited
+            wait = min(wait, 5.0, MAX_QUEUE_WAIT - waited)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    # ---------- 재시도 ----------
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        try:
+            import openai
+            retryable = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)
+            return isinstance(error, retryable)
+        except ImportError:
+            return False
+
+    @staticmethod
+    def _backoff(attempt: int, error: Exception) -> float:
+        # 서버가 Retry-After 를 주면 우선 사용, 아니면 full jitter 지수 백오프
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF) + random.uniform(0, 0.5)
+            except ValueError:
+                pass
+        return random.uniform(0, min(MAX_BACKOFF, BASE_BACKOFF * (2 ** attempt)))
+
+    # ---------- 집계 ----------
+
+    def _record(self, tool: str, model: str, **values):
+        key = f"{tool}|{model}"
+        with self.lock:
+            entry = self.stats.setdefault(key, {
+                "tool": tool,
+                "model": model,
+                "calls": 0,
+                "coalesced": 0,
+                "retries": 0,
+                "errors": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "latency_total": 0.0,
+                "latency_max": 0.0,
+                "queue_wait_total": 0.0,
+            })
+            for name, value in values.items():
+                if name == "latency":
+                    entry["latency_total"] += value
+                    entry["latency_max"] = max(entry["latency_max"], value)
+                elif name == "queue_wait":
+                    entry["queue_wait_total"] += value
+                else:
+                    entry[name] += value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """도구/모델별 호출 집계"""
+        with self.lock:
+            rows = []
+            for entry in self.stats.values():
+                calls = entry["calls"] or 1
+                rows.append({
+                    **entry,
+                    "latency_avg": round(entry["latency_total"] / calls, 3),
+                    "queue_wait_avg": round(entry["queue_wait_total"] / calls, 3),
+                })
+            limiters = {
+                model: {
+                    "request_tokens": round(limiter.requests.tokens, 1),
+                    "token_tokens": round(limiter.tokens.tokens, 1),
+                }
+                for model, limiter in self.limiters.items()
+            }
+        return {"tools": sorted(rows, key=lambda row: (row["tool"], row["model"])), "buckets": limiters}
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
+
+    # ---------- 호출 ----------
+
+    @staticmethod
+    def _request_key(llm: "GatewayChatOpenAI", messages: List[BaseMessage], stop, kwargs) -> str:
+        payload = {
+            "model": llm.model_name,
+            "temperature": llm.temperature,
+            "max_tokens": llm.max_tokens,
+            "messages": [(message.type, message.content) for message in messages],
+            "stop": stop,
+            "kwargs": kwargs,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def _estimate_tokens(llm: "GatewayChatOpenAI", messages: List[BaseMessage]) -> int:
+        try:
+            prompt_tokens = llm.get_num_tokens_from_messages(messages)
+        except Exception:
+            prompt_tokens = sum(len(str(message.content)) for message in messages) // 2
+        return prompt_tokens + (llm.max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+    @staticmethod
+    def _usage(result: ChatResult) -> Dict[str, int]:
+        usage = (result.llm_output or {}).get("token_usage") or {}
+        return {
+            "prompt_tokens": int(usage.get("prompt_tokens") or 0),
+            "completion_tokens": int(usage.get("completion_tokens") or 0),
+        }
+
+    def _join_or_lead(self, key: str):
+        """동일 요청이 진행 중이면 (기존 Future, False), 아니면 (새 Future, True)"""
+        with self.lock:
+            future = self.inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self.inflight[key] = future
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Optional[ChatResult], error: Optional[BaseException]):
+        with self.lock:
+            self.inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _after_call(self, llm, estimated: int, result: ChatResult, started: float, queue_wait: float):
+        usage = self._usage(result)
+        actual = usage["prompt_tokens"] + usage["completion_tokens"]
+        if actual:
+            self._limiter(llm.model_name).tokens.adjust(actual - estimated)
+        annotate(**{"llm.queue_wait_ms": round(queue_wait * 1000, 2), "llm.estimated_tokens": estimated})
+        self._record(
+            llm.tool_name, llm.model_name,
+            calls=1,
+            prompt_tokens=usage["prompt_tokens"], completion_tokens=usage["completion_tokens"],
+            latency=time.perf_counter() - started, queue_wait=queue_wait,
+        )
+
+    def generate(self, llm: "GatewayChatOpenAI", messages: List[BaseMessage], stop, kwargs, call: Callable[[], ChatResult]) -> ChatResult:
+        key = self._request_key(llm, messages, stop, kwargs)
+        future, leader = self._join_or_lead(key)
+        if not leader:
+            self._record(llm.tool_name, llm.model_name, coalesced=1)
+            annotate(**{"llm.coalesced": True})
+            return future.result().model_copy(deep=True)
+
+        result, error = None, None
+        try:
+            estimated = self._estimate_tokens(llm, messages)
+            started = time.perf_counter()
+            queue_wait = 0.0
+            for attempt in range(MAX_ATTEMPTS):
+                queue_wait += self._acquire(llm.model_name, estimated, llm.priority)
+                try:
+                    result = call()
+                    break
+                except Exception as e:
+                    if attempt + 1 >= MAX_ATTEMPTS or not self._is_retryable(e):
+                        raise
+                    self._record(llm.tool_name, llm.model_name, retries=1)
+                    annotate(**{"llm.retries": attempt + 1})
+                    time.sleep(self._backoff(attempt, e))
+            self._after_call(llm, estimated, result, started, queue_wait)
+            return result
+        except BaseException as e:
+            error = e
+            self._record(llm.tool_name, llm.model_name, errors=1)
+            raise
+        finally:
+            self._finish(key, future, result, error)
+
+    async def agenerate(self, llm: "GatewayChatOpenAI", messages: List[BaseMessage], stop, kwargs, call) -> ChatResult:
+        key = self._request_key(llm, messages, stop, kwargs)
+        future, leader = self._join_or_lead(key)
+        if not leader:
+            self._record(llm.tool_name, llm.model_name, coalesced=1)
+            annotate(**{"llm.coalesced": True})
+            result = await asyncio.wrap_future(future)
+            return result.model_copy(deep=True)
+
+        result, error = None, None
+        try:
+            estimated = self._estimate_tokens(llm, messages)
+            started = time.perf_counter()
+            queue_wait = 0.0
+            for attempt in range(MAX_ATTEMPTS):
+                queue_wait += await self._aacquire(llm.model_name, estimated, llm.priority)
+                try:
+                    result = await call()
+                    break
+                except Exception as e:
+                    if attempt + 1 >= MAX_ATTEMPTS or not self._is_retryable(e):
+                        raise
+                    self._record(llm.tool_name, llm.model_name, retries=1)
+                    annotate(**{"llm.retries": attempt + 1})
+                    await asyncio.sleep(self._backoff(attempt, e))
+            self._after_call(llm, estimated, result, started, queue_wait)
+            return result
+        except BaseException as e:
+            error = e
+            self._record(llm.tool_name, llm.model_name, errors=1)
+            raise
+        finally:
+            self._finish(key, future, result, error)
+
+
+gateway = LLMGateway()
+install_langchain_tracer()
+
+
+class GatewayChatOpenAI(ChatOpenAI):
+    """게이트웨이를 거쳐 호출되는 ChatOpenAI
+
+    ChatOpenAI 를 그대로 상속하므로 `prompt | llm`, LLMChain, invoke/ainvoke 등
+    기존 사용 방식은 바뀌지 않는다.
+    """
+
+    tool_name: str = "default"
+    priority: str = PRIORITY_BATCH
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        return gateway.generate(
+            self, messages, stop, kwargs,
+            lambda: super(GatewayChatOpenAI, self)._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        )
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        return await gateway.agenerate(
+            self, messages, stop, kwargs,
+            lambda: super(GatewayChatOpenAI, self)._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        )
+
+
+def get_llm(
+    model: str = "gpt-4o-mini",
+    tool: str = "default",
+    priority: str = PRIORITY_BATCH,
+    **kwargs: Any,
+) -> GatewayChatOpenAI:
+    """게이트웨이 경유 ChatOpenAI 생성
+
+    Args:
+        model: 모델명
+        tool: 집계용 도구 이름
+        priority: "interactive" (사용자 대기 요청) 또는 "batch"
+        **kwargs: ChatOpenAI 추가 인자 (temperature, max_tokens 등)
+    """
+    # 재시도는 게이트웨이가 담당하므로 클라이언트 자체 재시도는 끔
+    kwargs.setdefault("max_retries", 0)
+    # 추적 콜백이 LLM span 이름/속성으로 사용
+    kwargs["metadata"] = {"llm_tool": tool, "llm_priority": priority, **(kwargs.get("metadata") or {})}
+    return GatewayChatOpenAI(model=model, tool_name=tool, priority=priority, **kwargs)
+
+
+def get_llm_stats() -> Dict[str, Any]:
+    return gateway.get_stats()
@@ -0,0 +1,558 @@
+"""
+에이전트 추적 (span)
+
+LangGraph 노드 / 도구 / LLM 호출을 span 으로 기록해 한 요청(예: 40초 걸린 이력서 분석)이
+어느 노드·어느 LLM 호출에서 시간을 쓰는지 보여준다.
+- LangChain 콜백 훅으로 모든 그래프 실행(root) · LangGraph 노드 · LangChain 도구 · LLM 호출을 자동 기록
+  (노드/도구 코드는 수정하지 않음, LLM span 에는 모델 · 도구명 · prompt/completion 토큰 · 큐 대기)
+- 그 밖의 구간은 `with span("이름", kind="tool"):` 로 직접 기록 (redis_cache 도구는 cache hit/miss 포함)
+- 백엔드 요청의 W3C traceparent 헤더를 이어받아 같은 trace_id 로 묶음
+- 내보내기: TRACE_EXPORT_PATH (JSON lines 파일) / OTEL_EXPORTER_OTLP_ENDPOINT (OTLP/HTTP JSON)
+  둘 다 없으면 내보내지 않고 프로세스 내 집계만 유지
+- 이름별 최근 TRACE_METRIC_WINDOW 건의 p50/p95 (get_trace_metrics → /metrics)
+
+사용 예:
+    from agent.utils.tracing import annotate, span
+    with span("resume_orchestrator.highlight", kind="tool", application_id=application_id):
+        ...
+        annotate(sections=len(sections))
+"""
+import atexit
+import json
+import os
+import queue
+import re
+import secrets
+import threading
+import time
+import urllib.request
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "kocruit-agent")
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH")
+_OTLP_BASE = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+OTLP_TRACES_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT") or (
+    f"{_OTLP_BASE.rstrip('/')}/v1/traces" if _OTLP_BASE else None
+)
+
+METRIC_WINDOW = int(os.getenv("TRACE_METRIC_WINDOW", 500))   # 이름별 백분위 계산에 쓰는 최근 span 수
+RECENT_SPANS = int(os.getenv("TRACE_RECENT_SPANS", 5000))     # get_trace() 로 조회할 수 있는 최근 span 수
+EXPORT_QUEUE_SIZE = 10000
+EXPORT_BATCH_SIZE = 200
+EXPORT_INTERVAL_SECONDS = 2.0
+MAX_ATTRIBUTE_LENGTH = 256
+
+# OTLP SpanKind
+_OTLP_KINDS = {"server": 2, "client": 3, "llm": 3}
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def _new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+class Span:
+    """하나의 구간 (trace_id / span_id 는 W3C 형식 16진수 문자열)"""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "attributes",
+                 "start_ns", "end_ns", "error", "_started")
+
+    def __init__(self, name: str, kind: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.span_id = _new_span_id()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes: Dict[str, Any] = {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        self.set(**attributes)
+
+    def set(self, **attributes: Any):
+        """속성 추가 (None 은 무시, 문자열은 MAX_ATTRIBUTE_LENGTH 로 자름)"""
+        for key, value in attributes.items():
+            if value is None:
+                continue
+            if not isinstance(value, (bool, int, float, str)):
+                value = str(value)
+            if isinstance(value, str) and len(value) > MAX_ATTRIBUTE_LENGTH:
+                value = value[:MAX_ATTRIBUTE_LENGTH]
+            self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        if self.end_ns is None:
+            return (time.perf_counter() - self._started) * 1000
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def end(self, error: Optional[BaseException] = None):
+        if self.end_ns is not None:
+            return
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"[:MAX_ATTRIBUTE_LENGTH]
+        # 시작 시각은 wall clock, 길이는 monotonic clock 기준
+        self.end_ns = self.start_ns + int((time.perf_counter() - self._started) * 1_000_000_000)
+        _record(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start_ns / 1_000_000_000,
+            "duration_ms": round(self.duration_ms, 2),
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        attributes = [{"key": "span.type", "value": {"stringValue": self.kind}}]
+        for key, value in self.attributes.items():
+            if isinstance(value, bool):
+                typed = {"boolValue": value}
+            elif isinstance(value, int):
+                typed = {"intValue": str(value)}
+            elif isinstance(value, float):
+                typed = {"doubleValue": value}
+            else:
+                typed = {"stringValue": value}
+            attributes.append({"key": key, "value": typed})
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _OTLP_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": attributes,
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("agent_current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def annotate(**attributes: Any):
+    """현재 span 에 속성 추가 (span 밖이면 무시)"""
+    span_ = _current_span.get()
+    if span_ is not None:
+        span_.set(**attributes)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str]]:
+    """W3C traceparent → (trace_id, parent span_id). 형식이 틀리면 None"""
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if not match or match.group(1) == "ff" or set(match.group(2)) == {"0"} or set(match.group(3)) == {"0"}:
+        return None
+    return match.group(2), match.group(3)
+
+
+def format_traceparent(span_: Span) -> str:
+    return f"00-{span_.trace_id}-{span_.span_id}-01"
+
+
+def start_span(name: str, kind: str = "internal", parent: Optional[Span] = None,
+               traceparent: Optional[str] = None, **attributes: Any) -> Span:
+    """span 생성 (현재 span 으로 설정하지는 않음 - 끝낼 때 span.end())
+
+    부모는 parent → traceparent 헤더 → 현재 span 순으로 정하고, 없으면 새 trace 를 시작한다.
+    """
+    if parent is None:
+        remote = parse_traceparent(traceparent)
+        if remote is not None:
+            return Span(name, kind, remote[0], remote[1], attributes)
+        parent = _current_span.get()
+    if parent is not None:
+        return Span(name, kind, parent.trace_id, parent.span_id, attributes)
+    return Span(name, kind, _new_trace_id(), None, attributes)
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", traceparent: Optional[str] = None, **attributes: Any) -> Iterator[Span]:
+    """구간 기록 (블록 안에서는 이 span 이 현재 span - 하위 LLM/노드 span 의 부모가 됨)"""
+    span_ = start_span(name, kind, traceparent=traceparent, **attributes)
+    token = _current_span.set(span_)
+    try:
+        yield span_
+    except BaseException as e:
+        span_.end(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span_.end()
+
+
+# ---------------------------------------------------------------------------
+# 집계 (이름별 p50 / p95)
+# ---------------------------------------------------------------------------
+
+class TraceMetrics:
+    """(kind, name) 별 최근 METRIC_WINDOW 건 지연시간 + 토큰/캐시 합계 (프로세스 단위)"""
+
+    def __init__(self, window: int = METRIC_WINDOW, recent: int = RECENT_SPANS):
+        self._lock = threading.Lock()
+        self._window = window
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._recent: Deque[Span] = deque(maxlen=recent)
+
+    def observe(self, span_: Span):
+        duration = span_.duration_ms
+        with self._lock:
+            entry = self._entries.get((span_.kind, span_.name))
+            if entry is None:
+                entry = self._entries[(span_.kind, span_.name)] = {
+                    "durations": deque(maxlen=self._window),
+                    "count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                    "prompt_tokens": 0, "completion_tokens": 0, "queue_wait_ms": 0.0, "cache": {},
+                }
+            entry["durations"].append(duration)
+            entry["count"] += 1
+            entry["total_ms"] += duration
+            entry["max_ms"] = max(entry["max_ms"], duration)
+            if span_.error:
+                entry["errors"] += 1
+            attributes = span_.attributes
+            entry["prompt_tokens"] += int(attributes.get("llm.prompt_tokens") or 0)
+            entry["completion_tokens"] += int(attributes.get("llm.completion_tokens") or 0)
+            entry["queue_wait_ms"] += float(attributes.get("llm.queue_wait_ms") or 0.0)
+            cache = attributes.get("cache")
+            if cache:
+                entry["cache"][cache] = entry["cache"].get(cache, 0) + 1
+            self._recent.append(span_)
+
+    @staticmethod
+    def _percentile(ordered: List[float], q: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, max(0, int(round(q * len(ordered) + 0.5)) - 1))
+        return ordered[index]
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = []
+            for (kind, name), entry in self._entries.items():
+                ordered = sorted(entry["durations"])
+                row = {
+                    "kind": kind,
+                    "name": name,
+                    "count": entry["count"],
+                    "errors": entry["errors"],
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 2),
+                    "p50_ms": round(self._percentile(ordered, 0.50), 2),
+                    "p95_ms": round(self._percentile(ordered, 0.95), 2),
+                    "max_ms": round(entry["max_ms"], 2),
+                }
+                if kind == "llm":
+                    row.update(
+                        prompt_tokens=entry["prompt_tokens"],
+                        completion_tokens=entry["completion_tokens"],
+                        queue_wait_avg_ms=round(entry["queue_wait_ms"] / entry["count"], 2),
+                    )
+                if entry["cache"]:
+                    row["cache"] = dict(entry["cache"])
+                rows.append(row)
+        rows.sort(key=lambda row: (row["kind"], -row["p95_ms"]))
+        return {"service": SERVICE_NAME, "window": self._window, "spans": rows, "exporter": exporter.status()}
+
+    def trace(self, trace_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            spans = [span_ for span_ in self._recent if span_.trace_id == trace_id]
+        return [span_.to_dict() for span_ in sorted(spans, key=lambda item: item.start_ns)]
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self._recent.clear()
+
+
+# ---------------------------------------------------------------------------
+# 내보내기 (JSON lines / OTLP HTTP JSON)
+# ---------------------------------------------------------------------------
+
+class SpanExporter:
+    """끝난 span 을 백그라운드 스레드에서 묶어 내보냄 (큐가 가득 차면 버리고 개수만 셈)"""
+
+    def __init__(self, path: Optional[str] = TRACE_EXPORT_PATH, endpoint: Optional[str] = OTLP_TRACES_ENDPOINT):
+        self.path = path
+        self.endpoint = endpoint
+        self.exported = 0
+        self.dropped = 0
+        self.failures = 0
+        self._queue: "queue.Queue[Span]" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path or self.endpoint)
+
+    def submit(self, span_: Span):
+        if not self.enabled:
+            return
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+        try:
+            self._queue.put_nowait(span_)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self, first: Optional[Span] = None) -> List[Span]:
+        batch = [first] if first is not None else []
+        while len(batch) < EXPORT_BATCH_SIZE:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=EXPORT_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+            self._export(self._drain(first))
+
+    def flush(self):
+        """남은 span 을 지금 내보냄 (종료 시 atexit)"""
+        batch = self._drain()
+        while batch:
+            self._export(batch)
+            batch = self._drain()
+
+    def _export(self, batch: List[Span]):
+        with self._lock:
+            try:
+                if self.path:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        for span_ in batch:
+                            f.write(json.dumps(span_.to_dict(), ensure_ascii=False) + "\n")
+                if self.endpoint:
+                    payload = {"resourceSpans": [{
+                        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                        "scopeSpans": [{"scope": {"name": "agent.utils.tracing"}, "spans": [span_.to_otlp() for span_ in batch]}],
+                    }]}
+                    request = urllib.request.Request(
+                        self.endpoint, data=json.dumps(payload).encode(),
+                        headers={"Content-Type": "application/json"}, method="POST"
+                    )
+                    urllib.request.urlopen(request, timeout=5).close()
+                self.exported += len(batch)
+            except Exception as e:
+                self.failures += 1
+                print(f"[TRACING] span 내보내기 실패 ({len(batch)}개): {e}")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "json_path": self.path,
+            "otlp_endpoint": self.endpoint,
+            "queued": self._queue.qsize(),
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "failures": self.failures,
+        }
+
+
+trace_metrics = TraceMetrics()
+exporter = SpanExporter()
+
+
+def _record(span_: Span):
+    trace_metrics.observe(span_)
+    exporter.submit(span_)
+
+
+def get_trace_metrics() -> Dict[str, Any]:
+    return trace_metrics.report()
+
+
+def get_trace(trace_id: str) -> List[Dict[str, Any]]:
+    """최근 span 중 trace_id 에 속한 것 (시작 순)"""
+    return trace_metrics.trace(trace_id)
+
+
+# ---------------------------------------------------------------------------
+# LangChain / LangGraph 콜백 훅
+# ---------------------------------------------------------------------------
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+def _build_langchain_handler():
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class TracingCallbackHandler(BaseCallbackHandler):
+        """그래프 실행 · LangGraph 노드 · 도구 · LLM 호출을 span 으로 기록
+
+        노드 안의 RunnableSequence / 프롬프트 / 파서 같은 하위 체인은 span 을 만들지 않고
+        부모 span 으로 이어 준다. 기록하는 span 은 실행되는 동안 현재 span 이 되므로
+        노드 안에서 연 span(redis_cache 도구 등)과 LLM 호출이 그 노드 아래에 붙는다.
+        """
+
+        run_inline = True  # 비동기 실행에서도 같은 컨텍스트에서 호출되어야 현재 span 이 전달됨
+
+        def __init__(self):
+            # run_id → (span, contextvar token, 부모 span). 하위 체인은 span 자리에 부모 span, token 은 None
+            self._runs: Dict[Any, Tuple[Optional[Span], Any, Optional[Span]]] = {}
+            self._lock = threading.Lock()
+
+        def _parent(self, parent_run_id) -> Optional[Span]:
+            # 현재 span 우선 (노드 안에서 연 도구 span 아래에 LLM span 이 붙도록),
+            # 컨텍스트가 전달되지 않은 스레드에서는 LangChain 부모 run 으로 찾음
+            current = _current_span.get()
+            if current is not None or parent_run_id is None:
+                return current
+            with self._lock:
+                entry = self._runs.get(parent_run_id)
+            return entry[0] if entry is not None else None
+
+        def _start(self, run_id, parent_run_id, name: str, kind: str, **attributes):
+            parent = self._parent(parent_run_id)
+            span_ = start_span(name, kind, parent=parent, **attributes)
+            token = _current_span.set(span_)
+            with self._lock:
+                self._runs[run_id] = (span_, token, parent)
+
+        def _pass_through(self, run_id, parent_run_id):
+            parent = self._parent(parent_run_id)
+            with self._lock:
+                self._runs[run_id] = (parent, None, parent)
+
+        def _end(self, run_id, error: Optional[BaseException] = None, **attributes):
+            with self._lock:
+                entry = self._runs.pop(run_id, None)
+            if entry is None or entry[1] is None:
+                return
+            span_, token, parent = entry
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # 시작과 다른 컨텍스트에서 끝난 경우 (스트리밍 등) - 부모로 되돌림
+                if _current_span.get() is span_:
+                    _current_span.set(parent)
+            span_.set(**attributes)
+            span_.end(error)
+
+        # -- 체인 (그래프 / 노드) --
+
+        def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+            name = kwargs.get("name") or (serialized or {}).get("name") or "chain"
+            node = (metadata or {}).get("langgraph_node")
+            if parent_run_id is None:
+                self._start(run_id, parent_run_id, name, "graph")
+            elif node and node == name and not node.startswith("__"):
+                self._start(run_id, parent_run_id, name, "node",
+                            **{"langgraph.step": (metadata or {}).get("langgraph_step")})
+            else:
+                self._pass_through(run_id, parent_run_id)
+
+        def on_chain_end(self, outputs, *, run_id, **kwargs):
+            self._end(run_id)
+
+        def on_chain_error(self, error, *, run_id, **kwargs):
+            self._end(run_id, error)
+
+        # -- 도구 --
+
+        def on_tool_start(self, serialized, input_str, *, run_id, parent_run_id=None, **kwargs):
+            name = kwargs.get("name") or (serialized or {}).get("name") or "tool"
+            self._start(run_id, parent_run_id, name, "tool")
+
+        def on_tool_end(self, output, *, run_id, **kwargs):
+            self._end(run_id)
+
+        def on_tool_error(self, error, *, run_id, **kwargs):
+            self._end(run_id, error)
+
+        # -- LLM --
+
+        def _llm_start(self, run_id, parent_run_id, metadata, kwargs):
+            metadata = metadata or {}
+            params = kwargs.get("invocation_params") or {}
+            model = metadata.get("ls_model_name") or params.get("model_name") or params.get("model")
+            tool = metadata.get("llm_tool")
+            self._start(run_id, parent_run_id, f"llm:{tool or model or 'unknown'}", "llm",
+                        **{"llm.model": model, "llm.tool": tool, "llm.priority": metadata.get("llm_priority")})
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+            self._llm_start(run_id, parent_run_id, metadata, kwargs)
+
+        def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+            self._llm_start(run_id, parent_run_id, metadata, kwargs)
+
+        def on_llm_end(self, response, *, run_id, **kwargs):
+            llm_output = response.llm_output or {}
+            usage = llm_output.get("token_usage") or {}
+            prompt_tokens = usage.get("prompt_tokens")
+            completion_tokens = usage.get("completion_tokens")
+            if prompt_tokens is None:
+                # llm_output 가 없는 경우 (스트리밍 등) 메시지의 usage_metadata 사용
+                for generations in response.generations:
+                    for generation in generations:
+                        usage_metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                        prompt_tokens = (prompt_tokens or 0) + usage_metadata.get("input_tokens", 0)
+                        completion_tokens = (completion_tokens or 0) + usage_metadata.get("output_tokens", 0)
+            self._end(run_id, **{
+                "llm.prompt_tokens": prompt_tokens,
+                "llm.completion_tokens": completion_tokens,
+                "llm.response_model": llm_output.get("model_name"),
+            })
+
+        def on_llm_error(self, error, *, run_id, **kwargs):
+            self._end(run_id, error)
+
+    return TracingCallbackHandler()
+
+
+def install_langchain_tracer():
+    """모든 LangChain/LangGraph 실행에 추적 콜백을 붙임 (여러 번 호출해도 한 번만 등록)
+
+    ContextVar 의 기본값으로 핸들러를 두므로 워커 스레드를 포함한 모든 실행에 적용된다.
+    """
+    global _installed
+    if _installed:
+        return
+    with _install_lock:
+        if _installed:
+            return
+        from langchain_core.tracers.context import register_configure_hook
+
+        handler_var = ContextVar("agent_trace_handler", default=_build_langchain_handler())
+        register_configure_hook(handler_var, inheritable=True)
+        _installed = True
+
+
+def trace_graph(graph, name: str):
+    """컴파일된 LangGraph 에 이름을 붙이고 추적 콜백을 등록
+
+    이름이 없으면 모든 그래프가 "LangGraph" 로 집계되므로 workflow.compile() 결과를 감싸서 반환한다.
+        return trace_graph(workflow.compile(), "highlight_workflow")
+    """
+    install_langchain_tracer()
+    graph.name = name
+    return graph
@@ -0,0 +1,392 @@
+"""
+하이라이트 후처리용 전환어 / 감정 어휘 주석기
+
+전환어·긍정·부정 어휘 패턴을 한 번만 컴파일한 하나의 결합 정규식(접두사 트라이 형태)으로 만들어
+자기소개서 전체를 한 번 훑고, 일치 위치를 배열로 보관한다. 문장별 전환어 위치와 전환어 앞/뒤 감정은
+이 배열을 구간 조회해서 구하므로, 같은 자기소개서에 대해 오렌지 후보 선정과 부정 하이라이트 필터링이
+같은 주석을 재사용한다.
+
+- annotate_document(text): 문장 분리([.!?] + 공백) + 문장별 주석 (최근 문서 LRU 캐시)
+- annotate_text(text): 문서에 없는 문장(LLM 이 돌려준 구절 등) 단독 주석
+- 판정 규칙은 기존 highlight_workflow 의 is_transition_word / analyze_transition_context /
+  analyze_sentiment 와 같다 (패턴 순서, 왼쪽 우선 일치, 패턴별 1회 카운트)
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 전환어 감지 (is_transition_word)
+TRANSITION_PATTERNS = [
+    # 대조/반전 전환어
+    r'하지만|그럼에도\s*불구하고|그러나|다만|단|오히려|반면|반대로|대신|대신에|그런데|그렇지만',
+    # 시간/순서 전환어
+    r'그러다가|그\s*후|이후|그\s*다음|다음에는|그\s*때부터|그\s*때|그\s*이후|그\s*다음에',
+    # 조건/결과 전환어
+    r'만약|만약에|결과적으로|결국|마침내|드디어|그\s*결과|그\s*끝에',
+    # 추가/강조 전환어
+    r'또한|게다가|더욱이|무엇보다|특히|특별히|더구나|거기에|또\s*한편',
+    # 인과 전환어
+    r'그\s*이유로|그\s*때문에|그\s*래서|그\s*때문|그\s*결과로|그\s*덕분에',
+    # 예시 전환어
+    r'예를\s*들면|예시로|구체적으로|실제로|사실|실제로는'
+]
+
+# 문맥 분석에서 위치를 찾는 전환어 (analyze_transition_context, 이 순서대로 시도)
+CONTEXT_TRANSITION_PATTERNS = [
+    r'하지만|그러나|그런데|그렇지만|다만|단|오히려|반면|반대로|대신|대신에',
+    r'그러다가|그\s*후|이후|그\s*다음|다음에는|그\s*때부터',
+    r'만약|만약에|결과적으로|결국|마침내|드디어',
+    r'또한|게다가|더욱이|무엇보다|특히|특별히'
+]
+
+POSITIVE_PATTERNS = [
+    r'성공|성과|개선|향상|증가|달성|완료|해결|극복|발전|성장|도약|혁신|창의|효율|최적화',
+    r'좋은|훌륭한|우수한|뛰어난|탁월한|최고의|최상의|완벽한|완전한|완성된',
+    r'만족|기쁨|희망|자신감|긍정|낙관|열정|의지|노력|성실|책임감|주도성',
+    r'배웠다|성장했다|개선했다|해결했다|달성했다|완료했다|극복했다|발전했다',
+    r'잘\s*했다|성공했다|완료했다|해결했다|개선했다|향상했다|증가했다|달성했다',
+    r'좋았다|훌륭했다|우수했다|뛰어났다|탁월했다|완벽했다|완전했다|완성했다'
+]
+
+NEGATIVE_PATTERNS = [
+    r'실패|실패했다|실패했고|실패했으며|실패했지만|실패했고|실패했으니|실패했으므로',
+    r'어려움|어려웠다|어려웠고|어려웠으며|어려웠지만|어려웠고|어려웠으니|어려웠으므로',
+    r'문제|문제가|문제를|문제에|문제로|문제와|문제는|문제도|문제만|문제까지',
+    r'실수|실수했다|실수했고|실수했으며|실수했지만|실수했고|실수했으니|실수했으므로',
+    r'부족|부족했다|부족했고|부족했으며|부족했지만|부족했고|부족했으니|부족했으므로',
+    r'미흡|미흡했다|미흡했고|미흡했으며|미흡했지만|미흡했고|미흡했으니|미흡했으므로',
+    r'부족함|부족함을|부족함에|부족함으로|부족함과|부족함은|부족함도|부족함만|부족함까지',
+    r'실망|실망했다|실망했고|실망했으며|실망했지만|실망했고|실망했으니|실망했으므로',
+    r'좌절|좌절했다|좌절했고|좌절했으며|좌절했지만|좌절했고|좌절했으니|좌절했으므로',
+    r'힘들었다|어려웠다|막막했다|당황했다|혼란스러웠다|불안했다|걱정했다',
+    r'나쁜|안좋은|부족한|미흡한|실패한|실패했다|실패했고|실패했으며|실패했지만',
+    r'어려웠다|힘들었다|막막했다|당황했다|혼란스러웠다|불안했다|걱정했다|실망했다|좌절했다'
+]
+
+# 문장 분리 (analyze_category_with_llm 과 같은 규칙)
+SENTENCE_BOUNDARY = re.compile(r'[.!?]\s+')
+_WHITESPACE = r'\s*'
+
+
+def _tokens(literal: str) -> List[str]:
+    """'그\\s*후' → ['그', '\\s*', '후']"""
+    tokens, index = [], 0
+    while index < len(literal):
+        if literal.startswith(_WHITESPACE, index):
+            tokens.append(_WHITESPACE)
+            index += len(_WHITESPACE)
+        else:
+            tokens.append(re.escape(literal[index]))
+            index += 1
+    return tokens
+
+
+def _trie_regex(literals: List[str]) -> str:
+    """어휘 목록 → 접두사 트라이 정규식 (각 위치에서 첫 글자로 분기, 가장 긴 어휘 우선)"""
+    trie: Dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for token in _tokens(literal):
+            node = node.setdefault(token, {})
+        node[""] = {}
+
+    def render(node: Dict[str, Any]) -> str:
+        branches = [token + render(child) for token, child in sorted(node.items()) if token]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # 더 긴 어휘를 먼저 시도하고 안 되면 여기서 끝남 (탐욕적 선택)
+            return ("(?:" + body + ")?") if len(branches) == 1 else body + "?"
+        return body
+
+    return render(trie)
+
+
+class LexiconMatcher:
+    """전환어/문맥 전환어/긍정/부정 패턴을 한 번에 찾는 결합 매처
+
+    패턴마다 비트 하나를 배정하고, 위치별 일치 결과는 (start, end, 패턴 비트마스크) 배열로 돌려준다.
+    """
+
+    def __init__(self):
+        self.groups: Dict[str, List[int]] = {}
+        self._patterns: List[re.Pattern] = []
+        literals = set()
+        for group, patterns in (
+            ("transition", TRANSITION_PATTERNS),
+            ("context", CONTEXT_TRANSITION_PATTERNS),
+            ("positive", POSITIVE_PATTERNS),
+            ("negative", NEGATIVE_PATTERNS),
+        ):
+            self.groups[group] = []
+            for pattern in patterns:
+                self.groups[group].append(len(self._patterns))
+                self._patterns.append(re.compile(pattern, re.IGNORECASE))
+                literals.update(pattern.split("|"))
+        self.masks = {group: sum(1 << bit for bit in bits) for group, bits in self.groups.items()}
+        # 첫 글자 문자 클래스로 대부분의 위치를 먼저 거르고, 통과한 위치에서만 트라이를 시도 (겹치는 일치도 찾도록 lookahead)
+        first_chars = "".join(sorted({re.escape(literal[0]) for literal in literals}))
+        self._scanner = re.compile(
+            "(?=[" + first_chars + "])(?=(" + _trie_regex(sorted(literals)) + "))", re.IGNORECASE
+        )
+        self._credit_cache: Dict[str, int] = {}
+
+    def pattern(self, bit: int) -> re.Pattern:
+        return self._patterns[bit]
+
+    def credit(self, token: str) -> int:
+        """이 위치에서 시작하는 일치(token) 로 성립하는 패턴 비트마스크"""
+        mask = self._credit_cache.get(token)
+        if mask is None:
+            mask = 0
+            for bit, pattern in enumerate(self._patterns):
+                if pattern.match(token):
+                    mask |= 1 << bit
+            self._credit_cache[token] = mask
+        return mask
+
+    def scan(self, text: str) -> Tuple[List[int], List[int], List[int]]:
+        """텍스트 전체를 한 번 훑어 (시작 위치, 끝 위치, 패턴 비트마스크) 목록 반환 (시작 위치 오름차순)"""
+        starts, ends, masks = [], [], []
+        for match in self._scanner.finditer(text):
+            starts.append(match.start(1))
+            ends.append(match.end(1))
+            masks.append(self.credit(match.group(1)))
+        return starts, ends, masks
+
+    def counts(self, masks: np.ndarray, group: str) -> np.ndarray:
+        """비트마스크 배열 → 그룹(positive/negative 등) 에 속한 성립 패턴 수"""
+        bits = np.asarray(self.groups[group], dtype=np.int64)
+        return ((masks[:, None] >> bits[None, :]) & 1).sum(axis=1)
+
+
+_matcher: Optional[LexiconMatcher] = None
+
+
+def get_lexicon_matcher() -> LexiconMatcher:
+    global _matcher
+    if _matcher is None:
+        _matcher = LexiconMatcher()
+    return _matcher
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def _sentiment_of(mask: int, text_length: int, matcher: LexiconMatcher) -> str:
+    if text_length < 2:
+        return 'neutral'
+    positive = _popcount(mask & matcher.masks["positive"])
+    negative = _popcount(mask & matcher.masks["negative"])
+    if positive > negative and positive > 0:
+        return 'positive'
+    elif negative > positive and negative > 0:
+        return 'negative'
+    return 'neutral'
+
+
+def _empty_context() -> Dict[str, Any]:
+    return {
+        'has_context_change': False,
+        'positive_after_negative': False,
+        'negative_after_positive': False,
+        'transition_word': '',
+        'before_transition': '',
+        'after_transition': '',
+        'before_sentiment': 'neutral',
+        'after_sentiment': 'neutral'
+    }
+
+
+@dataclass
+class SentenceAnnotation:
+    text: str
+    start: int                      # 문서 내 위치
+    end: int
+    is_transition: bool
+    sentiment: str
+    positive_count: int
+    negative_count: int
+    context: Dict[str, Any] = field(default_factory=_empty_context)
+
+
+class TextAnnotator:
+    """한 텍스트의 일치 목록을 들고 임의 구간의 패턴 마스크를 조회"""
+
+    def __init__(self, text: str, matcher: Optional[LexiconMatcher] = None):
+        self.text = text
+        self.matcher = matcher or get_lexicon_matcher()
+        self.starts, self.ends, self.masks = self.matcher.scan(text)
+
+    def span_mask(self, start: int, end: int) -> int:
+        """[start, end) 안에서 성립하는 패턴 비트마스크 (구간을 잘라 re.search 한 것과 같음)"""
+        mask = 0
+        for index in range(bisect_left(self.starts, start), bisect_left(self.starts, end)):
+            if self.ends[index] <= end:
+                mask |= self.masks[index]
+            else:
+                # 구간 끝에 걸친 일치는 잘린 부분만으로 다시 판정 (예: '실패했다' 가 '실패' 에서 잘린 경우)
+                mask |= self.matcher.credit(self.text[self.starts[index]:end])
+        return mask
+
+    def first_position(self, start: int, end: int, bit: int) -> Optional[int]:
+        """[start, end) 에서 패턴(bit) 이 처음 성립하는 위치"""
+        flag = 1 << bit
+        for index in range(bisect_left(self.starts, start), bisect_left(self.starts, end)):
+            if not self.masks[index] & flag:
+                continue
+            position = self.starts[index]
+            if self.ends[index] <= end or self.matcher.credit(self.text[position:end]) & flag:
+                return position
+        return None
+
+    def has_transition(self, start: int, end: int) -> bool:
+        return bool(self.span_mask(start, end) & self.matcher.masks["transition"])
+
+    def sentiment(self, start: int, end: int) -> str:
+        text = self.text[start:end].strip()
+        if len(text) < 2:
+            return 'neutral'
+        return _sentiment_of(self.span_mask(start, end), len(text), self.matcher)
+
+    def transition_context(self, start: int, end: int) -> Dict[str, Any]:
+        """전환어를 중심으로 앞뒤 문맥 분석 (analyze_transition_context 와 같은 결과)"""
+        result = _empty_context()
+        sentence = self.text[start:end]
+        for bit in self.matcher.groups["context"]:
+            position = self.first_position(start, end, bit)
+            if position is None:
+                continue
+            match = self.matcher.pattern(bit).match(sentence, position - start)
+            before_text = sentence[:match.start()].strip()
+            after_text = sentence[match.end():].strip()
+            # 전환어 앞뒤 텍스트가 모두 있는 경우만 분석
+            if before_text and after_text:
+                before_sentiment = self.sentiment(start, start + match.start())
+                after_sentiment = self.sentiment(start + match.end(), end)
+                result.update({
+                    'has_context_change': True,
+                    'transition_word': match.group(),
+                    'before_transition': before_text,
+                    'after_transition': after_text,
+                    'before_sentiment': before_sentiment,
+                    'after_sentiment': after_sentiment
+                })
+                if before_sentiment == 'negative' and after_sentiment == 'positive':
+                    result['positive_after_negative'] = True
+                elif before_sentiment == 'positive' and after_sentiment == 'negative':
+                    result['negative_after_positive'] = True
+                break
+        return result
+
+    def annotate(self, start: int, end: int) -> SentenceAnnotation:
+        mask = self.span_mask(start, end)
+        text = self.text[start:end]
+        is_transition = bool(mask & self.matcher.masks["transition"])
+        return SentenceAnnotation(
+            text=text,
+            start=start,
+            end=end,
+            is_transition=is_transition,
+            sentiment=_sentiment_of(mask, len(text.strip()), self.matcher) if text.strip() else 'neutral',
+            positive_count=_popcount(mask & self.matcher.masks["positive"]),
+            negative_count=_popcount(mask & self.matcher.masks["negative"]),
+            # 문맥 분석은 전환어 문장만 (기존 필터와 같은 조건)
+            context=self.transition_context(start, end) if is_transition else _empty_context(),
+        )
+
+
+class DocumentAnnotation:
+    """자기소개서 한 건의 문장별 주석
+
+    문장별 패턴 마스크 / 긍정·부정 패턴 수 / 감정은 일치 배열을 문장 번호로 모아 한 번에 계산하고,
+    전환어 앞뒤 문맥 분석만 전환어가 있는 문장에 대해 따로 한다.
+    """
+
+    def __init__(self, text: str):
+        annotator = TextAnnotator(text)
+        matcher = annotator.matcher
+        self.annotator = annotator
+        self.sentences: List[SentenceAnnotation] = []
+        self._by_text: Dict[str, SentenceAnnotation] = {}
+
+        spans = split_sentence_spans(text)
+        if not spans:
+            return
+        sentence_starts = np.asarray([start for start, _ in spans], dtype=np.int64)
+        sentence_ends = np.asarray([end for _, end in spans], dtype=np.int64)
+        hit_starts = np.asarray(annotator.starts, dtype=np.int64)
+        hit_ends = np.asarray(annotator.ends, dtype=np.int64)
+        hit_masks = np.asarray(annotator.masks, dtype=np.int64)
+
+        # 일치 → 속한 문장 번호, 문장 안에서 끝나는 일치의 마스크를 문장별로 OR
+        sentence_ids = np.searchsorted(sentence_starts, hit_starts, side="right") - 1
+        clipped = np.maximum(sentence_ids, 0)
+        in_sentence = (sentence_ids >= 0) & (hit_starts < sentence_ends[clipped])
+        whole = in_sentence & (hit_ends <= sentence_ends[clipped])
+        masks = np.zeros(len(spans), dtype=np.int64)
+        np.bitwise_or.at(masks, sentence_ids[whole], hit_masks[whole])
+        for index in np.nonzero(in_sentence & ~whole)[0]:
+            sentence_id = int(sentence_ids[index])
+            masks[sentence_id] |= matcher.credit(text[int(hit_starts[index]):int(sentence_ends[sentence_id])])
+
+        positive = matcher.counts(masks, "positive")
+        negative = matcher.counts(masks, "negative")
+        transition = (masks & matcher.masks["transition"]) != 0
+        lengths = sentence_ends - sentence_starts
+        sentiments = np.where(
+            lengths < 2, "neutral",
+            np.where(positive > negative, "positive", np.where(negative > positive, "negative", "neutral"))
+        )
+
+        for index, (start, end) in enumerate(spans):
+            is_transition = bool(transition[index])
+            annotation = SentenceAnnotation(
+                text=text[start:end],
+                start=start,
+                end=end,
+                is_transition=is_transition,
+                sentiment=str(sentiments[index]),
+                positive_count=int(positive[index]),
+                negative_count=int(negative[index]),
+                context=annotator.transition_context(start, end) if is_transition else _empty_context(),
+            )
+            self.sentences.append(annotation)
+            self._by_text.setdefault(annotation.text, annotation)
+
+    def lookup(self, sentence: str) -> SentenceAnnotation:
+        """문서 문장이면 저장된 주석, 아니면(LLM 이 일부만 돌려준 구절 등) 그 구절만 따로 주석"""
+        sentence = sentence.strip()
+        annotation = self._by_text.get(sentence)
+        return annotation if annotation is not None else annotate_text(sentence)
+
+
+def split_sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """re.split(r'[.!?]\\s+', text) 조각의 strip 된 (start, end) 위치 (빈 조각 제외)"""
+    spans, previous = [], 0
+    for match in list(SENTENCE_BOUNDARY.finditer(text)) + [None]:
+        end = match.start() if match else len(text)
+        piece = text[previous:end]
+        stripped = piece.strip()
+        if stripped:
+            start = previous + (len(piece) - len(piece.lstrip()))
+            spans.append((start, start + len(stripped)))
+        if match:
+            previous = match.end()
+    return spans
+
+
+def annotate_text(text: str) -> SentenceAnnotation:
+    annotator = TextAnnotator(text)
+    return annotator.annotate(0, len(text))
+
+
+@lru_cache(maxsize=32)
+def annotate_document(text: str) -> DocumentAnnotation:
+    return DocumentAnnotation(text)
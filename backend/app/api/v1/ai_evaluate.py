@@ -13,8 +13,6 @@ from sqlalchemy import or_
 # agent tool import
 import sys, os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../../agent'))
-from agent.tools.written_test_generation_tool import generate_written_test_questions
-from agent.tools.answer_grading_tool import grade_written_test_answer
 from app.schemas.written_test_answer import WrittenTestAnswerCreate, WrittenTestAnswerResponse
 
 import openai
@@ -75,6 +73,7 @@ def generate_written_test(req: WrittenTestGenerateRequest, db: Session = Depends
                 raise HTTPException(status_code=400, detail=f"JobPost의 '{key}' 필드가 비어 있습니다.")
         
         # 호출 방식 변경: jobpost_dict를 jobpost 키로 감싸서 넘김
+        from agent.tools.written_test_generation_tool import generate_written_test_questions
         questions = generate_written_test_questions({"jobpost": jobpost_dict})
         return {"questions": questions}
     except Exception as e:
@@ -128,6 +127,7 @@ def submit_written_test_answer(req: WrittenTestAnswerCreate, db: Session = Depen
         # AI 채점: score, feedback이 없는 경우에만 평가
         question = db.query(WrittenTestQuestion).filter(WrittenTestQuestion.id == req.question_id).first()
         if question and (answer.score is None or answer.score == 0):
+            from agent.tools.answer_grading_tool import grade_written_test_answer
             result = grade_written_test_answer(question.question_text, req.answer_text)
             answer.score = result["score"]
             answer.feedback = result["feedback"]
@@ -254,6 +254,7 @@ def auto_grade_written_test_by_jobpost(jobpost_id: int, db: Session = Depends(ge
             question = next((q for q in questions if q.id == answer.question_id), None)
             if not question:
                 continue
+            from agent.tools.answer_grading_tool import grade_written_test_answer
             result = grade_written_test_answer(question.question_text, answer.answer_text)
             if result["score"] is not None:
                 answer.score = result["score"]
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import Table, MetaData, select
-from typing import List
+from typing import List, Optional
 import json
-import re
+import httpx
 from app.core.database import get_db
+from app.core.agent_client import AgentUnavailableError, get_agent_client
+from app.core.pagination import DEFAULT_PAGE_SIZE, estimated_row_count, paginate
 from app.schemas.application import (
     ApplicationCreate, ApplicationUpdate, ApplicationDetail, 
     ApplicationList
@@ -12,7 +14,8 @@ from app.schemas.application import (
 from app.models.application import Application, ApplyStatus, DocumentStatus, InterviewStatus, WrittenTestStatus
 from app.models.user import User
 from app.api.v1.auth import get_current_user
-from app.models.resume import Resume, Spec
+from app.models.resume import Resume
+from app.services.resume_profile_service import ResumeProfileService
 from app.models.applicant_user import ApplicantUser
 from app.models.schedule import ScheduleInterview
 from app.models.job import JobPost
@@ -21,6 +24,7 @@ from app.utils.llm_cache import redis_cache
 from app.models.written_test_answer import WrittenTestAnswer
 from app.schemas.written_test_answer import WrittenTestAnswerResponse
 from app.services.application_evaluation_service import auto_evaluate_all_applications
+from app.services.application_transition_service import ApplicationTransitionService
 from app.utils.enum_converter import get_safe_interview_status
 
 router = APIRouter()
@@ -28,13 +32,27 @@ router = APIRouter()
 
 @router.get("/", response_model=List[ApplicationList])
 def get_applications(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    applications = db.query(Application).offset(skip).limit(limit).all()
-    return applications
+    """지원서 목록 (키셋 페이지네이션, 다음 페이지는 X-Next-Cursor 헤더의 cursor 로 요청)"""
+    query = db.query(
+        Application.id, Application.job_post_id, Application.user_id,
+        Application.status, Application.document_status,
+        Application.applied_at.label("created_at"),  # application 에는 created_at 컬럼이 없어 지원 시각 사용
+        Application.score, Application.ai_score, Application.human_score, Application.final_score,
+        Application.application_source, Application.pass_reason, Application.fail_reason,
+        Application.applied_at, Application.ai_interview_pass_reason, Application.ai_interview_fail_reason
+    )
+    return paginate(
+        query, (Application.id,), response,
+        limit=limit, cursor=cursor, skip=skip,
+        total=estimated_row_count(db, Application.__tablename__)
+    )
 
 
 @router.get("/{application_id}", response_model=ApplicationDetail)
@@ -49,7 +67,7 @@ def get_application(
         db.query(Application)
         .options(
             joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs)
+            joinedload(Application.resume)
         )
         .filter(Application.id == application_id)
         .first()
@@ -58,153 +76,13 @@ def get_application(
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    # Spec 데이터 분류 (의미적으로 유사한 것들을 그룹화)
-    educations = []
-    awards = []
-    certificates = []
-    skills = []
-    experiences = []  # activities + project_experience를 통합
-    
-    if application.resume and application.resume.specs:
-        for spec in application.resume.specs:
-            spec_type = str(spec.spec_type)
-            spec_title = str(spec.spec_title)
-            spec_description = spec.spec_description or ""
-            
-            if spec_type == "education":
-                if spec_title == "institution":
-                    education = {
-                        "period": "",
-                        "schoolName": spec_description,
-                        "major": "",
-                        "graduated": False,
-                        "degree": "",
-                        "gpa": "",
-                        "duration": ""
-                    }
-                    educations.append(education)
-                elif spec_title == "start_date":
-                    if educations:
-                        educations[-1]["startDate"] = spec_description
-                elif spec_title == "end_date":
-                    if educations:
-                        educations[-1]["endDate"] = spec_description
-                elif spec_title == "degree":
-                    if educations:
-                        educations[-1]["degree"] = spec_description
-                        # major/degree 파싱 추가
-                        degree_raw = spec_description or ""
-                        school_name = educations[-1]["schoolName"] or ""
-                        import re
-                        if "고등학교" in school_name:
-                            educations[-1]["major"] = ""
-                            educations[-1]["degree"] = ""
-                        elif "대학교" in school_name or "대학" in school_name:
-                            if degree_raw:
-                                m = re.match(r"(.+?)\((.+?)\)", degree_raw)
-                                if m:
-                                    educations[-1]["major"] = m.group(1).strip() if m.group(1) else degree_raw.strip()
-                                    educations[-1]["degree"] = m.group(2).strip() if m.group(2) else ""
-                                else:
-                                    educations[-1]["major"] = degree_raw.strip()
-                                    educations[-1]["degree"] = ""
-                            else:
-                                educations[-1]["major"] = ""
-                                educations[-1]["degree"] = ""
-                        else:
-                            educations[-1]["major"] = ""
-                            educations[-1]["degree"] = ""
-                elif spec_title == "gpa":
-                    if educations:
-                        educations[-1]["gpa"] = spec_description
-                elif spec_title == "duration":
-                    if educations:
-                        educations[-1]["duration"] = spec_description
-            
-            elif spec_type == "awards":
-                if spec_title == "title":
-                    award = {
-                        "title": spec_description,
-                        "date": "",
-                        "description": "",
-                        "duration": ""
-                    }
-                    awards.append(award)
-                elif spec_title == "date":
-                    if awards:
-                        awards[-1]["date"] = spec_description
-                elif spec_title == "description":
-                    if awards:
-                        awards[-1]["description"] = spec_description
-                elif spec_title == "duration":
-                    if awards:
-                        awards[-1]["duration"] = spec_description
-            
-            elif spec_type == "certifications":
-                if spec_title == "name":
-                    certificate = {
-                        "name": spec_description,
-                        "date": "",
-                        "duration": ""
-                    }
-                    certificates.append(certificate)
-                elif spec_title == "date":
-                    if certificates:
-                        certificates[-1]["date"] = spec_description
-                elif spec_title == "duration":
-                    if certificates:
-                        certificates[-1]["duration"] = spec_description
-            
-            elif spec_type == "skills":
-                skills.append(spec_description)
-            
-            elif spec_type == "activities":
-                if spec_title == "organization":
-                    experience = {
-                        "type": "activity",
-                        "organization": spec_description,
-                        "role": "",
-                        "period": "",
-                        "description": "",
-                        "duration": ""
-                    }
-                    experiences.append(experience)
-                elif spec_title == "role":
-                    if experiences and experiences[-1]["type"] == "activity":
-                        experiences[-1]["role"] = spec_description
-                elif spec_title == "period":
-                    if experiences and experiences[-1]["type"] == "activity":
-                        experiences[-1]["period"] = spec_description
-                elif spec_title == "description":
-                    if experiences and experiences[-1]["type"] == "activity":
-                        experiences[-1]["description"] = spec_description
-                elif spec_title == "duration":
-                    if experiences and experiences[-1]["type"] == "activity":
-                        experiences[-1]["duration"] = spec_description
-            
-            elif spec_type == "project_experience":
-                if spec_title == "title":
-                    experience = {
-                        "type": "project",
-                        "title": spec_description,
-                        "role": "",
-                        "duration": "",
-                        "technologies": "",
-                        "description": ""
-                    }
-                    experiences.append(experience)
-                elif spec_title == "role":
-                    if experiences and experiences[-1]["type"] == "project":
-                        experiences[-1]["role"] = spec_description
-                elif spec_title == "duration":
-                    if experiences and experiences[-1]["type"] == "project":
-                        experiences[-1]["duration"] = spec_description
-                elif spec_title == "technologies":
-                    if experiences and experiences[-1]["type"] == "project":
-                        experiences[-1]["technologies"] = spec_description
-                elif spec_title == "description":
-                    if experiences and experiences[-1]["type"] == "project":
-                        experiences[-1]["description"] = spec_description
+    # Spec 데이터 분류 (의미적으로 유사한 것들을 그룹화) - 이력서 프로필에서 읽음
+    profile = ResumeProfileService.load_profile(db, application.resume_id)
+    educations = ResumeProfileService.to_education_entries(profile)
+    awards = list(profile.awards or []) if profile else []
+    certificates = list(profile.certificates or []) if profile else []
+    skills = list(profile.skills or []) if profile else []
+    experiences = list(profile.experiences or []) if profile else []  # activities + project_experience를 통합
     
     # 응답 데이터 구성
     response_data = {
@@ -241,7 +119,7 @@ def get_application(
     print(f"API 응답 데이터: {response_data}")
     print(f"User 정보: {application.user.name if application.user else 'None'}")
     print(f"Resume 정보: {application.resume.content[:50] if application.resume and application.resume.content is not None else 'None'}")
-    print(f"Spec 개수: {len(application.resume.specs) if application.resume else 0}")
+    print(f"Spec 개수: {profile.spec_count if profile else 0}")
     print(f"Education 개수: {len(educations)}")
     print(f"Awards 개수: {len(awards)}")
     print(f"Certificates 개수: {len(certificates)}")
@@ -260,7 +138,7 @@ def get_application_content(
         db.query(Application)
         .options(
             joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs)
+            joinedload(Application.resume)
         )
         .filter(Application.id == application_id)
         .first()
@@ -345,13 +223,13 @@ def update_application_status(
         from app.utils.llm_cache import invalidate_cache
         
         # 지원자 상세 캐시 무효화
-        application_cache_pattern = f"api_cache:get_application:*application_id_{application_id}*"
+        application_cache_pattern = f"api_cache:get_application:*application_id_{application_id}:*"
         invalidate_cache(application_cache_pattern)
         
         # 지원자 목록 캐시 무효화 (해당 공고의 모든 지원자 목록)
         job_post_id = application.job_post_id
-        applicants_cache_pattern = f"api_cache:get_applicants_by_job:*job_post_id_{job_post_id}*"
-        applicants_with_interview_cache_pattern = f"api_cache:get_applicants_with_interview:*job_post_id_{job_post_id}*"
+        applicants_cache_pattern = f"api_cache:get_applicants_by_job:*job_post_id_{job_post_id}:*"
+        applicants_with_interview_cache_pattern = f"api_cache:get_applicants_with_interview:*job_post_id_{job_post_id}:*"
         invalidate_cache(applicants_cache_pattern)
         invalidate_cache(applicants_with_interview_cache_pattern)
         
@@ -372,7 +250,6 @@ def ai_evaluate_application(
     current_user: User = Depends(get_current_user)
 ):
     """AI를 사용하여 지원자의 서류를 평가합니다. (개발/테스트용)"""
-    import requests
     import json
     
     # 지원서 정보 가져오기
@@ -390,105 +267,13 @@ def ai_evaluate_application(
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    # Spec 데이터 구성
-    spec_data = {
-        "education": {},
-        "certifications": [],
-        "awards": [],
-        "skills": {},
-        "activities": [],
-        "projects": []
-    }
-    
-    if resume.specs:
-        print(f"[AI-EVALUATION] 총 {len(resume.specs)}개의 spec 데이터 발견")
-        for spec in resume.specs:
-            print(f"[AI-EVALUATION] Spec: type={spec.spec_type}, title={spec.spec_title}, description={spec.spec_description}")
-            
-            if spec.spec_type == "education":
-                if spec.spec_title == "institution":
-                    spec_data["education"]["university"] = spec.spec_description
-                elif spec.spec_title == "major":
-                    spec_data["education"]["major"] = spec.spec_description
-                elif spec.spec_title == "degree":
-                    spec_data["education"]["degree"] = spec.spec_description
-                elif spec.spec_title == "gpa":
-                    spec_data["education"]["gpa"] = float(spec.spec_description) if spec.spec_description and spec.spec_description.replace('.', '').isdigit() else 0.0
-                elif spec.spec_title == "start_date":
-                    spec_data["education"]["start_date"] = spec.spec_description
-                elif spec.spec_title == "end_date":
-                    spec_data["education"]["end_date"] = spec.spec_description
-            
-            elif spec.spec_type == "certifications":
-                if spec.spec_title == "name":
-                    spec_data["certifications"].append(spec.spec_description)
-                    print(f"[AI-EVALUATION] 자격증 추가: {spec.spec_description}")
-                elif spec.spec_title == "date":
-                    if spec_data["certifications"]:
-                        # 마지막 자격증에 날짜 정보 추가
-                        spec_data["certifications"][-1] = f"{spec_data['certifications'][-1]} ({spec.spec_description})"
-            
-            elif spec.spec_type == "awards":
-                if spec.spec_title == "title":
-                    spec_data["awards"].append(spec.spec_description)
-                elif spec.spec_title == "date":
-                    if spec_data["awards"]:
-                        spec_data["awards"][-1] = f"{spec_data['awards'][-1]} ({spec.spec_description})"
-                elif spec.spec_title == "description":
-                    if spec_data["awards"]:
-                        spec_data["awards"][-1] = f"{spec_data['awards'][-1]} - {spec.spec_description}"
-            
-            elif spec.spec_type == "skills":
-                if spec.spec_title == "name" or spec.spec_title == "내용":
-                    if "programming_languages" not in spec_data["skills"]:
-                        spec_data["skills"]["programming_languages"] = []
-                    spec_data["skills"]["programming_languages"].append(spec.spec_description)
-            
-            elif spec.spec_type == "activities":
-                if spec.spec_title == "organization":
-                    activity = {"organization": spec.spec_description}
-                    spec_data["activities"].append(activity)
-                elif spec.spec_title == "role":
-                    if spec_data["activities"]:
-                        spec_data["activities"][-1]["role"] = spec.spec_description
-                elif spec.spec_title == "period":
-                    if spec_data["activities"]:
-                        spec_data["activities"][-1]["period"] = spec.spec_description
-                elif spec.spec_title == "description":
-                    if spec_data["activities"]:
-                        spec_data["activities"][-1]["description"] = spec.spec_description
-            
-            elif spec.spec_type == "project_experience":
-                if spec.spec_title == "title":
-                    project = {"title": spec.spec_description}
-                    spec_data["projects"].append(project)
-                elif spec.spec_title == "role":
-                    if spec_data["projects"]:
-                        spec_data["projects"][-1]["role"] = spec.spec_description
-                elif spec.spec_title == "duration":
-                    if spec_data["projects"]:
-                        spec_data["projects"][-1]["duration"] = spec.spec_description
-                elif spec.spec_title == "technologies":
-                    if spec_data["projects"]:
-                        spec_data["projects"][-1]["technologies"] = spec.spec_description
-                elif spec.spec_title == "description":
-                    if spec_data["projects"]:
-                        spec_data["projects"][-1]["description"] = spec.spec_description
+    # Spec 데이터 구성 (이력서 프로필에서 읽음)
+    profile = ResumeProfileService.load_profile(db, resume.id)
+    if profile is None or not profile.spec_count:
+        print("[AI-EVALUATION] Spec 데이터가 없습니다.")
     else:
-        print(f"[AI-EVALUATION] Spec 데이터가 없습니다.")
-    
-    # 모든 spec 타입이 항상 포함되도록 보장
-    for key, default in [
-        ("education", {}),
-        ("certifications", []),
-        ("awards", []),
-        ("skills", {}),
-        ("activities", []),
-        ("projects", []),
-        ("portfolio", {})
-    ]:
-        if key not in spec_data:
-            spec_data[key] = default
+        print(f"[AI-EVALUATION] 총 {profile.spec_count}개의 spec 데이터 발견")
+    spec_data = ResumeProfileService.to_spec_data(profile)
 
     # Weight 데이터 구성
     weights = db.query(Weight).filter(
@@ -521,7 +306,6 @@ def ai_evaluate_application(
     
     # AI Agent API 호출
     try:
-        agent_url = "http://kocruit_agent:8001/evaluate-application/"
         payload = {
             "job_posting": job_posting,
             "spec_data": spec_data,
@@ -534,7 +318,7 @@ def ai_evaluate_application(
         print(f"[AI-EVALUATION] Spec Data: {json.dumps(spec_data, ensure_ascii=False, indent=2)}")
         print(f"[AI-EVALUATION] Weight Data: {json.dumps(weight_dict, ensure_ascii=False, indent=2)}")
         
-        response = requests.post(agent_url, json=payload, timeout=30)
+        response = get_agent_client().post_sync("/evaluate-application/", json=payload)
         response.raise_for_status()
         
         result = response.json()
@@ -564,7 +348,9 @@ def ai_evaluate_application(
             "confidence": result.get("confidence", 0.0)
         }
         
-    except requests.exceptions.RequestException as e:
+    except AgentUnavailableError as e:
+        raise HTTPException(status_code=503, detail=f"AI Agent 과부하로 요청을 거절했습니다: {e.reason}")
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"AI Agent API 호출 실패: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI 평가 중 오류 발생: {str(e)}")
@@ -596,20 +382,12 @@ def reset_ai_scores_for_job(
     """특정 채용공고의 모든 지원자의 AI 점수를 초기화합니다.
     초기화 후 자동 평가 시스템이 실행되어 새로운 AI 평가가 진행됩니다."""
     
-    # 해당 채용공고의 모든 지원자 조회
-    applications = db.query(Application).filter(Application.job_post_id == job_post_id).all()
-    
-    if not applications:
+    # AI 면접 전용 필드만 UPDATE 한 번으로 초기화 (application 기본 필드는 건드리지 않음)
+    reset_count = ApplicationTransitionService.reset_ai_interview_scores(db, job_post_id)
+    if not reset_count:
+        db.rollback()
         raise HTTPException(status_code=404, detail="해당 채용공고에 지원자가 없습니다.")
     
-    reset_count = 0
-    for application in applications:
-        # AI 면접 전용 필드만 초기화 (application 기본 필드는 건드리지 않음)
-        application.ai_interview_score = None
-        application.ai_interview_pass_reason = None
-        application.ai_interview_fail_reason = None
-        reset_count += 1
-    
     db.commit()
     
     # 자동 평가 시스템 실행 (기존 함수 활용)
@@ -643,13 +421,14 @@ def get_applicants_by_job(
         db.query(Application)
         .options(
             joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs)
+            joinedload(Application.resume)
         )
         .filter(Application.job_post_id == job_post_id)
         .all()
     )
     
     print(f"📊 전체 지원자 수: {len(applications)}")
+    profiles = ResumeProfileService.load_profiles(db, [app.resume_id for app in applications if app.resume_id])
     
     applicants = []
     for app in applications:
@@ -660,63 +439,8 @@ def get_applicants_by_job(
         if not app.user:
             continue
             
-        # 학력 정보 추출: resume.specs에서 추출
-        education = None
-        degree = None
-        major = None
-        certificates = []
-        if app.resume and app.resume.specs:
-            edu_specs = [
-                s for s in app.resume.specs 
-                if s.spec_type == "education" and s.spec_title == "institution"
-            ]
-            if edu_specs:
-                education = edu_specs[0].spec_description
-            
-            # degree 정보 추출 및 major/degree 분리
-            degree_specs = [
-                s for s in app.resume.specs
-                if s.spec_type == "education" and s.spec_title == "degree"
-            ]
-            if degree_specs:
-                degree_raw = degree_specs[0].spec_description or ""
-                school_name = education or ""
-                if "고등학교" in school_name:
-                    major = ""
-                    degree = ""
-                elif "대학교" in school_name or "대학" in school_name:
-                    if degree_raw:
-                        m = re.match(r"(.+?)\((.+?)\)", degree_raw)
-                        if m:
-                            major = m.group(1).strip() if m.group(1) else degree_raw.strip()
-                            degree = m.group(2).strip() if m.group(2) else ""
-                        else:
-                            major = degree_raw.strip()
-                            degree = ""
-                    else:
-                        major = ""
-                        degree = ""
-                else:
-                    major = ""
-                    degree = ""
-            else:
-                major = ""
-                degree = ""
-                
-            # 자격증 정보 추출
-            cert_name_specs = [
-                s for s in app.resume.specs
-                if s.spec_type == "certifications" and s.spec_title == "name"
-            ]
-            for cert in cert_name_specs:
-                if cert.spec_description:
-                    cert_date = next((s.spec_description for s in app.resume.specs if s.spec_type == "certifications" and s.spec_title == "date"), "")
-                    cert_duration = next((s.spec_description for s in app.resume.specs if s.spec_type == "certifications" and s.spec_title == "duration"), "")
-                    certificates.append({
-                        "name": cert.spec_description,
-                        "date": cert_date,
-                        "duration": cert_duration
-                    })
+        # 학력/자격증 정보: 이력서 프로필에서 읽음
+        summary = ResumeProfileService.to_applicant_summary(profiles.get(app.resume_id))
         
         applicant_data = {
             "id": app.user.id,
@@ -734,13 +458,13 @@ def get_applicants_by_job(
             "fail_reason": app.fail_reason,
             "birthDate": app.user.birth_date.isoformat() if app.user.birth_date else None,
             "gender": app.user.gender if app.user.gender else None,
-            "education": education,
-            "degree": degree_specs[0].spec_description if degree_specs else None,
-            "major": major,
-            "degree_type": degree,
+            "education": summary["education"],
+            "degree": summary["degree"],
+            "major": summary["major"],
+            "degree_type": summary["degree_type"],
             "resume_id": app.resume_id,
             "address": app.user.address if app.user.address else None,
-            "certificates": certificates
+            "certificates": summary["certificates"]
         }
         applicants.append(applicant_data)
     
@@ -954,7 +678,7 @@ def get_passed_applicants(
         db.query(Application)
         .options(
             joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs)
+            joinedload(Application.resume)
         )
         .filter(
             Application.job_post_id == job_post_id,
@@ -964,6 +688,7 @@ def get_passed_applicants(
     )
     
     print(f"📊 서류 합격자 수: {len(applications)}")
+    profiles = ResumeProfileService.load_profiles(db, [app.resume_id for app in applications if app.resume_id])
     
     applicants = []
     for app in applications:
@@ -974,63 +699,8 @@ def get_passed_applicants(
         if not app.user:
             continue
             
-        # 학력 정보 추출: resume.specs에서 추출
-        education = None
-        degree = None
-        major = None
-        certificates = []
-        if app.resume and app.resume.specs:
-            edu_specs = [
-                s for s in app.resume.specs 
-                if s.spec_type == "education" and s.spec_title == "institution"
-            ]
-            if edu_specs:
-                education = edu_specs[0].spec_description
-            
-            # degree 정보 추출 및 major/degree 분리
-            degree_specs = [
-                s for s in app.resume.specs
-                if s.spec_type == "education" and s.spec_title == "degree"
-            ]
-            if degree_specs:
-                degree_raw = degree_specs[0].spec_description or ""
-                school_name = education or ""
-                if "고등학교" in school_name:
-                    major = ""
-                    degree = ""
-                elif "대학교" in school_name or "대학" in school_name:
-                    if degree_raw:
-                        m = re.match(r"(.+?)\((.+?)\)", degree_raw)
-                        if m:
-                            major = m.group(1).strip() if m.group(1) else degree_raw.strip()
-                            degree = m.group(2).strip() if m.group(2) else ""
-                        else:
-                            major = degree_raw.strip()
-                            degree = ""
-                    else:
-                        major = ""
-                        degree = ""
-                else:
-                    major = ""
-                    degree = ""
-            else:
-                major = ""
-                degree = ""
-                
-            # 자격증 정보 추출
-            cert_name_specs = [
-                s for s in app.resume.specs
-                if s.spec_type == "certifications" and s.spec_title == "name"
-            ]
-            for cert in cert_name_specs:
-                if cert.spec_description:
-                    cert_date = next((s.spec_description for s in app.resume.specs if s.spec_type == "certifications" and s.spec_title == "date"), "")
-                    cert_duration = next((s.spec_description for s in app.resume.specs if s.spec_type == "certifications" and s.spec_title == "duration"), "")
-                    certificates.append({
-                        "name": cert.spec_description,
-                        "date": cert_date,
-                        "duration": cert_duration
-                    })
+        # 학력/자격증 정보: 이력서 프로필에서 읽음
+        summary = ResumeProfileService.to_applicant_summary(profiles.get(app.resume_id))
         
         applicant_data = {
             "id": app.user.id,
@@ -1048,13 +718,13 @@ def get_passed_applicants(
             "fail_reason": app.fail_reason,
             "birthDate": app.user.birth_date.isoformat() if app.user.birth_date else None,
             "gender": app.user.gender if app.user.gender else None,
-            "education": education,
-            "degree": degree_specs[0].spec_description if degree_specs else None,
-            "major": major,
-            "degree_type": degree,
+            "education": summary["education"],
+            "degree": summary["degree"],
+            "major": summary["major"],
+            "degree_type": summary["degree_type"],
             "resume_id": app.resume_id,
             "address": app.user.address if app.user.address else None,
-            "certificates": certificates
+            "certificates": summary["certificates"]
         }
         applicants.append(applicant_data)
     
@@ -6,6 +6,7 @@ from app.schemas.auth import LoginRequest, LoginResponse, SignupRequest, Refresh
 from app.models.user import User, CompanyUser, UserType, UserRole
 from app.models.company import Company
 from app.core import security
+from app.core.principal_cache import Principal, principal_cache
 from app.core.config import settings
 from jose import JWTError
 from typing import Optional
@@ -19,7 +20,12 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+def get_current_principal(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
+    """인증 주체 스냅샷 (id, user_type, role, company_id, department_id)
+
+    프로세스 내 LRU / Redis 캐시에서 조회하므로 대부분의 요청은 DB 를 거치지 않는다.
+    ORM 객체(관계 로딩 등)가 필요 없는 엔드포인트는 get_current_user 대신 이것을 사용한다.
+    """
     payload = security.verify_token(token)
     if payload is None:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
@@ -27,13 +33,18 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if not email:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
     
-    # CompanyUser를 먼저 조회
-    user = db.query(CompanyUser).filter(CompanyUser.email == email).first()
-    if not user:
-        # CompanyUser가 없으면 일반 User 조회
-        user = db.query(User).filter(User.email == email).first()
-    
+    principal = principal_cache.resolve(db, email)
+    if principal is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return principal
+
+
+def get_current_user(principal: Principal = Depends(get_current_principal), db: Session = Depends(get_db)) -> User:
+    # 캐시된 principal 의 PK 로 한 번만 조회 (기업회원은 CompanyUser 로 로드)
+    model = CompanyUser if principal.is_company_user else User
+    user = db.get(model, principal.id)
     if not user:
+        principal_cache.invalidate(principal.email)
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
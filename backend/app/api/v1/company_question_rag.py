@@ -3,31 +3,22 @@ from pydantic import BaseModel
 from dotenv import load_dotenv
 from typing import List
 import os
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain_community.tools.tavily_search import TavilySearchResults
-from langchain.chains.summarize import load_summarize_chain
-from langchain_core.documents import Document
 import redis
 import json
+import threading
+from types import SimpleNamespace
 
 router = APIRouter()
 load_dotenv()
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
-llm = ChatOpenAI(model="gpt-4o-mini")
 
 redis_client = redis.Redis(host='redis', port=6379, db=0)
 
-# 1. Tavily로 검색
-search_tool = TavilySearchResults()
-
-# 2. 요약 체인 (검색 결과 요약)
-summarize_chain = load_summarize_chain(llm, chain_type="stuff")
+# 1~2. 검색 도구 / 요약 체인과 3~4. 질문 생성 체인은 LangChain import 와 클라이언트 생성이 무거워
+# 서버 시작 시가 아니라 첫 요청 때 _get_chains() 에서 한 번 만든다
 
 # 3. 인재상 기반 질문 생성 프롬프트
-values_prompt = PromptTemplate.from_template(
-    """
+VALUES_PROMPT = """
     다음은 "{company_name}"의 인재상, 핵심가치, 기업문화에 대한 정보입니다:
     ---
     {company_values}
@@ -35,11 +26,9 @@ values_prompt = PromptTemplate.from_template(
     이 내용을 바탕으로, 면접에서 사용할 수 있는 인재상/가치관 관련 질문을 3개 생성해 주세요.
     회사의 핵심가치와 인재상에 부합하는 지원자인지 확인하는 질문으로 만들어 주세요.
     """
-)
 
 # 4. 기술/뉴스 기반 질문 생성 프롬프트
-tech_prompt = PromptTemplate.from_template(
-    """
+TECH_PROMPT = """
     다음은 "{company_name}"의 최근 기술 동향과 뉴스 요약입니다:
     ---
     {company_context}
@@ -47,10 +36,31 @@ tech_prompt = PromptTemplate.from_template(
     이 내용을 바탕으로, 면접에서 사용할 수 있는 기술/산업 관련 질문을 3개 생성해 주세요.
     구체적이고 현실적인 질문으로 만들어 주세요.
     """
-)
 
-generate_values_questions = LLMChain(llm=llm, prompt=values_prompt)
-generate_tech_questions = LLMChain(llm=llm, prompt=tech_prompt)
+_chains = None
+_chains_lock = threading.Lock()
+
+
+def _get_chains() -> SimpleNamespace:
+    """Tavily 검색 도구, 요약 체인, 질문 생성 체인 (프로세스당 한 번 생성)"""
+    global _chains
+    if _chains is None:
+        with _chains_lock:
+            if _chains is None:
+                from langchain.chains import LLMChain
+                from langchain.chains.summarize import load_summarize_chain
+                from langchain.prompts import PromptTemplate
+                from langchain_community.tools.tavily_search import TavilySearchResults
+                from langchain_openai import ChatOpenAI
+
+                llm = ChatOpenAI(model="gpt-4o-mini")
+                _chains = SimpleNamespace(
+                    search_tool=TavilySearchResults(),
+                    summarize_chain=load_summarize_chain(llm, chain_type="stuff"),
+                    generate_values_questions=LLMChain(llm=llm, prompt=PromptTemplate.from_template(VALUES_PROMPT)),
+                    generate_tech_questions=LLMChain(llm=llm, prompt=PromptTemplate.from_template(TECH_PROMPT)),
+                )
+    return _chains
 
 # 5. 응답 모델
 class CompanyQuestionRagResponse(BaseModel):
@@ -67,8 +77,11 @@ async def generate_company_questions_rag(company_name: str = Query(...)):
     if isinstance(cached, bytes):
         return json.loads(cached)
     try:
+        from langchain_core.documents import Document
+        chains = _get_chains()
+
         # 1) 인재상/가치관 검색
-        values_search_results = search_tool.invoke({
+        values_search_results = chains.search_tool.invoke({
             "query": f"{company_name} 인재상 OR 핵심가치 OR 기업문화 OR 기업이념"
         })
         
@@ -83,12 +96,12 @@ async def generate_company_questions_rag(company_name: str = Query(...)):
         
         values_summary = ""
         if values_docs:
-            values_summary = summarize_chain.run(values_docs)
+            values_summary = chains.summarize_chain.run(values_docs)
         else:
             values_summary = f"{company_name}의 인재상과 기업문화에 대한 정보를 찾을 수 없습니다."
 
         # 2) 기술/뉴스 검색
-        news_search_results = search_tool.invoke({
+        news_search_results = chains.search_tool.invoke({
             "query": f"{company_name} 기술 블로그 OR 뉴스 OR 최신동향"
         })
         
@@ -103,12 +116,12 @@ async def generate_company_questions_rag(company_name: str = Query(...)):
         
         news_summary = ""
         if news_docs:
-            news_summary = summarize_chain.run(news_docs)
+            news_summary = chains.summarize_chain.run(news_docs)
         else:
             news_summary = f"{company_name}의 최신 뉴스와 기술 동향에 대한 정보를 찾을 수 없습니다."
 
         # 3) 인재상 기반 질문 생성
-        values_result = generate_values_questions.invoke({
+        values_result = chains.generate_values_questions.invoke({
             "company_name": company_name,
             "company_values": values_summary
         })
@@ -116,7 +129,7 @@ async def generate_company_questions_rag(company_name: str = Query(...)):
         values_questions = [q.strip() for q in values_text.split("\n") if q.strip()]
 
         # 4) 기술/뉴스 기반 질문 생성
-        tech_result = generate_tech_questions.invoke({
+        tech_result = chains.generate_tech_questions.invoke({
             "company_name": company_name,
             "company_context": news_summary
         })
@@ -143,8 +156,11 @@ def generate_questions(company_name: str, company_context: str = ""):
     if isinstance(cached, bytes):
         return json.loads(cached)
     try:
+        from langchain_core.documents import Document
+        chains = _get_chains()
+
         # 인재상 검색
-        values_search_results = search_tool.invoke({
+        values_search_results = chains.search_tool.invoke({
             "query": f"{company_name} 인재상 OR 핵심가치 OR 기업문화"
         })
         
@@ -159,7 +175,7 @@ def generate_questions(company_name: str, company_context: str = ""):
         
         values_summary = ""
         if values_docs:
-            values_summary = summarize_chain.run(values_docs)
+            values_summary = chains.summarize_chain.run(values_docs)
         else:
             values_summary = f"{company_name}의 인재상과 기업문화에 대한 정보를 찾을 수 없습니다."
 
@@ -167,7 +183,7 @@ def generate_questions(company_name: str, company_context: str = ""):
         if company_context and company_context != "회사에 대한 정보가 없습니다.":
             news_summary = company_context
         else:
-            news_search_results = search_tool.invoke({
+            news_search_results = chains.search_tool.invoke({
                 "query": f"{company_name} 기술 블로그 OR 뉴스"
             })
             
@@ -181,16 +197,16 @@ def generate_questions(company_name: str, company_context: str = ""):
                             news_docs.append(Document(page_content=content))
             
             if news_docs:
-                news_summary = summarize_chain.run(news_docs)
+                news_summary = chains.summarize_chain.run(news_docs)
             else:
                 news_summary = f"{company_name}의 최신 뉴스와 기술 동향에 대한 정보를 찾을 수 없습니다."
 
         # 질문 생성
-        values_result = generate_values_questions.invoke({
+        values_result = chains.generate_values_questions.invoke({
             "company_name": company_name,
             "company_values": values_summary
         })
-        tech_result = generate_tech_questions.invoke({
+        tech_result = chains.generate_tech_questions.invoke({
             "company_name": company_name,
             "company_context": news_summary
         })
@@ -3,10 +3,11 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
 from app.models.application import Application
-from app.models.resume import Resume, Spec
+from app.models.resume import Resume
 from app.models.growth_prediction_result import GrowthPredictionResult
 from app.services.high_performer_pattern_service import HighPerformerPatternService
 from app.services.applicant_growth_scoring_service import ApplicantGrowthScoringService
+from app.services.resume_profile_service import ResumeProfileService
 from app.schemas.growth_prediction import GrowthPredictionRequest, GrowthPredictionResponse
 import time
 
@@ -76,14 +77,9 @@ def predict_growth(
     resume = db.query(Resume).filter(Resume.id == application.resume_id).first()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    specs = db.query(Spec).filter(Spec.resume_id == resume.id).all()
-    specs_dict = [
-        {
-            "spec_type": s.spec_type,
-            "spec_title": s.spec_title,
-            "spec_description": s.spec_description
-        } for s in specs
-    ]
+    profile = ResumeProfileService.load_profile(db, resume.id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Resume profile not found")
     # 2. 고성과자 패턴 통계(평균 등) 조회
     pattern_service = HighPerformerPatternService()
     # kmeans로 1회 분석(클러스터 1개만 사용, 전체 평균)
@@ -102,7 +98,7 @@ def predict_growth(
     # 3. 지원자-고성과자 비교/스코어링
     high_performer_members = pattern_result["cluster_patterns"][0]["members"]
     scoring_service = ApplicantGrowthScoringService(high_performer_stats, high_performer_members)
-    result = scoring_service.score_applicant(specs_dict)
+    result = scoring_service.score_applicant(profile)
 
     # 3.5. boxplot_data 생성
     import numpy as np
@@ -130,15 +126,9 @@ def predict_growth(
     exp_vals = get_values('total_experience_years')
     print('고성과자 경력(년) 값:', exp_vals)
     # 지원자 값 추출
-    norm = scoring_service.normalize_applicant_specs(specs_dict)
-    # 지원자 경력(년) 추출 (specs에서 직접 추출 필요)
-    applicant_exp = None
-    for spec in specs_dict:
-        if spec.get('spec_type') == 'experience' and spec.get('spec_title') == 'years':
-            try:
-                applicant_exp = float(spec.get('spec_description'))
-            except:
-                applicant_exp = None
+    norm = scoring_service.normalize_applicant_specs(profile)
+    # 지원자 경력(년) (이력서 프로필의 experience/years)
+    applicant_exp = profile.experience_years
     boxplot_data = {}
     # 경력(년)
     if exp_vals and len(exp_vals) > 0:
@@ -3,29 +3,31 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import List, Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.interview_evaluation import InterviewEvaluation, EvaluationDetail, InterviewEvaluationItem
 from app.schemas.interview_evaluation import InterviewEvaluation as InterviewEvaluationSchema, InterviewEvaluationCreate
 from datetime import datetime
 from decimal import Decimal
 from app.models.application import Application
 from app.services.interviewer_profile_service import InterviewerProfileService
+from app.services.interview_evaluation_summary_service import InterviewEvaluationSummaryService
 from app.utils.llm_cache import invalidate_cache
 import os
 import uuid
 from app.models.interview_evaluation import EvaluationType
 from app.models.interview_question_log import InterviewQuestionLog
 import traceback
-import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import r2_score
-import pandas as pd
 from datetime import datetime, timedelta
 import json
 
 router = APIRouter()
 
+# 공고별 평가 목록 응답 필드 (유형별로 기존 응답 형태 유지)
+AI_EVALUATION_FIELDS = ("application_id", "applicant_name", "interview_id", "evaluation_id",
+                        "total_score", "grade_counts", "passed", "created_at")
+PANEL_EVALUATION_FIELDS = ("application_id", "applicant_name", "interview_id", "evaluation_id",
+                           "total_score", "summary", "created_at")
+
 @router.post("/", response_model=InterviewEvaluationSchema)
 def create_evaluation(evaluation: InterviewEvaluationCreate, db: Session = Depends(get_db)):
     try:
@@ -97,7 +99,7 @@ def create_evaluation(evaluation: InterviewEvaluationCreate, db: Session = Depen
         # 캐시 무효화: 새로운 평가가 생성되었으므로 관련 캐시 무효화
         try:
             # 면접 평가 관련 캐시 무효화
-            evaluation_cache_pattern = f"api_cache:get_evaluation_by_interview_and_evaluator:*interview_id_{evaluation.interview_id}*"
+            evaluation_cache_pattern = f"api_cache:get_evaluation_by_interview_and_evaluator:*interview_id_{evaluation.interview_id}:*"
             invalidate_cache(evaluation_cache_pattern)
             
             # 면접 일정 관련 캐시도 무효화 (평가자가 변경될 수 있음)
@@ -230,7 +232,7 @@ def update_evaluation(evaluation_id: int, evaluation: InterviewEvaluationCreate,
         # 캐시 무효화: 평가가 업데이트되었으므로 관련 캐시 무효화
         try:
             # 면접 평가 관련 캐시 무효화
-            evaluation_cache_pattern = f"api_cache:get_evaluation_by_interview_and_evaluator:*interview_id_{db_evaluation.interview_id}*"
+            evaluation_cache_pattern = f"api_cache:get_evaluation_by_interview_and_evaluator:*interview_id_{db_evaluation.interview_id}:*"
             invalidate_cache(evaluation_cache_pattern)
             
             # 면접 일정 관련 캐시도 무효화
@@ -466,76 +468,15 @@ def get_ai_interview_evaluation(application_id: int, db: Session = Depends(get_d
         raise HTTPException(status_code=500, detail=f"AI 면접 평가 조회 실패: {str(e)}")
 
 @router.get("/ai-interview/job-post/{job_post_id}")
-def get_ai_interview_evaluations_by_job_post(job_post_id: int, db: Session = Depends(get_db)):
+def get_ai_interview_evaluations_by_job_post(job_post_id: int, db: Session = Depends(get_read_db)):
     """특정 공고의 모든 AI 면접 평가 결과 조회"""
     try:
-        from app.models.schedule import AIInterviewSchedule
-        
-        print(f"🔍 AI 면접 평가 조회 시작 - job_post_id: {job_post_id}")
-        
-        # 해당 공고의 AI 면접 일정 조회
-        ai_schedules = db.query(AIInterviewSchedule).filter(
-            AIInterviewSchedule.job_post_id == job_post_id
-        ).all()
-        
-        print(f"📊 조회된 AI 면접 일정 수: {len(ai_schedules)}")
-        
-        if not ai_schedules:
-            print("⚠️ 해당 공고의 AI 면접 일정이 없습니다.")
-            return {
-                "success": True,
-                "job_post_id": job_post_id,
-                "total_evaluations": 0,
-                "evaluations": []
-            }
-        
-        # 각 일정의 평가 결과 조회
-        evaluations = []
-        for schedule in ai_schedules:
-            try:
-                evaluation = db.query(InterviewEvaluation).filter(
-                    InterviewEvaluation.interview_id == schedule.id,
-                    InterviewEvaluation.evaluation_type == EvaluationType.AI
-                ).first()
-                
-                if evaluation:
-                    # 평가 항목 조회
-                    evaluation_items = db.query(InterviewEvaluationItem).filter(
-                        InterviewEvaluationItem.evaluation_id == evaluation.id
-                    ).all()
-                    
-                    # 등급별 개수 계산
-                    grade_counts = {"상": 0, "중": 0, "하": 0}
-                    for item in evaluation_items:
-                        if item.grade in grade_counts:
-                            grade_counts[item.grade] += 1
-                    
-                    # 합격 여부 판정
-                    total_items = len(evaluation_items)
-                    low_threshold = max(2, int(total_items * 0.15))
-                    passed = grade_counts["하"] < low_threshold
-                    
-                    evaluations.append({
-                        "application_id": schedule.application_id,
-                        "applicant_name": schedule.applicant.name if schedule.applicant else "",
-                        "interview_id": schedule.id,
-                        "evaluation_id": evaluation.id,
-                        "total_score": float(evaluation.total_score) if evaluation.total_score else 0,
-                        "grade_counts": grade_counts,
-                        "passed": passed,
-                        "created_at": evaluation.created_at.isoformat() if evaluation.created_at else None
-                    })
-                    
-                    print(f"✅ 지원자 {schedule.application_id} ({schedule.applicant.name if schedule.applicant else 'Unknown'}) AI 면접 평가 처리 완료")
-                else:
-                    print(f"⚠️ 지원자 {schedule.application_id}의 AI 면접 평가가 없습니다.")
-                    
-            except Exception as schedule_error:
-                print(f"❌ 일정 {schedule.id} 처리 중 오류: {str(schedule_error)}")
-                continue
-        
-        print(f"🎯 AI 면접 평가 결과: {len(evaluations)}명의 평가 데이터 반환")
-        
+        # 지원자별 등급 개수·합격 여부를 한 번의 GROUP BY 로 집계 (평가가 바뀌지 않았으면 캐시 사용)
+        summaries = InterviewEvaluationSummaryService.get_job_post_summaries(db, job_post_id, EvaluationType.AI)
+        evaluations = [{key: summary[key] for key in AI_EVALUATION_FIELDS} for summary in summaries]
+
+        print(f"🎯 AI 면접 평가 결과: {len(evaluations)}명의 평가 데이터 반환 (job_post_id: {job_post_id})")
+
         return {
             "success": True,
             "job_post_id": job_post_id,
@@ -550,62 +491,15 @@ def get_ai_interview_evaluations_by_job_post(job_post_id: int, db: Session = Dep
         raise HTTPException(status_code=500, detail=f"AI 면접 평가 조회 실패: {str(e)}")
 
 @router.get("/job-post/{job_post_id}/practical")
-def get_practical_interview_evaluations_by_job_post(job_post_id: int, db: Session = Depends(get_db)):
+def get_practical_interview_evaluations_by_job_post(job_post_id: int, db: Session = Depends(get_read_db)):
     """특정 공고의 모든 실무진 면접 평가 결과 조회"""
     try:
-        print(f"🔍 실무진 면접 평가 조회 시작 - job_post_id: {job_post_id}")
-        
-        # 해당 공고의 지원자들 조회
-        applications = db.query(Application).filter(
-            Application.job_post_id == job_post_id
-        ).all()
-        
-        print(f"📊 조회된 지원자 수: {len(applications)}")
-        
-        if not applications:
-            print("⚠️ 해당 공고의 지원자가 없습니다.")
-            return {
-                "success": True,
-                "job_post_id": job_post_id,
-                "total_evaluations": 0,
-                "evaluations": []
-            }
-        
-        # 각 지원자의 실무진 면접 평가 결과 조회
-        evaluations = []
-        for application in applications:
-            try:
-                evaluation = db.query(InterviewEvaluation).filter(
-                    InterviewEvaluation.interview_id == application.id,
-                    InterviewEvaluation.evaluation_type == EvaluationType.PRACTICAL
-                ).first()
-                
-                if evaluation:
-                    # 평가 항목 조회
-                    evaluation_items = db.query(InterviewEvaluationItem).filter(
-                        InterviewEvaluationItem.evaluation_id == evaluation.id
-                    ).all()
-                    
-                    evaluations.append({
-                        "application_id": application.id,
-                        "applicant_name": application.user.name if application.user else "",
-                        "interview_id": application.id,
-                        "evaluation_id": evaluation.id,
-                        "total_score": float(evaluation.total_score) if evaluation.total_score else 0,
-                        "summary": evaluation.summary,
-                        "created_at": evaluation.created_at.isoformat() if evaluation.created_at else None
-                    })
-                    
-                    print(f"✅ 지원자 {application.id} ({application.user.name if application.user else 'Unknown'}) 실무진 면접 평가 처리 완료")
-                else:
-                    print(f"⚠️ 지원자 {application.id}의 실무진 면접 평가가 없습니다.")
-                    
-            except Exception as app_error:
-                print(f"❌ 지원자 {application.id} 처리 중 오류: {str(app_error)}")
-                continue
-        
-        print(f"🎯 실무진 면접 평가 결과: {len(evaluations)}명의 평가 데이터 반환")
-        
+        # 지원자별 등급 개수·합격 여부를 한 번의 GROUP BY 로 집계 (평가가 바뀌지 않았으면 캐시 사용)
+        summaries = InterviewEvaluationSummaryService.get_job_post_summaries(db, job_post_id, EvaluationType.PRACTICAL)
+        evaluations = [{key: summary[key] for key in PANEL_EVALUATION_FIELDS} for summary in summaries]
+
+        print(f"🎯 실무진 면접 평가 결과: {len(evaluations)}명의 평가 데이터 반환 (job_post_id: {job_post_id})")
+
         return {
             "success": True,
             "job_post_id": job_post_id,
@@ -620,62 +514,15 @@ def get_practical_interview_evaluations_by_job_post(job_post_id: int, db: Sessio
         raise HTTPException(status_code=500, detail=f"실무진 면접 평가 조회 실패: {str(e)}")
 
 @router.get("/job-post/{job_post_id}/executive")
-def get_executive_interview_evaluations_by_job_post(job_post_id: int, db: Session = Depends(get_db)):
+def get_executive_interview_evaluations_by_job_post(job_post_id: int, db: Session = Depends(get_read_db)):
     """특정 공고의 모든 임원진 면접 평가 결과 조회"""
     try:
-        print(f"🔍 임원진 면접 평가 조회 시작 - job_post_id: {job_post_id}")
-        
-        # 해당 공고의 지원자들 조회
-        applications = db.query(Application).filter(
-            Application.job_post_id == job_post_id
-        ).all()
-        
-        print(f"📊 조회된 지원자 수: {len(applications)}")
-        
-        if not applications:
-            print("⚠️ 해당 공고의 지원자가 없습니다.")
-            return {
-                "success": True,
-                "job_post_id": job_post_id,
-                "total_evaluations": 0,
-                "evaluations": []
-            }
-        
-        # 각 지원자의 임원진 면접 평가 결과 조회
-        evaluations = []
-        for application in applications:
-            try:
-                evaluation = db.query(InterviewEvaluation).filter(
-                    InterviewEvaluation.interview_id == application.id,
-                    InterviewEvaluation.evaluation_type == EvaluationType.EXECUTIVE
-                ).first()
-                
-                if evaluation:
-                    # 평가 항목 조회
-                    evaluation_items = db.query(InterviewEvaluationItem).filter(
-                        InterviewEvaluationItem.evaluation_id == evaluation.id
-                    ).all()
-                    
-                    evaluations.append({
-                        "application_id": application.id,
-                        "applicant_name": application.user.name if application.user else "",
-                        "interview_id": application.id,
-                        "evaluation_id": evaluation.id,
-                        "total_score": float(evaluation.total_score) if evaluation.total_score else 0,
-                        "summary": evaluation.summary,
-                        "created_at": evaluation.created_at.isoformat() if evaluation.created_at else None
-                    })
-                    
-                    print(f"✅ 지원자 {application.id} ({application.user.name if application.user else 'Unknown'}) 임원진 면접 평가 처리 완료")
-                else:
-                    print(f"⚠️ 지원자 {application.id}의 임원진 면접 평가가 없습니다.")
-                    
-            except Exception as app_error:
-                print(f"❌ 지원자 {application.id} 처리 중 오류: {str(app_error)}")
-                continue
-        
-        print(f"🎯 임원진 면접 평가 결과: {len(evaluations)}명의 평가 데이터 반환")
-        
+        # 지원자별 등급 개수·합격 여부를 한 번의 GROUP BY 로 집계 (평가가 바뀌지 않았으면 캐시 사용)
+        summaries = InterviewEvaluationSummaryService.get_job_post_summaries(db, job_post_id, EvaluationType.EXECUTIVE)
+        evaluations = [{key: summary[key] for key in PANEL_EVALUATION_FIELDS} for summary in summaries]
+
+        print(f"🎯 임원진 면접 평가 결과: {len(evaluations)}명의 평가 데이터 반환 (job_post_id: {job_post_id})")
+
         return {
             "success": True,
             "job_post_id": job_post_id,
@@ -690,39 +537,14 @@ def get_executive_interview_evaluations_by_job_post(job_post_id: int, db: Sessio
         raise HTTPException(status_code=500, detail=f"임원진 면접 평가 조회 실패: {str(e)}")
 
 @router.get("/ai-interview/summary")
-def get_ai_interview_summary(db: Session = Depends(get_db)):
+def get_ai_interview_summary(db: Session = Depends(get_read_db)):
     """AI 면접 전체 요약 통계"""
     try:
-        # 전체 AI 면접 평가 수
-        total_evaluations = db.query(InterviewEvaluation).filter(
-            InterviewEvaluation.evaluation_type == EvaluationType.AI
-        ).count()
-        
-        # 합격/불합격 통계
-        passed_count = 0
-        failed_count = 0
-        
-        evaluations = db.query(InterviewEvaluation).filter(
-            InterviewEvaluation.evaluation_type == EvaluationType.AI
-        ).all()
-        
-        for evaluation in evaluations:
-            evaluation_items = db.query(InterviewEvaluationItem).filter(
-                InterviewEvaluationItem.evaluation_id == evaluation.id
-            ).all()
-            
-            if evaluation_items:
-                grade_counts = {"상": 0, "중": 0, "하": 0}
-                for item in evaluation_items:
-                    if item.grade in grade_counts:
-                        grade_counts[item.grade] += 1
-                
-                total_items = len(evaluation_items)
-                low_threshold = max(2, int(total_items * 0.15))
-                if grade_counts["하"] < low_threshold:
-                    passed_count += 1
-                else:
-                    failed_count += 1
+        # 평가별 '하' 개수/항목 수를 집계한 뒤 합격/불합격을 DB 에서 세기
+        stats = InterviewEvaluationSummaryService.get_ai_pass_statistics(db)
+        total_evaluations = stats["total_evaluations"]
+        passed_count = stats["passed_count"]
+        failed_count = stats["failed_count"]
         
         return {
             "success": True,
@@ -814,62 +636,40 @@ async def upload_interview_audio(
 
 @router.post("/job-post/{job_post_id}/final-selection")
 def update_final_selection(job_post_id: int, db: Session = Depends(get_db)):
-    """최종 선발 상태 업데이트 - headcount만큼 최종 합격자 선정"""
+    """최종 선발 상태 업데이트 - headcount만큼 최종 합격자 선정
+
+    공고 행을 잠근 뒤 부족분만 순위 UPDATE 한 번으로 선발하므로 동시에 눌러도 headcount 를 넘지 않는다.
+    """
     try:
-        # 공고 정보 조회
-        from app.models.job import JobPost
-        job_post = db.query(JobPost).filter(JobPost.id == job_post_id).first()
-        if not job_post:
-            raise HTTPException(status_code=404, detail="공고를 찾을 수 없습니다.")
+        from app.services.application_transition_service import ApplicationTransitionService
         
-        headcount = job_post.headcount or 1
-        target_count = headcount  # headcount만큼만 선발
+        result = ApplicationTransitionService.select_final_candidates(db, job_post_id)
+        if result is None:
+            raise HTTPException(status_code=404, detail="공고를 찾을 수 없습니다.")
+        db.commit()
         
-        # 현재 최종 선발자 수 확인 (final_status 기준)
-        from app.models.application import FinalStatus
-        current_selected = db.query(Application).filter(
-            Application.job_post_id == job_post_id,
-            Application.final_status == FinalStatus.SELECTED
-        ).count()
-        
-        # 추가로 선발할 인원 수 계산
-        additional_needed = max(0, target_count - current_selected)
-        
-        if additional_needed > 0:
-            # 임원 면접까지 완료된 지원자들을 점수 순으로 정렬하여 추가 선발
-            candidates = db.query(Application).filter(
-                Application.job_post_id == job_post_id,
-                Application.document_status == 'PASSED',
-                Application.final_status != FinalStatus.SELECTED,
-                Application.executive_score.isnot(None)
-            ).order_by(Application.final_score.desc()).limit(additional_needed).all()
-            
-            # 상태 업데이트 (final_status만 변경, pass_reason은 건드리지 않음)
-            for candidate in candidates:
-                candidate.final_status = FinalStatus.SELECTED
-            
-            db.commit()
-            
-            return {
-                "success": True,
-                "job_post_id": job_post_id,
-                "headcount": headcount,
-                "target_count": target_count,
-                "current_selected": current_selected,
-                "additional_selected": len(candidates),
-                "message": f"{len(candidates)}명의 지원자가 추가로 최종 선발자로 선정되었습니다."
-            }
+        additional_selected = result["additional_selected"]
+        if additional_selected > 0:
+            message = f"{additional_selected}명의 지원자가 추가로 최종 선발자로 선정되었습니다."
+        elif result["current_selected"] >= result["headcount"]:
+            message = "이미 목표 인원이 충족되었습니다."
         else:
-            return {
-                "success": True,
-                "job_post_id": job_post_id,
-                "headcount": headcount,
-                "target_count": target_count,
-                "current_selected": current_selected,
-                "additional_selected": 0,
-                "message": "이미 목표 인원이 충족되었습니다."
-            }
+            message = "추가로 선발할 수 있는 지원자가 없습니다."
+        
+        return {
+            "success": True,
+            "job_post_id": job_post_id,
+            "headcount": result["headcount"],
+            "target_count": result["headcount"],
+            "current_selected": result["current_selected"],
+            "additional_selected": additional_selected,
+            "selected_application_ids": result["application_ids"],
+            "message": message
+        }
             
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"최종 선발 업데이트 실패: {str(e)}") 
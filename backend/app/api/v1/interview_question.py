@@ -11,6 +11,7 @@ from app.models.job import JobPost
 from app.models.resume import Resume, Spec
 from app.models.personal_question_result import PersonalQuestionResult
 from app.services.interview_question_service import InterviewQuestionService
+from app.services.resume_profile_service import ResumeProfileService
 from app.schemas.interview_question import (
     InterviewQuestionCreate, 
     InterviewQuestionResponse, 
@@ -33,6 +34,14 @@ redis_client = redis.Redis(host='redis', port=6379, db=0)
 
 router = APIRouter()
 
+# 개인별 질문 생성 시 기술 스택 분류 (키워드가 skills 문자열에 포함되면 해당 분류에 추가)
+SKILL_KEYWORDS = [
+    ("Java", "programming_languages"),
+    ("Python", "programming_languages"),
+    ("Spring", "frameworks"),
+    ("React", "frameworks"),
+]
+
 # 통합 API용 스키마
 class IntegratedQuestionRequest(BaseModel):
     resume_id: Optional[int] = None
@@ -1115,6 +1124,7 @@ async def generate_passed_applicants_questions(
         
         # 각 합격자에 대한 개인별 질문 생성
         applicants_data = []
+        profiles = ResumeProfileService.load_profiles(db, [applicant["resume_id"] for applicant in passed_applicants if applicant.get("resume_id")])
         
         for applicant in passed_applicants:
             # Resume 데이터 조회
@@ -1158,33 +1168,25 @@ async def generate_passed_applicants_questions(
                 "certificates": applicant.get("certificates", [])
             }
             
-            # Spec 데이터에서 추가 정보 추출
-            for spec in specs:
-                if str(spec.spec_type) == "experience" and str(spec.spec_title) == "company":
-                    resume_data["experience"]["companies"].append(spec.spec_description or "")
-                elif str(spec.spec_type) == "experience" and str(spec.spec_title) == "position":
-                    resume_data["experience"]["position"] = spec.spec_description or ""
-                elif str(spec.spec_type) == "experience" and str(spec.spec_title) == "duration":
-                    resume_data["experience"]["duration"] = spec.spec_description or ""
-                elif str(spec.spec_type) == "skills" and str(spec.spec_title) == "name":
-                    if "Java" in (spec.spec_description or ""):
-                        resume_data["skills"]["programming_languages"].append("Java")
-                    if "Python" in (spec.spec_description or ""):
-                        resume_data["skills"]["programming_languages"].append("Python")
-                    if "Spring" in (spec.spec_description or ""):
-                        resume_data["skills"]["frameworks"].append("Spring")
-                    if "React" in (spec.spec_description or ""):
-                        resume_data["skills"]["frameworks"].append("React")
-                elif str(spec.spec_type) == "projects" and str(spec.spec_title) == "name":
-                    resume_data["projects"].append({
-                        "name": spec.spec_description or "",
-                        "description": ""
-                    })
-                elif str(spec.spec_type) == "activities" and str(spec.spec_title) == "name":
-                    resume_data["activities"].append({
-                        "name": spec.spec_description or "",
-                        "description": ""
-                    })
+            # 이력서 프로필에서 추가 정보 추출
+            profile = profiles.get(applicant["resume_id"])
+            if profile:
+                for work in profile.work_experiences or []:
+                    if work.get("company"):
+                        resume_data["experience"]["companies"].append(work["company"])
+                    if work.get("position"):
+                        resume_data["experience"]["position"] = work["position"]
+                    if work.get("duration"):
+                        resume_data["experience"]["duration"] = work["duration"]
+                for skill in profile.skills or []:
+                    for keyword, category in SKILL_KEYWORDS:
+                        if keyword in skill:
+                            resume_data["skills"][category].append(keyword)
+                for item in profile.experiences or []:
+                    if item["type"] == "project":
+                        resume_data["projects"].append({"name": item.get("title", ""), "description": item.get("description", "")})
+                    else:
+                        resume_data["activities"].append({"name": item.get("organization", ""), "description": item.get("description", "")})
             
             applicants_data.append({
                 "name": applicant["name"],
@@ -2132,7 +2134,7 @@ async def evaluate_audio(
     """
     오디오 파일을 받아 agent 컨테이너에 전달하여 실시간 분석 후 결과 반환
     """
-    import httpx
+    from app.core.agent_client import get_agent_client
     
     # 1. 임시 파일로 저장
     with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
@@ -2140,21 +2142,20 @@ async def evaluate_audio(
         tmp_path = tmp.name
 
     try:
-        # 2. agent 컨테이너에 HTTP 요청으로 분석 요청
-        async with httpx.AsyncClient() as client:
-            with open(tmp_path, "rb") as f:
-                files = {"audio_file": f}
-                data = {
-                    "application_id": application_id,
-                    "question_id": question_id,
-                    "question_text": question_text
-                }
-                response = await client.post(
-                    "http://agent:8001/evaluate-audio",
-                    files=files,
-                    data=data
-                )
-                result = response.json()
+        # 2. agent 컨테이너에 HTTP 요청으로 분석 요청 (공유 에이전트 클라이언트)
+        with open(tmp_path, "rb") as f:
+            files = {"audio_file": f}
+            data = {
+                "application_id": application_id,
+                "question_id": question_id,
+                "question_text": question_text
+            }
+            response = await get_agent_client().post(
+                "/evaluate-audio",
+                files=files,
+                data=data
+            )
+            result = response.json()
         
         # 3. DB 저장
         db = next(get_db())  # Depends 사용 불가 시 직접 호출
@@ -3,13 +3,11 @@ from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 import tempfile
-from weasyprint import HTML
 from jinja2 import Template
 import json
-from langchain_openai import ChatOpenAI
 import re
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.models.application import Application, ApplyStatus, WrittenTestStatus, DocumentStatus
 from app.models.job import JobPost
 from app.models.resume import Resume
@@ -149,6 +147,7 @@ def generate_detailed_analysis(job_post, applications, passed_applicants, writte
             import threading
             
             def call_llm():
+                from langchain_openai import ChatOpenAI
                 llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7, request_timeout=25)
                 response = llm.invoke(prompt)
                 return response.content.strip()
@@ -213,7 +212,7 @@ def generate_detailed_analysis(job_post, applications, passed_applicants, writte
 @router.get("/job-aptitude")
 async def get_job_aptitude_report_data(
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
     # current_user: User = Depends(get_current_user)  # 임시로 인증 제거
 ):
     # Redis 캐시 확인
@@ -419,7 +418,7 @@ async def get_job_aptitude_report_data(
 @router.get("/job-aptitude/pdf")
 async def download_job_aptitude_report_pdf(
     job_post_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
@@ -542,6 +541,7 @@ async def download_job_aptitude_report_pdf(
         
         # PDF 생성
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+            from weasyprint import HTML
             HTML(string=rendered_html).write_pdf(tmp.name)
             return FileResponse(
                 path=tmp.name,
@@ -558,7 +558,7 @@ async def download_job_aptitude_report_pdf(
 async def get_applicant_written_test_details(
     applicant_id: int,
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """지원자별 필기시험 상세 결과 조회"""
     try:
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.models.user import User
-from app.api.v1.auth import get_current_user
+from app.core.principal_cache import Principal
+from app.api.v1.auth import get_current_principal
 # 스케줄러 싱글톤 인스턴스
 from app.scheduler.job_status_scheduler import JobStatusScheduler
 
@@ -13,7 +13,7 @@ router = APIRouter()
 
 @router.post("/manual-update")
 async def manual_job_status_update(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """수동 JobPost 상태 업데이트 실행"""
     # 기업 사용자만 접근 가능
@@ -28,7 +28,7 @@ async def manual_job_status_update(
 
 @router.get("/scheduler-status")
 async def get_job_status_scheduler_status(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """JobPost 상태 스케줄러 상태 확인"""
     # 기업 사용자만 접근 가능
@@ -1,32 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from app.core import security
+from app.core.database import get_db, SessionLocal
+from app.core.pagination import DEFAULT_PAGE_SIZE, cached_count, paginate
 from app.schemas.notification import (
     NotificationCreate, NotificationUpdate, NotificationDetail, NotificationList
 )
 from app.models.notification import Notification
-from app.models.user import User
-from app.api.v1.auth import get_current_user
+from app.core.principal_cache import Principal, principal_cache
+from app.api.v1.auth import get_current_principal
+from app.services.notification_stream_service import queue_unread_counts, stream_notifications
 
 router = APIRouter()
 
 
+def _resolve_stream_principal(token: Optional[str]) -> Principal:
+    """SSE 연결 인증 (스트림이 열려 있는 동안 DB 세션을 잡고 있지 않도록 여기서 바로 닫는다)"""
+    payload = security.verify_token(token) if token else None
+    if not payload or not payload.get("sub"):
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+    db = SessionLocal()
+    try:
+        principal = principal_cache.resolve(db, payload["sub"])
+    finally:
+        db.close()
+    if principal is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return principal
+
+
+@router.get("/stream")
+async def notification_stream(
+    request: Request,
+    access_token: Optional[str] = None,
+    last_event_id: Optional[str] = None
+):
+    """새 알림 / 미읽음 개수 변화를 Server-Sent Events 로 전달
+
+    EventSource 는 헤더를 지정할 수 없어 토큰을 access_token 쿼리로도 받는다.
+    재접속 시 브라우저가 보내는 Last-Event-ID 헤더(또는 last_event_id 쿼리) 이후 이벤트를 재전송한다.
+    """
+    authorization = request.headers.get("authorization", "")
+    token = access_token or (authorization[7:] if authorization.lower().startswith("bearer ") else None)
+    principal = await run_in_threadpool(_resolve_stream_principal, token)
+    cursor = request.headers.get("last-event-id") or last_event_id
+    return StreamingResponse(
+        stream_notifications(request, principal.id, cursor),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/", response_model=List[NotificationList])
 def get_notifications(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
-    notifications = db.query(Notification).filter(Notification.user_id == current_user.id).offset(skip).limit(limit).all()
-    return notifications
+    """알림 목록 (키셋 페이지네이션, (user_id, id) 인덱스 순)"""
+    query = db.query(
+        Notification.id, Notification.message, Notification.type,
+        Notification.is_read, Notification.created_at, Notification.url
+    ).filter(Notification.user_id == current_user.id)
+    return paginate(
+        query, (Notification.id,), response,
+        limit=limit, cursor=cursor, skip=skip,
+        total=cached_count(f"notification:user:{current_user.id}", query)
+    )
 
 
 @router.get("/unread", response_model=List[NotificationList])
 def get_unread_notifications(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     notifications = db.query(Notification).filter(
         Notification.user_id == current_user.id,
@@ -38,7 +90,7 @@ def get_unread_notifications(
 @router.get("/unread/count")
 def get_unread_count(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     count = db.query(Notification).filter(
         Notification.user_id == current_user.id,
@@ -51,7 +103,7 @@ def get_unread_count(
 def get_notification(
     notification_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     notification = db.query(Notification).filter(
         Notification.id == notification_id, 
@@ -66,7 +118,7 @@ def get_notification(
 def create_notification(
     notification: NotificationCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     db_notification = Notification(**notification.dict())
     db.add(db_notification)
@@ -82,7 +134,7 @@ def create_notification(
 def delete_notification(
     notification_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     db_notification = db.query(Notification).filter(
         Notification.id == notification_id,
@@ -99,9 +151,10 @@ def delete_notification(
 @router.delete("/all")
 def delete_all_notifications(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     db.query(Notification).filter(Notification.user_id == current_user.id).delete()
+    queue_unread_counts(db, [current_user.id])
     db.commit()
     return {"message": "All notifications deleted successfully"}
 
@@ -110,7 +163,7 @@ def delete_all_notifications(
 def mark_as_read(
     notification_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     db_notification = db.query(Notification).filter(
         Notification.id == notification_id,
@@ -127,12 +180,13 @@ def mark_as_read(
 @router.put("/read-all")
 def mark_all_as_read(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     db.query(Notification).filter(
         Notification.user_id == current_user.id,
         Notification.is_read == False
     ).update({"is_read": True})
+    queue_unread_counts(db, [current_user.id])
     db.commit()
     return {"message": "All notifications marked as read"}
 
@@ -140,7 +194,7 @@ def mark_all_as_read(
 @router.put("/read-interview")
 def mark_interview_notifications_as_read(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Mark all interview-related notifications as read for the current user"""
     updated_count = db.query(Notification).filter(
@@ -148,6 +202,8 @@ def mark_interview_notifications_as_read(
         Notification.is_read == False,
         Notification.type.in_(["INTERVIEW_PANEL_REQUEST", "RESUME_VIEWED"])
     ).update({"is_read": True})
+    if updated_count:
+        queue_unread_counts(db, [current_user.id])
     db.commit()
     return {"message": f"{updated_count} interview notifications marked as read"}
 
@@ -6,38 +6,66 @@ import asyncio
 import logging
 from datetime import datetime
 import base64
-import tempfile
 import os
 
+from ...core.agent_client import AgentUnavailableError, get_agent_client
 from ...core.database import get_db
 from ...models.interview_evaluation import InterviewEvaluation
 from ...models.interview_panel import InterviewPanelAssignment, InterviewPanelRequest, InterviewPanelMember
 from ...schemas.interview_evaluation import InterviewEvaluationCreate
+from ...services.realtime_interview_service import AudioRingBuffer, session_store
 
 router = APIRouter()
 
+# 오디오 버퍼/마이크로 배치 설정
+AUDIO_BUFFER_BYTES = int(os.getenv("REALTIME_AUDIO_BUFFER_BYTES", 4 * 1024 * 1024))  # 세션당 최대 4MB
+AUDIO_BATCH_BYTES = int(os.getenv("REALTIME_AUDIO_BATCH_BYTES", 512 * 1024))         # 에이전트 호출 1회당 최대 512KB
+AUDIO_BATCH_WINDOW = float(os.getenv("REALTIME_AUDIO_BATCH_WINDOW", 0.5))            # 청크 모으는 대기 시간(초)
+BACKPRESSURE_TIMEOUT = 10.0
+
 # WebSocket 연결 관리
+# 세션 데이터는 Redis(session_store)에 저장하고, 이 워커에 붙어 있는 연결과 오디오 파이프라인만 메모리에 둔다.
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
-        self.interview_sessions: Dict[str, Dict] = {}
+        self.audio_buffers: Dict[str, AudioRingBuffer] = {}
+        self.pipeline_tasks: Dict[str, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket, session_id: str):
         await websocket.accept()
         self.active_connections[session_id] = websocket
-        self.interview_sessions[session_id] = {
-            "start_time": datetime.now(),
-            "transcripts": [],
-            "evaluations": [],
-            "speaker_notes": {}
-        }
+        await session_store.open(session_id)
+        
+        buffer = AudioRingBuffer(AUDIO_BUFFER_BYTES)
+        self.audio_buffers[session_id] = buffer
+        self.pipeline_tasks[session_id] = asyncio.create_task(run_audio_pipeline(session_id, buffer))
         logging.info(f"WebSocket 연결됨: {session_id}")
     
-    def disconnect(self, session_id: str):
+    async def disconnect(self, session_id: str, end_session: bool = False):
+        if (session_id not in self.active_connections and session_id not in self.audio_buffers
+                and session_id not in self.pipeline_tasks):
+            return  # 이미 정리됨 (session_end 후 엔드포인트 종료 시 두 번째 호출)
+        buffer = self.audio_buffers.pop(session_id, None)
+        if buffer:
+            buffer.close()
+        task = self.pipeline_tasks.pop(session_id, None)
+        if task and task is not asyncio.current_task():
+            try:
+                # 남은 오디오 처리 완료 대기
+                await asyncio.wait_for(task, timeout=30.0)
+            except (asyncio.TimeoutError, Exception) as e:
+                logging.warning(f"오디오 파이프라인 종료 대기 실패: {e}")
+                task.cancel()
         if session_id in self.active_connections:
             del self.active_connections[session_id]
-        if session_id in self.interview_sessions:
-            del self.interview_sessions[session_id]
+        try:
+            if end_session:
+                await session_store.delete(session_id)
+            else:
+                # 재접속 시 다른 워커에서도 이어서 처리할 수 있도록 데이터는 유지
+                await session_store.release(session_id)
+        except Exception as e:
+            logging.error(f"세션 상태 정리 실패: {e}")
         logging.info(f"WebSocket 연결 해제: {session_id}")
     
     async def send_personal_message(self, message: str, session_id: str):
@@ -52,33 +80,18 @@ manager = ConnectionManager()
 
 @router.websocket("/ws/interview/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
-    """실시간 면접 WebSocket 엔드포인트"""
+    """실시간 면접 WebSocket 엔드포인트
+
+    - 바이너리 프레임: 오디오 청크 (버퍼에 적재 후 마이크로 배치로 처리)
+    - 텍스트 프레임: JSON 제어 메시지 (speaker_note, evaluation_request, session_end, audio_chunk(base64, 하위 호환))
+    """
     await manager.connect(websocket, session_id)
     
     try:
         while True:
             # 클라이언트로부터 메시지 수신 (타임아웃 설정)
             try:
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-                message = json.loads(data)
-                
-                # 메시지 타입에 따른 처리
-                message_type = message.get("type")
-                
-                if message_type == "audio_chunk":
-                    await handle_audio_chunk(session_id, message)
-                elif message_type == "speaker_note":
-                    await handle_speaker_note(session_id, message)
-                elif message_type == "evaluation_request":
-                    await handle_evaluation_request(session_id, message)
-                elif message_type == "session_end":
-                    await handle_session_end(session_id, message)
-                else:
-                    await manager.send_personal_message(
-                        json.dumps({"error": "Unknown message type"}),
-                        session_id
-                    )
-                    
+                frame = await asyncio.wait_for(websocket.receive(), timeout=30.0)
             except asyncio.TimeoutError:
                 # 타임아웃 시 연결 유지를 위한 ping 메시지 전송
                 await manager.send_personal_message(
@@ -86,15 +99,69 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                     session_id
                 )
                 continue
+            
+            if frame.get("type") == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            
+            if frame.get("bytes") is not None:
+                await enqueue_audio(session_id, frame["bytes"], datetime.now().timestamp())
+                continue
+            
+            message = json.loads(frame.get("text") or "{}")
+            
+            # 메시지 타입에 따른 처리
+            message_type = message.get("type")
+            
+            if message_type == "audio_chunk":
+                await handle_audio_chunk(session_id, message)
+            elif message_type == "speaker_note":
+                await handle_speaker_note(session_id, message)
+            elif message_type == "evaluation_request":
+                await handle_evaluation_request(session_id, message)
+            elif message_type == "session_end":
+                await handle_session_end(session_id, message)
+                break
+            else:
+                await manager.send_personal_message(
+                    json.dumps({"error": "Unknown message type"}),
+                    session_id
+                )
                 
     except WebSocketDisconnect:
-        manager.disconnect(session_id)
+        pass
     except Exception as e:
         logging.error(f"WebSocket 오류: {e}")
-        manager.disconnect(session_id)
+    finally:
+        # session_end 처리 실패(타임아웃/세션 없음) 포함 모든 종료 경로에서 버퍼·파이프라인·연결 정리
+        await manager.disconnect(session_id)
+
+async def enqueue_audio(session_id: str, audio_bytes: bytes, timestamp: float):
+    """오디오 청크를 세션 버퍼에 적재 (버퍼가 가득 차면 처리 속도를 따라잡을 때까지 수신 중지)"""
+    buffer = manager.audio_buffers.get(session_id)
+    if buffer is None:
+        return
+    
+    if buffer.push(audio_bytes, timestamp):
+        return
+    
+    # 버퍼 포화: 클라이언트에 알리고, 처리 태스크가 버퍼를 비울 때까지 다음 프레임을 읽지 않음
+    await manager.send_personal_message(
+        json.dumps({"type": "backpressure", "paused": True, "buffered_bytes": buffer.size}),
+        session_id
+    )
+    if not await buffer.wait_for_space(timeout=BACKPRESSURE_TIMEOUT) or not buffer.push(audio_bytes, timestamp):
+        logging.warning(f"오디오 버퍼 포화로 청크 폐기: {session_id}")
+        await manager.send_personal_message(
+            json.dumps({"type": "audio_dropped", "timestamp": timestamp, "bytes": len(audio_bytes)}),
+            session_id
+        )
+    await manager.send_personal_message(
+        json.dumps({"type": "backpressure", "paused": False, "buffered_bytes": buffer.size}),
+        session_id
+    )
 
 async def handle_audio_chunk(session_id: str, message: Dict[str, Any]):
-    """오디오 청크 처리"""
+    """오디오 청크 처리 (base64 JSON 메시지 하위 호환)"""
     try:
         audio_data = message.get("audio_data")
         timestamp = message.get("timestamp", datetime.now().timestamp())
@@ -106,60 +173,63 @@ async def handle_audio_chunk(session_id: str, message: Dict[str, Any]):
             )
             return
         
-        # Base64 디코딩
-        audio_bytes = base64.b64decode(audio_data)
+        # Base64 디코딩 후 바이너리 프레임과 동일한 버퍼로 전달
+        await enqueue_audio(session_id, base64.b64decode(audio_data), timestamp)
+        
+    except Exception as e:
+        logging.error(f"오디오 청크 처리 오류: {e}")
+        await manager.send_personal_message(
+            json.dumps({"error": str(e)}),
+            session_id
+        )
+
+async def run_audio_pipeline(session_id: str, buffer: AudioRingBuffer):
+    """세션 오디오 처리 루프: 버퍼에 쌓인 청크를 모아 한 번에 에이전트로 전달"""
+    while True:
+        has_data = await buffer.wait_for_data()
+        if not has_data and buffer.closed:
+            break
         
-        # 임시 파일에 저장
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_audio_path = temp_file.name
+        # 짧은 시간 동안 청크를 더 모아서 호출 횟수를 줄임 (마이크로 배치)
+        if not buffer.closed and buffer.size < AUDIO_BATCH_BYTES:
+            await asyncio.sleep(AUDIO_BATCH_WINDOW)
         
-        # 음성 인식 및 화자 분리 처리
-        result = await process_audio_chunk(temp_audio_path, timestamp)
+        timestamp, audio_bytes, chunk_count = buffer.drain(AUDIO_BATCH_BYTES)
+        if not chunk_count:
+            continue
         
-        # 세션 데이터 업데이트
-        if session_id in manager.interview_sessions:
-            session_data = manager.interview_sessions[session_id]
+        try:
+            result = await process_audio_chunk(session_id, audio_bytes, timestamp, chunk_count)
             
+            # 세션 데이터 업데이트
             if result.get("transcription", {}).get("text"):
-                session_data["transcripts"].append({
+                await session_store.append_transcript(session_id, {
                     "timestamp": timestamp,
                     "speaker": result.get("diarization", {}).get("current_speaker", "unknown"),
                     "text": result["transcription"]["text"]
                 })
             
             if result.get("evaluation", {}).get("score", 0) > 0:
-                session_data["evaluations"].append(result["evaluation"])
-        
-        # 결과를 클라이언트에 전송
-        await manager.send_personal_message(
-            json.dumps({
-                "type": "audio_processed",
-                "result": result
-            }),
-            session_id
-        )
-        
-        # 임시 파일 삭제
-        os.unlink(temp_audio_path)
-        
-    except Exception as e:
-        logging.error(f"오디오 청크 처리 오류: {e}")
-        await manager.send_personal_message(
-            json.dumps({"error": str(e)}),
-            session_id
-        )
+                await session_store.append_evaluation(session_id, result["evaluation"])
+            
+            # 결과를 클라이언트에 전송
+            await manager.send_personal_message(
+                json.dumps({
+                    "type": "audio_processed",
+                    "result": result
+                }),
+                session_id
+            )
+        except Exception as e:
+            logging.error(f"오디오 배치 처리 오류: {e}")
+            try:
+                await manager.send_personal_message(json.dumps({"error": str(e)}), session_id)
+            except Exception:
+                pass
 
-async def process_audio_chunk(audio_path: str, timestamp: float) -> Dict[str, Any]:
-    """오디오 청크 처리 (비동기)"""
+async def process_audio_chunk(session_id: str, audio_chunk: bytes, timestamp: float, chunk_count: int = 1) -> Dict[str, Any]:
+    """오디오 배치 처리 (비동기)"""
     try:
-        # AI 에이전트 서비스 호출 (HTTP API 사용)
-        import httpx
-        
-        # 오디오 파일을 바이트로 읽기
-        with open(audio_path, 'rb') as f:
-            audio_chunk = f.read()
-        
         # 간단한 오디오 분석 (실제로는 더 정교한 분석 필요)
         audio_features = {
             "volume": 0.5,  # 실제로는 오디오에서 추출
@@ -171,46 +241,49 @@ async def process_audio_chunk(audio_path: str, timestamp: float) -> Dict[str, An
         # 음성 인식 (실제로는 Whisper 사용)
         transcription_result = {"text": "안녕하세요, 자기소개를 해드리겠습니다.", "success": True}
         
-        # AI 에이전트 서비스 호출
+        # AI 에이전트 서비스 호출 (공유 클라이언트로 연결 재사용, 서킷이 열려 있으면 즉시 실패)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://kocruit_agent:8001/agent/ai-interview-evaluation",
-                    json={
-                        "session_id": f"session_{timestamp}",
-                        "job_info": "IT 개발자",
-                        "audio_data": {
-                            "transcript": transcription_result.get("text", ""),
-                            "audio_features": audio_features
-                        },
-                        "behavior_data": {
-                            "eye_contact": 7,
-                            "facial_expression": 8,
-                            "posture": 6,
-                            "tone": 7,
-                            "extraversion": 6,
-                            "openness": 7,
-                            "conscientiousness": 8,
-                            "agreeableness": 7,
-                            "neuroticism": 4
-                        },
-                        "game_data": {
-                            "focus_score": 7,
-                            "response_time_score": 8,
-                            "memory_score": 6,
-                            "situation_score": 7,
-                            "problem_solving_score": 8
-                        }
+            response = await get_agent_client().post(
+                "/agent/ai-interview-evaluation",
+                json={
+                    "session_id": session_id,
+                    "job_info": "IT 개발자",
+                    "audio_data": {
+                        "transcript": transcription_result.get("text", ""),
+                        "audio_features": audio_features,
+                        "chunk_count": chunk_count,
+                        "audio_bytes": len(audio_chunk)
                     },
-                    timeout=30.0
-                )
+                    "behavior_data": {
+                        "eye_contact": 7,
+                        "facial_expression": 8,
+                        "posture": 6,
+                        "tone": 7,
+                        "extraversion": 6,
+                        "openness": 7,
+                        "conscientiousness": 8,
+                        "agreeableness": 7,
+                        "neuroticism": 4
+                    },
+                    "game_data": {
+                        "focus_score": 7,
+                        "response_time_score": 8,
+                        "memory_score": 6,
+                        "situation_score": 7,
+                        "problem_solving_score": 8
+                    }
+                }
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+            else:
+                logging.error(f"AI 에이전트 호출 실패: {response.status_code}")
+                result = {"error": f"AI 에이전트 호출 실패: {response.status_code}", "success": False}
                 
-                if response.status_code == 200:
-                    result = response.json()
-                else:
-                    logging.error(f"AI 에이전트 호출 실패: {response.status_code}")
-                    result = {"error": f"AI 에이전트 호출 실패: {response.status_code}", "success": False}
-                    
+        except AgentUnavailableError as e:
+            logging.warning(f"AI 에이전트 호출 생략: {e}")
+            result = {"error": f"AI 에이전트 과부하: {e.reason}", "success": False}
         except Exception as e:
             logging.error(f"AI 에이전트 호출 오류: {e}")
             result = {"error": f"AI 에이전트 호출 오류: {str(e)}", "success": False}
@@ -219,6 +292,7 @@ async def process_audio_chunk(audio_path: str, timestamp: float) -> Dict[str, An
         if result.get("success", True) and "error" not in result:
             return {
                 "timestamp": timestamp,
+                "chunk_count": chunk_count,
                 "transcription": transcription_result,
                 "diarization": {"current_speaker": "지원자", "confidence": 0.9},
                 "evaluation": {
@@ -232,6 +306,7 @@ async def process_audio_chunk(audio_path: str, timestamp: float) -> Dict[str, An
         else:
             return {
                 "timestamp": timestamp,
+                "chunk_count": chunk_count,
                 "transcription": transcription_result,
                 "diarization": {"current_speaker": "unknown", "error": result.get("error", "Unknown error")},
                 "evaluation": {"score": 0, "feedback": [f"오류: {result.get('error', 'Unknown error')}"], "success": False},
@@ -244,6 +319,7 @@ async def process_audio_chunk(audio_path: str, timestamp: float) -> Dict[str, An
         # 오류 발생 시에도 시뮬레이션 대신 오류 정보 반환
         return {
             "timestamp": timestamp,
+            "chunk_count": chunk_count,
             "transcription": {"text": f"처리 오류: {str(e)}", "success": False},
             "diarization": {"current_speaker": "unknown", "error": str(e)},
             "evaluation": {"score": 0, "feedback": [f"오류: {str(e)}"], "success": False},
@@ -266,15 +342,10 @@ async def handle_speaker_note(session_id: str, message: Dict[str, Any]):
             return
         
         # 세션 데이터에 메모 추가
-        if session_id in manager.interview_sessions:
-            session_data = manager.interview_sessions[session_id]
-            if speaker not in session_data["speaker_notes"]:
-                session_data["speaker_notes"][speaker] = []
-            
-            session_data["speaker_notes"][speaker].append({
-                "timestamp": timestamp,
-                "note": note
-            })
+        await session_store.add_speaker_note(session_id, speaker, {
+            "timestamp": timestamp,
+            "note": note
+        })
         
         # 확인 메시지 전송
         await manager.send_personal_message(
@@ -297,15 +368,14 @@ async def handle_speaker_note(session_id: str, message: Dict[str, Any]):
 async def handle_evaluation_request(session_id: str, message: Dict[str, Any]):
     """평가 요청 처리"""
     try:
-        if session_id not in manager.interview_sessions:
+        session_data = await session_store.load(session_id)
+        if session_data is None:
             await manager.send_personal_message(
                 json.dumps({"error": "Session not found"}),
                 session_id
             )
             return
         
-        session_data = manager.interview_sessions[session_id]
-        
         # 세션 요약 생성
         summary = {
             "session_id": session_id,
@@ -347,15 +417,22 @@ async def handle_evaluation_request(session_id: str, message: Dict[str, Any]):
 async def handle_session_end(session_id: str, message: Dict[str, Any]):
     """세션 종료 처리"""
     try:
-        if session_id not in manager.interview_sessions:
+        # 버퍼에 남은 오디오를 모두 처리한 뒤 최종 결과 생성
+        buffer = manager.audio_buffers.get(session_id)
+        if buffer:
+            buffer.close()
+        task = manager.pipeline_tasks.get(session_id)
+        if task:
+            await asyncio.wait_for(asyncio.shield(task), timeout=30.0)
+        
+        session_data = await session_store.load(session_id)
+        if session_data is None:
             await manager.send_personal_message(
                 json.dumps({"error": "Session not found"}),
                 session_id
             )
             return
         
-        session_data = manager.interview_sessions[session_id]
-        
         # 최종 결과 생성
         final_result = {
             "session_id": session_id,
@@ -379,7 +456,7 @@ async def handle_session_end(session_id: str, message: Dict[str, Any]):
         )
         
         # 연결 종료
-        manager.disconnect(session_id)
+        await manager.disconnect(session_id, end_session=True)
         
     except Exception as e:
         logging.error(f"세션 종료 처리 오류: {e}")
@@ -390,18 +467,18 @@ async def handle_session_end(session_id: str, message: Dict[str, Any]):
 
 @router.get("/interview/session/{session_id}/status")
 async def get_session_status(session_id: str):
-    """세션 상태 조회"""
-    if session_id not in manager.interview_sessions:
+    """세션 상태 조회 (어느 워커에서 조회해도 동일한 결과)"""
+    session_data = await session_store.load(session_id)
+    if session_data is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session_data = manager.interview_sessions[session_id]
-    
     return {
         "session_id": session_id,
-        "is_active": session_id in manager.active_connections,
+        "is_active": bool(session_data["worker"]),
+        "worker": session_data["worker"],
         "start_time": session_data["start_time"].isoformat(),
         "duration": (datetime.now() - session_data["start_time"]).total_seconds(),
         "total_transcripts": len(session_data["transcripts"]),
         "total_evaluations": len(session_data["evaluations"]),
         "speakers": list(session_data["speaker_notes"].keys())
-    } 
\ No newline at end of file
+    }
@@ -3,16 +3,14 @@ from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Dict, Any, Optional
 import tempfile
-from weasyprint import HTML
 from jinja2 import Template
 import json
-from langchain_openai import ChatOpenAI
 import re
 from pydantic import BaseModel
 from app.core.config import settings
 from sqlalchemy import or_
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.application import Application, ApplyStatus, DocumentStatus, WrittenTestStatus
 from app.models.job import JobPost
 from app.models.resume import Resume
@@ -23,6 +21,8 @@ from app.models.interview_evaluation import InterviewEvaluation, EvaluationType
 from app.models.schedule import AIInterviewSchedule
 from app.schemas.report import DocumentReportResponse, WrittenTestReportResponse
 from app.utils.llm_cache import redis_cache
+from app.services.report_statistics_service import ReportStatisticsService
+from app.services.resume_profile_service import ResumeProfileService
 
 router = APIRouter()
 
@@ -48,6 +48,7 @@ def extract_top3_rejection_reasons_llm(fail_reasons: list[str]) -> list[str]:
 응답은 반드시 JSON 배열로만 출력해라.
 """
     print("[LLM-탈락사유] 프롬프트:\n", prompt)
+    from langchain_openai import ChatOpenAI
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.9, timeout=30)
     try:
         response = llm.invoke(prompt)
@@ -76,6 +77,7 @@ def extract_passed_summary_llm(pass_reasons: list[str]) -> str:
 이 내용을 바탕으로, 이번 채용에서 어떤 유형/능력의 인재가 합격했는지 한글로 2~3문장으로 요약해줘.
 예시: \"실무 경험과 자격증을 고루 갖춘 지원자가 선발되었습니다. PM 경력과 정보처리기사 자격증 보유가 주요 합격 요인으로 작용했습니다.\"
 """
+    from langchain_openai import ChatOpenAI
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7, timeout=30)
     try:
         response = llm.invoke(prompt)
@@ -89,7 +91,7 @@ def extract_passed_summary_llm(pass_reasons: list[str]) -> str:
 @router.get("/document")
 async def get_document_report_data(
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
     # current_user: User = Depends(get_current_user)  # 임시로 인증 제거
 ):
     try:
@@ -124,7 +126,7 @@ async def get_document_report_data(
         # 지원자 정보 조회 (status 필드 사용)
         applications = db.query(Application).options(
             joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs)
+            joinedload(Application.resume)
         ).filter(Application.job_post_id == job_post_id).all()
         
         print(f"📊 지원자 수: {len(applications)}명")
@@ -193,12 +195,14 @@ async def get_document_report_data(
         # 지원자 상세 정보 (이미 로드된 데이터 사용)
         applicants_data = []
         passed_reasons = []
+        profiles = ResumeProfileService.load_profiles(db, [app.resume_id for app in applications if app.resume_id])
         for app in applications:
             if app.user and app.resume:
-                # Spec 정보 집계 (이미 로드된 데이터 사용)
-                education = next((s.spec_title for s in app.resume.specs if s.spec_type == "학력"), "")
-                experience = sum(1 for s in app.resume.specs if s.spec_type == "경력")
-                certificates = sum(1 for s in app.resume.specs if s.spec_type == "자격증")
+                # Spec 정보 집계 (이력서 프로필에서 읽음)
+                profile = profiles.get(app.resume_id)
+                education = (profile.institution if profile else None) or ""
+                experience = len(profile.work_experiences or []) if profile else 0
+                certificates = profile.certificate_count if profile else 0
                 
                 # document_status 필드 사용
                 if app.document_status == "PASSED" and app.pass_reason:
@@ -263,7 +267,7 @@ async def get_document_report_data(
 @router.get("/document/pdf")
 async def download_document_report_pdf(
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
     # current_user: User = Depends(get_current_user)  # 임시로 인증 제거
 ):
     try:
@@ -399,6 +403,7 @@ async def download_document_report_pdf(
         # PDF 생성
         # ⚠️ 한글 폰트가 서버에 설치되어 있어야 한글이 깨지지 않습니다. (예: Malgun Gothic)
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+            from weasyprint import HTML
             HTML(string=rendered_html).write_pdf(tmp.name)
             return FileResponse(
                 path=tmp.name,
@@ -511,6 +516,7 @@ async def generate_comprehensive_evaluation(
 답변은 한국어로 작성하고, 200-300자 내외로 작성해주세요.
 """
 
+        from langchain_openai import ChatOpenAI
         llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
         response = llm.invoke(prompt)
         comprehensive_comment = response.content.strip()
@@ -535,7 +541,7 @@ async def generate_comprehensive_evaluation(
 @router.get("/statistics")
 async def get_statistics_report_data(
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
     # current_user: User = Depends(get_current_user)  # 임시로 인증 제거
 ):
     """지원자 통계 보고서 데이터 조회"""
@@ -551,138 +557,9 @@ async def get_statistics_report_data(
         if not job_post:
             raise HTTPException(status_code=404, detail="공고를 찾을 수 없습니다.")
         
-        # 지원자 정보 조회 (관계 데이터 포함)
-        applications = db.query(Application).options(
-            joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs)
-        ).filter(Application.job_post_id == job_post_id).all()
-        
-        print(f"📊 지원자 수: {len(applications)}명")
-        
-        if not applications:
-            return {
-                "job_post": {
-                    "title": job_post.title,
-                    "department": job_post.department,
-                    "position": job_post.title,
-                    "recruit_count": job_post.headcount,
-                    "start_date": job_post.start_date,
-                    "end_date": job_post.end_date
-                },
-                "stats": {
-                    "total_applicants": 0,
-                    "gender_stats": [],
-                    "age_group_stats": [],
-                    "education_stats": [],
-                    "certificate_stats": [],
-                    "province_stats": []
-                }
-            }
-        
-        # 통계 데이터 계산
-        total_applicants = len(applications)
-        
-        # 성별 통계
-        gender_stats = {}
-        for app in applications:
-            if app.user and app.user.gender:
-                gender = app.user.gender
-                gender_stats[gender] = gender_stats.get(gender, 0) + 1
-        
-        # 연령대 통계
-        age_group_stats = {}
-        for app in applications:
-            if app.user and app.user.birth_date:
-                try:
-                    from datetime import datetime
-                    birth_year = app.user.birth_date.year
-                    current_year = datetime.now().year
-                    age = current_year - birth_year
-                    
-                    if age < 20:
-                        age_group = "20대 미만"
-                    elif age < 30:
-                        age_group = "20대"
-                    elif age < 40:
-                        age_group = "30대"
-                    elif age < 50:
-                        age_group = "40대"
-                    elif age < 60:
-                        age_group = "50대"
-                    else:
-                        age_group = "60대 이상"
-                    
-                    age_group_stats[age_group] = age_group_stats.get(age_group, 0) + 1
-                except:
-                    pass
-        
-        # 학력 통계
-        education_stats = {}
-        for app in applications:
-            if app.resume and app.resume.specs:
-                for spec in app.resume.specs:
-                    if spec.spec_type == "education" and spec.spec_title == "degree":
-                        education = spec.spec_description
-                        if education:
-                            education_stats[education] = education_stats.get(education, 0) + 1
-                            break
-        
-        # 자격증 통계
-        certificate_stats = {}
-        for app in applications:
-            if app.resume and app.resume.specs:
-                cert_count = 0
-                for spec in app.resume.specs:
-                    if spec.spec_type == "certificate":
-                        cert_count += 1
-                
-                cert_key = f"{cert_count}개"
-                certificate_stats[cert_key] = certificate_stats.get(cert_key, 0) + 1
-        
-        # 지역 통계
-        province_stats = {}
-        for app in applications:
-            if app.user and app.user.address:
-                # 주소에서 시/도 추출
-                address = app.user.address
-                if "서울" in address:
-                    province = "서울"
-                elif "부산" in address:
-                    province = "부산"
-                elif "대구" in address:
-                    province = "대구"
-                elif "인천" in address:
-                    province = "인천"
-                elif "광주" in address:
-                    province = "광주"
-                elif "대전" in address:
-                    province = "대전"
-                elif "울산" in address:
-                    province = "울산"
-                elif "세종" in address:
-                    province = "세종"
-                elif "경기" in address:
-                    province = "경기"
-                elif "강원" in address:
-                    province = "강원"
-                elif "충북" in address or "충청북도" in address:
-                    province = "충북"
-                elif "충남" in address or "충청남도" in address:
-                    province = "충남"
-                elif "전북" in address or "전라북도" in address:
-                    province = "전북"
-                elif "전남" in address or "전라남도" in address:
-                    province = "전남"
-                elif "경북" in address or "경상북도" in address:
-                    province = "경북"
-                elif "경남" in address or "경상남도" in address:
-                    province = "경남"
-                elif "제주" in address:
-                    province = "제주"
-                else:
-                    province = "기타"
-                
-                province_stats[province] = province_stats.get(province, 0) + 1
+        # 성별/연령대/학력/자격증/지역 통계 (DB 집계)
+        stats = ReportStatisticsService.get_applicant_statistics(db, job_post_id)
+        print(f"📊 지원자 수: {stats['total_applicants']}명")
         
         return {
             "job_post": {
@@ -693,14 +570,7 @@ async def get_statistics_report_data(
                 "start_date": job_post.start_date,
                 "end_date": job_post.end_date
             },
-            "stats": {
-                "total_applicants": total_applicants,
-                "gender_stats": [{"name": k, "value": v} for k, v in gender_stats.items()],
-                "age_group_stats": [{"name": k, "count": v} for k, v in age_group_stats.items()],
-                "education_stats": [{"name": k, "value": v} for k, v in education_stats.items()],
-                "certificate_stats": [{"name": k, "count": v} for k, v in certificate_stats.items()],
-                "province_stats": [{"name": k, "count": v} for k, v in province_stats.items()]
-            }
+            "stats": stats
         }
         
     except Exception as e:
@@ -713,7 +583,7 @@ async def get_statistics_report_data(
 @router.get("/job-aptitude")
 async def get_job_aptitude_report_data(
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
     # current_user: User = Depends(get_current_user)  # 임시로 인증 제거
 ):
     # Redis 캐시 확인
@@ -732,49 +602,15 @@ async def get_job_aptitude_report_data(
         if not job_post:
             raise HTTPException(status_code=404, detail="공고를 찾을 수 없습니다.")
         
-        # 전체 지원자 조회 (디버깅용)
-        all_applications = db.query(Application).filter(Application.job_post_id == job_post_id).all()
-        print(f"[JOB-APTITUDE-REPORT] 전체 지원자 수: {len(all_applications)}")
-        
-        # written_test_status가 NULL인 경우도 확인
-        null_status_applications = db.query(Application).filter(
-            Application.job_post_id == job_post_id,
-            Application.written_test_status.is_(None)
-        ).all()
-        print(f"[JOB-APTITUDE-REPORT] written_test_status가 NULL인 지원자 수: {len(null_status_applications)}")
-        
-        # 필기합격자 정보 조회 (written_test_status가 PASSED인 지원자들 또는 NULL인 경우)
-        # 임시로 NULL 상태도 필기합격자로 간주 (테스트용)
-        applications = db.query(Application).filter(
-            Application.job_post_id == job_post_id,
-            (Application.written_test_status == WrittenTestStatus.PASSED) | 
-            (Application.written_test_status.is_(None))
-        ).all()
-        
-        print(f"[JOB-APTITUDE-REPORT] job_post_id: {job_post_id}")
-        print(f"[JOB-APTITUDE-REPORT] 필기합격자 조회 결과: {len(applications)}명")
-        
-        # 전체 지원자 수도 확인
-        all_applications = db.query(Application).filter(Application.job_post_id == job_post_id).all()
-        print(f"[JOB-APTITUDE-REPORT] 전체 지원자 수: {len(all_applications)}명")
-        
-        # written_test_status별 분포 확인
-        status_counts = {}
-        for app in all_applications:
-            status = app.written_test_status.value if app.written_test_status else 'NULL'
-            status_counts[status] = status_counts.get(status, 0) + 1
-        print(f"[JOB-APTITUDE-REPORT] written_test_status 분포: {status_counts}")
-        
-        # 서류합격자 수 조회
-        document_passed_applications = db.query(Application).filter(
-            Application.job_post_id == job_post_id,
-            Application.document_status == DocumentStatus.PASSED
-        ).all()
-        document_passed_count = len(document_passed_applications)
-        print(f"[JOB-APTITUDE-REPORT] 서류합격자 수: {document_passed_count}명")
+        # 필기 평가 집계 (인원수/평균/최고/최저/표준편차를 단일 쿼리로 계산)
+        # 필기합격자: written_test_status가 PASSED이거나 NULL인 지원자 (임시로 NULL 상태도 포함)
+        written_stats = ReportStatisticsService.get_written_test_statistics(db, job_post_id)
+        total_applicants = written_stats["passed_count"]
+        document_passed_count = written_stats["document_passed_count"]
+        print(f"[JOB-APTITUDE-REPORT] job_post_id: {job_post_id}, 전체 지원자 수: {written_stats['total_count']}명, "
+              f"필기합격자 수: {total_applicants}명, 서류합격자 수: {document_passed_count}명")
         
         # 통계 계산
-        total_applicants = len(applications)
         if total_applicants == 0:
             return {
                 "job_post": {
@@ -796,31 +632,14 @@ async def get_job_aptitude_report_data(
                 }
             }
         
-        # 전체 응시자 조회 (필기시험 응시자)
-        all_written_applications = db.query(Application).filter(
-            Application.job_post_id == job_post_id,
-            Application.written_test_score.isnot(None)
-        ).all()
-        total_written_applicants = len(all_written_applications)
-        
-        # 필기 점수 통계 (합격자)
-        written_scores = [float(app.written_test_score) for app in applications if app.written_test_score is not None]
-        average_written_score = sum(written_scores) / len(written_scores) if written_scores else 0
+        # 전체 응시자(필기 점수 보유자) 수 및 평균
+        total_written_applicants = written_stats["written_count"]
+        total_average_score = written_stats["written_avg"]
         
-        # 전체 응시자 평균 점수 계산
-        all_written_scores = [float(app.written_test_score) for app in all_written_applications if app.written_test_score is not None]
-        total_average_score = sum(all_written_scores) / len(all_written_scores) if all_written_scores else 0
-        
-        # 커트라인 점수 계산 (합격자 중 최저점수)
-        cutoff_score = min(written_scores) if written_scores else 0
-        
-        # 표준편차 계산
-        import math
-        if written_scores:
-            variance = sum((x - average_written_score) ** 2 for x in written_scores) / len(written_scores)
-            standard_deviation = math.sqrt(variance)
-        else:
-            standard_deviation = 0
+        # 합격자 점수 통계
+        average_written_score = written_stats["passed_avg"]
+        cutoff_score = written_stats["passed_min"]  # 커트라인 점수 (합격자 중 최저점수)
+        standard_deviation = written_stats["passed_stddev"]
         
         # 전체 응시자 대비 합격률 계산
         pass_rate = round((total_applicants / total_written_applicants * 100), 1) if total_written_applicants > 0 else 0
@@ -834,12 +653,12 @@ async def get_job_aptitude_report_data(
             },
             {
                 "category": "최고점수",
-                "score": max(written_scores) if written_scores else 0,
+                "score": written_stats["passed_max"],
                 "description": "필기합격자 중 최고 점수"
             },
             {
                 "category": "최저점수",
-                "score": min(written_scores) if written_scores else 0,
+                "score": written_stats["passed_min"],
                 "description": "필기합격자 중 최저 점수"
             },
             {
@@ -849,22 +668,8 @@ async def get_job_aptitude_report_data(
             }
         ]
         
-        # 필기합격자 상세 정보
-        passed_applicants = []
-        for app in applications:
-            resume = db.query(Resume).filter(Resume.id == app.resume_id).first()
-            user = db.query(User).filter(User.id == app.user_id).first()
-            if resume and user:
-                passed_applicants.append({
-                    "id": app.id,  # 지원자 ID 추가
-                    "name": user.name,
-                    "written_score": float(app.written_test_score) if app.written_test_score is not None else 0,
-                    "evaluation_date": app.applied_at.strftime("%Y-%m-%d") if app.applied_at else "",
-                    "status": "필기합격"
-                })
-        
-        # 점수순으로 정렬
-        passed_applicants.sort(key=lambda x: x['written_score'], reverse=True)
+        # 필기합격자 상세 정보 (점수순 정렬, 백분위 포함)
+        passed_applicants = ReportStatisticsService.get_written_test_passed_applicants(db, job_post_id)
         
         # 요약 생성
         summary = f"이번 채용에서 총 {total_applicants}명이 필기평가에 합격했습니다. 평균 점수는 {round(average_written_score, 1)}점이며, 전체 지원자 대비 {pass_rate}%의 합격률을 보였습니다."
@@ -906,7 +711,7 @@ async def get_job_aptitude_report_data(
 @router.get("/job-aptitude/pdf")
 async def download_job_aptitude_report_pdf(
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
     # current_user: User = Depends(get_current_user)  # 임시로 인증 제거
 ):
     try:
@@ -1020,6 +825,7 @@ async def download_job_aptitude_report_pdf(
         
         # PDF 생성
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+            from weasyprint import HTML
             HTML(string=rendered_html).write_pdf(tmp.name)
             return FileResponse(
                 path=tmp.name,
@@ -1035,7 +841,7 @@ async def download_job_aptitude_report_pdf(
 @router.get("/interview")
 async def get_interview_report_data(
     job_post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
     # current_user: User = Depends(get_current_user)  # 임시로 인증 제거
 ):
     """
@@ -4,6 +4,8 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from app.core.database import get_db
+from app.core.principal_cache import Principal
+from app.api.v1.auth import get_current_principal
 from app.services.resume_plagiarism_service import ResumePlagiarismService
 
 router = APIRouter()
@@ -22,6 +24,7 @@ class PlagiarismCheckResponse(BaseModel):
     all_similar_resumes: Optional[List[dict]] = None
     message: Optional[str] = None
     error: Optional[str] = None
+    engine: Optional[str] = None
 
 class BatchEmbedRequest(BaseModel):
     resume_ids: Optional[List[int]] = Field(None, description="임베딩할 이력서 ID 리스트 (None이면 모든 이력서)")
@@ -56,7 +59,8 @@ async def check_plagiarism(
         result = plagiarism_service.detect_plagiarism(
             resume_content=request.resume_content,
             resume_id=request.resume_id,
-            similarity_threshold=request.similarity_threshold
+            similarity_threshold=request.similarity_threshold,
+            db=db
         )
         
         return PlagiarismCheckResponse(**result)
@@ -88,6 +92,73 @@ async def check_resume_plagiarism(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이력서 표절 검사 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/check-plagiarism-embedding", response_model=PlagiarismCheckResponse)
+async def check_plagiarism_embedding(request: PlagiarismCheckRequest):
+    """
+    OpenAI 임베딩 + ChromaDB 문서 단위 유사도로 표절 검사 (외부 API 호출)
+    """
+    try:
+        result = plagiarism_service.detect_plagiarism_by_embedding(
+            resume_content=request.resume_content,
+            resume_id=request.resume_id,
+            similarity_threshold=request.similarity_threshold
+        )
+        return PlagiarismCheckResponse(**result, engine="embedding")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"표절 검사 중 오류가 발생했습니다: {str(e)}")
+
+@router.post("/screen-job-post/{job_post_id}")
+def screen_job_post(
+    job_post_id: int,
+    similarity_threshold: float = Query(0.9, description="표절 의심 임계값"),
+    embed_missing: bool = Query(False, description="임베딩이 없는 이력서를 먼저 임베딩할지 여부"),
+    db: Session = Depends(get_db)
+):
+    """
+    공고 지원자 이력서끼리 전체 쌍 표절 검사
+    
+    - **job_post_id**: 공고 ID
+    - **similarity_threshold**: 표절 의심 임계값 (기본값: 0.9)
+    - **embed_missing**: 임베딩이 없는 이력서를 먼저 임베딩 (기본값: False)
+    """
+    try:
+        return plagiarism_service.screen_job_post(
+            db=db,
+            job_post_id=job_post_id,
+            similarity_threshold=similarity_threshold,
+            embed_missing=embed_missing
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"공고 일괄 표절 검사 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/local-index/stats")
+async def get_local_index_stats():
+    """
+    로컬 MinHash/LSH 표절 인덱스 통계
+    """
+    try:
+        return plagiarism_service.get_local_index_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"로컬 인덱스 통계 조회 중 오류가 발생했습니다: {str(e)}")
+
+@router.post("/local-index/rebuild")
+def rebuild_local_index(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    DB 의 모든 이력서로 로컬 MinHash/LSH 표절 인덱스 재구성 (기업 회원 전용)
+    """
+    if current_user.role not in ["ADMIN", "MEMBER", "MANAGER", "EMPLOYEE"]:
+        raise HTTPException(status_code=403, detail="기업 회원만 접근 가능합니다")
+    try:
+        result = plagiarism_service.rebuild_local_index(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"로컬 인덱스 재구성 중 오류가 발생했습니다: {str(e)}")
+    if result is None:
+        raise HTTPException(status_code=409, detail="다른 작업자가 로컬 인덱스를 구성하고 있습니다.")
+    return result
+
 @router.post("/embed-resume/{resume_id}")
 async def embed_resume(
     resume_id: int,
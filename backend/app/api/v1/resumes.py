@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from app.core.database import get_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, cached_count, paginate
 from app.schemas.resume import (
     ResumeCreate, ResumeUpdate, ResumeDetail, ResumeList,
     ResumeMemoCreate, ResumeMemoUpdate, ResumeMemoDetail
@@ -11,6 +12,8 @@ from app.models.user import User
 from app.models.application import Application
 from app.api.v1.auth import get_current_user
 from app.utils.llm_cache import redis_cache
+from app.services.resume_plagiarism_service import index_resume_content, remove_resume_from_index
+from app.services.resume_profile_service import ResumeProfileService
 from pydantic import BaseModel
 from app.models.job import JobPost
 from app.models.resume import Spec
@@ -37,13 +40,22 @@ class ResumeAnalysisResponse(BaseModel):
 
 @router.get("/", response_model=List[ResumeList])
 def get_resumes(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).offset(skip).limit(limit).all()
-    return resumes
+    """내 이력서 목록 (키셋 페이지네이션, (user_id, id) 인덱스 순)"""
+    query = db.query(Resume.id, Resume.title, Resume.user_id, Resume.created_at).filter(
+        Resume.user_id == current_user.id
+    )
+    return paginate(
+        query, (Resume.id,), response,
+        limit=limit, cursor=cursor, skip=skip,
+        total=cached_count(f"resume:user:{current_user.id}", query)
+    )
 
 
 @router.get("/{resume_id}", response_model=ResumeDetail)
@@ -69,6 +81,7 @@ def create_resume(
     db.add(db_resume)
     db.commit()
     db.refresh(db_resume)
+    index_resume_content(db_resume.id, db_resume.content)
     return db_resume
 
 
@@ -83,29 +96,33 @@ def update_resume(
     if not db_resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    for field, value in resume.dict(exclude_unset=True).items():
+    update_data = resume.dict(exclude_unset=True)
+    for field, value in update_data.items():
         setattr(db_resume, field, value)
     
     db.commit()
     db.refresh(db_resume)
+
+    if "content" in update_data:
+        index_resume_content(resume_id, db_resume.content)
     
     # 캐시 무효화: 이력서가 수정되었으므로 관련 캐시 무효화
     try:
         from app.utils.llm_cache import invalidate_cache
         
         # 이력서 상세 캐시 무효화
-        resume_cache_pattern = f"api_cache:get_resume:*resume_id_{resume_id}*"
+        resume_cache_pattern = f"api_cache:get_resume:*resume_id_{resume_id}:*"
         invalidate_cache(resume_cache_pattern)
         
         # 해당 이력서를 사용하는 지원자들의 캐시도 무효화
         applications = db.query(Application).filter(Application.resume_id == resume_id).all()
         for app in applications:
-            application_cache_pattern = f"api_cache:get_application:*application_id_{app.id}*"
+            application_cache_pattern = f"api_cache:get_application:*application_id_{app.id}:*"
             invalidate_cache(application_cache_pattern)
             
             # 지원자 목록 캐시도 무효화
-            job_applicants_cache_pattern = f"api_cache:get_applicants_by_job:*job_post_id_{app.job_post_id}*"
-            job_applicants_with_interview_cache_pattern = f"api_cache:get_applicants_with_interview:*job_post_id_{app.job_post_id}*"
+            job_applicants_cache_pattern = f"api_cache:get_applicants_by_job:*job_post_id_{app.job_post_id}:*"
+            job_applicants_with_interview_cache_pattern = f"api_cache:get_applicants_with_interview:*job_post_id_{app.job_post_id}:*"
             invalidate_cache(job_applicants_cache_pattern)
             invalidate_cache(job_applicants_with_interview_cache_pattern)
         
@@ -128,6 +145,7 @@ def delete_resume(
     
     db.delete(db_resume)
     db.commit()
+    remove_resume_from_index(resume_id)
     return {"message": "Resume deleted successfully"}
 
 
@@ -240,6 +258,7 @@ async def generate_applicant_comparison_analysis(request: ResumeAnalysisRequest,
         )
         
         other_applicants = []
+        profiles = ResumeProfileService.load_profiles(db, [app.resume_id for app in other_applications if app.resume_id])
         for app in other_applications:
             try:
                 # ApplicantUser 확인
@@ -250,27 +269,10 @@ async def generate_applicant_comparison_analysis(request: ResumeAnalysisRequest,
                 # 이력서 텍스트 생성
                 app_resume_text = combine_resume_and_specs(app.resume, app.resume.specs)
                 
-                # 기본 정보 추출
-                education = "정보 없음"
-                major = "정보 없음"
-                
-                if app.resume.specs:
-                    # 학력 정보 추출
-                    edu_specs = [s for s in app.resume.specs if s.spec_type == "education" and s.spec_title == "institution"]
-                    if edu_specs:
-                        education = edu_specs[0].spec_description or "정보 없음"
-                    
-                    # 전공 정보 추출
-                    degree_specs = [s for s in app.resume.specs if s.spec_type == "education" and s.spec_title == "degree"]
-                    if degree_specs:
-                        degree_raw = degree_specs[0].spec_description or ""
-                        if degree_raw:
-                            import re
-                            m = re.match(r"(.+?)\((.+?)\)", degree_raw)
-                            if m:
-                                major = m.group(1).strip()
-                            else:
-                                major = degree_raw.strip()
+                # 기본 정보 추출 (이력서 프로필에서 읽음)
+                profile = profiles.get(app.resume_id)
+                education = (profile.institution if profile else None) or "정보 없음"
+                major = (profile.major if profile else None) or "정보 없음"
                 
                 applicant_data = {
                     "application_id": app.id,
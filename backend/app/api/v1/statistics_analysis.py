@@ -4,8 +4,7 @@ from typing import List, Dict, Any
 from pydantic import BaseModel
 import json
 import os
-from langchain_openai import ChatOpenAI
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.application import Application
 from app.models.resume import Resume
 from app.models.user import User
@@ -28,6 +27,7 @@ def get_llm():
     if not api_key:
         return None
     
+    from langchain_openai import ChatOpenAI
     return ChatOpenAI(
         model="gpt-4o-mini",
         temperature=0.3,
@@ -500,7 +500,7 @@ async def analyze_statistics(request: StatisticsAnalysisRequest, db: Session = D
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @router.get("/job/{job_post_id}/analysis/{chart_type}", response_model=StatisticsAnalysisResponse)
-async def get_latest_analysis(job_post_id: int, chart_type: str, db: Session = Depends(get_db)):
+async def get_latest_analysis(job_post_id: int, chart_type: str, db: Session = Depends(get_read_db)):
     """특정 채용공고의 특정 차트 타입에 대한 최신 분석 결과 조회"""
     try:
         analysis = StatisticsAnalysisService.get_analysis_by_job_post_and_type(
@@ -529,7 +529,7 @@ async def get_latest_analysis(job_post_id: int, chart_type: str, db: Session = D
         raise HTTPException(status_code=500, detail=f"Failed to retrieve analysis: {str(e)}")
 
 @router.get("/job/{job_post_id}/analyses", response_model=StatisticsAnalysisListResponse)
-async def get_all_analyses(job_post_id: int, limit: int = 100, db: Session = Depends(get_db)):
+async def get_all_analyses(job_post_id: int, limit: int = 100, db: Session = Depends(get_read_db)):
     """특정 채용공고의 모든 분석 결과 조회"""
     try:
         analyses = StatisticsAnalysisService.get_analyses_by_job_post(db, job_post_id, limit)
@@ -558,7 +558,7 @@ async def get_all_analyses(job_post_id: int, limit: int = 100, db: Session = Dep
         raise HTTPException(status_code=500, detail=f"Failed to retrieve analyses: {str(e)}")
 
 @router.get("/analysis/{analysis_id}", response_model=StatisticsAnalysisResponse)
-async def get_analysis_by_id(analysis_id: int, db: Session = Depends(get_db)):
+async def get_analysis_by_id(analysis_id: int, db: Session = Depends(get_read_db)):
     """ID로 특정 분석 결과 조회"""
     try:
         analysis = StatisticsAnalysisService.get_analysis_by_id(db, analysis_id)
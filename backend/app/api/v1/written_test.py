@@ -3,7 +3,6 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from typing import List, Dict, Any
 from pydantic import BaseModel
-from agent.tools.written_test_generation_tool import generate_written_test_questions
 from app.models.job import JobPost  # 실제 공고 모델 import
 from app.models.application import Application, DocumentStatus, WrittenTestStatus
 import traceback
@@ -40,6 +39,7 @@ def generate_written_test(
     # LLM 기반 문제 생성
     try:
         print("LLM 입력값:", jobpost_dict)  # 진단용 로그
+        from agent.tools.written_test_generation_tool import generate_written_test_questions
         questions = generate_written_test_questions({"jobpost": jobpost_dict})
     except Exception as e:
         print(traceback.format_exc())  # 전체 스택트레이스 출력
@@ -0,0 +1,373 @@
+"""
+백엔드 → 에이전트 공유 HTTP 클라이언트
+
+에이전트(kocruit_agent) 호출마다 requests.post / httpx.AsyncClient() 를 새로 만들던 것을
+애플리케이션 범위의 클라이언트 하나로 모은다.
+
+- keep-alive 연결 풀 재사용 (h2 패키지가 설치되어 있으면 HTTP/2)
+- 라우트별 타임아웃 / 재시도 횟수 (ROUTE_POLICIES)
+- 재시도 예산: 최근 요청 수에 비례한 토큰만큼만 재시도해 장애 시 재시도 폭주를 막는다
+- 서킷 브레이커: 라우트별 연속 실패가 쌓이거나 동시 요청이 상한에 닿으면
+  에이전트를 기다리지 않고 AgentUnavailableError 로 즉시 실패
+- 라우트별 지연시간 히스토그램 (/monitor/agent-client)
+- 요청의 trace 를 traceparent 헤더로 전달 (에이전트 span 이 같은 trace 로 묶임, app.core.tracing)
+
+비동기 엔드포인트는 post(), 동기 엔드포인트/스케줄러 작업은 post_sync() 를 사용한다.
+두 경로는 브레이커·재시도 예산·히스토그램을 공유한다.
+"""
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.metrics import LatencyHistogram
+from app.core.tracing import TRACEPARENT_HEADER, outgoing_traceparent
+
+logger = logging.getLogger(__name__)
+
+AGENT_BASE_URL = os.getenv("AGENT_URL", "http://kocruit_agent:8001")
+AGENT_HTTP2 = os.getenv("AGENT_HTTP2", "true").lower() == "true"
+AGENT_MAX_CONNECTIONS = int(os.getenv("AGENT_MAX_CONNECTIONS", 50))
+AGENT_MAX_KEEPALIVE = int(os.getenv("AGENT_MAX_KEEPALIVE", 20))
+
+# 서킷 브레이커
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("AGENT_BREAKER_FAILURES", 5))   # 연속 실패 몇 번에 열지
+BREAKER_RESET_SECONDS = float(os.getenv("AGENT_BREAKER_RESET", 15.0))     # 열린 뒤 시험 요청까지 대기
+
+# 재시도 예산: 요청 1건당 RETRY_BUDGET_RATIO 토큰 적립, 재시도 1회당 1 토큰 소비
+RETRY_BUDGET_RATIO = float(os.getenv("AGENT_RETRY_BUDGET_RATIO", 0.2))
+RETRY_BUDGET_MIN_TOKENS = float(os.getenv("AGENT_RETRY_BUDGET_MIN", 10))
+RETRY_BACKOFF_SECONDS = 0.2
+
+# 요청이 에이전트에 도달하지 못한 게 확실한 오류 → POST 라도 재시도해도 안전
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+RETRYABLE_STATUSES = {502, 503, 504}
+
+
+class AgentUnavailableError(Exception):
+    """서킷이 열려 있거나 라우트 동시 요청 상한에 닿아 호출하지 않고 실패"""
+
+    def __init__(self, route: str, reason: str):
+        self.route = route
+        self.reason = reason
+        super().__init__(f"에이전트 호출 차단 ({route}): {reason}")
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    retries: int = 1
+    max_in_flight: int = 20
+
+
+DEFAULT_POLICY = RoutePolicy()
+
+ROUTE_POLICIES: Dict[str, RoutePolicy] = {
+    # 서류 AI 평가 (LLM 호출 포함)
+    "/evaluate-application/": RoutePolicy(timeout=60.0, retries=1, max_in_flight=16),
+    # 실시간 면접 오디오 배치 평가: 늦은 결과는 쓸모없으므로 짧게, 재시도 없음
+    "/agent/ai-interview-evaluation": RoutePolicy(timeout=10.0, retries=0, max_in_flight=32),
+    # 업로드 오디오 분석 (파일 스트림이라 재시도 불가)
+    "/evaluate-audio": RoutePolicy(timeout=120.0, retries=0, max_in_flight=8),
+}
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class CircuitBreaker:
+    """closed → (연속 실패) → open → (대기 후) half_open → 시험 요청 결과로 closed/open"""
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_seconds: float = BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.open_count = 0
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_seconds:
+                return False
+            self.state = "half_open"
+            self.probe_in_flight = False
+        # half_open: 시험 요청 하나만 통과
+        if self.probe_in_flight:
+            return False
+        self.probe_in_flight = True
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+        self.state = "closed"
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.open_count += 1
+                logger.warning(f"에이전트 서킷 열림 (연속 실패 {self.consecutive_failures}회)")
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+
+class RetryBudget:
+    """요청량에 비례한 재시도 토큰 버킷"""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_tokens: float = RETRY_BUDGET_MIN_TOKENS):
+        self.ratio = ratio
+        self.max_tokens = min_tokens
+        self.tokens = min_tokens
+        self.spent = 0
+        self.denied = 0
+
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.spent += 1
+            return True
+        self.denied += 1
+        return False
+
+
+class _RouteState:
+    def __init__(self, policy: RoutePolicy):
+        self.policy = policy
+        self.breaker = CircuitBreaker()
+        self.latency = LatencyHistogram()
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.rejected = 0
+        self.retries = 0
+        self.status_counts: Dict[str, int] = {}
+
+
+class AgentClient:
+    """에이전트 호출용 공유 클라이언트 (get_agent_client() 로 사용)"""
+
+    def __init__(self, base_url: str = AGENT_BASE_URL):
+        self.base_url = base_url
+        self.http2 = AGENT_HTTP2 and _h2_available()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+        self._routes: Dict[str, _RouteState] = {}
+        self._budget = RetryBudget()
+        self._lock = threading.Lock()
+
+    # -- 클라이언트 ---------------------------------------------------------
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(max_connections=AGENT_MAX_CONNECTIONS, max_keepalive_connections=AGENT_MAX_KEEPALIVE)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=self._limits(),
+                timeout=httpx.Timeout(DEFAULT_POLICY.timeout, connect=DEFAULT_POLICY.connect_timeout),
+            )
+        return self._async_client
+
+    def _get_sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(
+                    base_url=self.base_url,
+                    http2=self.http2,
+                    limits=self._limits(),
+                    timeout=httpx.Timeout(DEFAULT_POLICY.timeout, connect=DEFAULT_POLICY.connect_timeout),
+                )
+            return self._sync_client
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._sync_client is not None:
+                self._sync_client.close()
+                self._sync_client = None
+
+    # -- 라우트 상태 --------------------------------------------------------
+
+    def _route(self, path: str) -> _RouteState:
+        state = self._routes.get(path)
+        if state is None:
+            with self._lock:
+                state = self._routes.setdefault(path, _RouteState(ROUTE_POLICIES.get(path, DEFAULT_POLICY)))
+        return state
+
+    def _acquire(self, path: str, state: _RouteState):
+        with self._lock:
+            if state.in_flight >= state.policy.max_in_flight:
+                state.rejected += 1
+                raise AgentUnavailableError(path, f"동시 요청 상한 {state.policy.max_in_flight} 초과")
+            if not state.breaker.allow():
+                state.rejected += 1
+                raise AgentUnavailableError(path, "서킷 열림")
+            state.in_flight += 1
+            state.requests += 1
+            self._budget.deposit()
+
+    def _should_retry(self, state: _RouteState, attempt: int, retryable: bool) -> bool:
+        if not retryable or attempt >= state.policy.retries:
+            return False
+        with self._lock:
+            if not self._budget.withdraw():
+                return False
+            state.retries += 1
+            return True
+
+    def _finish(self, state: _RouteState, started: float, response: Optional[httpx.Response]):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        failed = response is None or response.status_code >= 500
+        with self._lock:
+            state.in_flight -= 1
+            state.latency.observe(elapsed_ms)
+            key = str(response.status_code) if response is not None else "error"
+            state.status_counts[key] = state.status_counts.get(key, 0) + 1
+            if failed:
+                state.failures += 1
+                state.breaker.record_failure()
+            else:
+                state.breaker.record_success()
+
+    def _timeout(self, state: _RouteState, timeout: Optional[float]) -> httpx.Timeout:
+        return httpx.Timeout(timeout or state.policy.timeout, connect=state.policy.connect_timeout)
+
+    @staticmethod
+    def _with_trace(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """traceparent 헤더 추가 (재시도도 같은 span 으로 보냄)"""
+        headers = dict(kwargs.get("headers") or {})
+        headers.setdefault(TRACEPARENT_HEADER, outgoing_traceparent())
+        return {**kwargs, "headers": headers}
+
+    # -- 호출 ---------------------------------------------------------------
+
+    async def post(self, path: str, *, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """비동기 POST. 응답 상태 판단(raise_for_status 등)은 호출부에서 한다."""
+        kwargs = self._with_trace(kwargs)
+        state = self._route(path)
+        self._acquire(path, state)
+        started = time.perf_counter()
+        response = None
+        try:
+            attempt = 0
+            while True:
+                try:
+                    response = await self._get_async_client().post(path, timeout=self._timeout(state, timeout), **kwargs)
+                except RETRYABLE_ERRORS:
+                    if not self._should_retry(state, attempt, "files" not in kwargs):
+                        raise
+                else:
+                    if response.status_code not in RETRYABLE_STATUSES or not self._should_retry(state, attempt, "files" not in kwargs):
+                        return response
+                attempt += 1
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * attempt)
+        finally:
+            self._finish(state, started, response)
+
+    def post_sync(self, path: str, *, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """동기 POST (def 엔드포인트 / 스케줄러 작업용)"""
+        kwargs = self._with_trace(kwargs)
+        state = self._route(path)
+        self._acquire(path, state)
+        started = time.perf_counter()
+        response = None
+        try:
+            attempt = 0
+            while True:
+                try:
+                    response = self._get_sync_client().post(path, timeout=self._timeout(state, timeout), **kwargs)
+                except RETRYABLE_ERRORS:
+                    if not self._should_retry(state, attempt, "files" not in kwargs):
+                        raise
+                else:
+                    if response.status_code not in RETRYABLE_STATUSES or not self._should_retry(state, attempt, "files" not in kwargs):
+                        return response
+                attempt += 1
+                time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+        finally:
+            self._finish(state, started, response)
+
+    # -- 모니터링 -----------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            routes: Dict[str, Any] = {}
+            for path, state in self._routes.items():
+                routes[path] = {
+                    "policy": {
+                        "timeout": state.policy.timeout,
+                        "retries": state.policy.retries,
+                        "max_in_flight": state.policy.max_in_flight,
+                    },
+                    "breaker_state": state.breaker.state,
+                    "breaker_open_count": state.breaker.open_count,
+                    "in_flight": state.in_flight,
+                    "requests": state.requests,
+                    "failures": state.failures,
+                    "rejected": state.rejected,
+                    "retries": state.retries,
+                    "status_counts": dict(state.status_counts),
+                    "latency": state.latency.snapshot(),
+                }
+            return {
+                "base_url": self.base_url,
+                "http2": self.http2,
+                "retry_budget": {
+                    "tokens": round(self._budget.tokens, 2),
+                    "spent": self._budget.spent,
+                    "denied": self._budget.denied,
+                },
+                "routes": routes,
+            }
+
+
+_agent_client: Optional[AgentClient] = None
+_agent_client_lock = threading.Lock()
+
+
+def get_agent_client() -> AgentClient:
+    global _agent_client
+    if _agent_client is None:
+        with _agent_client_lock:
+            if _agent_client is None:
+                _agent_client = AgentClient()
+    return _agent_client
+
+
+async def close_agent_client():
+    global _agent_client
+    if _agent_client is not None:
+        await _agent_client.aclose()
+        _agent_client = None
+
+
+def get_agent_client_stats() -> Dict[str, Any]:
+    if _agent_client is None:
+        return {"base_url": AGENT_BASE_URL, "routes": {}}
+    return _agent_client.get_stats()
+
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     DB_USER: str = os.getenv("DB_USER", "myuser")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "1234")
     DATABASE_URL: str = os.getenv("DATABASE_URL", f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4")
+    # 읽기 전용 세션(get_read_db)용 복제본. 없으면 primary 에 별도 읽기 풀로 연결
+    DATABASE_READ_URL: Optional[str] = os.getenv("DATABASE_READ_URL")
     
     # JWT
     SECRET_KEY: str = "your-secret-key-here"
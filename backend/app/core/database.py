@@ -1,38 +1,226 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
 from app.core.config import settings
+from app.core.metrics import LatencyHistogram
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Dict
 import logging
 import os
+import re
+import threading
+import time
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# AWS RDS 최적화를 위한 연결 풀 설정 (MySQL Connector/Python 8.3.0 호환)
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=int(os.getenv("MYSQL_MAX_CONNECTIONS", 10)),
-    max_overflow=int(os.getenv("MYSQL_MAX_CONNECTIONS", 10)) * 2,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-    pool_timeout=30,
-    echo=False,
-    # MySQL Connector/Python 8.3.0 호환 설정
-    connect_args={
-        "connect_timeout": int(os.getenv("MYSQL_CONNECT_TIMEOUT", 30)),
-        "read_timeout": int(os.getenv("MYSQL_READ_TIMEOUT", 30)),
-        "write_timeout": int(os.getenv("MYSQL_WRITE_TIMEOUT", 30)),
-        "charset": "utf8mb4",
-        "autocommit": False,
-        "use_unicode": True,
-        "sql_mode": "STRICT_TRANS_TABLES,NO_ZERO_DATE,NO_ZERO_IN_DATE,ERROR_FOR_DIVISION_BY_ZERO"
-    }
+# 풀 대기 / 연결 점유 시간 버킷(ms)
+POOL_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000, 30000)
+CONNECTION_HOLD_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", 500))
+SLOW_QUERY_HISTORY = int(os.getenv("DB_SLOW_QUERY_HISTORY", 50))
+SLOW_QUERY_STATEMENT_CHARS = 500
+MAX_TRACKED_ROUTES = 200
+
+# 현재 요청 경로 (main.py 미들웨어가 설정, 요청 밖에서는 background)
+_current_route: ContextVar[str] = ContextVar("db_route", default="background")
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def set_request_route(method: str, path: str):
+    """연결 점유 시간을 집계할 라우트 설정 (숫자 경로 조각은 {id} 로 묶음), reset 용 토큰 반환"""
+    return _current_route.set(f"{method} {_NUMERIC_SEGMENT.sub('/{id}', path)}")
+
+
+def reset_request_route(token):
+    _current_route.reset(token)
+
+
+class PoolMetrics:
+    """엔진별 체크아웃 대기 / 라우트별 연결 점유 시간 / 느린 쿼리 (SQLAlchemy 이벤트로 수집)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkout_wait: Dict[str, LatencyHistogram] = {}
+        self.checkout_timeouts: Dict[str, int] = {}
+        self.connection_hold: Dict[str, LatencyHistogram] = {}
+        self.slow_queries = deque(maxlen=SLOW_QUERY_HISTORY)
+        self.slow_query_count: Dict[str, int] = {}
+
+    def observe_wait(self, engine_name: str, elapsed_ms: float):
+        with self._lock:
+            histogram = self.checkout_wait.get(engine_name)
+            if histogram is None:
+                histogram = self.checkout_wait[engine_name] = LatencyHistogram(POOL_WAIT_BUCKETS_MS)
+            histogram.observe(elapsed_ms)
+
+    def record_timeout(self, engine_name: str):
+        with self._lock:
+            self.checkout_timeouts[engine_name] = self.checkout_timeouts.get(engine_name, 0) + 1
+
+    def observe_hold(self, engine_name: str, route: str, elapsed_ms: float):
+        key = f"{engine_name} {route}"
+        with self._lock:
+            histogram = self.connection_hold.get(key)
+            if histogram is None:
+                # 라우트 수가 비정상적으로 늘어나도 메모리가 커지지 않도록 상한
+                if len(self.connection_hold) >= MAX_TRACKED_ROUTES:
+                    key = f"{engine_name} other"
+                    histogram = self.connection_hold.get(key)
+                if histogram is None:
+                    histogram = self.connection_hold[key] = LatencyHistogram(CONNECTION_HOLD_BUCKETS_MS)
+            histogram.observe(elapsed_ms)
+
+    def record_slow_query(self, engine_name: str, statement: str, elapsed_ms: float, route: str):
+        with self._lock:
+            self.slow_query_count[engine_name] = self.slow_query_count.get(engine_name, 0) + 1
+            self.slow_queries.append({
+                "engine": engine_name,
+                "route": route,
+                "elapsed_ms": round(elapsed_ms, 1),
+                "statement": " ".join(statement.split())[:SLOW_QUERY_STATEMENT_CHARS],
+                "at": time.time(),
+            })
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = sorted(self.connection_hold.items(), key=lambda item: item[1].sum_ms, reverse=True)
+            return {
+                "checkout_wait": {name: histogram.snapshot() for name, histogram in self.checkout_wait.items()},
+                "checkout_timeouts": dict(self.checkout_timeouts),
+                "connection_hold": {key: histogram.snapshot() for key, histogram in routes},
+                "slow_query_threshold_ms": SLOW_QUERY_MS,
+                "slow_query_count": dict(self.slow_query_count),
+                "slow_queries": list(reversed(self.slow_queries)),
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """체크아웃 대기 시간(새 연결 생성 포함)과 pool_timeout 초과 횟수를 기록하는 QueuePool"""
+
+    engine_name = "primary"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout(self.engine_name)
+            raise
+        pool_metrics.observe_wait(self.engine_name, (time.perf_counter() - start) * 1000)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() 등으로 풀을 다시 만들어도 엔진 이름 유지
+        pool = super().recreate()
+        pool.engine_name = self.engine_name
+        return pool
+
+
+def _create_engine(url: str, engine_name: str, max_connections: int):
+    # AWS RDS 최적화를 위한 연결 풀 설정 (MySQL Connector/Python 8.3.0 호환)
+    db_engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=max_connections,
+        max_overflow=max_connections * 2,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_timeout=30,
+        echo=False,
+        # MySQL Connector/Python 8.3.0 호환 설정
+        connect_args={
+            "connect_timeout": int(os.getenv("MYSQL_CONNECT_TIMEOUT", 30)),
+            "read_timeout": int(os.getenv("MYSQL_READ_TIMEOUT", 30)),
+            "write_timeout": int(os.getenv("MYSQL_WRITE_TIMEOUT", 30)),
+            "charset": "utf8mb4",
+            "autocommit": False,
+            "use_unicode": True,
+            "sql_mode": "STRICT_TRANS_TABLES,NO_ZERO_DATE,NO_ZERO_IN_DATE,ERROR_FOR_DIVISION_BY_ZERO"
+        }
+    )
+    db_engine.pool.engine_name = engine_name
+    _instrument(db_engine, engine_name)
+    return db_engine
+
+
+def _instrument(db_engine, engine_name: str):
+    """연결 점유 시간(checkout → checkin)과 느린 쿼리 수집 이벤트 등록"""
+
+    @event.listens_for(db_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        connection_record.info["route"] = _current_route.get()
+
+    @event.listens_for(db_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            route = connection_record.info.pop("route", "background")
+            pool_metrics.observe_hold(engine_name, route, (time.perf_counter() - started) * 1000)
+
+    @event.listens_for(db_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(db_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+        if elapsed_ms >= SLOW_QUERY_MS:
+            route = _current_route.get()
+            pool_metrics.record_slow_query(engine_name, statement, elapsed_ms, route)
+            logger.warning(f"느린 쿼리 {elapsed_ms:.0f}ms [{engine_name}] {route}: {' '.join(statement.split())[:200]}")
+
+    @event.listens_for(db_engine, "handle_error")
+    def _on_error(exception_context):
+        # 실패한 쿼리의 시작 시각이 남아 다음 쿼리 측정이 어긋나지 않도록 정리
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+MAX_CONNECTIONS = int(os.getenv("MYSQL_MAX_CONNECTIONS", 10))
+# 읽기 전용 세션(리포트/통계/대시보드) 풀 크기. 복제본이 없으면 primary 에 별도 풀로 붙어
+# 무거운 조회가 트랜잭션 요청의 연결을 모두 차지하지 못하도록 동시 연결 수를 따로 제한한다
+READ_MAX_CONNECTIONS = int(os.getenv("MYSQL_READ_MAX_CONNECTIONS", max(1, MAX_CONNECTIONS // 2)))
+
+engine = _create_engine(settings.DATABASE_URL, "primary", MAX_CONNECTIONS)
+read_engine = _create_engine(
+    settings.DATABASE_READ_URL or settings.DATABASE_URL,
+    "replica" if settings.DATABASE_READ_URL else "read",
+    READ_MAX_CONNECTIONS
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine, info={"read_only": True})
+
+
+class ReadOnlySessionError(RuntimeError):
+    """읽기 전용 세션에서 쓰기를 시도함"""
+
+
+@event.listens_for(ReadSessionLocal, "before_flush")
+def _reject_flush(session, flush_context, instances):
+    if session.new or session.dirty or session.deleted:
+        raise ReadOnlySessionError("읽기 전용 세션(get_read_db)에서는 변경 사항을 저장할 수 없습니다")
+
+
+@event.listens_for(ReadSessionLocal, "do_orm_execute")
+def _reject_bulk_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        raise ReadOnlySessionError("읽기 전용 세션(get_read_db)에서는 INSERT/UPDATE/DELETE 를 실행할 수 없습니다")
+
 
 # 베이스 클래스 생성
 Base = declarative_base()
@@ -50,16 +238,55 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """읽기 전용 세션 의존성 (DATABASE_READ_URL 복제본 또는 primary 의 읽기 전용 풀)
+
+    복제 지연이 있을 수 있으므로 방금 쓴 데이터를 바로 읽어야 하는 경로에는 get_db 를 쓴다.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Read database session error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _pool_status(db_engine) -> Dict[str, Any]:
+    pool = db_engine.pool
+    return {
+        "url": db_engine.url.render_as_string(hide_password=True),
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "timeout_seconds": pool.timeout(),
+    }
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """풀 상태 + 체크아웃 대기/점유 시간 히스토그램 + 최근 느린 쿼리 (DB 연결을 새로 열지 않음)"""
+    return {
+        "engines": {
+            "primary": _pool_status(engine),
+            read_engine.pool.engine_name: _pool_status(read_engine),
+        },
+        **pool_metrics.snapshot(),
+    }
+
+
 def get_connection_info():
-    """데이터베이스 연결 정보 반환"""
+    """데이터베이스 연결 정보 반환 (서버 변수 조회를 위해 연결을 하나 사용)"""
     try:
         with engine.connect() as connection:
             result = connection.execute(text("SHOW VARIABLES LIKE 'max_connections'"))
             max_connections = result.fetchone()
-            
+
             result = connection.execute(text("SHOW STATUS LIKE 'Threads_connected'"))
             current_connections = result.fetchone()
-            
+
             return {
                 "max_connections": max_connections[1] if max_connections else "N/A",
                 "current_connections": current_connections[1] if current_connections else "N/A",
@@ -70,4 +297,4 @@ def get_connection_info():
             }
     except Exception as e:
         logger.error(f"Failed to get connection info: {e}")
-        return {"error": str(e)} 
\ No newline at end of file
+        return {"error": str(e)}
@@ -0,0 +1,269 @@
+"""
+HTTP 조건부 GET (ETag / Last-Modified) 미들웨어
+
+- 인증된 요청(Authorization 헤더, access_token 쿠키 또는 쿼리)은 "private, no-cache" 로 응답해
+  공유 캐시에 저장되지 않게 하고, 브라우저는 매번 재검증(If-None-Match)만 보낸다.
+- 비인증 요청은 경로별 max-age 로 "public" 캐시.
+- 엔드포인트가 직접 Cache-Control 을 정한 응답은 그대로 두고, SSE(text/event-stream) 응답은 건드리지 않는다.
+- 버전 스탬프가 등록된 경로는 updated_at / 집계값으로 만든 ETag 를 먼저 계산해서,
+  일치하면 엔드포인트를 실행하지 않고(조회/직렬화 없이) 304 를 돌려준다.
+  엔드포인트의 인증/권한 검사도 건너뛰게 되므로, 인증이 없고 응답 데이터를 스탬프가
+  모두 덮는 경로만 등록한다 (이력서·공고 상세처럼 인증이 필요한 경로는 본문 해시 ETag 사용).
+- 그 외 JSON 응답은 본문 해시로 강한 ETag 를 만들어 일치하면 304 (전송량만 절약).
+"""
+import hashlib
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.database import SessionLocal
+from app.models.application import Application
+from app.models.job import JobPost
+from app.models.resume import Resume
+from app.models.user import User
+
+# 본문 해시 ETag 를 계산할 최대 응답 크기
+MAX_HASH_BODY_BYTES = 5 * 1024 * 1024
+
+# (경로 접두사, 비인증 요청 max-age) - 앞에서부터 먼저 일치하는 항목 사용
+MAX_AGE_RULES: List[Tuple[str, int]] = [
+    ("/api/v1/applications/", 300),
+    ("/api/v1/resumes/", 300),
+    ("/api/v1/company/jobposts/", 300),
+    ("/api/v1/interview-questions/", 1800),  # LLM 결과
+]
+DEFAULT_MAX_AGE = 60
+
+VersionStamp = Tuple[str, Optional[datetime]]
+
+
+def _as_text(*values) -> str:
+    return "|".join("" if value is None else str(value) for value in values)
+
+
+def _job_applicants_stamp(db: Session, job_post_id: int) -> Optional[VersionStamp]:
+    """공고 지원자 목록 버전: 지원서 상태/점수/사유 체크섬 + 이력서/사용자/공고 최종 수정 시각
+
+    application 테이블에는 updated_at 이 없어 상태·점수·합불 사유 컬럼의 CRC32 를 BIT_XOR 로 합친 값을 쓴다.
+    """
+    row_checksum = func.crc32(func.concat_ws(
+        "|",
+        Application.id, Application.status, Application.document_status,
+        Application.interview_status, Application.written_test_status, Application.final_status,
+        Application.score, Application.ai_score, Application.human_score, Application.final_score,
+        Application.written_test_score, Application.ai_interview_score, Application.executive_score,
+        Application.pass_reason, Application.fail_reason,
+        Application.ai_interview_pass_reason, Application.ai_interview_fail_reason, Application.resume_id
+    ))
+    row = db.query(
+        func.count(Application.id).label("count"),
+        func.bit_xor(row_checksum).label("checksum"),
+        func.max(Resume.updated_at).label("resume_updated"),
+        func.max(User.updated_at).label("user_updated")
+    ).outerjoin(
+        Resume, Resume.id == Application.resume_id
+    ).outerjoin(
+        User, User.id == Application.user_id
+    ).filter(
+        Application.job_post_id == job_post_id
+    ).one()
+    job_post_updated = db.query(JobPost.updated_at).filter(JobPost.id == job_post_id).scalar()
+
+    last_modified = max(
+        (value for value in (row.resume_updated, row.user_updated, job_post_updated) if value is not None),
+        default=None
+    )
+    return _as_text("applicants", job_post_id, row.count, row.checksum, row.resume_updated, row.user_updated, job_post_updated), last_modified
+
+
+# 면접 일정 포함 목록이 읽는 schedule_interview_applicant(모델 없음, 런타임 반영 테이블) + schedule_interview 체크섬
+_INTERVIEW_SCHEDULE_CHECKSUM = text("""
+    SELECT COUNT(*) AS count,
+           BIT_XOR(CRC32(CONCAT_WS('|', sia.user_id, sia.schedule_interview_id,
+                                   si.schedule_date, si.status))) AS checksum
+    FROM schedule_interview_applicant sia
+    JOIN (SELECT DISTINCT user_id FROM application WHERE job_post_id = :job_post_id) a
+      ON a.user_id = sia.user_id
+    LEFT JOIN schedule_interview si ON si.id = sia.schedule_interview_id
+""")
+
+
+def _job_interview_applicants_stamp(db: Session, job_post_id: int) -> Optional[VersionStamp]:
+    """면접 일정 포함 지원자 목록 버전: 지원자 목록 스탬프 + 지원자별 면접 일정 체크섬
+
+    schedule_interview 에는 updated_at 이 없어 일정 배정/일시/상태 변경은 체크섬으로만 잡힌다.
+    """
+    stamp = _job_applicants_stamp(db, job_post_id)
+    schedules = db.execute(_INTERVIEW_SCHEDULE_CHECKSUM, {"job_post_id": job_post_id}).one()
+    return _as_text(stamp[0], "schedules", schedules.count, schedules.checksum), stamp[1]
+
+
+# (경로 정규식, 버전 스탬프 함수) - 정규식 그룹이 함수 인자로 전달됨
+# 스탬프 일치 시 엔드포인트(인증 포함)를 실행하지 않으므로 인증 없는 경로만 등록한다
+VERSION_STAMP_RULES: List[Tuple[re.Pattern, Callable[..., Optional[VersionStamp]]]] = [
+    (
+        re.compile(
+            r"^/api/v1/applications/job/(?P<job_post_id>\d+)/"
+            r"(?:applicants|passed-applicants|counts|simple-counts)/?$"
+        ),
+        _job_applicants_stamp
+    ),
+    (
+        re.compile(
+            r"^/api/v1/applications/job/(?P<job_post_id>\d+)/"
+            r"applicants-with-(?:interview|ai-interview|second-interview)/?$"
+        ),
+        _job_interview_applicants_stamp
+    ),
+]
+
+
+def _compute_version_stamp(path: str) -> Optional[VersionStamp]:
+    for pattern, stamp_func in VERSION_STAMP_RULES:
+        match = pattern.match(path)
+        if not match:
+            continue
+        db = SessionLocal()
+        try:
+            kwargs = {name: int(value) for name, value in match.groupdict().items()}
+            return stamp_func(db, **kwargs)
+        except Exception as e:
+            print(f"[HTTP Cache] 버전 스탬프 계산 실패 ({path}): {e}")
+            return None
+        finally:
+            db.close()
+    return None
+
+
+def _has_stamp_rule(path: str) -> bool:
+    return any(pattern.match(path) for pattern, _ in VERSION_STAMP_RULES)
+
+
+def _credential_fingerprint(request: Request) -> Optional[str]:
+    """요청 주체 구분용 지문 (사용자마다 응답이 다르므로 ETag 에 포함)"""
+    credential = (
+        request.headers.get("authorization")
+        or request.cookies.get("access_token")
+        or request.query_params.get("access_token")  # EventSource 는 헤더를 못 붙여 쿼리로 인증
+    )
+    if not credential:
+        return None
+    return hashlib.sha1(credential.encode()).hexdigest()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 약한 비교 (W/ 접두사 무시)"""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _apply_cache_headers(response: Response, headers: Dict[str, str]):
+    """캐시 헤더 적용 (엔드포인트가 직접 정한 Cache-Control 은 유지)"""
+    for name, value in headers.items():
+        if name == "Cache-Control" and "cache-control" in response.headers:
+            continue
+        response.headers[name] = value
+
+
+def _not_modified_since(if_modified_since: Optional[str], last_modified: Optional[datetime]) -> bool:
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+class CacheMiddleware(BaseHTTPMiddleware):
+    """GET 응답 캐시 헤더 + 조건부 요청 처리"""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET":
+            return await call_next(request)
+
+        path = request.url.path
+        fingerprint = _credential_fingerprint(request)
+        headers = self._cache_headers(path, fingerprint is not None)
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+
+        # 1) 버전 스탬프 ETag: 엔드포인트 실행 전에 비교
+        stamp = await run_in_threadpool(_compute_version_stamp, path) if _has_stamp_rule(path) else None
+        if stamp is not None:
+            version, last_modified = stamp
+            tag = hashlib.sha1(_as_text(version, request.url.query, fingerprint).encode()).hexdigest()[:32]
+            headers["ETag"] = f'W/"{tag}"'
+            if last_modified is not None:
+                if last_modified.tzinfo is None:
+                    last_modified = last_modified.replace(tzinfo=timezone.utc)
+                headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+            if _etag_matches(if_none_match, headers["ETag"]) or (
+                if_none_match is None and _not_modified_since(if_modified_since, last_modified)
+            ):
+                return Response(status_code=304, headers=headers)
+
+            response = await call_next(request)
+            if response.status_code == 200:
+                _apply_cache_headers(response, headers)
+            return response
+
+        # 2) 본문 해시 ETag: JSON 응답만 (스트리밍/파일 응답은 헤더만 적용, SSE 는 손대지 않음)
+        response = await call_next(request)
+        content_type = response.headers.get("content-type", "")
+        if content_type.startswith("text/event-stream"):
+            return response
+        content_length = int(response.headers.get("content-length") or 0)
+        if (
+            response.status_code != 200
+            or not content_type.startswith("application/json")
+            or content_length > MAX_HASH_BODY_BYTES
+        ):
+            if response.status_code == 200:
+                _apply_cache_headers(response, headers)
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        if "cache-control" in response.headers:
+            headers["Cache-Control"] = response.headers["cache-control"]
+        headers["ETag"] = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        replaced = {"content-length", *(name.lower() for name in headers)}
+        response_headers = {k: v for k, v in response.headers.items() if k.lower() not in replaced}
+        response_headers.update(headers)
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=response_headers,
+            media_type=response.media_type,
+            background=response.background
+        )
+
+    @staticmethod
+    def _cache_headers(path: str, authenticated: bool) -> Dict[str, str]:
+        if authenticated:
+            # 사용자별 데이터: 공유 캐시 금지, 브라우저는 매번 재검증 (변경 없으면 304)
+            return {"Cache-Control": "private, no-cache", "Vary": "Authorization, Cookie"}
+        max_age = next((age for prefix, age in MAX_AGE_RULES if prefix in path), DEFAULT_MAX_AGE)
+        return {"Cache-Control": f"public, max-age={max_age}", "Vary": "Authorization, Cookie"}
@@ -0,0 +1,150 @@
+"""
+키셋(커서) 페이지네이션
+
+offset(skip).limit(limit) 는 앞쪽 행을 모두 읽고 버리므로 뒤 페이지일수록 느려진다.
+여기서는 (정렬 키..., id) 의 마지막 값을 불투명 커서로 돌려주고 다음 요청에서
+"그 값보다 뒤" 조건으로 인덱스를 바로 찾아 들어가므로 1페이지와 500페이지 비용이 같다.
+
+- 응답 본문은 기존 목록 형태(List[...])를 유지하고, 커서와 전체 개수는 헤더로 전달
+  X-Next-Cursor: 다음 페이지 커서 (마지막 페이지면 없음)
+  X-Total-Count: 전체 개수 (짧은 TTL 로 Redis 에 캐시한 값 또는 테이블 통계 추정치)
+- 쿼리는 목록 스키마 필드만 고른 컬럼 projection 이어야 한다 (ORM 엔티티/지연 로딩 없이 Row 반환)
+- cursor 없이 skip 을 보내는 기존 클라이언트는 offset 방식으로 그대로 동작
+"""
+import base64
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence
+
+import redis
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_, text
+from sqlalchemy.orm import Query, Session
+
+from app.core.cache import redis_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+COUNT_CACHE_TTL = int(os.getenv("PAGINATION_COUNT_TTL", 60))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+_DATETIME_TAG = "$dt"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """키 값 목록 → URL 안전 base64 커서"""
+    payload = [{_DATETIME_TAG: value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 → 키 값 목록 (형식이 맞지 않으면 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != size:
+            raise ValueError("cursor size mismatch")
+        return [
+            datetime.fromisoformat(value[_DATETIME_TAG]) if isinstance(value, dict) else value
+            for value in payload
+        ]
+    except (ValueError, TypeError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 커서입니다: {e}")
+
+
+def _after(keys: Sequence[Any], values: Sequence[Any], descending: bool):
+    """(k1, k2, ...) 가 values 보다 뒤인 조건 (행 생성자 비교 대신 인덱스 범위 조회가 되는 OR 전개)"""
+    conditions = []
+    for index, key in enumerate(keys):
+        equal_prefix = [keys[i] == values[i] for i in range(index)]
+        step = key < values[index] if descending else key > values[index]
+        conditions.append(and_(*equal_prefix, step))
+    return or_(*conditions)
+
+
+def paginate(
+    query: Query,
+    keys: Sequence[Any],
+    response: Response,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    descending: bool = False,
+    total: Optional[Callable[[], Optional[int]]] = None,
+) -> List[Any]:
+    """키셋 페이지 조회
+
+    Args:
+        query: 목록 스키마 컬럼을 고른 projection 쿼리 (필터 적용 완료)
+        keys: 정렬 키 컬럼들, 마지막은 유일한 id (인덱스 순서와 맞추고 projection 에 같은 이름으로 포함)
+        response: 커서/개수 헤더를 붙일 응답
+        limit: 페이지 크기 (MAX_PAGE_SIZE 로 제한)
+        cursor: 이전 응답의 X-Next-Cursor
+        skip: cursor 가 없을 때만 쓰는 기존 offset (하위 호환)
+        descending: 내림차순 여부
+        total: 전체 개수 함수 (cached_count / estimated_row_count)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = query.order_by(*[key.desc() if descending else key.asc() for key in keys])
+    if cursor:
+        query = query.filter(_after(keys, decode_cursor(cursor, len(keys)), descending))
+    elif skip:
+        query = query.offset(skip)
+
+    # 한 행을 더 읽어 다음 페이지 존재 여부 확인
+    rows = query.limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    if has_next:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([getattr(last, key.key) for key in keys])
+    if total is not None:
+        count = total()
+        if count is not None:
+            response.headers[TOTAL_COUNT_HEADER] = str(count)
+    return rows
+
+
+def cached_count(cache_key: str, query: Query, ttl: int = COUNT_CACHE_TTL) -> Callable[[], Optional[int]]:
+    """COUNT(*) 결과를 짧게 캐시 (목록을 스크롤하는 동안 페이지마다 세지 않도록)"""
+    def count() -> Optional[int]:
+        key = f"page_count:{cache_key}"
+        try:
+            cached = redis_client.get(key)
+            if cached is not None:
+                return int(cached)
+        except redis.RedisError as e:
+            logger.warning(f"목록 개수 캐시 조회 실패: {e}")
+        value = query.order_by(None).count()
+        try:
+            redis_client.setex(key, ttl, value)
+        except redis.RedisError as e:
+            logger.warning(f"목록 개수 캐시 저장 실패: {e}")
+        return value
+    return count
+
+
+def estimated_row_count(db: Session, table_name: str) -> Callable[[], Optional[int]]:
+    """필터 없는 전체 목록용 InnoDB 통계 추정치 (정확한 COUNT(*) 풀스캔 대신)"""
+    def count() -> Optional[int]:
+        try:
+            return db.execute(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+                ),
+                {"table_name": table_name}
+            ).scalar()
+        except Exception as e:
+            logger.warning(f"테이블 행 수 추정 실패 ({table_name}): {e}")
+            return None
+    return count
+
@@ -0,0 +1,183 @@
+"""
+인증 주체(principal) 캐시
+
+get_current_user 가 요청마다 이메일로 CompanyUser / User 를 조회하던 것을
+토큰 subject(이메일) 기준의 작은 불변 스냅샷 캐시로 대체한다.
+
+- 1차: 프로세스 내 LRU (짧은 TTL)
+- 2차: Redis (워커 간 공유)
+- 사용자 정보가 ORM 으로 변경/삭제되면 커밋 직후 두 캐시 모두에서 제거
+  (다른 워커의 프로세스 내 LRU 는 최대 LOCAL_TTL_SECONDS 동안 이전 값을 볼 수 있음)
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Optional, Set
+
+import redis
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session, with_polymorphic
+
+from app.core.cache import redis_client
+from app.models.user import User, CompanyUser
+
+logger = logging.getLogger(__name__)
+
+LOCAL_TTL_SECONDS = int(os.getenv("PRINCIPAL_LOCAL_TTL", 30))
+REDIS_TTL_SECONDS = int(os.getenv("PRINCIPAL_REDIS_TTL", 300))
+LOCAL_MAX_ENTRIES = int(os.getenv("PRINCIPAL_LOCAL_MAX", 10000))
+KEY_PREFIX = "auth:principal"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자 스냅샷 (권한 판단에 필요한 필드만)"""
+    id: int
+    email: str
+    user_type: str
+    role: Optional[str]
+    company_id: Optional[int] = None
+    department_id: Optional[int] = None
+
+    @property
+    def is_company_user(self) -> bool:
+        return self.user_type == "company"
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        role = getattr(user.role, "value", user.role)
+        return cls(
+            id=user.id,
+            email=user.email,
+            user_type=user.user_type or "individual",
+            role=role,
+            company_id=getattr(user, "company_id", None),
+            department_id=getattr(user, "department_id", None),
+        )
+
+
+class PrincipalCache:
+    def __init__(self, local_ttl: int = LOCAL_TTL_SECONDS, redis_ttl: int = REDIS_TTL_SECONDS, max_entries: int = LOCAL_MAX_ENTRIES):
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.max_entries = max_entries
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return f"{KEY_PREFIX}:{email}"
+
+    def _get_local(self, email: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._local.get(email)
+            if entry is None:
+                return None
+            principal, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._local[email]
+                return None
+            self._local.move_to_end(email)
+            return principal
+
+    def _set_local(self, principal: Principal):
+        with self._lock:
+            self._local[principal.email] = (principal, time.monotonic() + self.local_ttl)
+            self._local.move_to_end(principal.email)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def resolve(self, db: Session, email: str) -> Optional[Principal]:
+        """토큰 subject(이메일) → Principal (LRU → Redis → DB 순)"""
+        principal = self._get_local(email)
+        if principal is not None:
+            self.stats["local_hits"] += 1
+            return principal
+
+        try:
+            raw = redis_client.get(self._key(email))
+            if raw:
+                principal = Principal(**json.loads(raw))
+                self.stats["redis_hits"] += 1
+                self._set_local(principal)
+                return principal
+        except (redis.RedisError, TypeError, ValueError) as e:
+            logger.warning(f"Principal cache read failed: {e}")
+
+        self.stats["misses"] += 1
+        # CompanyUser 컬럼까지 한 번의 조인 쿼리로 로드
+        polymorphic_user = with_polymorphic(User, [CompanyUser])
+        user = db.query(polymorphic_user).filter(polymorphic_user.email == email).first()
+        if user is None:
+            return None
+
+        principal = Principal.from_user(user)
+        self._set_local(principal)
+        try:
+            redis_client.setex(self._key(email), self.redis_ttl, json.dumps(asdict(principal)))
+        except redis.RedisError as e:
+            logger.warning(f"Principal cache write failed: {e}")
+        return principal
+
+    def invalidate(self, *emails: str):
+        emails = [email for email in emails if email]
+        if not emails:
+            return
+        with self._lock:
+            for email in emails:
+                self._local.pop(email, None)
+        try:
+            redis_client.delete(*[self._key(email) for email in emails])
+        except redis.RedisError as e:
+            logger.warning(f"Principal cache invalidation failed: {e}")
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+
+principal_cache = PrincipalCache()
+
+
+def invalidate_principal(*emails: str):
+    """사용자 정보(역할, 회사, 부서 등)를 ORM 밖에서 변경했을 때 직접 호출"""
+    principal_cache.invalidate(*emails)
+
+
+# ---------------------------------------------------------------------------
+# ORM 변경 감지: User/CompanyUser 가 수정/삭제되면 커밋 후 캐시 제거
+# ---------------------------------------------------------------------------
+
+_PENDING_KEY = "principal_cache_invalidate"
+
+
+def _collect_emails(target: User) -> Set[str]:
+    emails = {target.email}
+    history = sa_inspect(target).attrs.email.history
+    emails.update(history.deleted or ())
+    return {email for email in emails if email}
+
+
+@event.listens_for(User, "after_update", propagate=True)
+@event.listens_for(User, "after_delete", propagate=True)
+def _mark_user_changed(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).update(_collect_emails(target))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    emails = session.info.pop(_PENDING_KEY, None)
+    if emails:
+        principal_cache.invalidate(*emails)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
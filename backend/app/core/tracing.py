@@ -0,0 +1,57 @@
+"""
+요청 추적 컨텍스트 (W3C traceparent)
+
+백엔드 요청마다 trace_id 를 정해(들어온 traceparent 가 있으면 이어받음) 에이전트 호출 헤더로 넘긴다.
+에이전트는 이 헤더를 부모로 server span 을 열고 그 아래에 LangGraph 노드 / 도구 / LLM span 을
+기록하므로 백엔드 요청 하나를 에이전트 /traces/{trace_id} 로 끝까지 따라갈 수 있다.
+요청 밖(스케줄러 작업 등)의 에이전트 호출은 호출마다 새 trace 로 시작한다.
+"""
+import re
+import secrets
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+TRACEPARENT_HEADER = "traceparent"
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# (trace_id, 현재 요청의 span_id)
+_current_trace: ContextVar[Optional[Tuple[str, str]]] = ContextVar("request_trace", default=None)
+
+
+def _parse(header: Optional[str]) -> Optional[str]:
+    """traceparent → trace_id (형식이 틀리면 None)"""
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if not match or match.group(1) == "ff" or set(match.group(2)) == {"0"}:
+        return None
+    return match.group(2)
+
+
+def start_request_trace(traceparent: Optional[str] = None):
+    """요청 trace 시작 (들어온 traceparent 의 trace_id 유지), reset 용 토큰 반환"""
+    trace_id = _parse(traceparent) or secrets.token_hex(16)
+    return _current_trace.set((trace_id, secrets.token_hex(8)))
+
+
+def reset_request_trace(token):
+    _current_trace.reset(token)
+
+
+def current_trace_id() -> Optional[str]:
+    current = _current_trace.get()
+    return current[0] if current else None
+
+
+def request_traceparent() -> Optional[str]:
+    """현재 요청의 traceparent (응답 헤더용)"""
+    current = _current_trace.get()
+    return f"00-{current[0]}-{current[1]}-01" if current else None
+
+
+def outgoing_traceparent() -> str:
+    """에이전트 호출에 붙일 traceparent (호출마다 새 span_id, 요청 밖이면 새 trace)"""
+    current = _current_trace.get()
+    trace_id = current[0] if current else secrets.token_hex(16)
+    return f"00-{trace_id}-{secrets.token_hex(8)}-01"
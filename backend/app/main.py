@@ -5,18 +5,11 @@ from contextlib import asynccontextmanager
 import uvicorn
 import asyncio
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.core.database import engine, Base
-try:
-    from apscheduler.schedulers.background import BackgroundScheduler
-except ImportError:
-    print("⚠️ APScheduler not available, using fallback")
-    BackgroundScheduler = None
-from app.core.database import SessionLocal
-from app.models.interview_evaluation import auto_process_applications
+from app.core.http_cache import CacheMiddleware
 from sqlalchemy import text, inspect
 import logging
 
@@ -25,10 +18,8 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     handlers=[logging.StreamHandler()]
 )
-from app.scheduler.job_status_scheduler import JobStatusScheduler
-from app.scheduler.question_generation_scheduler import QuestionGenerationScheduler
-from app.scheduler.interview_reminder_scheduler import start_interview_reminder_scheduler
-from app.scheduler.auto_written_test_grader import start_written_test_auto_grader
+from app.scheduler.coordinator import coordinator as background_jobs
+from app.scheduler.jobs import register_background_jobs
 
 def safe_create_tables():
     """안전한 테이블 생성 - 기존 테이블은 건드리지 않고 새로운 테이블만 생성"""
@@ -72,14 +63,8 @@ def safe_create_tables():
     except Exception as e:
         print(f"❌ Safe table creation failed: {e}")
 # safe_create_tables 함수 제거 - Base.metadata.create_all()이 모든 테이블을 안전하게 생성함
-from app.models.interview_evaluation import auto_process_applications
 from app.models.interview_question import InterviewQuestion, QuestionType
 
-
-# JobPost 상태 스케줄러 인스턴스 (싱글톤)
-from app.scheduler.job_status_scheduler import JobStatusScheduler
-job_status_scheduler = JobStatusScheduler()
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("=== FastAPI 서버 시작 ===")
@@ -115,36 +100,15 @@ async def lifespan(app: FastAPI):
                 print("최대 재시도 횟수 초과. 애플리케이션을 종료합니다.")
                 raise e
     
-    # JobPost 상태 스케줄러 시작
-    print("🔄 Starting JobPost status scheduler...")
-    asyncio.create_task(job_status_scheduler.start())
-    print("JobPost 상태 스케줄러 시작 완료")
-
-    # 필기 답안 자동 채점 스케줄러 시작
-    start_written_test_auto_grader()
-
-    
-    # 면접 질문 생성 스케줄러 시작
-    print("🔄 Starting Question Generation scheduler...")
-    try:
-        # 백그라운드에서 스케줄러 실행
-        import threading
-        scheduler_thread = threading.Thread(
-            target=QuestionGenerationScheduler.run_scheduler,
-            daemon=True
-        )
-        scheduler_thread.start()
-        print("면접 질문 생성 스케줄러 시작 완료")
-    except Exception as e:
-        print(f"면접 질문 생성 스케줄러 시작 실패: {e}")
-    
-    # 면접 일정 리마인더 스케줄러 시작
-    print("Starting Interview Reminder scheduler...")
+    # 백그라운드 주기 작업 (JobPost 상태, 필기 자동 채점, 면접 질문 생성, 면접 리마인더, 지원서 자동 처리)
+    # 모든 워커가 등록하지만 lease 를 가진 리더 워커에서만 실행된다
+    print("🔄 Starting background job coordinator...")
     try:
-        start_interview_reminder_scheduler()
-        print("면접 일정 리마인더 스케줄러 시작 완료")
+        register_background_jobs(background_jobs)
+        background_jobs.start()
+        print("백그라운드 작업 조정기 시작 완료")
     except Exception as e:
-        print(f"면접 일정 리마인더 스케줄러 시작 실패: {e}")
+        print(f"백그라운드 작업 조정기 시작 실패: {e}")
     
     # 시드 데이터 실행
     try:
@@ -182,9 +146,13 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
-    print("🔄 Stopping JobPost status scheduler...")
-    await job_status_scheduler.stop()
-    print("JobPost 상태 스케줄러 중지 완료")
+    print("🔄 Stopping background job coordinator...")
+    background_jobs.stop()
+    print("백그라운드 작업 조정기 중지 완료 (리더 lease 반납)")
+    
+    # 공유 에이전트 HTTP 클라이언트 정리
+    from app.core.agent_client import close_agent_client
+    await close_agent_client()
 
 
 app = FastAPI(
@@ -222,33 +190,31 @@ async def print_routes():
         except Exception as e:
             print(f"Route info error: {e}")
 
-# 브라우저 캐싱 미들웨어
-class CacheMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+# DB 연결 점유 시간을 라우트별로 집계하기 위한 요청 경로 표시
+@app.middleware("http")
+async def db_route_context(request: Request, call_next):
+    from app.core.database import set_request_route, reset_request_route
+    token = set_request_route(request.method, request.url.path)
+    try:
+        return await call_next(request)
+    finally:
+        reset_request_route(token)
+
+# 요청 trace 컨텍스트 (에이전트 호출에 traceparent 로 전달, 응답 헤더로 trace_id 확인)
+@app.middleware("http")
+async def trace_context(request: Request, call_next):
+    from app.core.tracing import TRACEPARENT_HEADER, request_traceparent, reset_request_trace, start_request_trace
+    token = start_request_trace(request.headers.get(TRACEPARENT_HEADER))
+    try:
         response = await call_next(request)
-        
-        # GET 요청에 대해서만 캐싱 적용
-        if request.method == "GET":
-            # API 엔드포인트별 캐시 설정
-            path = request.url.path
-            
-            if "/api/v1/applications/" in path:
-                # 지원자 관련 API: 5분 캐시
-                response.headers["Cache-Control"] = "public, max-age=300"
-            elif "/api/v1/resumes/" in path:
-                # 이력서 관련 API: 5분 캐시
-                response.headers["Cache-Control"] = "public, max-age=300"
-            elif "/api/v1/company/jobposts/" in path:
-                # 채용공고 관련 API: 5분 캐시
-                response.headers["Cache-Control"] = "public, max-age=300"
-            elif "/api/v1/interview-questions/" in path:
-                # 면접 질문 API: 30분 캐시 (LLM 결과)
-                response.headers["Cache-Control"] = "public, max-age=1800"
-            else:
-                # 기본: 1분 캐시
-                response.headers["Cache-Control"] = "public, max-age=60"
-        
+        response.headers[TRACEPARENT_HEADER] = request_traceparent()
         return response
+    finally:
+        reset_request_trace(token)
+
+# 브라우저 캐싱 미들웨어 (ETag / Last-Modified 조건부 GET)
+# CORS 보다 먼저 등록해 CORS 가 바깥쪽에서 304 응답에도 헤더를 붙이도록 한다
+app.add_middleware(CacheMiddleware)
 
 # CORS 설정
 app.add_middleware(
@@ -267,9 +233,6 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
-# 브라우저 캐싱 미들웨어 추가
-app.add_middleware(CacheMiddleware)
-
 # API 라우터 등록
 #app.include_router(api_router)
 app.include_router(api_router, prefix="/api/v1")
@@ -289,12 +252,12 @@ async def root():
 @app.get("/performance")
 async def performance_info():
     """성능 정보 엔드포인트"""
-    from app.core.database import get_connection_info
+    from app.core.database import get_pool_stats
     from app.core.cache import get_cache_stats
     from app.utils.llm_cache import get_cache_stats as llm_cache_stats
     
     try:
-        db_info = get_connection_info()
+        db_info = get_pool_stats()["engines"]
         cache_stats = llm_cache_stats()
         
         return {
@@ -305,31 +268,22 @@ async def performance_info():
     except Exception as e:
         return {"error": str(e)}
 
-def run_auto_process():
-    print("run_auto_process called") 
-    """자동 처리 함수"""
-    db = SessionLocal()
-    try:
-        # 기존 자동 처리
-        auto_process_applications(db)
-        
-        # AI 평가 배치 프로세스 추가 (임시 비활성화)
-        # auto_evaluate_all_applications(db)  # final_status 데이터 보호를 위해 비활성화
-        
-        print("자동 처리 완료")
-    except Exception as e:
-        print(f"자동 처리 중 오류: {e}")
-    finally:
-        db.close()
+@app.get("/monitor/database")
+async def database_status():
+    """엔진별 풀 상태 / 체크아웃 대기 히스토그램 / 라우트별 연결 점유 시간 / 최근 느린 쿼리"""
+    from app.core.database import get_pool_stats
+    return get_pool_stats()
 
-# APScheduler 등록 (예: 10분마다 실행)
-if BackgroundScheduler:
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(run_auto_process, 'interval', minutes=10)
-    scheduler.start()
-    print("✅ APScheduler started successfully")
-else:
-    print("⚠️ APScheduler not available, skipping scheduled jobs")
+@app.get("/monitor/agent-client")
+async def agent_client_status():
+    """에이전트 호출 라우트별 서킷 상태 / 재시도 예산 / 지연시간 히스토그램"""
+    from app.core.agent_client import get_agent_client_stats
+    return get_agent_client_stats()
+
+@app.get("/scheduler/status")
+async def scheduler_status():
+    """백그라운드 작업 리더 상태 및 최근 실행 이력"""
+    return background_jobs.get_status()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from .company import Company, Department
 from .job import JobPost, JobPostRole
 from .application import Application
 from .resume import Resume
+from .resume_profile import ResumeProfile
 from .schedule import Schedule
 from .interview_question import InterviewQuestion
 from .interview_question_log import InterviewQuestionLog
@@ -20,6 +21,7 @@ from .highlight_result import HighlightResult
 from .analysis_result import AnalysisResult
 from .growth_prediction_result import GrowthPredictionResult
 from .statistics_analysis import StatisticsAnalysis
+from .background_job_run import BackgroundJobRun
 from app.core.database import Base
 
 from .evaluation_criteria import EvaluationCriteria
@@ -33,6 +35,7 @@ __all__ = [
     "JobPostRole",
     "Application",
     "Resume",
+    "ResumeProfile",
     "Schedule",
     "InterviewQuestion",
     "InterviewQuestionLog", 
@@ -52,6 +55,7 @@ __all__ = [
     "AnalysisResult",
     "GrowthPredictionResult",
     "StatisticsAnalysis",
+    "BackgroundJobRun",
     "WrittenTestAnswer",
     "Notification",
     "ApplicantUser",
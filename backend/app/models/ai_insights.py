@@ -18,6 +18,7 @@ class AIInsights(Base):
     # LangGraph 실행 정보
     langgraph_execution_id = Column(String(100), nullable=True)
     execution_time = Column(Float, nullable=True)  # 실행 시간 (초)
+    input_fingerprint = Column(String(64), nullable=True, index=True)  # 입력 통계 지문 (같으면 재생성하지 않음)
     
     # 분석 결과 (JSON 형태로 저장)
     score_analysis = Column(JSON, nullable=True)
@@ -49,6 +50,7 @@ class AIInsights(Base):
             "analysis_status": self.analysis_status,
             "langgraph_execution_id": self.langgraph_execution_id,
             "execution_time": self.execution_time,
+            "input_fingerprint": self.input_fingerprint,
             "score_analysis": self.score_analysis,
             "correlation_analysis": self.correlation_analysis,
             "trend_analysis": self.trend_analysis,
@@ -103,6 +103,7 @@ class Application(Base):
     ai_interview_score = Column(Numeric(5, 2))  # AI 면접 전용 점수
     ai_interview_pass_reason = Column(Text)  # AI 면접 합격 이유
     ai_interview_fail_reason = Column(Text)  # AI 면접 불합격 이유
+    executive_score = Column(Numeric(5, 2))  # 임원 면접 점수 (임원진 평가 저장 시 갱신)
     final_status = Column(SqlEnum(FinalStatus), default=FinalStatus.PENDING, nullable=False)  # 최종 선발 상태
     
     # Relationships with back_populates
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from datetime import datetime
+from app.core.database import Base
+
+
+class BackgroundJobRun(Base):
+    """백그라운드 주기 작업 실행 이력 (리더 워커에서만 기록)"""
+    __tablename__ = "background_job_run"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(100), nullable=False)
+    worker = Column(String(255), nullable=False)
+    status = Column(String(20), nullable=False, default="RUNNING")  # RUNNING / SUCCESS / FAILED
+    rows_affected = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, default=datetime.now, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_background_job_run_job_started", "job_name", "started_at"),
+    )
@@ -2,6 +2,7 @@ import enum
 from sqlalchemy import Column, Integer, ForeignKey, DECIMAL, Text, TIMESTAMP, Boolean, Enum as SqlEnum
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.core.agent_client import get_agent_client
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.models.job import JobPost
@@ -65,7 +66,9 @@ class EvaluationDetail(Base):
     evaluation = relationship('InterviewEvaluation', back_populates='details')
 
 def auto_process_applications(db: Session):
+    """마감된 공고의 대기 지원서를 점수순으로 합격/불합격 처리 (처리한 지원서 수 반환)"""
     now = datetime.now()
+    updated_count = 0
     expired_jobposts = db.query(JobPost).filter(JobPost.end_date < now).all()
     for jobpost in expired_jobposts:
         headcount = getattr(jobpost, 'headcount', 1) or 1
@@ -81,8 +84,9 @@ def auto_process_applications(db: Session):
                 app.status = ApplyStatus.PASSED
             else:
                 app.status = ApplyStatus.REJECTED
+        updated_count += len(waiting_apps)
     db.commit()
-    return True
+    return updated_count
 
 
 def auto_evaluate_all_applications(db: Session):
@@ -90,7 +94,6 @@ def auto_evaluate_all_applications(db: Session):
     모든 지원자에 대해 AI 평가를 자동으로 실행합니다.
     AI 평가가 아직 실행되지 않은 지원자들의 ai_score, status, pass_reason, fail_reason을 업데이트합니다.
     """
-    import requests
     import json
     
     # AI 평가가 아직 실행되지 않은 지원자들 조회
@@ -99,6 +102,9 @@ def auto_evaluate_all_applications(db: Session):
     ).all()
     
     print(f"AI 평가가 필요한 지원자 수: {len(unevaluated_applications)}")
+    # models 패키지 초기화 중 순환 import 를 피하려고 함수 안에서 가져온다
+    from app.services.resume_profile_service import ResumeProfileService
+    profiles = ResumeProfileService.load_profiles(db, [a.resume_id for a in unevaluated_applications if a.resume_id])
     
     for application in unevaluated_applications:
         try:
@@ -114,90 +120,8 @@ def auto_evaluate_all_applications(db: Session):
                 print(f"이력서를 찾을 수 없음: application_id={application.id}")
                 continue
             
-            # Spec 데이터 구성
-            spec_data = {
-                "education": {},
-                "certifications": [],
-                "awards": [],
-                "skills": {},
-                "activities": [],
-                "projects": []
-            }
-            if resume.specs:
-                for spec in resume.specs:
-                    if spec.spec_type == "education":
-                        if spec.spec_title == "institution":
-                            spec_data["education"]["university"] = spec.spec_description
-                        elif spec.spec_title == "major":
-                            spec_data["education"]["major"] = spec.spec_description
-                        elif spec.spec_title == "degree":
-                            spec_data["education"]["degree"] = spec.spec_description
-                        elif spec.spec_title == "gpa":
-                            spec_data["education"]["gpa"] = float(spec.spec_description) if spec.spec_description and spec.spec_description.replace('.', '').isdigit() else 0.0
-                        elif spec.spec_title == "start_date":
-                            spec_data["education"]["start_date"] = spec.spec_description
-                        elif spec.spec_title == "end_date":
-                            spec_data["education"]["end_date"] = spec.spec_description
-                    elif spec.spec_type == "certifications":
-                        if spec.spec_title == "name":
-                            spec_data["certifications"].append(spec.spec_description)
-                        elif spec.spec_title == "date":
-                            if spec_data["certifications"]:
-                                spec_data["certifications"][-1] = f"{spec_data['certifications'][-1]} ({spec.spec_description})"
-                    elif spec.spec_type == "awards":
-                        if spec.spec_title == "title":
-                            spec_data["awards"].append(spec.spec_description)
-                        elif spec.spec_title == "date":
-                            if spec_data["awards"]:
-                                spec_data["awards"][-1] = f"{spec_data['awards'][-1]} ({spec.spec_description})"
-                        elif spec.spec_title == "description":
-                            if spec_data["awards"]:
-                                spec_data["awards"][-1] = f"{spec_data['awards'][-1]} - {spec.spec_description}"
-                    elif spec.spec_type == "skills":
-                        if spec.spec_title == "name" or spec.spec_title == "내용":
-                            if "programming_languages" not in spec_data["skills"]:
-                                spec_data["skills"]["programming_languages"] = []
-                            spec_data["skills"]["programming_languages"].append(spec.spec_description)
-                    elif spec.spec_type == "activities":
-                        if spec.spec_title == "organization":
-                            activity = {"organization": spec.spec_description}
-                            spec_data["activities"].append(activity)
-                        elif spec.spec_title == "role":
-                            if spec_data["activities"]:
-                                spec_data["activities"][-1]["role"] = spec.spec_description
-                        elif spec.spec_title == "period":
-                            if spec_data["activities"]:
-                                spec_data["activities"][-1]["period"] = spec.spec_description
-                        elif spec.spec_title == "description":
-                            if spec_data["activities"]:
-                                spec_data["activities"][-1]["description"] = spec.spec_description
-                    elif spec.spec_type == "project_experience":
-                        if spec.spec_title == "title":
-                            project = {"title": spec.spec_description}
-                            spec_data["projects"].append(project)
-                        elif spec.spec_title == "role":
-                            if spec_data["projects"]:
-                                spec_data["projects"][-1]["role"] = spec.spec_description
-                        elif spec.spec_title == "duration":
-                            if spec_data["projects"]:
-                                spec_data["projects"][-1]["duration"] = spec.spec_description
-                        elif spec.spec_title == "technologies":
-                            if spec_data["projects"]:
-                                spec_data["projects"][-1]["technologies"] = spec.spec_description
-                        elif spec.spec_title == "description":
-                            if spec_data["projects"]:
-                                spec_data["projects"][-1]["description"] = spec.spec_description
-            # 모든 spec 타입이 항상 포함되도록 보장
-            for key, default in [
-                ("education", {}),
-                ("certifications", []),
-                ("awards", []),
-                ("skills", {}),
-                ("activities", []),
-                ("projects", [])
-            ]:
-                if key not in spec_data:
-                    spec_data[key] = default
+            # Spec 데이터 구성 (이력서 프로필에서 읽음)
+            spec_data = ResumeProfileService.to_spec_data(profiles.get(resume.id))
             
             # 이력서 데이터 구성
             resume_data = {
@@ -234,7 +158,6 @@ def auto_evaluate_all_applications(db: Session):
             print(f"  weight_dict: {weight_dict}")
 
             # AI Agent API 호출
-            agent_url = "http://kocruit_agent:8001/evaluate-application/"
             payload = {
                 "job_posting": job_posting,
                 "spec_data": spec_data,
@@ -249,7 +172,7 @@ def auto_evaluate_all_applications(db: Session):
             print(f"  resume_data 키: {list(resume_data.keys())}")
             print(f"  weight_data 키: {list(weight_dict.keys())}")
             
-            response = requests.post(agent_url, json=payload, timeout=30)
+            response = get_agent_client().post_sync("/evaluate-application/", json=payload)
             response.raise_for_status()
             
             result = response.json()
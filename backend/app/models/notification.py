@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -6,6 +6,10 @@ from app.core.database import Base
 
 class Notification(Base):
     __tablename__ = "notification"
+    __table_args__ = (
+        # 일정 기반 알림(면접 리마인더 등) 중복 방지 키. schedule_id 가 NULL 인 일반 알림은 제약을 받지 않는다
+        UniqueConstraint("user_id", "type", "schedule_id", name="uq_notification_user_type_schedule"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     message = Column(Text)
@@ -14,6 +18,7 @@ class Notification(Base):
     is_read = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     url = Column(String(255), nullable=True)
+    schedule_id = Column(Integer, nullable=True)
     
     # Relationships
     user = relationship("User") 
\ No newline at end of file
@@ -26,6 +26,7 @@ class Resume(Base):
     applications = relationship("Application", back_populates="resume")
     specs = relationship("Spec", back_populates="resume")
     memos = relationship("ResumeMemo", back_populates="resume")
+    profile = relationship("ResumeProfile", back_populates="resume", uselist=False, passive_deletes=True)
 
 
 class Spec(Base):
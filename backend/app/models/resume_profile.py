@@ -0,0 +1,66 @@
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.core.database import Base
+
+
+# 학력 수준 코드 (degree 문자열에서 판정, 앞에서부터 먼저 일치하는 항목 사용 - "전문학사"가 "학사"보다 먼저)
+EDUCATION_LEVELS = [
+    ("고등학교", 1),
+    ("고졸", 1),
+    ("전문학사", 2),
+    ("학사", 3),
+    ("석사", 4),
+    ("박사", 5),
+]
+# 학력 수준 코드 → 성장 가능성 스코어링 학위 점수 (고졸=1, 전문학사=1.5, 학사=2, 석사=3, 박사=4)
+DEGREE_SCORES = {1: 1.0, 2: 1.5, 3: 2.0, 4: 3.0, 5: 4.0}
+
+
+class ResumeProfile(Base):
+    """이력서 스펙(EAV) 을 이력서당 한 행으로 정리한 조회용 프로필
+
+    spec 테이블이 바뀌면 ResumeProfileService 가 다시 만든다.
+    숫자/코드 값은 컬럼으로 두어 SQL 로 바로 필터/집계할 수 있게 하고,
+    목록형 값은 화면 응답 형태 그대로 JSON 으로 둔다.
+    """
+    __tablename__ = "resume_profile"
+
+    resume_id = Column(Integer, ForeignKey('resume.id', ondelete="CASCADE"), primary_key=True)
+
+    # 첫 번째 학력
+    institution = Column(String(255))
+    degree_raw = Column(String(255))                 # spec 원문 (예: "컴퓨터공학(학사)")
+    major = Column(String(255))
+    degree = Column(String(50))                      # 괄호 안 학위 (예: "학사")
+    education_level = Column(SmallInteger, nullable=False, default=0)  # EDUCATION_LEVELS 코드, 0 = 정보 없음
+    gpa = Column(Float)
+    education_start_date = Column(String(50))
+    education_end_date = Column(String(50))
+
+    certificate_count = Column(Integer, nullable=False, default=0)
+    experience_years = Column(Float)
+    promotion_speed_years = Column(Float)
+    kpi_score = Column(Float)
+
+    educations = Column(JSON)        # [{schoolName, major, degree, gpa, startDate, endDate, duration, ...}]
+    certificates = Column(JSON)      # [{name, date, duration}]
+    awards = Column(JSON)            # [{title, date, description, duration}]
+    skills = Column(JSON)            # [str]
+    experiences = Column(JSON)       # 대외활동 + 프로젝트 [{type: activity|project, ...}]
+    work_experiences = Column(JSON)  # 경력 [{company, position, duration}]
+
+    spec_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    resume = relationship("Resume", back_populates="profile")
+
+    __table_args__ = (
+        Index("ix_resume_profile_education_level", "education_level"),
+        Index("ix_resume_profile_experience_years", "experience_years"),
+        Index("ix_resume_profile_certificate_count", "certificate_count"),
+    )
+
+    @property
+    def degree_score(self) -> float:
+        return DEGREE_SCORES.get(self.education_level or 0, 0.0)
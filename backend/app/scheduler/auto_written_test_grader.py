@@ -1,40 +1,26 @@
-from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.models.written_test_answer import WrittenTestAnswer
 from app.models.written_test_question import WrittenTestQuestion
-from agent.tools.answer_grading_tool import grade_written_test_answer
-from app.models.application import Application, WrittenTestStatus
-from app.models.job import JobPost
+from app.models.application import Application
+from app.services.application_transition_service import ApplicationTransitionService
 from sqlalchemy import func
 import datetime
 
 def update_written_test_pass_status(db, jobpost_id):
-    jobpost = db.query(JobPost).filter(JobPost.id == jobpost_id).first()
-    headcount = jobpost.headcount if jobpost and jobpost.headcount else 1
-    cutoff = headcount * 5
-    apps = db.query(Application)\
-        .filter(Application.job_post_id == jobpost_id)\
-        .order_by(
-            (Application.written_test_score == None).asc(),
-            Application.written_test_score.desc()
-        ).all()
-    if not apps:
-        return
-    # cutoff 점수 구하기
-    if len(apps) <= cutoff:
-        cutoff_score = apps[-1].written_test_score
-    else:
-        cutoff_score = apps[cutoff-1].written_test_score
-    for app in apps:
-        if app.written_test_score is not None and app.written_test_score >= cutoff_score:
-            app.written_test_status = WrittenTestStatus.PASSED
-        else:
-            app.written_test_status = WrittenTestStatus.FAILED
+    """필기 점수 상위 5배수(동점자 포함) 합격 처리 - 공고 잠금 + 순위 UPDATE 한 번"""
+    result = ApplicationTransitionService.update_written_test_status(db, jobpost_id)
+    if result is None:
+        print(f"[Auto Grader] 공고를 찾을 수 없어 필기 합격 처리 생략: jobpost_id={jobpost_id}")
+        return None
     db.commit()
+    return result
 
 
 def auto_grade_unscored_answers():
+    """미채점 필기 답안 자동 채점 (채점한 답안 수 반환)"""
+    from agent.tools.answer_grading_tool import grade_written_test_answer
+
     start_time = datetime.datetime.now()
     print(f"[Auto Grader] 채점 시작: {start_time}")
     total_graded = 0
@@ -112,9 +98,4 @@ def auto_grade_unscored_answers():
             break
     end_time = datetime.datetime.now()
     print(f"[Auto Grader] 채점 끝: {end_time} (소요: {end_time - start_time}, 총 {total_graded}개 채점)")
-
-def start_written_test_auto_grader():
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(auto_grade_unscored_answers, 'interval', minutes=3)
-    scheduler.start()
-    print("[Auto Grader] 필기 답안 자동 채점 스케줄러가 시작되었습니다.") 
\ No newline at end of file
+    return total_graded
@@ -0,0 +1,317 @@
+"""
+백그라운드 작업 조정기
+
+uvicorn 워커가 여러 개여도 주기 작업이 한 워커에서만 실행되도록
+lease 기반 리더 선출을 한다.
+
+- 모든 워커가 같은 작업 목록을 등록하고 APScheduler 를 띄우지만,
+  실제 실행은 lease 를 가진 리더 워커에서만 한다.
+- 리더는 heartbeat 마다 lease 를 갱신하고, 리더가 죽으면 lease 가 만료된 뒤
+  다른 워커가 lease 를 가져가 리더가 된다 (자동 failover).
+- 실행마다 시작/종료 시각, 처리 행 수, 오류를 background_job_run 테이블에 남긴다.
+
+lease 저장소는 SCHEDULER_LEASE_BACKEND 로 선택한다.
+    redis (기본): SET NX PX + 토큰 비교 갱신
+    mysql       : GET_LOCK 네임드 락 (락을 잡은 DB 세션이 끊기면 자동 해제)
+"""
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import redis
+from apscheduler.schedulers.background import BackgroundScheduler
+from pytz import timezone
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.models.background_job_run import BackgroundJobRun
+
+logger = logging.getLogger(__name__)
+
+KST = timezone('Asia/Seoul')
+
+LEASE_NAME = os.getenv("SCHEDULER_LEASE_NAME", "kocruit:scheduler:leader")
+LEASE_BACKEND = os.getenv("SCHEDULER_LEASE_BACKEND", "redis")
+LEASE_TTL_SECONDS = int(os.getenv("SCHEDULER_LEASE_TTL", 30))
+# lease 만료 전에 여러 번 갱신할 수 있도록 TTL 의 1/3 간격으로 heartbeat
+HEARTBEAT_SECONDS = max(1, LEASE_TTL_SECONDS // 3)
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class RedisLease:
+    """Redis 키 기반 lease (값 = 소유자 토큰)"""
+
+    # 내가 가진 lease 일 때만 연장/해제
+    _RENEW = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    _RELEASE = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+
+    def __init__(self, name: str, ttl_seconds: int):
+        self.name = name
+        self.ttl_ms = ttl_seconds * 1000
+        self.token = f"{WORKER_ID}:{uuid.uuid4().hex[:8]}"
+        self.client = redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=3, socket_timeout=3)
+        self.held = False
+
+    def acquire_or_renew(self) -> bool:
+        if self.held:
+            self.held = bool(self.client.eval(self._RENEW, 1, self.name, self.token, self.ttl_ms))
+        else:
+            self.held = bool(self.client.set(self.name, self.token, nx=True, px=self.ttl_ms))
+        return self.held
+
+    def holder(self) -> Optional[str]:
+        value = self.client.get(self.name)
+        return value.decode() if isinstance(value, bytes) else value
+
+    def release(self):
+        if self.held:
+            self.client.eval(self._RELEASE, 1, self.name, self.token)
+            self.held = False
+
+
+class MySQLLease:
+    """MySQL GET_LOCK 기반 lease
+
+    락은 커넥션에 묶여 있으므로 리더 동안 전용 커넥션을 계속 유지한다.
+    프로세스가 죽어 커넥션이 끊기면 MySQL 이 락을 즉시 해제한다.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int):
+        self.name = name[:64]  # MySQL 락 이름 최대 길이
+        self.connection = None
+        self.held = False
+
+    def acquire_or_renew(self) -> bool:
+        if self.held:
+            try:
+                owner = self.connection.execute(
+                    text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {"name": self.name}
+                ).scalar()
+                self.held = bool(owner)
+            except Exception:
+                self.held = False
+            if not self.held:
+                self._close()
+            return self.held
+
+        self.connection = engine.connect()
+        acquired = self.connection.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": self.name}).scalar()
+        self.held = acquired == 1
+        if not self.held:
+            self._close()
+        return self.held
+
+    def holder(self) -> Optional[str]:
+        with engine.connect() as connection:
+            owner = connection.execute(text("SELECT IS_USED_LOCK(:name)"), {"name": self.name}).scalar()
+        return f"mysql-connection:{owner}" if owner else None
+
+    def release(self):
+        if self.held and self.connection is not None:
+            try:
+                self.connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+            finally:
+                self.held = False
+                self._close()
+
+    def _close(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+            self.connection = None
+
+
+def _rows_affected(result: Any) -> Optional[int]:
+    """작업 반환값에서 처리 행 수 추출 (int 또는 rows_affected/updated_count 키를 가진 dict)"""
+    if isinstance(result, bool):
+        return None
+    if isinstance(result, int):
+        return result
+    if isinstance(result, dict):
+        for key in ("rows_affected", "updated_count"):
+            if isinstance(result.get(key), int):
+                return result[key]
+    return None
+
+
+class BackgroundJobCoordinator:
+    """주기 작업 등록 + 리더 워커에서만 실행"""
+
+    def __init__(self, lease_name: str = LEASE_NAME, backend: str = LEASE_BACKEND, ttl_seconds: int = LEASE_TTL_SECONDS):
+        lease_cls = MySQLLease if backend == "mysql" else RedisLease
+        self.lease = lease_cls(lease_name, ttl_seconds)
+        self.scheduler = BackgroundScheduler(timezone=KST, job_defaults={"coalesce": True, "max_instances": 1})
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.is_leader = False
+        self.leader_since: Optional[datetime] = None
+        self._stop_event = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def register(self, name: str, func: Callable[[], Any], trigger: str, run_on_election: bool = False, **trigger_args):
+        """주기 작업 등록
+
+        Args:
+            name: 작업 이름 (실행 이력의 job_name)
+            func: 인자 없는 동기 함수. int 또는 {"rows_affected"/"updated_count": int} 를 반환하면 처리 행 수로 기록
+            trigger: APScheduler trigger ('interval' / 'cron')
+            run_on_election: 이 워커가 리더가 되는 즉시 한 번 실행 (기존 '서버 시작 시 즉시 실행' 대체)
+        """
+        self.jobs[name] = {
+            "func": func,
+            "trigger": trigger,
+            "trigger_args": trigger_args,
+            "run_on_election": run_on_election,
+        }
+
+    def start(self):
+        if self.scheduler.running:
+            return
+        for name, job in self.jobs.items():
+            self.scheduler.add_job(
+                self.run_job, job["trigger"], args=[name], id=name, replace_existing=True, **job["trigger_args"]
+            )
+        self.scheduler.start()
+        self._stop_event.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="scheduler-leader-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+        logger.info(f"[Scheduler] {len(self.jobs)}개 작업 등록, 리더 선출 시작 (worker={WORKER_ID})")
+
+    def stop(self):
+        self._stop_event.set()
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        with self._lock:
+            try:
+                self.lease.release()
+            except Exception as e:
+                logger.warning(f"[Scheduler] lease 해제 실패: {e}")
+            self.is_leader = False
+
+    def _heartbeat_loop(self):
+        while not self._stop_event.is_set():
+            self._heartbeat()
+            self._stop_event.wait(HEARTBEAT_SECONDS)
+
+    def _heartbeat(self):
+        with self._lock:
+            was_leader = self.is_leader
+            try:
+                self.is_leader = self.lease.acquire_or_renew()
+            except Exception as e:
+                # lease 저장소에 닿지 않으면 리더 여부를 확신할 수 없으므로 실행을 멈춘다
+                logger.warning(f"[Scheduler] lease 갱신 실패: {e}")
+                self.is_leader = False
+
+        if self.is_leader and not was_leader:
+            self.leader_since = datetime.now()
+            logger.info(f"[Scheduler] 리더로 선출됨 (worker={WORKER_ID})")
+            for name, job in self.jobs.items():
+                if job["run_on_election"]:
+                    self.scheduler.add_job(self.run_job, args=[name], id=f"{name}:on-election", replace_existing=True)
+        elif was_leader and not self.is_leader:
+            self.leader_since = None
+            logger.warning(f"[Scheduler] 리더 lease 상실 (worker={WORKER_ID})")
+
+    def run_job(self, name: str, force: bool = False) -> Optional[Dict[str, Any]]:
+        """등록된 작업 1회 실행 (리더가 아니면 건너뜀, force=True 면 리더 여부 무시)"""
+        if not (self.is_leader or force):
+            return None
+        job = self.jobs[name]
+        run_id = self._record_start(name)
+        try:
+            result = job["func"]()
+        except Exception as e:
+            logger.error(f"[Scheduler] {name} 실행 실패: {e}")
+            self._record_end(run_id, "FAILED", None, str(e))
+            return {"job_name": name, "status": "FAILED", "error": str(e)}
+        rows = _rows_affected(result)
+        self._record_end(run_id, "SUCCESS", rows, None)
+        return {"job_name": name, "status": "SUCCESS", "rows_affected": rows}
+
+    def _record_start(self, name: str) -> Optional[int]:
+        db = SessionLocal()
+        try:
+            run = BackgroundJobRun(job_name=name, worker=WORKER_ID, status="RUNNING", started_at=datetime.now())
+            db.add(run)
+            db.commit()
+            return run.id
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[Scheduler] 실행 이력 기록 실패 ({name}): {e}")
+            return None
+        finally:
+            db.close()
+
+    def _record_end(self, run_id: Optional[int], status: str, rows: Optional[int], error: Optional[str]):
+        if run_id is None:
+            return
+        db = SessionLocal()
+        try:
+            db.query(BackgroundJobRun).filter(BackgroundJobRun.id == run_id).update({
+                BackgroundJobRun.status: status,
+                BackgroundJobRun.rows_affected: rows,
+                BackgroundJobRun.error: error[:2000] if error else None,
+                BackgroundJobRun.finished_at: datetime.now(),
+            }, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[Scheduler] 실행 이력 갱신 실패 (run_id={run_id}): {e}")
+        finally:
+            db.close()
+
+    def get_status(self, recent_runs: int = 20) -> Dict[str, Any]:
+        """리더 상태, 등록 작업, 최근 실행 이력"""
+        try:
+            holder = self.lease.holder()
+        except Exception as e:
+            holder = f"unknown ({e})"
+
+        jobs: List[Dict[str, Any]] = []
+        for name in self.jobs:
+            scheduled = self.scheduler.get_job(name) if self.scheduler.running else None
+            jobs.append({
+                "name": name,
+                "next_run_time": scheduled.next_run_time.isoformat() if scheduled and scheduled.next_run_time else None,
+            })
+
+        db = SessionLocal()
+        try:
+            runs = db.query(BackgroundJobRun).order_by(BackgroundJobRun.id.desc()).limit(recent_runs).all()
+            recent = [
+                {
+                    "job_name": run.job_name,
+                    "worker": run.worker,
+                    "status": run.status,
+                    "rows_affected": run.rows_affected,
+                    "started_at": run.started_at.isoformat() if run.started_at else None,
+                    "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+                    "error": run.error,
+                }
+                for run in runs
+            ]
+        except Exception as e:
+            recent = [{"error": str(e)}]
+        finally:
+            db.close()
+
+        return {
+            "worker": WORKER_ID,
+            "is_leader": self.is_leader,
+            "leader_since": self.leader_since.isoformat() if self.leader_since else None,
+            "lease_holder": holder,
+            "jobs": jobs,
+            "recent_runs": recent,
+        }
+
+
+coordinator = BackgroundJobCoordinator()
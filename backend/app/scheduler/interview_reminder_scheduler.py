@@ -1,78 +1,65 @@
 import logging
 from datetime import datetime, timedelta, time
 from sqlalchemy.orm import Session
-from apscheduler.schedulers.background import BackgroundScheduler
 from pytz import timezone
 from app.core.database import SessionLocal
 from app.models.schedule import Schedule, InterviewScheduleStatus
 from app.models.job import JobPost
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationService, REMINDER_NOTIFICATION_TYPE
 from app.models.interview_panel import InterviewPanelAssignment, InterviewPanelMember
 from app.models.user import CompanyUser
 
 logger = logging.getLogger(__name__)
 
-REMINDER_TYPE = "INTERVIEW_REMINDER"
+REMINDER_TYPE = REMINDER_NOTIFICATION_TYPE
 KST = timezone('Asia/Seoul')
 
 def send_interview_reminders():
+    """내일 면접이 있는 면접관에게 리마인더 알림 발송 (발송 건수 반환)"""
     db: Session = SessionLocal()
     try:
         tomorrow = (datetime.now(KST) + timedelta(days=1)).date()
         start_dt = KST.localize(datetime.combine(tomorrow, time.min))
         end_dt = KST.localize(datetime.combine(tomorrow, time.max))
 
-        # 1. schedule에서 interview type + 다음날 일정 찾기
-        schedules = db.query(Schedule).filter(
+        # 내일 면접 일정 → 패널 배정 → 패널 멤버 → 면접관을 한 번의 조인으로 (면접관, 일정, 공고명) 목록으로 만든다
+        targets = db.query(
+            CompanyUser.id.label("user_id"),
+            Schedule.id.label("schedule_id"),
+            Schedule.scheduled_at,
+            JobPost.title.label("job_title")
+        ).select_from(Schedule).join(
+            InterviewPanelAssignment, InterviewPanelAssignment.schedule_id == Schedule.id
+        ).join(
+            InterviewPanelMember, InterviewPanelMember.assignment_id == InterviewPanelAssignment.id
+        ).join(
+            CompanyUser, CompanyUser.id == InterviewPanelMember.company_user_id
+        ).outerjoin(
+            JobPost, JobPost.id == Schedule.job_post_id
+        ).filter(
             Schedule.schedule_type == 'interview',
             Schedule.scheduled_at >= start_dt,
             Schedule.scheduled_at <= end_dt
-        ).all()
-        logger.info(f"[Interview Reminder] Found {len(schedules)} interview schedules for {tomorrow}")
+        ).distinct().all()
+        logger.info(f"[Interview Reminder] Found {len(targets)} interviewer/schedule pairs for {tomorrow}")
 
-        for schedule in schedules:
-            # 2. interview_panel_assignment에서 schedule_id 매칭
-            assignments = db.query(InterviewPanelAssignment).filter(
-                InterviewPanelAssignment.schedule_id == schedule.id
-            ).all()
-            for assignment in assignments:
-                # 3. interview_panel_member에서 assignment_id 매칭
-                members = db.query(InterviewPanelMember).filter(
-                    InterviewPanelMember.assignment_id == assignment.id
-                ).all()
-                for member in members:
-                    # 4. 각 member의 company_user_id에게 알림
-                    interviewer = db.query(CompanyUser).filter(CompanyUser.id == member.company_user_id).first()
-                    if not interviewer:
-                        continue
-                    # 5. 중복 알림 방지: user_id+schedule_id 조합
-                    from app.models.notification import Notification
-                    existing = db.query(Notification).filter(
-                        Notification.user_id == interviewer.id,
-                        Notification.type == REMINDER_TYPE,
-                        Notification.message.like(f"%{schedule.title if schedule else ''}%"),
-                        Notification.message.like(f"%ScheduleID:{schedule.id}%"),
-                        Notification.is_read == False
-                    ).first()
-                    if existing:
-                        continue  # Already sent
-                    job_post = db.query(JobPost).filter(JobPost.id == schedule.job_post_id).first() if schedule else None
-                    job_title = job_post.title if job_post else "면접"
-                    kst_interview_time = schedule.scheduled_at.astimezone(KST)
-                    # ScheduleID를 메시지에 숨겨서 중복 방지
-                    message = f"[면접 일정 알림] '{job_title}' 면접이 내일({kst_interview_time.strftime('%Y-%m-%d %H:%M')}) 예정되어 있습니다. 준비를 부탁드립니다. [ScheduleID:{schedule.id}]"
-                    NotificationService.create_reminder_notification(db, interviewer.id, message)
-                    logger.info(f"[Interview Reminder] Sent reminder to user {interviewer.id} for schedule {schedule.id}")
+        reminders = []
+        for target in targets:
+            job_title = target.job_title or "면접"
+            kst_interview_time = target.scheduled_at.astimezone(KST)
+            reminders.append({
+                "user_id": target.user_id,
+                "schedule_id": target.schedule_id,
+                "message": f"[면접 일정 알림] '{job_title}' 면접이 내일({kst_interview_time.strftime('%Y-%m-%d %H:%M')}) 예정되어 있습니다. 준비를 부탁드립니다."
+            })
+
+        # (user_id, type, schedule_id) 유니크 키로 중복 방지 + 한 번의 INSERT ... ON DUPLICATE KEY UPDATE
+        sent_count = NotificationService.create_reminder_notifications(db, reminders)
         db.commit()
+        logger.info(f"[Interview Reminder] Sent {sent_count} reminders ({len(reminders) - sent_count} already sent)")
+        return sent_count
     except Exception as e:
         logger.error(f"[Interview Reminder] Error: {e}")
+        raise
     finally:
         db.close()
-
-def start_interview_reminder_scheduler():
-    scheduler = BackgroundScheduler(timezone=KST)
-    scheduler.add_job(send_interview_reminders, 'cron', hour=9, minute=0)  # Every day at 9am KST
-    # 서버 시작 시 즉시 한 번 실행
-    send_interview_reminders()
-    scheduler.start()
-    logger.info("[Interview Reminder] Interview reminder scheduler started.") 
\ No newline at end of file
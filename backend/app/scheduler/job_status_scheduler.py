@@ -376,6 +376,13 @@ class JobStatusScheduler:
                 db.close()
             return {"success": False, "error": str(e)}
     
+    def run_once(self):
+        """상태 업데이트 1회 실행 (백그라운드 작업 조정기에서 호출, 별도 스레드에서 실행됨)"""
+        result = asyncio.run(self._update_job_status())
+        if not result.get("success"):
+            raise RuntimeError(result.get("error"))
+        return result
+    
     async def run_manual_update(self):
         """수동 상태 업데이트 실행"""
         try:
@@ -387,9 +394,11 @@ class JobStatusScheduler:
             return {"error": str(e)}
     
     def get_scheduler_status(self):
-        """스케줄러 상태 반환"""
+        """스케줄러 상태 반환 (주기 실행은 백그라운드 작업 조정기가 리더 워커에서 담당)"""
+        from app.scheduler.coordinator import coordinator
         return {
-            "running": self.running,
+            "running": coordinator.scheduler.running,
             "update_interval": self.update_interval,
+            "is_leader": coordinator.is_leader,
             "active_task": self.task is not None
         } 
\ No newline at end of file
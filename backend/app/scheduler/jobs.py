@@ -0,0 +1,94 @@
+"""
+백그라운드 주기 작업 등록
+
+서버에서 주기적으로 실행되는 모든 작업을 여기에서 한 번에 등록한다.
+등록된 작업은 app.scheduler.coordinator 가 리더 워커에서만 실행한다.
+"""
+from app.core.database import SessionLocal
+from app.models.interview_evaluation import auto_process_applications
+from app.scheduler.auto_written_test_grader import auto_grade_unscored_answers
+from app.scheduler.coordinator import BackgroundJobCoordinator
+from app.scheduler.interview_reminder_scheduler import send_interview_reminders, KST
+from app.scheduler.job_status_scheduler import JobStatusScheduler
+from app.scheduler.question_generation_scheduler import QuestionGenerationScheduler
+from app.services.resume_plagiarism_service import build_local_index, get_local_plagiarism_index
+from app.services.resume_profile_service import ResumeProfileService
+
+
+def run_auto_process():
+    """마감 공고 지원서 자동 처리 (처리한 지원서 수 반환)"""
+    db = SessionLocal()
+    try:
+        # AI 평가 배치 프로세스 (auto_evaluate_all_applications) 는 final_status 데이터 보호를 위해 비활성화
+        return auto_process_applications(db)
+    finally:
+        db.close()
+
+
+def compact_plagiarism_index():
+    """로컬 표절 인덱스 저널을 스냅샷에 합침 (색인된 이력서 수 반환)
+
+    아직 전체 구성된 적이 없으면(스냅샷 없음) 저널만 스냅샷으로 굳히지 않고 DB 전체로 구성한다.
+    """
+    index = get_local_plagiarism_index()
+    if not index.has_snapshot():
+        db = SessionLocal()
+        try:
+            build_local_index(db, force=False)
+        finally:
+            db.close()
+    else:
+        index.compact()
+    return index.stats()["documents"]
+
+
+def rebuild_resume_profiles():
+    """이력서 프로필 전체 재구성 (SQL 로 직접 바뀐 spec 반영, 재구성한 프로필 수 반환)"""
+    db = SessionLocal()
+    try:
+        return ResumeProfileService.rebuild_all(db)
+    finally:
+        db.close()
+
+
+def register_background_jobs(coordinator: BackgroundJobCoordinator):
+    # JobPost 상태 갱신: 1시간마다, 리더가 되면 즉시 1회
+    coordinator.register(
+        "job_status_update", JobStatusScheduler().run_once,
+        "interval", hours=1, run_on_election=True
+    )
+    # 필기 답안 자동 채점: 3분마다
+    coordinator.register(
+        "written_test_auto_grade", auto_grade_unscored_answers,
+        "interval", minutes=3
+    )
+    # 공통 면접 질문 생성: 매일 새벽 2시
+    coordinator.register(
+        "common_question_generation", QuestionGenerationScheduler.generate_common_questions_for_new_job_posts,
+        "cron", hour=2, minute=0, timezone=KST, run_on_election=True
+    )
+    # 개별 면접 질문 생성: 매시간 정각
+    coordinator.register(
+        "individual_question_generation", QuestionGenerationScheduler.generate_individual_questions_for_scheduled_interviews,
+        "cron", minute=0, timezone=KST, run_on_election=True
+    )
+    # 면접 일정 리마인더: 매일 오전 9시
+    coordinator.register(
+        "interview_reminder", send_interview_reminders,
+        "cron", hour=9, minute=0, timezone=KST, run_on_election=True
+    )
+    # 마감 공고 지원서 자동 처리: 10분마다
+    coordinator.register(
+        "auto_process_applications", run_auto_process,
+        "interval", minutes=10
+    )
+    # 로컬 표절 인덱스 스냅샷 정리: 매일 새벽 4시, 리더가 되면 즉시 1회 (처음 기동 시 전체 구성)
+    coordinator.register(
+        "plagiarism_index_compact", compact_plagiarism_index,
+        "cron", hour=4, minute=0, timezone=KST, run_on_election=True
+    )
+    # 이력서 프로필 재구성: 매일 새벽 4시 30분, 리더가 되면 즉시 1회
+    coordinator.register(
+        "resume_profile_rebuild", rebuild_resume_profiles,
+        "cron", hour=4, minute=30, timezone=KST, run_on_election=True
+    )
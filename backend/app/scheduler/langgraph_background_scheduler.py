@@ -20,12 +20,10 @@ from ..models.interview_question import InterviewQuestion, QuestionType
 from ..models.interview_evaluation import InterviewEvaluation
 from ..models.interview_question_log import InterviewQuestionLog
 
-# LangGraph 워크플로우 import
+# LangGraph 워크플로우 경로 (LangChain/LLM 클라이언트를 불러오는 워크플로우 모듈은 작업 실행 시 import)
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../agent'))
-from agent.agents.interview_question_workflow import generate_comprehensive_interview_questions
-from agent.agents.ai_interview_workflow import run_ai_interview
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +75,7 @@ class LangGraphBackgroundScheduler:
             job_info = f"{job_post.title} - {job_post.description}" if job_post else ""
             
             # LangGraph 워크플로우 실행
+            from agent.agents.interview_question_workflow import generate_comprehensive_interview_questions
             workflow_result = generate_comprehensive_interview_questions(
                 resume_text=resume_text,
                 job_info=job_info,
@@ -139,6 +138,7 @@ class LangGraphBackgroundScheduler:
             resume_text = f"{resume.name} - {resume.education} - {resume.experience}"
             
             # LangGraph 워크플로우 실행
+            from agent.agents.interview_question_workflow import generate_comprehensive_interview_questions
             workflow_result = generate_comprehensive_interview_questions(
                 resume_text=resume_text,
                 job_info="",
@@ -189,6 +189,7 @@ class LangGraphBackgroundScheduler:
             resume_text = f"{resume.name} - {resume.education} - {resume.experience}"
             
             # LangGraph 워크플로우 실행
+            from agent.agents.interview_question_workflow import generate_comprehensive_interview_questions
             workflow_result = generate_comprehensive_interview_questions(
                 resume_text=resume_text,
                 job_info="",
@@ -70,9 +70,11 @@ class QuestionGenerationScheduler:
                     logger.error(f"공고 {job_post.id} 공통 질문 생성 실패: {str(e)}")
             
             logger.info(f"공통 질문 생성 완료: {len(new_job_posts)}개 공고, {total_questions}개 질문")
+            return total_questions
             
         except Exception as e:
             logger.error(f"공통 질문 생성 스케줄러 오류: {str(e)}")
+            raise
         finally:
             db.close()
     
@@ -107,15 +109,17 @@ class QuestionGenerationScheduler:
                     logger.error(f"공고 {job_post.id} 개별 질문 생성 실패: {str(e)}")
             
             logger.info(f"개별 질문 생성 완료: {len(scheduled_job_posts)}개 공고, {total_questions}개 질문")
+            return total_questions
             
         except Exception as e:
             logger.error(f"개별 질문 생성 스케줄러 오류: {str(e)}")
+            raise
         finally:
             db.close()
     
     @staticmethod
     def run_scheduler():
-        """스케줄러 실행 (main.py에서 호출됨)"""
+        """단독 실행용 스케줄러 (서버에서는 app.scheduler.jobs 에 등록되어 리더 워커에서만 실행됨)"""
         logger.info("면접 질문 생성 스케줄러 시작")
         
         try:
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+서버 시작(import) 시간 벤치마크 (-X importtime)
+
+backend(app.main) / agent(agent.main) 를 새 인터프리터에서 import 하면서 -X importtime 출력을 모아
+전체 import 시간, 누적 시간이 큰 모듈 상위 N개, 시작 시 불러온 무거운 패키지(torch, whisper,
+sentence-transformers, sklearn, LangChain, Chroma, weasyprint ...)를 보여준다.
+무거운 패키지는 첫 사용 시(또는 agent 의 백그라운드 워밍업에서) import 해야 하므로
+--fail-on-heavy / --max-seconds 로 지연 import 가 깨졌는지 확인할 수 있다.
+
+    python backend/app/scripts/benchmark_import_time.py --target backend agent --top 20
+    python backend/app/scripts/benchmark_import_time.py --target agent --repeat 3 --fail-on-heavy
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# docker-compose 와 같은 import 경로 (backend: /app = backend, agent 는 /app/agent 로 마운트)
+TARGETS = {
+    "backend": {"module": "app.main", "cwd": REPO_ROOT / "backend", "path": [REPO_ROOT / "backend", REPO_ROOT]},
+    "agent": {"module": "agent.main", "cwd": REPO_ROOT, "path": [REPO_ROOT, REPO_ROOT / "agent"]},
+}
+
+# 시작 시 import 되면 안 되는 패키지 (최상위 패키지 이름)
+HEAVY_PACKAGES = (
+    "torch", "torchaudio", "whisper", "transformers", "sentence_transformers", "sklearn", "hdbscan",
+    "pandas", "librosa", "pyannote", "langchain", "langchain_openai", "langchain_community",
+    "langgraph", "chromadb", "weasyprint", "cv2", "mediapipe",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+_WALL_MARKER = "__import_wall_seconds__="
+
+
+def run_once(target: str) -> Tuple[Optional[float], List[Tuple[str, int, int, int]], str]:
+    """대상 모듈을 새 프로세스에서 import → (wall 초, [(모듈, self us, cumulative us, 깊이)], 오류 출력)"""
+    config = TARGETS[target]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(path) for path in config["path"]] + [env.get("PYTHONPATH", "")]).rstrip(os.pathsep)
+    code = (
+        "import time; started = time.perf_counter(); "
+        f"import {config['module']}; "
+        f"print('{_WALL_MARKER}' + str(time.perf_counter() - started))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=config["cwd"], env=env, capture_output=True, text=True
+    )
+
+    entries = []
+    errors = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+        elif not line.startswith("import time:"):
+            errors.append(line)
+
+    wall = None
+    for line in completed.stdout.splitlines():
+        if line.startswith(_WALL_MARKER):
+            wall = float(line[len(_WALL_MARKER):])
+    return wall, entries, "\n".join(errors[-20:]) if completed.returncode else ""
+
+
+def heavy_packages(entries: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """시작 시 불러온 무거운 패키지 → 최상위 패키지 import 누적 시간(us)"""
+    loaded = {}
+    for module, _, cumulative_us, _ in entries:
+        if module in HEAVY_PACKAGES and module not in loaded:
+            loaded[module] = cumulative_us
+    return loaded
+
+
+def report(target: str, repeat: int, top: int) -> Tuple[Optional[float], Dict[str, int]]:
+    walls = []
+    entries: List[Tuple[str, int, int, int]] = []
+    for _ in range(repeat):
+        wall, entries, error = run_once(target)
+        if wall is None:
+            print(f"[{target}] import 실패\n{error}")
+            return None, {}
+        walls.append(wall)
+
+    best = min(walls)
+    print(f"\n[{target}] import {TARGETS[target]['module']}: "
+          f"최소 {best:.2f}s / 평균 {sum(walls) / len(walls):.2f}s ({repeat}회), 모듈 {len(entries)}개")
+
+    print(f"  누적 시간 상위 {top}개 (마지막 실행 기준)")
+    for module, self_us, cumulative_us, depth in sorted(entries, key=lambda item: item[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:9.1f}ms  self {self_us / 1000:7.1f}ms  {'  ' * min(depth, 6)}{module}")
+
+    loaded = heavy_packages(entries)
+    if loaded:
+        print("  시작 시 불러온 무거운 패키지: " + ", ".join(
+            f"{name}({cumulative_us / 1000:.0f}ms)" for name, cumulative_us in sorted(loaded.items(), key=lambda item: -item[1])
+        ))
+    else:
+        print("  시작 시 불러온 무거운 패키지: 없음")
+    return best, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="backend / agent 서버 import 시간 벤치마크")
+    parser.add_argument("--target", nargs="+", choices=sorted(TARGETS), default=["backend", "agent"])
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--max-seconds", type=float, default=None, help="import 시간이 이보다 길면 실패")
+    parser.add_argument("--fail-on-heavy", action="store_true", help="무거운 패키지를 시작 시 불러오면 실패")
+    args = parser.parse_args()
+
+    failed = False
+    for target in args.target:
+        best, loaded = report(target, max(1, args.repeat), args.top)
+        if best is None:
+            failed = True
+            continue
+        if args.max_seconds is not None and best > args.max_seconds:
+            print(f"  ❌ {best:.2f}s > --max-seconds {args.max_seconds}")
+            failed = True
+        if args.fail_on_heavy and loaded:
+            print(f"  ❌ 무거운 패키지를 시작 시 불러옴: {', '.join(sorted(loaded))}")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+로컬 표절 인덱스(MinHash/LSH) 조회 벤치마크
+
+임의 단어로 만든 이력서 n 개로 인덱스를 구성한 뒤, 새 이력서 한 건의 후보 조회
+(shingle 해시 + MinHash + band 조회, detect_plagiarism 에서 DB 원문 대조 전 단계) 시간을 잰다.
+질의의 절반에는 색인된 이력서의 문단 하나를 복사해 넣어 후보로 잡히는지도 확인한다.
+
+    cd backend && python -m app.scripts.benchmark_plagiarism_index --sizes 10000 100000
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from app.utils.minhash_lsh import PersistentLSHIndex
+
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+PARAGRAPHS_PER_RESUME = 6
+WORDS_PER_PARAGRAPH = 60
+
+
+def make_vocabulary(rng: np.random.Generator, size: int = 5000):
+    return ["".join(rng.choice(SYLLABLES, size=rng.integers(2, 5))) for _ in range(size)]
+
+
+def make_paragraph(vocabulary, rng: np.random.Generator) -> str:
+    return " ".join(vocabulary[i] for i in rng.integers(0, len(vocabulary), size=WORDS_PER_PARAGRAPH))
+
+
+def make_resume(vocabulary, rng: np.random.Generator):
+    return [make_paragraph(vocabulary, rng) for _ in range(PARAGRAPHS_PER_RESUME)]
+
+
+def run(n: int, queries: int):
+    rng = np.random.default_rng(n)
+    vocabulary = make_vocabulary(rng)
+    resumes = [make_resume(vocabulary, rng) for _ in range(n)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = PersistentLSHIndex(directory)
+        started = time.perf_counter()
+        index.rebuild((resume_id, "\n".join(paragraphs)) for resume_id, paragraphs in enumerate(resumes))
+        build_seconds = time.perf_counter() - started
+        stats = index.stats()
+
+        latencies, planted, found = [], 0, 0
+        for query_number in range(queries):
+            paragraphs = make_resume(vocabulary, rng)
+            source_id = None
+            if query_number % 2 == 0:
+                source_id = int(rng.integers(0, n))
+                paragraphs[int(rng.integers(0, PARAGRAPHS_PER_RESUME))] = resumes[source_id][int(rng.integers(0, PARAGRAPHS_PER_RESUME))]
+                planted += 1
+            started = time.perf_counter()
+            candidates = index.candidates("\n".join(paragraphs), limit=10)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if source_id is not None and any(candidate_id == source_id for candidate_id, _, _ in candidates):
+                found += 1
+
+    p50, p95 = np.percentile(latencies, [50, 95])
+    print(
+        f"n={n:>6}  구성 {build_seconds:7.1f}s  청크 {stats['chunks']:>8}  "
+        f"조회 p50 {p50:6.2f}ms  p95 {p95:6.2f}ms  "
+        f"복사 문단 검출 {found}/{planted}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 표절 인덱스 조회 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        run(n, args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,37 +2,44 @@ from sqlalchemy.orm import Session
 from app.models.ai_insights import AIInsights, AIInsightsComparison
 from app.models.interview_evaluation import InterviewEvaluation, EvaluationType
 from app.models.application import Application
+from app.services.interview_evaluation_summary_service import evaluation_scope
+from sqlalchemy import func
 import sys
 import os
 import json
 import time
+import hashlib
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-# LangGraph 워크플로우 import
+# LangGraph 워크플로우 경로 (워크플로우 모듈은 분석을 실행할 때 import)
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../agent'))
-from agents.ai_insights_workflow import run_ai_insights_analysis
+
+# 점수 통계를 지문(fingerprint)에 넣을 때의 반올림 자릿수 (이보다 작은 변화로는 재생성하지 않음)
+FINGERPRINT_PRECISION = 1
+SCORE_BUCKET_SIZE = 10
+
+EVALUATION_STAGES = (
+    ("ai", EvaluationType.AI),
+    ("practical", EvaluationType.PRACTICAL),
+    ("executive", EvaluationType.EXECUTIVE),
+)
+
+
+def _to_float(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
 
 class AIInsightsService:
     
     @staticmethod
     def get_or_create_ai_insights(db: Session, job_post_id: int, force_regenerate: bool = False) -> Dict[str, Any]:
-        """AI 인사이트 조회 또는 생성"""
+        """AI 인사이트 조회 또는 생성
+
+        입력 통계의 지문이 같은 완료된 분석이 있으면 LLM 을 호출하지 않고 그대로 반환한다.
+        """
         try:
-            # 기존 분석 결과 확인
-            existing_insights = db.query(AIInsights).filter(
-                AIInsights.job_post_id == job_post_id,
-                AIInsights.analysis_type == "advanced"
-            ).order_by(AIInsights.created_at.desc()).first()
-            
-            # 강제 재생성이 아니고 최근 분석이 있으면 반환
-            if not force_regenerate and existing_insights:
-                # 24시간 이내 분석이면 재사용
-                time_diff = datetime.now() - existing_insights.created_at
-                if time_diff.total_seconds() < 86400:  # 24시간
-                    return existing_insights.to_dict()
-            
-            # 면접 데이터 수집
+            # 면접 데이터 수집 (SQL 집계)
             interview_data = AIInsightsService._collect_interview_data(db, job_post_id)
             
             if not interview_data.get("has_data"):
@@ -41,16 +48,33 @@ class AIInsightsService:
                     "job_post_id": job_post_id
                 }
             
+            fingerprint = AIInsightsService._fingerprint(interview_data)
+            
+            # 강제 재생성이 아니고 같은 입력으로 만든 분석이 있으면 재사용
+            if not force_regenerate:
+                existing_insights = db.query(AIInsights).filter(
+                    AIInsights.job_post_id == job_post_id,
+                    AIInsights.analysis_type == "advanced",
+                    AIInsights.analysis_status == "completed",
+                    AIInsights.input_fingerprint == fingerprint
+                ).order_by(AIInsights.created_at.desc()).first()
+                if existing_insights:
+                    return existing_insights.to_dict()
+            
             # LangGraph 워크플로우 실행
+            from agents.ai_insights_workflow import run_ai_insights_analysis
             start_time = time.time()
             langgraph_result = run_ai_insights_analysis(job_post_id, interview_data)
             execution_time = time.time() - start_time
+            if langgraph_result.get("error"):
+                raise ValueError(langgraph_result["error"])
             
             # DB에 저장
             db_insights = AIInsights(
                 job_post_id=job_post_id,
                 analysis_type="advanced",
                 analysis_status="completed",
+                input_fingerprint=fingerprint,
                 langgraph_execution_id=f"lg_{job_post_id}_{int(time.time())}",
                 execution_time=execution_time,
                 score_analysis=langgraph_result.get("insights", {}).get("basic", {}).get("score_distribution"),
@@ -87,62 +111,123 @@ class AIInsightsService:
                 "job_post_id": job_post_id
             }
     
+    @staticmethod
+    def _fingerprint(interview_data: Dict[str, Any]) -> str:
+        """입력 통계 지문 (개수·분포는 그대로, 평균/표준편차 등은 반올림해 미세한 변화는 무시)"""
+        def quantize(value):
+            if isinstance(value, float):
+                return round(value, FINGERPRINT_PRECISION)
+            if isinstance(value, dict):
+                return {key: quantize(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [quantize(item) for item in value]
+            return value
+        
+        payload = {
+            key: quantize(interview_data.get(key))
+            for key in ("total_applicants", "applicant_score_mean", "score_stats", "status_counts", "evaluation_counts")
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+    
+    @staticmethod
+    def _collect_score_stats(db: Session, job_post_id: int, evaluation_type: EvaluationType) -> Dict[str, Any]:
+        """한 면접 단계의 점수 통계 (10점 구간별 GROUP BY 한 번, 점수 없는 평가는 bucket NULL 로 묶임)"""
+        scope = evaluation_scope(db, job_post_id, evaluation_type)
+        score = InterviewEvaluation.total_score
+        bucket = func.floor(score / SCORE_BUCKET_SIZE) * SCORE_BUCKET_SIZE
+        rows = db.query(
+            bucket,
+            func.count(InterviewEvaluation.id),
+            func.count(score),
+            func.sum(score),
+            func.sum(score * score),
+            func.min(score),
+            func.max(score)
+        ).join(
+            scope, scope.c.interview_id == InterviewEvaluation.interview_id
+        ).filter(
+            InterviewEvaluation.evaluation_type == evaluation_type
+        ).group_by(bucket).all()
+        
+        evaluations = scored = 0
+        total = total_sq = 0.0
+        minimum = maximum = None
+        histogram = {}
+        for bucket_value, evaluation_count, scored_count, score_sum, score_sq_sum, score_min, score_max in rows:
+            evaluations += evaluation_count
+            if not scored_count:
+                continue
+            scored += scored_count
+            total += float(score_sum)
+            total_sq += float(score_sq_sum)
+            minimum = float(score_min) if minimum is None else min(minimum, float(score_min))
+            maximum = float(score_max) if maximum is None else max(maximum, float(score_max))
+            histogram[str(int(bucket_value))] = scored_count
+        
+        mean = total / scored if scored else 0
+        variance = max(total_sq / scored - mean * mean, 0) if scored else 0
+        return {
+            "evaluations": evaluations,
+            "count": scored,
+            "mean": mean,
+            "stddev": variance ** 0.5,
+            "min": minimum,
+            "max": maximum,
+            "histogram": dict(sorted(histogram.items(), key=lambda item: int(item[0])))
+        }
+    
     @staticmethod
     def _collect_interview_data(db: Session, job_post_id: int) -> Dict[str, Any]:
-        """면접 데이터 수집"""
+        """면접 데이터 수집 (지원자 상태 분포 + 단계별 점수 통계를 SQL 로 집계)"""
         try:
-            # 지원자 정보 수집
-            applications = db.query(Application).filter(
+            # 지원자 상태 조합별 인원/점수 합계 (GROUP BY 한 번)
+            status_rows = db.query(
+                Application.status,
+                Application.document_status,
+                Application.interview_status,
+                Application.final_status,
+                func.count(Application.id),
+                func.count(Application.score),
+                func.sum(Application.score)
+            ).filter(
                 Application.job_post_id == job_post_id
+            ).group_by(
+                Application.status, Application.document_status,
+                Application.interview_status, Application.final_status
             ).all()
             
-            if not applications:
+            total_applicants = sum(row[4] for row in status_rows)
+            if not total_applicants:
                 return {"has_data": False}
             
-            # 면접 평가 데이터 수집
-            ai_evaluations = db.query(InterviewEvaluation).filter(
-                InterviewEvaluation.evaluation_type == EvaluationType.AI
-            ).all()
-            
-            practical_evaluations = db.query(InterviewEvaluation).filter(
-                InterviewEvaluation.evaluation_type == EvaluationType.PRACTICAL
-            ).all()
-            
-            executive_evaluations = db.query(InterviewEvaluation).filter(
-                InterviewEvaluation.evaluation_type == EvaluationType.EXECUTIVE
-            ).all()
-            
-            # 점수 데이터 추출
-            ai_scores = [e.total_score for e in ai_evaluations if e.total_score is not None]
-            practical_scores = [e.total_score for e in practical_evaluations if e.total_score is not None]
-            executive_scores = [e.total_score for e in executive_evaluations if e.total_score is not None]
-            
-            # 지원자 상세 정보
-            applicants_data = []
-            for app in applications:
-                applicant_data = {
-                    "id": app.id,
-                    "user_id": app.user_id,
-                    "status": app.status.value if app.status else None,
-                    "document_status": app.document_status.value if app.document_status else None,
-                    "interview_status": app.interview_status.value if app.interview_status else None,
-                    "final_status": app.final_status.value if app.final_status else None,
-                    "score": app.score
-                }
-                applicants_data.append(applicant_data)
+            status_counts = {"status": {}, "document_status": {}, "interview_status": {}, "final_status": {}}
+            scored_applicants = 0
+            score_sum = 0.0
+            for status, document_status, interview_status, final_status, count, scored, total in status_rows:
+                for column, value in (("status", status), ("document_status", document_status),
+                                      ("interview_status", interview_status), ("final_status", final_status)):
+                    key = value.value if value else None
+                    status_counts[column][key] = status_counts[column].get(key, 0) + count
+                scored_applicants += scored
+                score_sum += _to_float(total) or 0
+            for column in status_counts:
+                status_counts[column] = dict(sorted(status_counts[column].items(), key=lambda item: str(item[0])))
+            
+            # 면접 단계별 점수 통계 (해당 공고 평가만)
+            score_stats = {
+                stage: AIInsightsService._collect_score_stats(db, job_post_id, evaluation_type)
+                for stage, evaluation_type in EVALUATION_STAGES
+            }
             
             return {
                 "has_data": True,
                 "job_post_id": job_post_id,
-                "total_applicants": len(applications),
-                "ai_scores": ai_scores,
-                "practical_scores": practical_scores,
-                "executive_scores": executive_scores,
-                "all_applicants": applicants_data,
+                "total_applicants": total_applicants,
+                "score_stats": score_stats,
+                "status_counts": status_counts,
+                "applicant_score_mean": score_sum / scored_applicants if scored_applicants else None,
                 "evaluation_counts": {
-                    "ai": len(ai_evaluations),
-                    "practical": len(practical_evaluations),
-                    "executive": len(executive_evaluations)
+                    stage: stats["evaluations"] for stage, stats in score_stats.items()
                 }
             }
             
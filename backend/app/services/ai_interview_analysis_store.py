@@ -0,0 +1,243 @@
+"""
+AI 면접 분석 데이터 저장소
+
+ai_interview_applicant_evaluation_extended.json 을 지원자마다 통째로 json.load 하고 선형 탐색하던 방식 대신,
+파일을 한 번만 읽어 applicant_id 를 PRIMARY KEY 로 하는 SQLite 테이블(항목별 컬럼)로 적재한다.
+
+- 조회는 키 조회(get) / IN 조회(get_many) 로 처리
+- 원본 파일의 (mtime, size) 를 meta 테이블에 기록해 두고, 바뀌면 자동으로 다시 적재
+- SQLite 파일은 캐시 디렉터리에 두므로 배치 스크립트가 새 프로세스로 실행돼도 재파싱하지 않음
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DATA_FILENAME = 'ai_interview_applicant_evaluation_extended.json'
+
+# 응답에 값이 없을 때 쓰는 기본값 (컬럼 순서 = SQLite 테이블 컬럼 순서)
+ANALYSIS_DEFAULTS: Dict[str, float] = {
+    # 기본 항목들
+    "speech_rate": 150.0,
+    "smile_frequency": 1.0,
+    "eye_contact_ratio": 0.8,
+    "redundancy_score": 0.05,
+    "total_silence_time": 1.0,
+
+    # 음성/화법 확장 항목들
+    "pronunciation_score": 0.85,
+    "volume_level": 0.75,
+    "emotion_variation": 0.6,
+    "intonation_score": 0.7,
+    "background_noise_level": 0.1,
+
+    # 비언어적 행동 확장 항목들
+    "hand_gesture": 0.5,
+    "nod_count": 2,
+    "posture_changes": 2,
+    "eye_aversion_count": 1,
+    "facial_expression_variation": 0.6,
+
+    # 상호작용 확장 항목들
+    "question_understanding_score": 0.8,
+    "conversation_flow_score": 0.75,
+    "interaction_score": 0.75,
+
+    # 언어/내용 확장 항목들
+    "positive_word_ratio": 0.6,
+    "negative_word_ratio": 0.1,
+    "technical_term_count": 5,
+    "grammar_error_count": 1,
+    "conciseness_score": 0.7,
+    "creativity_score": 0.6,
+    "stress_signal_score": 0.3,
+    "visual_distraction_score": 0.15,
+    "language_switch_count": 0,
+    "emotion_consistency_score": 0.8
+}
+ANALYSIS_FIELDS: Tuple[str, ...] = tuple(ANALYSIS_DEFAULTS)
+
+CACHE_DIR = os.getenv(
+    "AI_INTERVIEW_ANALYSIS_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "kocruit_ai_interview_analysis")
+)
+SCHEMA_VERSION = "1"
+
+# SQLite 바인딩 변수 제한(기본 999)보다 작게 IN 조회를 나눈다
+_IN_CHUNK_SIZE = 500
+
+
+def default_data_paths() -> List[str]:
+    """기본 JSON 파일 탐색 경로 (Docker 컨테이너 / 로컬 실행 순)"""
+    return [
+        os.path.join('/app/data', DATA_FILENAME),  # Docker 컨테이너 내부
+        os.path.join('/app/backend/data', DATA_FILENAME),  # 백엔드 디렉토리 내부
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data', DATA_FILENAME),  # 상대 경로
+        os.path.join('data', DATA_FILENAME),  # 현재 디렉토리 기준
+        os.path.join('..', 'data', DATA_FILENAME),  # 상위 디렉토리
+    ]
+
+
+def resolve_data_path(json_path: Optional[str] = None) -> str:
+    """JSON 파일 경로 결정 (json_path 가 없으면 기본 경로들을 차례로 확인)"""
+    if json_path is not None:
+        return json_path
+    possible_paths = default_data_paths()
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    raise ValueError(f"JSON 파일을 찾을 수 없습니다. 시도한 경로: {possible_paths}")
+
+
+class AIInterviewAnalysisStore:
+    """JSON 한 파일에 대응하는 SQLite 키 조회 저장소"""
+
+    def __init__(self, json_path: str, cache_dir: str = CACHE_DIR):
+        self.json_path = os.path.abspath(json_path)
+        digest = hashlib.sha1(self.json_path.encode()).hexdigest()[:16]
+        self.db_path = os.path.join(cache_dir, f"analysis_{digest}.sqlite3")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._source_version: Optional[str] = None
+
+    @staticmethod
+    def _file_version(path: str) -> str:
+        stat = os.stat(path)
+        return f"{SCHEMA_VERSION}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _build(self, version: str) -> None:
+        """JSON 을 한 번 파싱해 임시 파일에 적재한 뒤 교체 (다른 프로세스가 읽는 중이어도 안전)"""
+        try:
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            raise ValueError(f"JSON 파일 로드 실패: {e}")
+
+        rows = []
+        for applicant_data in data:
+            applicant_id = applicant_data.get('applicant_id')
+            if applicant_id is None:
+                continue
+            responses = applicant_data.get('responses') or []
+            # 첫 번째 응답 사용 (현재는 각 지원자당 1개 응답)
+            response = responses[0] if responses else {}
+            rows.append((applicant_id, 1 if responses else 0, *(response.get(field) for field in ANALYSIS_FIELDS)))
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.db_path), suffix=".tmp")
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp_path)
+            # 컬럼 타입을 지정하지 않아 정수/실수가 JSON 원본 그대로 보존된다
+            columns = ", ".join(ANALYSIS_FIELDS)
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute(f"CREATE TABLE analysis (applicant_id INTEGER PRIMARY KEY, has_response INTEGER, {columns})")
+            placeholders = ", ".join("?" * (len(ANALYSIS_FIELDS) + 2))
+            # 같은 applicant_id 가 여러 번 있으면 기존 선형 탐색처럼 첫 번째 것을 사용
+            conn.executemany(f"INSERT OR IGNORE INTO analysis VALUES ({placeholders})", rows)
+            conn.execute("INSERT INTO meta VALUES ('source_version', ?)", (version,))
+            conn.commit()
+            conn.close()
+            os.replace(tmp_path, self.db_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        print(f"✅ AI 면접 분석 데이터 적재: {len(rows)}개 지원자 ({self.json_path})")
+
+    def _stored_version(self) -> Optional[str]:
+        if not os.path.exists(self.db_path):
+            return None
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'source_version'").fetchone()
+            finally:
+                conn.close()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    def _connection(self) -> sqlite3.Connection:
+        """원본 파일이 바뀌었으면 다시 적재하고 읽기 연결 반환 (호출마다 stat 한 번)"""
+        version = self._file_version(self.json_path)
+        if self._conn is not None and self._source_version == version:
+            return self._conn
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._stored_version() != version:
+            self._build(version)
+        self._conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+        self._source_version = version
+        return self._conn
+
+    @staticmethod
+    def _to_analysis(row: tuple) -> Dict[str, Any]:
+        return {
+            field: (value if value is not None else ANALYSIS_DEFAULTS[field])
+            for field, value in zip(ANALYSIS_FIELDS, row)
+        }
+
+    def get(self, applicant_id: int) -> Dict[str, Any]:
+        """지원자 한 명의 분석 데이터 (없으면 ValueError)"""
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT has_response, {', '.join(ANALYSIS_FIELDS)} FROM analysis WHERE applicant_id = ?",
+                (applicant_id,)
+            ).fetchone()
+        if row is None:
+            raise ValueError(f"지원자 ID {applicant_id}를 찾을 수 없습니다")
+        if not row[0]:
+            raise ValueError(f"지원자 {applicant_id}의 응답 데이터가 없습니다")
+        return self._to_analysis(row[1:])
+
+    def get_many(self, applicant_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """여러 지원자의 분석 데이터 {applicant_id: 분석 데이터} (없거나 응답이 없는 지원자는 제외)"""
+        ids = list(dict.fromkeys(applicant_ids))
+        result: Dict[int, Dict[str, Any]] = {}
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(ids), _IN_CHUNK_SIZE):
+                chunk = ids[start:start + _IN_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT applicant_id, {', '.join(ANALYSIS_FIELDS)} FROM analysis "
+                    f"WHERE has_response = 1 AND applicant_id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for row in rows:
+                    result[row[0]] = self._to_analysis(row[1:])
+        return result
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+
+
+_stores: Dict[str, AIInterviewAnalysisStore] = {}
+_stores_lock = threading.Lock()
+_default_path: Optional[str] = None
+
+
+def get_analysis_store(json_path: Optional[str] = None) -> AIInterviewAnalysisStore:
+    """JSON 경로별 저장소 싱글톤 (기본 경로 탐색은 프로세스당 한 번)"""
+    global _default_path
+    if json_path is None:
+        if _default_path is None or not os.path.exists(_default_path):
+            _default_path = resolve_data_path()
+            print(f"📁 JSON 파일 경로: {_default_path}")
+        json_path = _default_path
+
+    key = os.path.abspath(json_path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = AIInterviewAnalysisStore(key)
+                _stores[key] = store
+    return store
@@ -3,6 +3,7 @@ import os
 from app.models.interview_evaluation import InterviewEvaluation, InterviewEvaluationItem, EvaluationStatus, EvaluationType
 from app.models.schedule import Schedule, ScheduleInterview, InterviewScheduleStatus
 from app.models.application import InterviewStatus
+from app.services.ai_interview_analysis_store import get_analysis_store, resolve_data_path
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -168,25 +169,12 @@ def get_grade_and_reason_stress(stress_signal_score):
         return "하", "스트레스 신호가 많음"
 
 def load_ai_interview_data(json_path: str = None):
-    """AI 면접 평가 데이터 로드 (확장된 버전 사용)"""
-    if json_path is None:
-        # Docker 컨테이너 내부 경로 설정
-        # /app 디렉토리에서 backend/data/ai_interview_applicant_evaluation_extended.json 찾기
-        possible_paths = [
-            '/app/data/ai_interview_applicant_evaluation_extended.json',  # Docker 컨테이너 내부
-            '/app/backend/data/ai_interview_applicant_evaluation_extended.json',  # 백엔드 디렉토리 내부
-            os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'ai_interview_applicant_evaluation_extended.json'),  # 상대 경로
-            'data/ai_interview_applicant_evaluation_extended.json',  # 현재 디렉토리 기준
-            '../data/ai_interview_applicant_evaluation_extended.json',  # 상위 디렉토리
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                json_path = path
-                print(f"📁 JSON 파일 경로: {json_path}")
-                break
-        else:
-            raise ValueError(f"JSON 파일을 찾을 수 없습니다. 시도한 경로: {possible_paths}")
+    """AI 면접 평가 데이터 전체 로드 (확장된 버전 사용)
+
+    지원자 단위 조회는 get_applicant_analysis_data / get_applicants_analysis_data 를 사용한다.
+    """
+    json_path = resolve_data_path(json_path)
+    print(f"📁 JSON 파일 경로: {json_path}")
     
     try:
         with open(json_path, 'r', encoding='utf-8') as f:
@@ -197,60 +185,15 @@ def load_ai_interview_data(json_path: str = None):
         raise ValueError(f"JSON 파일 로드 실패: {e}")
 
 def get_applicant_analysis_data(applicant_id: int, json_path: str = None):
-    """특정 지원자의 분석 데이터 조회 (확장된 24개 항목)"""
-    data = load_ai_interview_data(json_path)
-    
-    for applicant_data in data:
-        if applicant_data.get('applicant_id') == applicant_id:
-            responses = applicant_data.get('responses', [])
-            if not responses:
-                raise ValueError(f"지원자 {applicant_id}의 응답 데이터가 없습니다")
-            
-            # 첫 번째 응답 사용 (현재는 각 지원자당 1개 응답)
-            response = responses[0]
-            
-            # 모든 평가 항목 반환
-            return {
-                # 기본 항목들
-                "speech_rate": response.get('speech_rate', 150.0),
-                "smile_frequency": response.get('smile_frequency', 1.0),
-                "eye_contact_ratio": response.get('eye_contact_ratio', 0.8),
-                "redundancy_score": response.get('redundancy_score', 0.05),
-                "total_silence_time": response.get('total_silence_time', 1.0),
-                
-                # 음성/화법 확장 항목들
-                "pronunciation_score": response.get('pronunciation_score', 0.85),
-                "volume_level": response.get('volume_level', 0.75),
-                "emotion_variation": response.get('emotion_variation', 0.6),
-                "intonation_score": response.get('intonation_score', 0.7),
-                "background_noise_level": response.get('background_noise_level', 0.1),
-                
-                # 비언어적 행동 확장 항목들
-                "hand_gesture": response.get('hand_gesture', 0.5),
-                "nod_count": response.get('nod_count', 2),
-                "posture_changes": response.get('posture_changes', 2),
-                "eye_aversion_count": response.get('eye_aversion_count', 1),
-                "facial_expression_variation": response.get('facial_expression_variation', 0.6),
-                
-                # 상호작용 확장 항목들
-                "question_understanding_score": response.get('question_understanding_score', 0.8),
-                "conversation_flow_score": response.get('conversation_flow_score', 0.75),
-                "interaction_score": response.get('interaction_score', 0.75),
-                
-                # 언어/내용 확장 항목들
-                "positive_word_ratio": response.get('positive_word_ratio', 0.6),
-                "negative_word_ratio": response.get('negative_word_ratio', 0.1),
-                "technical_term_count": response.get('technical_term_count', 5),
-                "grammar_error_count": response.get('grammar_error_count', 1),
-                "conciseness_score": response.get('conciseness_score', 0.7),
-                "creativity_score": response.get('creativity_score', 0.6),
-                "stress_signal_score": response.get('stress_signal_score', 0.3),
-                "visual_distraction_score": response.get('visual_distraction_score', 0.15),
-                "language_switch_count": response.get('language_switch_count', 0),
-                "emotion_consistency_score": response.get('emotion_consistency_score', 0.8)
-            }
-    
-    raise ValueError(f"지원자 ID {applicant_id}를 찾을 수 없습니다")
+    """특정 지원자의 분석 데이터 조회 (확장된 24개 항목)
+
+    JSON 은 파일이 바뀌었을 때만 다시 파싱되고, 조회는 SQLite 키 조회로 처리된다.
+    """
+    return get_analysis_store(json_path).get(applicant_id)
+
+def get_applicants_analysis_data(applicant_ids, json_path: str = None):
+    """여러 지원자의 분석 데이터를 한 번에 조회 {applicant_id: 분석 데이터} (배치 평가용)"""
+    return get_analysis_store(json_path).get_many(applicant_ids)
 
 def create_ai_interview_schedule(db: Session, application_id: int, job_post_id: int):
     """AI 면접용 ai_interview_schedule 자동 생성"""
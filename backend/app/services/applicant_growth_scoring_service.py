@@ -1,13 +1,12 @@
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 import numpy as np
 import re
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../agent'))
-from agent.agents.pattern_summary_node import PatternSummaryNode
-from langchain_openai import ChatOpenAI
 import json
+from app.models.resume_profile import ResumeProfile
 
 logger = logging.getLogger(__name__)
 
@@ -54,11 +53,19 @@ class ApplicantGrowthScoringService:
             "certifications": 0.1
         }
     
-    def normalize_applicant_specs(self, specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def normalize_applicant_specs(self, specs: Union[ResumeProfile, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
-        지원자 스펙(specs) 리스트를 정규화된 dict로 변환
+        지원자 스펙(specs) 리스트 또는 이력서 프로필(ResumeProfile)을 정규화된 dict로 변환
         Returns: {degree, certifications_count, promotion_speed, kpi, experience_years}
         """
+        if isinstance(specs, ResumeProfile):
+            return {
+                "degree": specs.degree_score,
+                "certifications_count": specs.certificate_count or 0,
+                "promotion_speed": specs.promotion_speed_years,
+                "kpi": specs.kpi_score,
+                "experience_years": specs.experience_years or 0.0,
+            }
         degree = 0.0
         certifications_count = 0
         promotion_speed = None
@@ -95,7 +102,7 @@ class ApplicantGrowthScoringService:
             "experience_years": experience_years,
         }
     
-    def score_applicant(self, applicant_specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def score_applicant(self, applicant_specs: Union[ResumeProfile, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
         지원자 스펙과 고성과자 통계 비교, 성장 가능성 점수 산출
         Returns: {total_score, detail: {항목별 점수, raw 값, 평균 대비 % 등}, comparison_chart_data, detail_explanation}
@@ -207,6 +214,7 @@ class ApplicantGrowthScoringService:
         # 주요 근거 생성 (LLM 기반)
         llm_reasons = []
         try:
+            from langchain_openai import ChatOpenAI
             llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.3)
             prompt = f"""
 지원자와 고성과자 평균을 비교해 성장 가능성 점수를 산출했습니다.
@@ -339,6 +347,7 @@ class ApplicantGrowthScoringService:
         # LLM 기반 점수 구조 설명 생성
         llm_narrative = None
         try:
+            from langchain_openai import ChatOpenAI
             llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.3)
             # 표 데이터를 텍스트 테이블로 변환
             table_str = "| 항목 | 지원자 | 고성과자평균 | 항목점수 | 비중 |\n|---|---|---|---|---|\n"
@@ -0,0 +1,196 @@
+"""
+지원자 상태 일괄 전이 (최종 선발 / 필기 합격 / AI 점수 초기화)
+
+순위 기반 전이를 지원서마다 불러와 Python 에서 바꾸고 커밋하던 방식 대신,
+- 공고 행을 SELECT ... FOR UPDATE 로 잠가 같은 공고의 전이를 직렬화하고
+- 창 함수(ROW_NUMBER / RANK)로 순위를 매긴 파생 테이블과 조인한 UPDATE 한 문장으로 처리한다.
+
+이미 목표 상태인 행은 건드리지 않으므로 여러 번 호출해도 결과가 같고(멱등),
+바뀐 지원서 목록을 반환한다. 커밋 후에는 공고 단위로 변경 이벤트 하나를 발행해
+지원자 목록 캐시를 무효화하고 Redis 채널로 알린다.
+"""
+import json
+import logging
+from typing import Any, Dict, List
+
+import redis
+from sqlalchemy import and_, case, event, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import redis_client
+from app.models.application import Application, DocumentStatus, FinalStatus, WrittenTestStatus
+from app.models.job import JobPost
+from app.utils.llm_cache import invalidate_cache
+
+logger = logging.getLogger(__name__)
+
+TRANSITION_CHANNEL = "application:transitions"
+WRITTEN_TEST_PASS_MULTIPLIER = 5  # 필기 합격: 모집 인원의 5배수
+
+_PENDING_KEY = "application_transition_events"
+
+# 전이 후 무효화할 지원자 목록 캐시 (app.utils.llm_cache 의 api_cache 키, ID 인자가 키에 드러남)
+_APPLICANT_CACHE_PATTERNS = (
+    "api_cache:get_applicants_by_job:*job_post_id_{job_post_id}:*",
+    "api_cache:get_applicants_with_interview:*job_post_id_{job_post_id}:*",
+    "api_cache:get_applicants_with_ai_interview:*job_post_id_{job_post_id}:*",
+    "api_cache:get_applicants_with_second_interview:*job_post_id_{job_post_id}:*",
+)
+
+
+def _lock_job_post(db: Session, job_post_id: int):
+    """공고 행 잠금 (같은 공고의 동시 전이는 커밋 순서대로 하나씩 실행됨)"""
+    return db.query(JobPost).filter(JobPost.id == job_post_id).with_for_update().first()
+
+
+def _apply(db: Session, ranked, target, changed_filter) -> List[int]:
+    """순위 파생 테이블 기준으로 바뀔 행을 조회한 뒤 한 번의 UPDATE 로 반영"""
+    changed_ids = [row[0] for row in db.query(ranked.c.id).filter(changed_filter).all()]
+    if changed_ids:
+        db.execute(
+            update(Application).where(Application.id == ranked.c.id, changed_filter).values(**target),
+            execution_options={"synchronize_session": False}
+        )
+    return changed_ids
+
+
+def _queue_event(db: Session, job_post_id: int, transition: str, data: Dict[str, Any]):
+    """커밋 후 발행할 전이 이벤트 등록 (롤백되면 버림)"""
+    db.info.setdefault(_PENDING_KEY, []).append({"job_post_id": job_post_id, "transition": transition, **data})
+
+
+def publish_transition_events(events: List[Dict[str, Any]]):
+    """지원자 목록 캐시 무효화 + 전이 이벤트 발행 (Redis 오류는 로그만)"""
+    for job_post_id in {item["job_post_id"] for item in events}:
+        for pattern in _APPLICANT_CACHE_PATTERNS:
+            invalidate_cache(pattern.format(job_post_id=job_post_id))
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            for item in events:
+                pipe.publish(TRANSITION_CHANNEL, json.dumps(item, ensure_ascii=False, default=str))
+            pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"지원자 상태 전이 이벤트 발행 실패: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session):
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        publish_transition_events(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+class ApplicationTransitionService:
+
+    @staticmethod
+    def select_final_candidates(db: Session, job_post_id: int) -> Dict[str, Any]:
+        """headcount 만큼 최종 선발 (임원 면접 점수가 있는 서류 합격자 중 final_score 순으로 부족분만 추가)
+
+        커밋은 호출한 쪽에서 한다. 공고가 없으면 None 을 반환한다.
+        """
+        job_post = _lock_job_post(db, job_post_id)
+        if not job_post:
+            return None
+
+        headcount = job_post.headcount or 1
+        current_selected = db.query(func.count(Application.id)).filter(
+            Application.job_post_id == job_post_id,
+            Application.final_status == FinalStatus.SELECTED
+        ).scalar()
+        additional_needed = max(0, headcount - current_selected)
+
+        selected_ids: List[int] = []
+        if additional_needed > 0:
+            ranked = select(
+                Application.id.label("id"),
+                func.row_number().over(
+                    order_by=(Application.final_score.is_(None), Application.final_score.desc(), Application.id)
+                ).label("position")
+            ).where(
+                Application.job_post_id == job_post_id,
+                Application.document_status == DocumentStatus.PASSED,
+                Application.final_status != FinalStatus.SELECTED,
+                Application.executive_score.isnot(None)
+            ).subquery()
+            selected_ids = _apply(
+                db, ranked,
+                {"final_status": FinalStatus.SELECTED},
+                ranked.c.position <= additional_needed
+            )
+            if selected_ids:
+                _queue_event(db, job_post_id, "final_selection", {"application_ids": selected_ids})
+
+        return {
+            "headcount": headcount,
+            "current_selected": current_selected,
+            "additional_selected": len(selected_ids),
+            "application_ids": selected_ids
+        }
+
+    @staticmethod
+    def update_written_test_status(db: Session, job_post_id: int) -> Dict[str, Any]:
+        """필기 점수 상위 headcount × 5 명(동점자 포함) PASSED, 나머지 FAILED
+
+        cutoff 번째 점수 이상이면 합격이므로 RANK() <= cutoff 와 같다. 커밋은 호출한 쪽에서 한다.
+        공고가 없으면 None 을 반환한다.
+        """
+        job_post = _lock_job_post(db, job_post_id)
+        if not job_post:
+            return None
+        headcount = job_post.headcount or 1
+        cutoff = headcount * WRITTEN_TEST_PASS_MULTIPLIER
+
+        ranked = select(
+            Application.id.label("id"),
+            func.rank().over(
+                order_by=(Application.written_test_score.is_(None), Application.written_test_score.desc())
+            ).label("position")
+        ).where(Application.job_post_id == job_post_id).subquery()
+
+        target_status = case(
+            (and_(Application.written_test_score.isnot(None), ranked.c.position <= cutoff), WrittenTestStatus.PASSED.value),
+            else_=WrittenTestStatus.FAILED.value
+        )
+        changed_filter = and_(
+            Application.id == ranked.c.id,
+            Application.written_test_status != target_status
+        )
+        changed = db.query(Application.id, target_status).filter(changed_filter).all()
+        if changed:
+            db.execute(
+                update(Application).where(changed_filter).values(written_test_status=target_status),
+                execution_options={"synchronize_session": False}
+            )
+            _queue_event(db, job_post_id, "written_test_status", {
+                "passed_ids": [row[0] for row in changed if row[1] == WrittenTestStatus.PASSED.value],
+                "failed_ids": [row[0] for row in changed if row[1] == WrittenTestStatus.FAILED.value]
+            })
+
+        return {"cutoff": cutoff, "changed": len(changed)}
+
+    @staticmethod
+    def reset_ai_interview_scores(db: Session, job_post_id: int) -> int:
+        """공고 지원자 전체의 AI 면접 전용 필드 초기화 (UPDATE 한 문장, 대상 지원서 수 반환)
+
+        커밋은 호출한 쪽에서 한다.
+        """
+        _lock_job_post(db, job_post_id)
+        reset_count = db.query(func.count(Application.id)).filter(
+            Application.job_post_id == job_post_id
+        ).scalar()
+        if reset_count:
+            db.execute(
+                update(Application).where(Application.job_post_id == job_post_id).values(
+                    ai_interview_score=None,
+                    ai_interview_pass_reason=None,
+                    ai_interview_fail_reason=None
+                ),
+                execution_options={"synchronize_session": False}
+            )
+            _queue_event(db, job_post_id, "ai_scores_reset", {"count": reset_count})
+        return reset_count
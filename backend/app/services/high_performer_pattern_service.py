@@ -1,31 +1,35 @@
 import logging
 from typing import List, Dict, Any, Tuple
 import numpy as np
-import pandas as pd
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-from hdbscan import HDBSCAN
 from sqlalchemy.orm import Session
 
 from app.models.high_performers import HighPerformer
-from app.utils.embedding_utils import TextEmbedder, create_career_text
+from app.utils.embedding_utils import create_career_text, get_text_embedder
 
-# LangGraph 패턴 요약 노드 import
+# LangGraph 패턴 요약 노드 경로 (import 는 요약을 처음 만들 때)
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'agent'))
-from agent.agents.pattern_summary_node import create_pattern_summary_node
 
 logger = logging.getLogger(__name__)
 
 class HighPerformerPatternService:
     """고성과자 패턴 분석 서비스"""
     
+    # sklearn / hdbscan / pandas / sentence-transformers / LangGraph 는 서버 시작 시간을 늘리므로
+    # 분석을 실제로 실행할 때 import 하고, 임베딩 모델은 프로세스 공용 인스턴스를 쓴다
+
     def __init__(self):
-        self.embedder = TextEmbedder()
-        self.scaler = StandardScaler()
-        # LLM 패턴 요약 노드 초기화
-        self.pattern_summary_node = create_pattern_summary_node()
+        self.embedder = get_text_embedder()
+        self._pattern_summary_node = None
+
+    @property
+    def pattern_summary_node(self):
+        """LLM 패턴 요약 노드 (처음 요약할 때 생성)"""
+        if self._pattern_summary_node is None:
+            from agent.agents.pattern_summary_node import create_pattern_summary_node
+            self._pattern_summary_node = create_pattern_summary_node()
+        return self._pattern_summary_node
     
     def get_high_performers_data(self, db: Session) -> List[Dict[str, Any]]:
         """
@@ -95,6 +99,7 @@ class HighPerformerPatternService:
         try:
             if method == "kmeans":
                 # KMeans 클러스터링
+                from sklearn.cluster import KMeans
                 kmeans = KMeans(n_clusters=min(n_clusters, len(embeddings)), random_state=42)
                 cluster_labels = kmeans.fit_predict(embeddings)
                 cluster_centers = kmeans.cluster_centers_
@@ -104,6 +109,7 @@ class HighPerformerPatternService:
                 
             elif method == "hdbscan":
                 # HDBSCAN 클러스터링 (자동 클러스터 수 결정)
+                from hdbscan import HDBSCAN
                 hdbscan = HDBSCAN(min_cluster_size=2, min_samples=1)
                 cluster_labels = hdbscan.fit_predict(embeddings)
                 
@@ -219,6 +225,7 @@ class HighPerformerPatternService:
             stats['certifications_count_mean'] = float(np.mean(cert_counts))
         # 범주형 데이터 빈도
         categorical_fields = ['education_level', 'current_position', 'major']
+        import pandas as pd
         for field in categorical_fields:
             values = [member.get(field) for member in cluster_members if member.get(field)]
             if values:
@@ -0,0 +1,230 @@
+"""
+면접 평가 대시보드 집계
+
+공고별 면접 평가 목록(AI / 실무진 / 임원진)을 일정·지원자마다 평가 → 평가 항목 → 지원자 이름을
+따로 조회하던 방식 대신, 지원자별 등급(상/중/하) 개수·항목 수·합격 여부를
+조건부 집계(SUM(CASE ...)) 한 번의 GROUP BY 쿼리로 만든다.
+
+결과는 (공고, 평가 유형, 버전 스탬프) 키로 Redis 에 캐시한다. 버전 스탬프는 평가 수 + 평가 최종 수정 시각 +
+지원자 최종 수정 시각이라 평가가 추가·수정되면 키가 바뀐다. 평가 항목에는 updated_at 이 없으므로
+항목이 ORM 으로 바뀌면 부모 평가의 updated_at 을 갱신한다 (아래 이벤트 리스너).
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+import redis
+from sqlalchemy import and_, case, event, func, inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import redis_client
+from app.models.application import Application
+from app.models.interview_evaluation import EvaluationType, InterviewEvaluation, InterviewEvaluationItem
+from app.models.schedule import AIInterviewSchedule
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "interview_eval_summary"
+CACHE_TTL_SECONDS = int(os.getenv("INTERVIEW_EVAL_SUMMARY_TTL", 3600))
+
+GRADES = ("상", "중", "하")
+
+# 합격 판정: '하' 개수가 max(2, 항목 수의 15%) 미만
+LOW_GRADE_MIN_THRESHOLD = 2
+LOW_GRADE_RATIO = 0.15
+
+
+def evaluation_scope(db: Session, job_post_id: int, evaluation_type: EvaluationType):
+    """평가 대상 (interview_id, application_id, 지원자 user_id) 서브쿼리
+
+    AI 면접 평가는 ai_interview_schedule.id 를, 실무진/임원진 평가는 application.id 를 interview_id 로 쓴다.
+    """
+    if evaluation_type == EvaluationType.AI:
+        return db.query(
+            AIInterviewSchedule.id.label("interview_id"),
+            AIInterviewSchedule.application_id.label("application_id"),
+            AIInterviewSchedule.applicant_user_id.label("user_id")
+        ).filter(AIInterviewSchedule.job_post_id == job_post_id).subquery()
+    return db.query(
+        Application.id.label("interview_id"),
+        Application.id.label("application_id"),
+        Application.user_id.label("user_id")
+    ).filter(Application.job_post_id == job_post_id).subquery()
+
+
+def _first_evaluations(db: Session, evaluation_type: EvaluationType):
+    """interview_id 별 첫 번째 평가 (기존 .first() 와 같은 대상)"""
+    return db.query(
+        InterviewEvaluation.interview_id.label("interview_id"),
+        func.min(InterviewEvaluation.id).label("evaluation_id")
+    ).filter(
+        InterviewEvaluation.evaluation_type == evaluation_type
+    ).group_by(InterviewEvaluation.interview_id).subquery()
+
+
+def _passed_expr(low_count, total_items):
+    """합격이면 1, 아니면 0"""
+    threshold = func.greatest(LOW_GRADE_MIN_THRESHOLD, func.floor(total_items * LOW_GRADE_RATIO))
+    return case((low_count < threshold, 1), else_=0)
+
+
+class InterviewEvaluationSummaryService:
+
+    @staticmethod
+    def get_version_stamp(db: Session, job_post_id: int, evaluation_type: EvaluationType) -> str:
+        """캐시 키용 버전: 대상 수 + 지원자 최종 수정 시각 + 평가 수 + 평가 최종 수정 시각
+
+        행 내용을 읽지 않는 COUNT/MAX 집계만 스칼라 서브쿼리로 묶어 한 번의 SELECT 로 조회한다.
+        """
+        scope = evaluation_scope(db, job_post_id, evaluation_type)
+
+        def applicants(column):
+            return db.query(column).select_from(scope).outerjoin(
+                User, User.id == scope.c.user_id
+            ).scalar_subquery()
+
+        def evaluations(column):
+            return db.query(column).select_from(InterviewEvaluation).join(
+                scope, scope.c.interview_id == InterviewEvaluation.interview_id
+            ).filter(InterviewEvaluation.evaluation_type == evaluation_type).scalar_subquery()
+
+        row = db.query(
+            applicants(func.count(scope.c.interview_id)),
+            applicants(func.max(User.updated_at)),
+            evaluations(func.count(InterviewEvaluation.id)),
+            evaluations(func.max(InterviewEvaluation.updated_at))
+        ).one()
+        return "|".join("" if value is None else str(value) for value in row)
+
+    @staticmethod
+    def compute(db: Session, job_post_id: int, evaluation_type: EvaluationType) -> List[Dict[str, Any]]:
+        """지원자별 평가 요약 (조건부 집계 GROUP BY 한 번)"""
+        scope = evaluation_scope(db, job_post_id, evaluation_type)
+        first = _first_evaluations(db, evaluation_type)
+        grade_columns = [
+            func.coalesce(func.sum(case((InterviewEvaluationItem.grade == grade, 1), else_=0)), 0)
+            for grade in GRADES
+        ]
+        total_items = func.count(InterviewEvaluationItem.id)
+
+        rows = db.query(
+            scope.c.interview_id,
+            scope.c.application_id,
+            User.name,
+            InterviewEvaluation.id,
+            InterviewEvaluation.total_score,
+            InterviewEvaluation.summary,
+            InterviewEvaluation.created_at,
+            total_items,
+            *grade_columns,
+            _passed_expr(grade_columns[2], total_items)
+        ).select_from(scope).join(
+            first, first.c.interview_id == scope.c.interview_id
+        ).join(
+            InterviewEvaluation, InterviewEvaluation.id == first.c.evaluation_id
+        ).outerjoin(
+            User, User.id == scope.c.user_id
+        ).outerjoin(
+            InterviewEvaluationItem, InterviewEvaluationItem.evaluation_id == InterviewEvaluation.id
+        ).group_by(
+            scope.c.interview_id, scope.c.application_id, User.name,
+            InterviewEvaluation.id, InterviewEvaluation.total_score,
+            InterviewEvaluation.summary, InterviewEvaluation.created_at
+        ).order_by(scope.c.interview_id).all()
+
+        summaries = []
+        for (interview_id, application_id, name, evaluation_id, total_score, summary, created_at,
+             item_count, high, middle, low, passed) in rows:
+            summaries.append({
+                "application_id": application_id,
+                "applicant_name": name or "",
+                "interview_id": interview_id,
+                "evaluation_id": evaluation_id,
+                "total_score": float(total_score) if total_score else 0,
+                "summary": summary,
+                "total_items": int(item_count or 0),
+                "grade_counts": {"상": int(high), "중": int(middle), "하": int(low)},
+                "passed": bool(passed),
+                "created_at": created_at.isoformat() if created_at else None
+            })
+        return summaries
+
+    @staticmethod
+    def get_job_post_summaries(db: Session, job_post_id: int, evaluation_type: EvaluationType) -> List[Dict[str, Any]]:
+        """공고 × 평가 유형 요약 (버전 스탬프가 같으면 Redis 캐시 사용)"""
+        stamp = InterviewEvaluationSummaryService.get_version_stamp(db, job_post_id, evaluation_type)
+        digest = hashlib.sha1(stamp.encode()).hexdigest()[:16]
+        cache_key = f"{CACHE_PREFIX}:{job_post_id}:{evaluation_type.value}:{digest}"
+
+        cached: Optional[bytes] = None
+        try:
+            cached = redis_client.get(cache_key)
+        except redis.RedisError as e:
+            logger.warning(f"면접 평가 요약 캐시 조회 실패: {e}")
+        if cached:
+            return json.loads(cached)
+
+        summaries = InterviewEvaluationSummaryService.compute(db, job_post_id, evaluation_type)
+        try:
+            redis_client.setex(cache_key, CACHE_TTL_SECONDS, json.dumps(summaries, ensure_ascii=False))
+        except redis.RedisError as e:
+            logger.warning(f"면접 평가 요약 캐시 저장 실패: {e}")
+        return summaries
+
+    @staticmethod
+    def get_ai_pass_statistics(db: Session) -> Dict[str, int]:
+        """전체 AI 면접 평가의 합격/불합격 수 (항목이 없는 평가는 어느 쪽에도 넣지 않음)"""
+        low_count = func.coalesce(func.sum(case((InterviewEvaluationItem.grade == "하", 1), else_=0)), 0)
+        total_items = func.count(InterviewEvaluationItem.id)
+        per_evaluation = db.query(
+            InterviewEvaluation.id.label("evaluation_id"),
+            total_items.label("total_items"),
+            _passed_expr(low_count, total_items).label("passed")
+        ).outerjoin(
+            InterviewEvaluationItem, InterviewEvaluationItem.evaluation_id == InterviewEvaluation.id
+        ).filter(
+            InterviewEvaluation.evaluation_type == EvaluationType.AI
+        ).group_by(InterviewEvaluation.id).subquery()
+
+        total, passed, failed = db.query(
+            func.count(per_evaluation.c.evaluation_id),
+            func.coalesce(func.sum(case((and_(per_evaluation.c.total_items > 0, per_evaluation.c.passed == 1), 1), else_=0)), 0),
+            func.coalesce(func.sum(case((and_(per_evaluation.c.total_items > 0, per_evaluation.c.passed == 0), 1), else_=0)), 0)
+        ).one()
+        return {"total_evaluations": int(total), "passed_count": int(passed), "failed_count": int(failed)}
+
+
+# ---------------------------------------------------------------------------
+# 평가 항목이 ORM 으로 바뀌면 부모 평가의 updated_at 을 갱신해 버전 스탬프가 바뀌게 한다
+# (평가 행 자체는 updated_at 이 ON UPDATE CURRENT_TIMESTAMP)
+# ---------------------------------------------------------------------------
+
+def _touch_evaluations(connection, evaluation_ids):
+    evaluation_ids = {evaluation_id for evaluation_id in evaluation_ids if evaluation_id is not None}
+    if evaluation_ids:
+        connection.execute(
+            InterviewEvaluation.__table__.update()
+            .where(InterviewEvaluation.__table__.c.id.in_(evaluation_ids))
+            .values(updated_at=func.now())
+        )
+
+
+@event.listens_for(InterviewEvaluationItem, "after_insert")
+@event.listens_for(InterviewEvaluationItem, "after_delete")
+def _touch_on_item_change(mapper, connection, target):
+    _touch_evaluations(connection, [target.evaluation_id])
+
+
+@event.listens_for(InterviewEvaluationItem.evaluation_id, "set", active_history=True)
+def _load_previous_evaluation_id(target, value, oldvalue, initiator):
+    """active_history 로 만료된 이전 evaluation_id 도 history 에 남긴다 (after_update 에서 사용)"""
+
+
+@event.listens_for(InterviewEvaluationItem, "after_update")
+def _touch_on_item_update(mapper, connection, target):
+    # 다른 평가로 옮겨진 항목은 이전 평가도 갱신
+    moved_from = sa_inspect(target).attrs.evaluation_id.history.deleted
+    _touch_evaluations(connection, [target.evaluation_id, *moved_from])
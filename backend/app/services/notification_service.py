@@ -1,8 +1,15 @@
+from datetime import datetime
+from sqlalchemy import case
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 from typing import List
 from app.models.notification import Notification
 from app.models.user import CompanyUser
 from app.models.job import JobPost
+# Notification ORM 변경 → 커밋 후 SSE 푸시 (리스너 등록)
+from app.services.notification_stream_service import queue_unread_counts
+
+REMINDER_NOTIFICATION_TYPE = "INTERVIEW_REMINDER"
 
 
 class NotificationService:
@@ -124,22 +131,58 @@ class NotificationService:
             Notification.user_id.in_(user_ids),
             Notification.type == "TEAM_MEMBER_ADDED"
         ).delete()
+        queue_unread_counts(db, user_ids)
         
         db.commit()
         return deleted_count 
 
     @staticmethod
-    def create_reminder_notification(db: Session, user_id: int, message: str):
+    def create_reminder_notifications(db: Session, reminders: List[dict]) -> int:
         """
-        Create a reminder notification for an interviewer.
+        Bulk upsert interview reminders keyed by (user_id, type, schedule_id).
+
+        Args:
+            db: Database session
+            reminders: List of dicts with user_id, schedule_id and message
+
+        Returns:
+            Number of reminders inserted or re-sent (existing rows with the same message are skipped)
         """
-        from app.models.notification import Notification
-        notification = Notification(
-            message=message,
-            user_id=user_id,
-            type="INTERVIEW_REMINDER",
-            is_read=False
-        )
-        db.add(notification)
-        db.flush()
-        return notification 
\ No newline at end of file
+        if not reminders:
+            return 0
+
+        # 이미 보낸 리마인더는 유니크 키 인덱스로 한 번에 조회
+        existing = {
+            (row.user_id, row.schedule_id): row.message
+            for row in db.query(Notification.user_id, Notification.schedule_id, Notification.message).filter(
+                Notification.user_id.in_({r["user_id"] for r in reminders}),
+                Notification.type == REMINDER_NOTIFICATION_TYPE,
+                Notification.schedule_id.in_({r["schedule_id"] for r in reminders})
+            )
+        }
+        rows = [
+            {
+                "user_id": r["user_id"],
+                "schedule_id": r["schedule_id"],
+                "type": REMINDER_NOTIFICATION_TYPE,
+                "message": r["message"],
+                "is_read": False,
+                "created_at": datetime.utcnow(),
+            }
+            for r in reminders
+            if existing.get((r["user_id"], r["schedule_id"])) != r["message"]
+        ]
+        if not rows:
+            return 0
+
+        # 동시 실행과 겹쳐도 키 충돌은 갱신으로 처리. 면접 시각이 바뀌어 메시지가 달라졌으면 다시 안 읽음으로 표시
+        table = Notification.__table__
+        statement = mysql_insert(table).values(rows)
+        statement = statement.on_duplicate_key_update([
+            ("is_read", case((table.c.message == statement.inserted.message, table.c.is_read), else_=False)),
+            ("message", statement.inserted.message),
+        ])
+        db.execute(statement)
+        # 일괄 INSERT 는 ORM 이벤트를 거치지 않으므로 미읽음 개수를 직접 푸시
+        queue_unread_counts(db, {row["user_id"] for row in rows})
+        return len(rows)
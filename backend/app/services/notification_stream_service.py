@@ -0,0 +1,416 @@
+"""
+알림 서버 푸시 (SSE + Redis pub/sub)
+
+브라우저 탭마다 30초 간격으로 /notifications/unread/count 를 호출하던 폴링을
+사용자별 이벤트 스트림으로 대체한다.
+
+발행 (커밋 직후, 백그라운드 스레드):
+    Notification 이 ORM 으로 추가/수정/삭제되면 세션에 이벤트를 모아 두었다가
+    커밋 후 발행 큐에 넣고, 발행 스레드가 사용자별 Redis Stream 에 XADD(재접속 재전송용) 하고
+    같은 ID 로 PUBLISH 한다. 커밋하는 요청은 Redis 를 기다리지 않으며, Redis 연결이 끊기면
+    PUBLISH_RETRY_SECONDS 동안 발행을 건너뛴다 (구독 쪽은 재연결 시 미읽음 개수로 다시 맞춘다).
+    query.update()/delete() 같은 일괄 변경은 queue_unread_counts() 로 절대 개수를 보낸다.
+
+전달 (비동기, 워커별):
+    NotificationHub 가 워커당 pub/sub 연결 하나로, 이 워커에 접속한 사용자 채널만 구독하고
+    탭별 큐로 나눠 준다. SSE 재접속 시 Last-Event-ID 이후 이벤트를 Stream 에서 재전송하며,
+    보관 범위를 벗어났으면 미읽음 개수 스냅샷을 보낸다.
+
+이벤트 종류:
+    notification   새 알림 (unread_delta: 미읽음 개수 증가분)
+    unread_delta   미읽음 개수 증감 (읽음 처리/삭제)
+    unread_count   미읽음 개수 절대값 (접속 시 스냅샷, 일괄 변경)
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from queue import Full, Queue
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import event, func, inspect as sa_inspect
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import redis_client
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.notification import Notification
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "notify:user"
+STREAM_MAXLEN = int(os.getenv("NOTIFICATION_STREAM_MAXLEN", 200))          # 사용자별 재전송 보관 개수
+STREAM_TTL_SECONDS = int(os.getenv("NOTIFICATION_STREAM_TTL", 24 * 3600))
+HEARTBEAT_SECONDS = float(os.getenv("NOTIFICATION_HEARTBEAT", 25))        # 프록시 유휴 연결 끊김 방지
+CLIENT_QUEUE_SIZE = 100
+RECONNECT_MS = 3000
+PUBLISH_QUEUE_SIZE = 10000      # 발행 대기 커밋 수 (넘치면 버림)
+PUBLISH_RETRY_SECONDS = 30      # Redis 연결 실패 후 발행을 건너뛰는 시간
+
+_PENDING_KEY = "notification_stream_events"
+
+Event = Tuple[int, str, Dict[str, Any]]  # (user_id, event, data)
+
+
+def _channel(user_id: int) -> str:
+    return f"{CHANNEL_PREFIX}:{user_id}"
+
+
+def _stream_key(user_id: int) -> str:
+    return f"{CHANNEL_PREFIX}:{user_id}:events"
+
+
+def _stream_id(value: str) -> Tuple[int, int]:
+    """Redis Stream ID("ms-seq") 비교용 튜플 (형식이 다르면 (0, 0))"""
+    try:
+        ms, _, seq = value.partition("-")
+        return int(ms), int(seq or 0)
+    except (TypeError, ValueError):
+        return 0, 0
+
+
+def serialize_notification(notification: Notification) -> Dict[str, Any]:
+    return {
+        "id": notification.id,
+        "message": notification.message,
+        "type": notification.type,
+        "url": notification.url,
+        "is_read": bool(notification.is_read),
+        "created_at": notification.created_at.isoformat() if notification.created_at else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 발행
+# ---------------------------------------------------------------------------
+
+_publish_queue: "Queue[List[Event]]" = Queue(maxsize=PUBLISH_QUEUE_SIZE)
+_publisher: Optional[threading.Thread] = None
+_publisher_lock = threading.Lock()
+_redis_down_until = 0.0
+
+
+def publish_events(events: Iterable[Event]):
+    """이벤트를 사용자별 Stream 에 기록하고 pub/sub 으로 알린다 (Redis 오류는 로그만)"""
+    global _redis_down_until
+    for user_id, name, data in events:
+        if user_id is None:
+            continue
+        if time.monotonic() < _redis_down_until:
+            return
+        payload = json.dumps(data, ensure_ascii=False, default=str)
+        try:
+            event_id = redis_client.xadd(
+                _stream_key(user_id), {"event": name, "data": payload},
+                maxlen=STREAM_MAXLEN, approximate=True
+            )
+            event_id = event_id.decode() if isinstance(event_id, bytes) else event_id
+            with redis_client.pipeline(transaction=False) as pipe:
+                pipe.expire(_stream_key(user_id), STREAM_TTL_SECONDS)
+                pipe.publish(_channel(user_id), json.dumps({"id": event_id, "event": name, "data": payload}))
+                pipe.execute()
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            _redis_down_until = time.monotonic() + PUBLISH_RETRY_SECONDS
+            logger.warning(f"알림 이벤트 발행 실패, {PUBLISH_RETRY_SECONDS}초간 발행 건너뜀: {e}")
+            return
+        except redis.RedisError as e:
+            logger.warning(f"알림 이벤트 발행 실패 (user_id={user_id}): {e}")
+
+
+def _publish_loop():
+    while True:
+        events = _publish_queue.get()
+        try:
+            publish_events(events)
+        except Exception as e:
+            logger.error(f"알림 이벤트 발행 스레드 오류: {e}")
+
+
+def _enqueue_events(events: List[Event]):
+    """커밋한 요청을 막지 않도록 발행 스레드에 넘긴다 (스레드는 처음 쓸 때 시작)"""
+    global _publisher
+    if _publisher is None or not _publisher.is_alive():
+        with _publisher_lock:
+            if _publisher is None or not _publisher.is_alive():
+                _publisher = threading.Thread(target=_publish_loop, name="notification-publisher", daemon=True)
+                _publisher.start()
+    try:
+        _publish_queue.put_nowait(events)
+    except Full:
+        logger.warning(f"알림 발행 큐가 가득 차 이벤트 {len(events)}개를 버림")
+
+
+def queue_event(session: Session, user_id: int, name: str, data: Dict[str, Any]):
+    """커밋 후 발행할 이벤트 등록 (롤백되면 버림)"""
+    session.info.setdefault(_PENDING_KEY, []).append((user_id, name, data))
+
+
+def queue_unread_counts(session: Session, user_ids: Iterable[int]):
+    """일괄 변경(query.update/delete) 뒤 사용자별 미읽음 개수를 한 번에 집계해 커밋 후 발행"""
+    user_ids = sorted({user_id for user_id in user_ids if user_id is not None})
+    if not user_ids:
+        return
+    counts = dict(
+        session.query(Notification.user_id, func.count(Notification.id))
+        .filter(Notification.user_id.in_(user_ids), Notification.is_read == False)
+        .group_by(Notification.user_id)
+        .all()
+    )
+    for user_id in user_ids:
+        queue_event(session, user_id, "unread_count", {"count": counts.get(user_id, 0)})
+
+
+def count_unread(user_id: int) -> int:
+    db = SessionLocal()
+    try:
+        return db.query(func.count(Notification.id)).filter(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        ).scalar() or 0
+    finally:
+        db.close()
+
+
+# ---------------------------------------------------------------------------
+# ORM 변경 감지
+# ---------------------------------------------------------------------------
+
+@event.listens_for(Notification.is_read, "set", active_history=True)
+def _load_previous_read_state(target, value, oldvalue, initiator):
+    # 커밋 후 만료된 객체도 변경 전 is_read 를 불러오게 해 after_update 에서 증감을 판단한다
+    return value
+
+
+@event.listens_for(Notification, "after_insert")
+def _notification_inserted(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        data = serialize_notification(target)
+        data["unread_delta"] = 0 if target.is_read else 1
+        queue_event(session, target.user_id, "notification", data)
+
+
+@event.listens_for(Notification, "after_update")
+def _notification_updated(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is None:
+        return
+    state = sa_inspect(target)
+    read_history = state.attrs.is_read.history
+    was_read = bool(read_history.deleted[0]) if read_history.deleted else bool(target.is_read)
+    if was_read != bool(target.is_read):
+        if target.is_read:
+            queue_event(session, target.user_id, "unread_delta", {"delta": -1, "read_ids": [target.id]})
+            return
+        data = serialize_notification(target)
+        data["unread_delta"] = 1
+        queue_event(session, target.user_id, "notification", data)
+    elif state.attrs.message.history.has_changes() and not target.is_read:
+        # 같은 알림 내용 갱신 (예: 팀 편성 알림 재발송)
+        data = serialize_notification(target)
+        data["unread_delta"] = 0
+        queue_event(session, target.user_id, "notification", data)
+
+
+@event.listens_for(Notification, "after_delete")
+def _notification_deleted(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        delta = 0 if target.is_read else -1
+        queue_event(session, target.user_id, "unread_delta", {"delta": delta, "deleted_ids": [target.id]})
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session):
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        _enqueue_events(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ---------------------------------------------------------------------------
+# 전달 (워커별 구독 허브 + SSE)
+# ---------------------------------------------------------------------------
+
+class NotificationHub:
+    """워커당 pub/sub 연결 하나로 접속 중인 사용자 채널만 구독해 탭별 큐로 전달"""
+
+    def __init__(self, redis_url: str = settings.REDIS_URL):
+        self.redis_url = redis_url
+        self._client: Optional[aioredis.Redis] = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._listeners: Dict[int, Set[asyncio.Queue]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def client(self) -> aioredis.Redis:
+        if self._client is None:
+            self._client = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    async def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            listeners = self._listeners.setdefault(user_id, set())
+            if not listeners:
+                await self._pubsub.subscribe(_channel(user_id))
+            listeners.add(queue)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_loop())
+        return queue
+
+    async def unsubscribe(self, user_id: int, queue: asyncio.Queue):
+        async with self._lock:
+            listeners = self._listeners.get(user_id)
+            if not listeners:
+                return
+            listeners.discard(queue)
+            if not listeners:
+                del self._listeners[user_id]
+                try:
+                    await self._pubsub.unsubscribe(_channel(user_id))
+                except redis.RedisError as e:
+                    logger.warning(f"알림 채널 구독 해제 실패 (user_id={user_id}): {e}")
+
+    async def _read_loop(self):
+        while True:
+            if not self._listeners:
+                await asyncio.sleep(1.0)
+                continue
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"알림 pub/sub 수신 오류, 재구독: {e}")
+                await asyncio.sleep(1.0)
+                await self._resubscribe()
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            try:
+                user_id = int(message["channel"].rsplit(":", 1)[1])
+                item = json.loads(message["data"])
+            except (ValueError, IndexError, TypeError):
+                continue
+            for queue in list(self._listeners.get(user_id, ())):
+                self._offer(queue, (item["id"], item["event"], item["data"]))
+
+    async def _resubscribe(self):
+        async with self._lock:
+            try:
+                if self._pubsub is not None:
+                    await self._pubsub.close()
+            except (redis.RedisError, OSError):
+                pass
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            channels = [_channel(user_id) for user_id in self._listeners]
+            try:
+                if channels:
+                    await self._pubsub.subscribe(*channels)
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"알림 채널 재구독 실패: {e}")
+                return
+        # 끊긴 동안 놓친 이벤트는 각 탭이 Stream 으로 다시 맞춘다
+        for listeners in list(self._listeners.values()):
+            for queue in list(listeners):
+                self._offer(queue, ("resync", None, None))
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item: tuple):
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # 느린 탭: 쌓인 이벤트를 버리고 개수 스냅샷으로 다시 맞추게 한다
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(("resync", None, None))
+
+    async def replay(self, user_id: int, last_event_id: str) -> Optional[List[tuple]]:
+        """Last-Event-ID 이후 이벤트 (보관 범위를 벗어났으면 None)"""
+        key = _stream_key(user_id)
+        oldest = await self.client.xrange(key, count=1)
+        if not oldest or _stream_id(oldest[0][0]) > _stream_id(last_event_id):
+            return None
+        entries = await self.client.xrange(key, min=f"({last_event_id}")
+        return [(entry_id, fields.get("event"), fields.get("data")) for entry_id, fields in entries]
+
+    async def latest_id(self, user_id: int) -> Optional[str]:
+        entries = await self.client.xrevrange(_stream_key(user_id), count=1)
+        return entries[0][0] if entries else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "subscribed_users": len(self._listeners),
+            "connections": sum(len(listeners) for listeners in self._listeners.values()),
+        }
+
+
+notification_hub = NotificationHub()
+
+
+def _sse(name: str, data: Any, event_id: Optional[str] = None) -> str:
+    if not isinstance(data, str):
+        data = json.dumps(data, ensure_ascii=False, default=str)
+    lines = [f"id: {event_id}"] if event_id else []
+    lines.append(f"event: {name}")
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+async def _snapshot(user_id: int) -> Tuple[Optional[str], str]:
+    """(커서, 미읽음 개수 이벤트). 커서를 먼저 읽어 개수에 이미 반영된 이벤트를 다시 더하지 않게 한다"""
+    try:
+        cursor = await notification_hub.latest_id(user_id)
+    except redis.RedisError:
+        cursor = None
+    count = await run_in_threadpool(count_unread, user_id)
+    return cursor, _sse("unread_count", {"count": count})
+
+
+async def stream_notifications(request, user_id: int, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+    """사용자 알림 SSE 스트림 (연결 중 DB 조회는 접속/재동기화 시 미읽음 개수 1회뿐)"""
+    queue = await notification_hub.subscribe(user_id)  # 재전송과 실시간 사이 공백이 없도록 먼저 구독
+    try:
+        yield f"retry: {RECONNECT_MS}\n\n"
+        cursor = last_event_id
+        replayed = None
+        if last_event_id:
+            try:
+                replayed = await notification_hub.replay(user_id, last_event_id)
+            except redis.RedisError as e:
+                logger.warning(f"알림 재전송 조회 실패 (user_id={user_id}): {e}")
+        if replayed is None:
+            cursor, snapshot = await _snapshot(user_id)
+            yield snapshot
+        else:
+            for event_id, name, data in replayed:
+                yield _sse(name, data, event_id)
+                cursor = event_id
+
+        while not await request.is_disconnected():
+            try:
+                event_id, name, data = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event_id == "resync":
+                cursor, snapshot = await _snapshot(user_id)
+                yield snapshot
+                continue
+            if cursor and _stream_id(event_id) <= _stream_id(cursor):
+                continue  # 재전송으로 이미 보낸 이벤트
+            cursor = event_id
+            yield _sse(name, data, event_id)
+    finally:
+        await notification_hub.unsubscribe(user_id, queue)
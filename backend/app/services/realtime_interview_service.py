@@ -0,0 +1,222 @@
+import asyncio
+import json
+import os
+import socket
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+
+# 세션 데이터 보관 기간 (재접속 대기 포함)
+SESSION_TTL_SECONDS = int(os.getenv("REALTIME_SESSION_TTL", 60 * 60 * 3))
+SESSION_KEY_PREFIX = "realtime_interview:session"
+
+# 현재 워커 식별자 (세션을 처리 중인 워커 표시용)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class AudioRingBuffer:
+    """고정 용량 오디오 청크 버퍼
+
+    WebSocket 수신 루프가 push 하고 처리 태스크가 drain 한다.
+    버퍼가 가득 차면 push 가 False 를 반환하고, 수신 측은 wait_for_space 로
+    처리 속도를 따라잡을 때까지 다음 프레임 수신을 멈춘다 (backpressure).
+    """
+
+    def __init__(self, capacity_bytes: int, low_watermark: float = 0.5):
+        self.capacity_bytes = capacity_bytes
+        self.low_watermark_bytes = int(capacity_bytes * low_watermark)
+        self._chunks: Deque[Tuple[float, bytes]] = deque()
+        self._size = 0
+        self._closed = False
+        self._data_available = asyncio.Event()
+        self._space_available = asyncio.Event()
+        self._space_available.set()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        return self._size >= self.capacity_bytes
+
+    def push(self, data: bytes, timestamp: float) -> bool:
+        """청크 추가. 용량 초과 시 추가하지 않고 False 반환"""
+        if self._closed:
+            return False
+        if self._size + len(data) > self.capacity_bytes and self._chunks:
+            self._space_available.clear()
+            return False
+        self._chunks.append((timestamp, data))
+        self._size += len(data)
+        self._data_available.set()
+        if self.is_full:
+            self._space_available.clear()
+        return True
+
+    def drain(self, max_bytes: int) -> Tuple[Optional[float], bytes, int]:
+        """최대 max_bytes 만큼 청크를 꺼내 하나로 합침
+
+        Returns:
+            (첫 청크 timestamp, 합쳐진 오디오 바이트, 청크 수)
+        """
+        parts: List[bytes] = []
+        first_timestamp = None
+        taken = 0
+        while self._chunks and (taken == 0 or taken + len(self._chunks[0][1]) <= max_bytes):
+            timestamp, data = self._chunks.popleft()
+            if first_timestamp is None:
+                first_timestamp = timestamp
+            parts.append(data)
+            taken += len(data)
+        self._size -= taken
+        if not self._chunks:
+            self._data_available.clear()
+        if self._size <= self.low_watermark_bytes:
+            self._space_available.set()
+        return first_timestamp, b"".join(parts), len(parts)
+
+    async def wait_for_data(self, timeout: Optional[float] = None) -> bool:
+        """데이터가 들어오거나 버퍼가 닫힐 때까지 대기"""
+        if self._chunks or self._closed:
+            return bool(self._chunks)
+        try:
+            await asyncio.wait_for(self._data_available.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return bool(self._chunks)
+
+    async def wait_for_space(self, timeout: Optional[float] = None) -> bool:
+        """버퍼 사용량이 low watermark 아래로 내려갈 때까지 대기"""
+        try:
+            await asyncio.wait_for(self._space_available.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self):
+        self._closed = True
+        self._data_available.set()
+        self._space_available.set()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+class RealtimeSessionStore:
+    """Redis 기반 실시간 면접 세션 저장소
+
+    세션 상태를 워커 프로세스 메모리가 아닌 Redis 에 두어
+    어느 워커가 WebSocket 을 받아도 같은 세션을 이어서 처리할 수 있다.
+
+    키 구조:
+        {prefix}:{session_id}                 HASH  start_time, worker
+        {prefix}:{session_id}:transcripts     LIST  JSON 항목
+        {prefix}:{session_id}:evaluations     LIST  JSON 항목
+        {prefix}:{session_id}:notes           HASH  speaker -> JSON 리스트
+    """
+
+    def __init__(self, redis_url: str = settings.REDIS_URL, ttl: int = SESSION_TTL_SECONDS):
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self._client: Optional[aioredis.Redis] = None
+
+    @property
+    def client(self) -> aioredis.Redis:
+        if self._client is None:
+            self._client = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    def _key(self, session_id: str, suffix: str = "") -> str:
+        key = f"{SESSION_KEY_PREFIX}:{session_id}"
+        return f"{key}:{suffix}" if suffix else key
+
+    def _keys(self, session_id: str) -> List[str]:
+        return [
+            self._key(session_id),
+            self._key(session_id, "transcripts"),
+            self._key(session_id, "evaluations"),
+            self._key(session_id, "notes"),
+        ]
+
+    async def _touch(self, pipe, session_id: str):
+        for key in self._keys(session_id):
+            pipe.expire(key, self.ttl)
+
+    async def open(self, session_id: str) -> Dict[str, Any]:
+        """세션 생성 또는 기존 세션 재접속 (현재 워커를 소유자로 기록)"""
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(self._key(session_id), "start_time", datetime.now().isoformat())
+            pipe.hset(self._key(session_id), "worker", WORKER_ID)
+            await self._touch(pipe, session_id)
+            await pipe.execute()
+        return await self.client.hgetall(self._key(session_id))
+
+    async def release(self, session_id: str):
+        """WebSocket 연결 해제 시 소유 워커 표시만 제거 (데이터는 TTL 동안 유지)"""
+        await self.client.hdel(self._key(session_id), "worker")
+
+    async def delete(self, session_id: str):
+        await self.client.delete(*self._keys(session_id))
+
+    async def exists(self, session_id: str) -> bool:
+        return bool(await self.client.exists(self._key(session_id)))
+
+    async def append_transcript(self, session_id: str, transcript: Dict[str, Any]):
+        await self._append(session_id, "transcripts", transcript)
+
+    async def append_evaluation(self, session_id: str, evaluation: Dict[str, Any]):
+        await self._append(session_id, "evaluations", evaluation)
+
+    async def _append(self, session_id: str, suffix: str, item: Dict[str, Any]):
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.rpush(self._key(session_id, suffix), json.dumps(item, ensure_ascii=False, default=str))
+            await self._touch(pipe, session_id)
+            await pipe.execute()
+
+    async def add_speaker_note(self, session_id: str, speaker: str, note: Dict[str, Any]):
+        key = self._key(session_id, "notes")
+        # 같은 화자 메모의 동시 추가 충돌 방지 (WATCH 기반 낙관적 잠금)
+        async with self.client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    raw = await pipe.hget(key, speaker)
+                    notes = json.loads(raw) if raw else []
+                    notes.append(note)
+                    pipe.multi()
+                    pipe.hset(key, speaker, json.dumps(notes, ensure_ascii=False, default=str))
+                    await self._touch(pipe, session_id)
+                    await pipe.execute()
+                    break
+                except aioredis.WatchError:
+                    continue
+
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 전체 데이터 조회 (없으면 None)"""
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._key(session_id))
+            pipe.lrange(self._key(session_id, "transcripts"), 0, -1)
+            pipe.lrange(self._key(session_id, "evaluations"), 0, -1)
+            pipe.hgetall(self._key(session_id, "notes"))
+            meta, transcripts, evaluations, notes = await pipe.execute()
+
+        if not meta or "start_time" not in meta:
+            return None
+
+        return {
+            "start_time": datetime.fromisoformat(meta["start_time"]),
+            "worker": meta.get("worker"),
+            "transcripts": [json.loads(item) for item in transcripts],
+            "evaluations": [json.loads(item) for item in evaluations],
+            "speaker_notes": {speaker: json.loads(raw) for speaker, raw in notes.items()},
+        }
+
+
+session_store = RealtimeSessionStore()
@@ -0,0 +1,247 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, and_, or_, extract, literal
+from typing import List, Dict, Any
+from datetime import datetime
+
+from app.models.application import Application, DocumentStatus, WrittenTestStatus
+from app.models.resume import Resume, Spec
+from app.models.user import User
+
+
+# 연령대 구간 (상한 나이, 라벨) - 보고서 표시 순서와 동일
+AGE_GROUPS = [
+    (20, "20대 미만"),
+    (30, "20대"),
+    (40, "30대"),
+    (50, "40대"),
+    (60, "50대"),
+]
+AGE_GROUP_OVERFLOW = "60대 이상"
+
+# 주소 → 시/도 매핑 (앞에서부터 먼저 일치하는 항목 사용)
+PROVINCE_PATTERNS = [
+    ("서울", ["서울"]),
+    ("부산", ["부산"]),
+    ("대구", ["대구"]),
+    ("인천", ["인천"]),
+    ("광주", ["광주"]),
+    ("대전", ["대전"]),
+    ("울산", ["울산"]),
+    ("세종", ["세종"]),
+    ("경기", ["경기"]),
+    ("강원", ["강원"]),
+    ("충북", ["충북", "충청북도"]),
+    ("충남", ["충남", "충청남도"]),
+    ("전북", ["전북", "전라북도"]),
+    ("전남", ["전남", "전라남도"]),
+    ("경북", ["경북", "경상북도"]),
+    ("경남", ["경남", "경상남도"]),
+    ("제주", ["제주"]),
+]
+PROVINCE_OTHER = "기타"
+
+
+def _age_group_expr(current_year: int):
+    """출생연도 → 연령대 라벨 CASE 식"""
+    age = literal(current_year) - extract("year", User.birth_date)
+    return case(
+        *[(age < upper, label) for upper, label in AGE_GROUPS],
+        else_=AGE_GROUP_OVERFLOW
+    )
+
+
+def _province_expr():
+    """주소 → 시/도 라벨 CASE 식"""
+    return case(
+        *[
+            (or_(*[User.address.contains(keyword) for keyword in keywords]), province)
+            for province, keywords in PROVINCE_PATTERNS
+        ],
+        else_=PROVINCE_OTHER
+    )
+
+
+def _ordered_counts(counts: Dict[str, int], order: List[str]) -> List[tuple]:
+    """정해진 라벨 순서대로 (라벨, 개수) 목록 반환"""
+    return [(label, counts[label]) for label in order if counts.get(label)]
+
+
+def _by_count(counts: Dict[str, int]) -> List[tuple]:
+    """개수 내림차순 (라벨, 개수) 목록 반환"""
+    return sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+
+
+class ReportStatisticsService:
+    """보고서용 지원자 통계 집계 (DB GROUP BY 기반)
+
+    지원자 수와 무관하게 결과 행 수가 (성별 × 연령대 × 지역) 조합 수로 제한되므로
+    지원자가 늘어도 애플리케이션 측 처리량은 일정하게 유지된다.
+    """
+
+    @staticmethod
+    def get_applicant_statistics(db: Session, job_post_id: int) -> Dict[str, Any]:
+        """성별/연령대/학력/자격증/지역 통계를 두 번의 집계 쿼리로 계산"""
+        current_year = datetime.now().year
+        age_group = _age_group_expr(current_year)
+        province = _province_expr()
+
+        # 1) 지원자 인구통계: (성별, 연령대, 지역) 조합별 지원자 수
+        gender_key = case((User.gender != "", User.gender), else_=None)
+        age_key = case((User.birth_date.isnot(None), age_group), else_=None)
+        province_key = case(
+            (and_(User.address.isnot(None), User.address != ""), province),
+            else_=None
+        )
+        demographic_rows = db.query(
+            gender_key.label("gender"),
+            age_key.label("age_group"),
+            province_key.label("province"),
+            func.count(Application.id).label("count")
+        ).outerjoin(
+            User, User.id == Application.user_id
+        ).filter(
+            Application.job_post_id == job_post_id
+        ).group_by(
+            gender_key, age_key, province_key
+        ).all()
+
+        total_applicants = 0
+        gender_counts: Dict[str, int] = {}
+        age_counts: Dict[str, int] = {}
+        province_counts: Dict[str, int] = {}
+        for row in demographic_rows:
+            count = int(row.count)
+            total_applicants += count
+            if row.gender:
+                gender_counts[row.gender] = gender_counts.get(row.gender, 0) + count
+            if row.age_group:
+                age_counts[row.age_group] = age_counts.get(row.age_group, 0) + count
+            if row.province:
+                province_counts[row.province] = province_counts.get(row.province, 0) + count
+
+        # 2) 이력서 스펙: 이력서별 첫 학위 / 자격증 개수를 집계한 뒤 (학위, 자격증 수)로 재집계
+        is_degree = and_(
+            Spec.spec_type == "education",
+            Spec.spec_title == "degree",
+            Spec.spec_description.isnot(None),
+            Spec.spec_description != ""
+        )
+        per_resume = db.query(
+            Application.id.label("application_id"),
+            func.min(case((is_degree, Spec.id), else_=None)).label("degree_spec_id"),
+            func.sum(case((Spec.spec_type == "certificate", 1), else_=0)).label("cert_count")
+        ).join(
+            Spec, Spec.resume_id == Application.resume_id
+        ).filter(
+            Application.job_post_id == job_post_id
+        ).group_by(Application.id).subquery()
+
+        degree_spec = db.query(Spec.id, Spec.spec_description).subquery()
+        spec_rows = db.query(
+            degree_spec.c.spec_description.label("degree"),
+            per_resume.c.cert_count,
+            func.count().label("count")
+        ).select_from(per_resume).outerjoin(
+            degree_spec, degree_spec.c.id == per_resume.c.degree_spec_id
+        ).group_by(
+            degree_spec.c.spec_description, per_resume.c.cert_count
+        ).all()
+
+        education_counts: Dict[str, int] = {}
+        certificate_counts: Dict[int, int] = {}
+        for row in spec_rows:
+            count = int(row.count)
+            if row.degree:
+                education_counts[row.degree] = education_counts.get(row.degree, 0) + count
+            cert_count = int(row.cert_count or 0)
+            certificate_counts[cert_count] = certificate_counts.get(cert_count, 0) + count
+
+        age_order = [label for _, label in AGE_GROUPS] + [AGE_GROUP_OVERFLOW]
+        province_order = [label for label, _ in PROVINCE_PATTERNS] + [PROVINCE_OTHER]
+
+        return {
+            "total_applicants": total_applicants,
+            "gender_stats": [{"name": k, "value": v} for k, v in _by_count(gender_counts)],
+            "age_group_stats": [{"name": k, "count": v} for k, v in _ordered_counts(age_counts, age_order)],
+            "education_stats": [{"name": k, "value": v} for k, v in _by_count(education_counts)],
+            "certificate_stats": [
+                {"name": f"{k}개", "count": certificate_counts[k]} for k in sorted(certificate_counts)
+            ],
+            "province_stats": [{"name": k, "count": v} for k, v in _ordered_counts(province_counts, province_order)]
+        }
+
+    @staticmethod
+    def get_written_test_statistics(db: Session, job_post_id: int) -> Dict[str, Any]:
+        """필기 평가 집계 (인원수, 평균, 최고/최저, 표준편차)를 단일 조건부 집계 쿼리로 계산"""
+        # 필기합격자: PASSED 또는 상태 미지정(NULL)
+        is_passed = or_(
+            Application.written_test_status == WrittenTestStatus.PASSED,
+            Application.written_test_status.is_(None)
+        )
+        passed_score = case((is_passed, Application.written_test_score), else_=None)
+
+        row = db.query(
+            func.count(Application.id).label("total_count"),
+            func.sum(case((Application.document_status == DocumentStatus.PASSED, 1), else_=0)).label("document_passed_count"),
+            func.sum(case((is_passed, 1), else_=0)).label("passed_count"),
+            func.count(Application.written_test_score).label("written_count"),
+            func.avg(Application.written_test_score).label("written_avg"),
+            func.avg(passed_score).label("passed_avg"),
+            func.max(passed_score).label("passed_max"),
+            func.min(passed_score).label("passed_min"),
+            func.stddev_pop(passed_score).label("passed_stddev")
+        ).filter(
+            Application.job_post_id == job_post_id
+        ).one()
+
+        def _float(value) -> float:
+            return float(value) if value is not None else 0
+
+        return {
+            "total_count": int(row.total_count or 0),
+            "document_passed_count": int(row.document_passed_count or 0),
+            "passed_count": int(row.passed_count or 0),
+            "written_count": int(row.written_count or 0),
+            "written_avg": _float(row.written_avg),
+            "passed_avg": _float(row.passed_avg),
+            "passed_max": _float(row.passed_max),
+            "passed_min": _float(row.passed_min),
+            "passed_stddev": _float(row.passed_stddev)
+        }
+
+    @staticmethod
+    def get_written_test_passed_applicants(db: Session, job_post_id: int) -> List[Dict[str, Any]]:
+        """필기합격자 명단 (점수 내림차순, 백분위는 DB 윈도 함수로 계산)"""
+        is_passed = or_(
+            Application.written_test_status == WrittenTestStatus.PASSED,
+            Application.written_test_status.is_(None)
+        )
+        score = func.coalesce(Application.written_test_score, 0)
+        percentile = func.percent_rank().over(order_by=score)
+
+        rows = db.query(
+            Application.id,
+            User.name,
+            score.label("written_score"),
+            Application.applied_at,
+            percentile.label("percentile")
+        ).join(
+            User, User.id == Application.user_id
+        ).join(
+            Resume, Resume.id == Application.resume_id
+        ).filter(
+            Application.job_post_id == job_post_id,
+            is_passed
+        ).order_by(score.desc(), Application.id).all()
+
+        return [
+            {
+                "id": row.id,
+                "name": row.name,
+                "written_score": float(row.written_score),
+                "percentile": round(float(row.percentile or 0) * 100, 1),
+                "evaluation_date": row.applied_at.strftime("%Y-%m-%d") if row.applied_at else "",
+                "status": "필기합격"
+            }
+            for row in rows
+        ]
@@ -1,16 +1,139 @@
+import fcntl
 import logging
+import os
+import threading
+import time
+import numpy as np
 from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError
 from sqlalchemy import text
+from app.core.database import SessionLocal
+from app.models.application import Application
 from app.models.resume import Resume
-from app.utils.openai_embedding_utils import OpenAIEmbedder
-from app.utils.chromadb_utils import ChromaDBManager
+from app.utils.minhash_lsh import PersistentLSHIndex, shingle_overlap
+from app.utils.similarity_matrix import label_clusters, screen_pairs
 from datetime import datetime
 import json
 
 logger = logging.getLogger(__name__)
 
+# 로컬 MinHash/LSH 인덱스 저장 위치 (워커 간 공유되도록 같은 디렉토리 사용)
+PLAGIARISM_INDEX_DIR = os.getenv("PLAGIARISM_INDEX_DIR", "./plagiarism_index")
+# LSH 후보 중 원문 대조까지 하는 최대 개수
+CANDIDATE_LIMIT = 10
+# 전체 유사도가 임계값 미만이어도, 이 길이(정규화 문자 수) 이상 그대로 겹치는 구간이 있으면 표절 의심
+SUSPECT_SPAN_CHARS = int(os.getenv("PLAGIARISM_SUSPECT_SPAN_CHARS", 200))
+# 공고 일괄 검사 응답에 담을 의심 쌍 최대 개수 (유사도 높은 순)
+PAIR_REPORT_LIMIT = 500
+
+# 인덱스가 아직 전체 구성되지 않았을 때 검사 요청이 들어오면 백그라운드로 구성 시작
+PLAGIARISM_INDEX_AUTO_BUILD = os.getenv("PLAGIARISM_INDEX_AUTO_BUILD", "true").lower() == "true"
+# 자동 구성 실패 후 재시도까지 대기 시간 (초)
+INDEX_BUILD_RETRY_SECONDS = 300
+
+_local_index: Optional[PersistentLSHIndex] = None
+_local_index_lock = threading.Lock()
+_index_build_thread: Optional[threading.Thread] = None
+_index_build_started_at = 0.0
+_index_build_lock = threading.Lock()
+
+
+def get_local_plagiarism_index() -> PersistentLSHIndex:
+    """프로세스 공용 로컬 표절 인덱스"""
+    global _local_index
+    if _local_index is None:
+        with _local_index_lock:
+            if _local_index is None:
+                _local_index = PersistentLSHIndex(PLAGIARISM_INDEX_DIR)
+    return _local_index
+
+
+def local_index_ready() -> bool:
+    """DB 전체 이력서로 한 번 이상 구성된 인덱스인지 (증분 저널만 있으면 False)"""
+    return get_local_plagiarism_index().has_snapshot()
+
+
+def _iter_resume_documents(db: Session, batch_size: int):
+    last_id = 0
+    while True:
+        rows = db.query(Resume.id, Resume.content).filter(
+            Resume.id > last_id, Resume.content.isnot(None)
+        ).order_by(Resume.id).limit(batch_size).all()
+        if not rows:
+            return
+        for row in rows:
+            yield row.id, extract_all_content(row.content)
+        last_id = rows[-1].id
+
+
+def build_local_index(db: Session, batch_size: int = 1000, force: bool = True) -> Optional[int]:
+    """DB 의 모든 이력서로 로컬 표절 인덱스 구성 (색인한 이력서 수 반환)
+
+    여러 워커가 동시에 구성하지 않도록 인덱스 디렉토리의 build.lock 을 잡는다.
+    다른 워커가 구성 중이거나, force=False 인데 이미 구성돼 있으면 None.
+    """
+    index = get_local_plagiarism_index()
+    with open(os.path.join(index.directory, "build.lock"), "a+") as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return None
+        if not force and index.has_snapshot():
+            return None
+        started = datetime.now()
+        indexed = index.rebuild(_iter_resume_documents(db, batch_size))
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(f"로컬 표절 인덱스 구성 완료: {indexed}개 ({elapsed:.1f}초)")
+        return indexed
+
+
+def _build_local_index_in_background():
+    db = SessionLocal()
+    try:
+        build_local_index(db, force=False)
+    except Exception as e:
+        logger.error(f"로컬 표절 인덱스 자동 구성 실패: {e}")
+    finally:
+        db.close()
+
+
+def ensure_local_index_build():
+    """인덱스가 구성되지 않았으면 백그라운드 스레드로 구성 시작 (실행 중이거나 최근 실패했으면 건너뜀)"""
+    global _index_build_thread, _index_build_started_at
+    if not PLAGIARISM_INDEX_AUTO_BUILD:
+        return
+    with _index_build_lock:
+        if _index_build_thread is not None and (
+            _index_build_thread.is_alive() or time.monotonic() - _index_build_started_at < INDEX_BUILD_RETRY_SECONDS
+        ):
+            return
+        _index_build_started_at = time.monotonic()
+        _index_build_thread = threading.Thread(
+            target=_build_local_index_in_background, name="plagiarism-index-build", daemon=True
+        )
+        _index_build_thread.start()
+
+
+def index_resume_content(resume_id: int, resume_content: Optional[str]):
+    """이력서 저장 시 로컬 표절 인덱스 증분 갱신 (실패해도 저장은 계속)"""
+    try:
+        index = get_local_plagiarism_index()
+        pure_content = extract_all_content(resume_content or "")
+        if pure_content and pure_content.strip():
+            index.upsert(resume_id, pure_content)
+        else:
+            index.delete(resume_id)
+    except Exception as e:
+        logger.warning(f"로컬 표절 인덱스 갱신 실패 (resume_{resume_id}): {e}")
+
+
+def remove_resume_from_index(resume_id: int):
+    try:
+        get_local_plagiarism_index().delete(resume_id)
+    except Exception as e:
+        logger.warning(f"로컬 표절 인덱스 삭제 실패 (resume_{resume_id}): {e}")
+
 def extract_all_content(resume_content):
     """
     resume.content가 JSON 배열이면 각 항목의 content만 이어붙여 반환.
@@ -31,11 +154,30 @@ class ResumePlagiarismService:
     def __init__(self, chroma_persist_dir: str = "./chroma_db"):
         """
         Args:
-            chroma_persist_dir: ChromaDB 데이터 저장 디렉토리
+            chroma_persist_dir: ChromaDB 데이터 저장 디렉토리 (임베딩 검사용)
+
+        표절 검사는 로컬 MinHash/LSH 인덱스로 한다. OpenAI 임베딩 / ChromaDB 는
+        detect_plagiarism_by_embedding 및 임베딩 관리 API 에서만 쓰이므로 처음 사용할 때 생성한다.
         """
-        self.embedder = OpenAIEmbedder()
-        self.chroma_manager = ChromaDBManager(persist_directory=chroma_persist_dir)
+        self.chroma_persist_dir = chroma_persist_dir
+        self.local_index = get_local_plagiarism_index()
+        self._embedder = None
+        self._chroma_manager = None
         logger.info("이력서 표절 검사 서비스 초기화 완료")
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            from app.utils.openai_embedding_utils import OpenAIEmbedder
+            self._embedder = OpenAIEmbedder()
+        return self._embedder
+
+    @property
+    def chroma_manager(self):
+        if self._chroma_manager is None:
+            from app.utils.chromadb_utils import ChromaDBManager
+            self._chroma_manager = ChromaDBManager(persist_directory=self.chroma_persist_dir)
+        return self._chroma_manager
     
     def embed_and_store_resume(self, db: Session, resume_id: int) -> bool:
         """
@@ -138,9 +280,110 @@ class ResumePlagiarismService:
             logger.error(f"일괄 임베딩 중 오류: {e}")
             return {"success": 0, "failed": 0, "total": 0, "error": str(e)}
     
-    def detect_plagiarism(self, resume_content: str, resume_id: Optional[int] = None, similarity_threshold: float = 0.9) -> Dict:
+    def detect_plagiarism(self, resume_content: str, resume_id: Optional[int] = None, similarity_threshold: float = 0.9, db: Optional[Session] = None) -> Dict:
+        """
+        이력서 표절 검사 (로컬 MinHash/LSH, 외부 호출 없음)
+
+        LSH 로 청크가 겹치는 후보를 찾고, 후보 원문과 shingle 을 대조해
+        similarity(검사 이력서 shingle 중 후보에도 있는 비율)와 일치 구간을 계산한다.
+
+        Args:
+            resume_content: 검사할 이력서 내용
+            resume_id: 이력서 ID (자기 자신 제외용)
+            similarity_threshold: 표절 의심 임계값
+            db: 후보 원문 조회용 세션 (없으면 새로 열고 닫음)
+
+        Returns:
+            표절 검사 결과
         """
-        이력서 표절 검사
+        if not resume_content or not resume_content.strip():
+            return {
+                "input_resume_id": resume_id,
+                "most_similar_resume": None,
+                "plagiarism_suspected": False,
+                "similarity_threshold": similarity_threshold,
+                "error": "이력서 내용이 비어있습니다."
+            }
+
+        if not local_index_ready():
+            # 전체 구성 전의 인덱스는 최근 저장된 이력서만 담고 있으므로 구성되는 동안은 임베딩 검사 사용
+            ensure_local_index_build()
+            return {**self.detect_plagiarism_by_embedding(resume_content, resume_id, similarity_threshold), "engine": "embedding"}
+
+        own_session = db is None
+        if own_session:
+            db = SessionLocal()
+        try:
+            candidates = self.local_index.candidates(resume_content, exclude=resume_id, limit=CANDIDATE_LIMIT)
+            candidate_ids = [candidate_id for candidate_id, _, _ in candidates]
+            rows = db.query(Resume.id, Resume.user_id, Resume.title, Resume.content).filter(
+                Resume.id.in_(candidate_ids)
+            ).all() if candidate_ids else []
+
+            similar_resumes = []
+            for row in rows:
+                overlap = shingle_overlap(resume_content, extract_all_content(row.content or ""))
+                longest_span = max((span["end"] - span["start"] for span in overlap["spans"]), default=0)
+                if not overlap["spans"]:
+                    continue
+                similar_resumes.append({
+                    "resume_id": row.id,
+                    "user_id": row.user_id,
+                    "title": row.title or "제목 없음",
+                    "similarity": overlap["containment"],
+                    "jaccard": overlap["jaccard"],
+                    "longest_match_chars": longest_span,
+                    "matching_spans": overlap["spans"],
+                    "source_spans": overlap["source_spans"],
+                })
+            similar_resumes.sort(key=lambda item: (item["similarity"], item["longest_match_chars"]), reverse=True)
+
+            if not similar_resumes:
+                return {
+                    "input_resume_id": resume_id,
+                    "most_similar_resume": None,
+                    "plagiarism_suspected": False,
+                    "similarity_threshold": similarity_threshold,
+                    "message": "유사한 이력서가 없습니다.",
+                    "engine": "minhash"
+                }
+
+            most_similar = similar_resumes[0]
+            plagiarism_suspected = any(
+                item["similarity"] >= similarity_threshold or item["longest_match_chars"] >= SUSPECT_SPAN_CHARS
+                for item in similar_resumes
+            )
+            if plagiarism_suspected:
+                logger.warning(
+                    f"표절 의심 이력서 발견: {resume_id} -> {most_similar['resume_id']} "
+                    f"(유사도: {most_similar['similarity']}, 최장 일치: {most_similar['longest_match_chars']}자)"
+                )
+
+            return {
+                "input_resume_id": resume_id,
+                "most_similar_resume": most_similar,
+                "plagiarism_suspected": plagiarism_suspected,
+                "similarity_threshold": similarity_threshold,
+                "all_similar_resumes": similar_resumes[:3],  # 상위 3개만 반환
+                "engine": "minhash"
+            }
+
+        except Exception as e:
+            logger.error(f"표절 검사 중 오류: {e}")
+            return {
+                "input_resume_id": resume_id,
+                "most_similar_resume": None,
+                "plagiarism_suspected": False,
+                "similarity_threshold": similarity_threshold,
+                "error": str(e)
+            }
+        finally:
+            if own_session:
+                db.close()
+
+    def detect_plagiarism_by_embedding(self, resume_content: str, resume_id: Optional[int] = None, similarity_threshold: float = 0.9) -> Dict:
+        """
+        이력서 표절 검사 (OpenAI 임베딩 + ChromaDB 문서 단위 유사도)
         
         Args:
             resume_content: 검사할 이력서 내용
@@ -310,17 +553,18 @@ class ResumePlagiarismService:
                     "error": "이력서를 찾을 수 없습니다."
                 }
             
-            # 3. force=True면 먼저 해당 이력서를 새로 임베딩하고 ChromaDB에 저장
+            # 3. force=True면 먼저 해당 이력서를 로컬 인덱스에 다시 색인
             if force:
-                logger.info(f"강제 재검사: 이력서 {resume_id} 새로 임베딩 및 저장")
-                self.embed_and_store_resume(db, resume_id)
+                logger.info(f"강제 재검사: 이력서 {resume_id} 로컬 인덱스 재색인")
+                index_resume_content(resume_id, resume.content)
             
             # 4. 표절 검사 실행
             logger.info(f"새로운 표절 검사 실행: resume_id={resume_id}, force={force}")
             result = self.detect_plagiarism(
                 resume_content=extract_all_content(resume.content),
                 resume_id=resume_id,
-                similarity_threshold=similarity_threshold
+                similarity_threshold=similarity_threshold,
+                db=db
             )
             
             # 5. 결과를 DB에 저장 (plagiarism_score, plagiarism_checked_at, most_similar_resume_id, similarity_threshold)
@@ -338,6 +582,105 @@ class ResumePlagiarismService:
                 "error": str(e)
             }
     
+    def screen_job_post(self, db: Session, job_post_id: int, similarity_threshold: float = 0.9, embed_missing: bool = False) -> Dict:
+        """
+        공고 지원자 이력서끼리 전체 쌍 표절 검사 (공고 마감 시 일괄 검사용)
+        
+        ChromaDB 에 저장된 임베딩을 한 행렬로 모아 블록 행렬곱으로 모든 쌍의 코사인 유사도를 구하고,
+        임계값 이상으로 연결된 의심 그룹을 묶는다.
+        코사인 유사도는 단건 검사가 resume.plagiarism_score 에 저장하는 containment 유사도와 척도가 달라
+        DB 에 저장하지 않고 응답(의심 이력서별 최대 유사도/가장 유사한 이력서)으로만 돌려준다.
+        
+        Args:
+            db: 데이터베이스 세션
+            job_post_id: 공고 ID
+            similarity_threshold: 표절 의심 임계값
+            embed_missing: 임베딩이 없는 이력서를 먼저 임베딩할지 여부 (OpenAI 호출)
+            
+        Returns:
+            검사 결과 요약 (의심 그룹, 의심 쌍, 의심 이력서, 임베딩 누락 이력서)
+        """
+        started = datetime.now()
+        resume_ids = [
+            row.resume_id for row in db.query(Application.resume_id).filter(
+                Application.job_post_id == job_post_id,
+                Application.resume_id.isnot(None)
+            ).distinct().order_by(Application.resume_id).all()
+        ]
+        if not resume_ids:
+            return {"job_post_id": job_post_id, "total_resumes": 0, "screened_resumes": 0, "groups": [], "pairs": []}
+        
+        ids, embeddings = self.chroma_manager.get_resume_embeddings(resume_ids)
+        missing = sorted(set(resume_ids) - set(ids))
+        if missing and embed_missing:
+            self.batch_embed_resumes(db, missing)
+            ids, embeddings = self.chroma_manager.get_resume_embeddings(resume_ids)
+            missing = sorted(set(resume_ids) - set(ids))
+        
+        if len(ids) < 2:
+            return {
+                "job_post_id": job_post_id,
+                "total_resumes": len(resume_ids),
+                "screened_resumes": len(ids),
+                "missing_embeddings": missing,
+                "groups": [],
+                "pairs": [],
+            }
+        
+        screening = screen_pairs(embeddings, similarity_threshold)
+        
+        suspected = [
+            {
+                "resume_id": resume_id,
+                "similarity": round(float(screening.best_similarity[index]), 4),
+                "most_similar_resume_id": ids[screening.best_match[index]],
+            }
+            for index, resume_id in enumerate(ids)
+            if screening.best_match[index] >= 0 and screening.best_similarity[index] >= similarity_threshold
+        ]
+        
+        order = np.argsort(-screening.pair_similarity)
+        pairs = [
+            {
+                "resume_id": ids[screening.pairs[index, 0]],
+                "similar_resume_id": ids[screening.pairs[index, 1]],
+                "similarity": round(float(screening.pair_similarity[index]), 4),
+            }
+            for index in order[:PAIR_REPORT_LIMIT]
+        ]
+        groups = label_clusters(screening.clusters, ids)
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(
+            f"공고 {job_post_id} 일괄 표절 검사 완료: {len(ids)}개 이력서, "
+            f"의심 쌍 {len(screening.pair_similarity)}개, 의심 그룹 {len(groups)}개 ({elapsed:.1f}초)"
+        )
+        return {
+            "job_post_id": job_post_id,
+            "total_resumes": len(resume_ids),
+            "screened_resumes": len(ids),
+            "missing_embeddings": missing,
+            "similarity_threshold": similarity_threshold,
+            "suspicious_pair_count": int(screening.pair_similarity.size),
+            "pairs_truncated": screening.pairs_truncated,
+            "groups": groups,
+            "pairs": pairs,
+            "suspected_resumes": suspected,
+            "elapsed_seconds": round(elapsed, 2),
+        }
+    
+    def rebuild_local_index(self, db: Session, batch_size: int = 1000) -> Optional[Dict]:
+        """DB 의 모든 이력서로 로컬 표절 인덱스 재구성 (다른 워커가 구성 중이면 None)"""
+        started = datetime.now()
+        indexed = build_local_index(db, batch_size=batch_size)
+        if indexed is None:
+            return None
+        elapsed = (datetime.now() - started).total_seconds()
+        return {"indexed": indexed, "elapsed_seconds": round(elapsed, 2), **self.local_index.stats()}
+
+    def get_local_index_stats(self) -> Dict:
+        """로컬 표절 인덱스 통계"""
+        return {"index_directory": self.local_index.directory, **self.local_index.stats()}
+
     def get_collection_stats(self) -> Dict:
         """ChromaDB 컬렉션 통계 반환"""
         return self.chroma_manager.get_collection_stats()
@@ -0,0 +1,405 @@
+"""
+이력서 프로필 서비스
+
+spec 테이블(EAV: spec_type / spec_title / spec_description) 을 이력서당 한 행의
+ResumeProfile 로 만들어 두고, 지원자 목록·AI 평가·면접 질문 생성·성장 예측·리포트가
+spec 행을 매번 문자열 비교로 훑는 대신 이 프로필을 읽게 한다.
+
+- 프로필은 spec 이 ORM 으로 추가/수정/삭제되면 커밋 직후 다시 만든다.
+- SQL 로 직접 넣은 spec 은 load_profiles 가 프로필이 없는 이력서를 만나면 그 자리에서 만들고,
+  전체 재구성은 rebuild_all 로 한다.
+"""
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.resume import Resume, Spec
+from app.models.resume_profile import EDUCATION_LEVELS, ResumeProfile
+
+logger = logging.getLogger(__name__)
+
+# 같은 의미로 쓰이는 spec_type 표기
+SPEC_TYPE_ALIASES = {
+    "학력": "education",
+    "경력": "experience",
+    "자격증": "certifications",
+    "certificate": "certifications",
+    "projects": "project_experience",
+    "프로젝트": "project_experience",
+    "skill": "skills",
+    "기술": "skills",
+}
+
+_DEGREE_PATTERN = re.compile(r"(.+?)\((.+?)\)")
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
+# 지원서 상세 응답의 학력 항목 키 (degree_raw / major_spec 은 평가용 내부 값이라 내보내지 않음)
+EDUCATION_RESPONSE_FIELDS = (
+    "period", "schoolName", "major", "graduated", "degree", "gpa", "duration", "startDate", "endDate"
+)
+
+# 프로필 컬럼 (resume_id 제외)
+_PROFILE_FIELDS = [
+    "institution", "degree_raw", "major", "degree", "education_level", "gpa",
+    "education_start_date", "education_end_date", "certificate_count",
+    "experience_years", "promotion_speed_years", "kpi_score",
+    "educations", "certificates", "awards", "skills", "experiences", "work_experiences",
+    "spec_count",
+]
+
+
+def parse_number(value: Optional[str]) -> Optional[float]:
+    """문자열에서 첫 숫자 추출 (예: "3.8/4.5" → 3.8, "약 3년" → 3.0)"""
+    if value is None:
+        return None
+    match = _NUMBER_PATTERN.search(str(value))
+    return float(match.group()) if match else None
+
+
+def education_level_of(degree_raw: Optional[str]) -> int:
+    """degree 문자열 → 학력 수준 코드 (괄호 안 학위 우선)"""
+    if not degree_raw:
+        return 0
+    match = re.search(r"\((.*?)\)", degree_raw)
+    degree_text = match.group(1) if match else degree_raw
+    for keyword, level in EDUCATION_LEVELS:
+        if keyword in degree_text:
+            return level
+    return 0
+
+
+def split_major_degree(school_name: str, degree_raw: str):
+    """학교명과 degree 원문 → (전공, 학위). 고등학교/대학이 아닌 곳은 빈 값"""
+    if "고등학교" in school_name:
+        return "", ""
+    if ("대학교" in school_name or "대학" in school_name) and degree_raw:
+        match = _DEGREE_PATTERN.match(degree_raw)
+        if match:
+            return (match.group(1).strip() if match.group(1) else degree_raw.strip()), (match.group(2).strip() if match.group(2) else "")
+        return degree_raw.strip(), ""
+    return "", ""
+
+
+class ResumeProfileService:
+
+    @staticmethod
+    def build_profile_data(specs: Iterable[Any]) -> Dict[str, Any]:
+        """spec 목록(ORM 객체 또는 spec_type/spec_title/spec_description dict) → 프로필 컬럼 값
+
+        같은 항목의 여러 spec (예: 자격증 name → date → duration) 은 id 순으로 이어진다고 보고
+        마지막으로 시작된 항목에 붙인다.
+        """
+        educations: List[Dict[str, Any]] = []
+        awards: List[Dict[str, Any]] = []
+        certificates: List[Dict[str, Any]] = []
+        skills: List[str] = []
+        experiences: List[Dict[str, Any]] = []
+        work_experiences: List[Dict[str, Any]] = []
+        numbers: Dict[str, Optional[float]] = {"experience_years": None, "promotion_speed_years": None, "kpi_score": None}
+        spec_count = 0
+
+        for spec in specs:
+            if isinstance(spec, dict):
+                spec_type, spec_title, description = spec.get("spec_type"), spec.get("spec_title"), spec.get("spec_description")
+            else:
+                spec_type, spec_title, description = spec.spec_type, spec.spec_title, spec.spec_description
+            spec_count += 1
+            spec_type = SPEC_TYPE_ALIASES.get(str(spec_type), str(spec_type))
+            spec_title = str(spec_title)
+            description = description or ""
+
+            if spec_type == "education":
+                if spec_title == "institution":
+                    educations.append({
+                        "period": "", "schoolName": description, "major": "", "graduated": False,
+                        "degree": "", "degree_raw": "", "gpa": "", "duration": ""
+                    })
+                elif not educations:
+                    continue
+                elif spec_title == "degree":
+                    major, degree = split_major_degree(educations[-1]["schoolName"] or "", description)
+                    educations[-1].update({"degree_raw": description, "major": major, "degree": degree})
+                elif spec_title == "major":
+                    educations[-1]["major_spec"] = description
+                elif spec_title == "start_date":
+                    educations[-1]["startDate"] = description
+                elif spec_title == "end_date":
+                    educations[-1]["endDate"] = description
+                elif spec_title in ("gpa", "duration"):
+                    educations[-1][spec_title] = description
+
+            elif spec_type == "awards":
+                if spec_title == "title":
+                    awards.append({"title": description, "date": "", "description": "", "duration": ""})
+                elif awards and spec_title in ("date", "description", "duration"):
+                    awards[-1][spec_title] = description
+
+            elif spec_type == "certifications":
+                if spec_title == "name":
+                    certificates.append({"name": description, "date": "", "duration": ""})
+                elif certificates and spec_title in ("date", "duration"):
+                    certificates[-1][spec_title] = description
+
+            elif spec_type == "skills":
+                if description:
+                    skills.append(description)
+
+            elif spec_type == "activities":
+                if spec_title in ("organization", "name"):
+                    experiences.append({
+                        "type": "activity", "organization": description, "role": "",
+                        "period": "", "description": "", "duration": ""
+                    })
+                elif experiences and experiences[-1]["type"] == "activity" and spec_title in ("role", "period", "description", "duration"):
+                    experiences[-1][spec_title] = description
+
+            elif spec_type == "project_experience":
+                if spec_title in ("title", "name"):
+                    experiences.append({
+                        "type": "project", "title": description, "role": "",
+                        "duration": "", "technologies": "", "description": ""
+                    })
+                elif experiences and experiences[-1]["type"] == "project" and spec_title in ("role", "duration", "technologies", "description"):
+                    experiences[-1][spec_title] = description
+
+            elif spec_type == "experience":
+                if spec_title == "years":
+                    numbers["experience_years"] = parse_number(description)
+                elif spec_title == "company":
+                    work_experiences.append({"company": description, "position": "", "duration": ""})
+                elif spec_title in ("position", "duration"):
+                    if not work_experiences:
+                        work_experiences.append({"company": "", "position": "", "duration": ""})
+                    work_experiences[-1][spec_title] = description
+                else:
+                    work_experiences.append({"company": spec_title, "position": "", "duration": description})
+
+            elif spec_type == "promotion_speed" and spec_title == "years":
+                numbers["promotion_speed_years"] = parse_number(description)
+
+            elif spec_type == "kpi" and spec_title == "score":
+                numbers["kpi_score"] = parse_number(description)
+
+        first = educations[0] if educations else {}
+        return {
+            "institution": first.get("schoolName") or None,
+            "degree_raw": first.get("degree_raw") or None,
+            "major": first.get("major") or first.get("major_spec") or None,
+            "degree": first.get("degree") or None,
+            "education_level": education_level_of(first.get("degree_raw")),
+            "gpa": parse_number(first.get("gpa")),
+            "education_start_date": first.get("startDate"),
+            "education_end_date": first.get("endDate"),
+            "certificate_count": len(certificates),
+            **numbers,
+            "educations": educations,
+            "certificates": certificates,
+            "awards": awards,
+            "skills": skills,
+            "experiences": experiences,
+            "work_experiences": work_experiences,
+            "spec_count": spec_count,
+        }
+
+    @staticmethod
+    def _build_rows(db: Session, resume_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        resume_ids = sorted(set(resume_ids))
+        if not resume_ids:
+            return []
+        existing = {
+            row.id for row in db.query(Resume.id).filter(Resume.id.in_(resume_ids)).all()
+        }
+        specs_by_resume: Dict[int, List[Spec]] = {resume_id: [] for resume_id in existing}
+        for spec in db.query(Spec).filter(Spec.resume_id.in_(existing)).order_by(Spec.resume_id, Spec.id).all():
+            specs_by_resume[spec.resume_id].append(spec)
+        return [
+            {"resume_id": resume_id, **ResumeProfileService.build_profile_data(specs)}
+            for resume_id, specs in specs_by_resume.items()
+        ]
+
+    @staticmethod
+    def _upsert(db: Session, rows: List[Dict[str, Any]]):
+        statement = mysql_insert(ResumeProfile).values(rows)
+        statement = statement.on_duplicate_key_update(
+            **{name: statement.inserted[name] for name in _PROFILE_FIELDS}
+        )
+        db.execute(statement)
+        db.commit()
+
+    @staticmethod
+    def refresh(db: Session, resume_ids: Iterable[int]) -> int:
+        """이력서들의 프로필을 spec 에서 다시 만들어 저장 (INSERT … ON DUPLICATE KEY UPDATE 한 번)"""
+        rows = ResumeProfileService._build_rows(db, resume_ids)
+        if rows:
+            ResumeProfileService._upsert(db, rows)
+        return len(rows)
+
+    @staticmethod
+    def load_profiles(db: Session, resume_ids: Iterable[int]) -> Dict[int, ResumeProfile]:
+        """이력서 ID 들의 프로필 일괄 조회
+
+        프로필이 없는 이력서는 spec 으로 바로 만들어 반환하고, 저장은 별도 세션으로 한다
+        (호출한 쪽의 트랜잭션을 커밋하지 않도록).
+        """
+        resume_ids = {resume_id for resume_id in resume_ids if resume_id is not None}
+        if not resume_ids:
+            return {}
+        profiles = {
+            profile.resume_id: profile
+            for profile in db.query(ResumeProfile).filter(ResumeProfile.resume_id.in_(resume_ids)).all()
+        }
+        missing = resume_ids - set(profiles)
+        if missing:
+            rows = ResumeProfileService._build_rows(db, missing)
+            profiles.update({row["resume_id"]: ResumeProfile(**row) for row in rows})
+            if rows:
+                write_db = SessionLocal()
+                try:
+                    ResumeProfileService._upsert(write_db, rows)
+                except Exception as e:
+                    write_db.rollback()
+                    logger.warning(f"이력서 프로필 저장 실패 ({len(rows)}개): {e}")
+                finally:
+                    write_db.close()
+        return profiles
+
+    @staticmethod
+    def load_profile(db: Session, resume_id: Optional[int]) -> Optional[ResumeProfile]:
+        if resume_id is None:
+            return None
+        return ResumeProfileService.load_profiles(db, [resume_id]).get(resume_id)
+
+    @staticmethod
+    def rebuild_all(db: Session, batch_size: int = 500) -> int:
+        """모든 이력서 프로필 재구성 (SQL 로 spec 을 직접 넣은 뒤 실행)"""
+        total = 0
+        last_id = 0
+        while True:
+            resume_ids = [
+                row.id for row in db.query(Resume.id).filter(Resume.id > last_id).order_by(Resume.id).limit(batch_size).all()
+            ]
+            if not resume_ids:
+                break
+            total += ResumeProfileService.refresh(db, resume_ids)
+            last_id = resume_ids[-1]
+        logger.info(f"이력서 프로필 재구성 완료: {total}개")
+        return total
+
+    @staticmethod
+    def to_spec_data(profile: Optional[ResumeProfile]) -> Dict[str, Any]:
+        """AI 서류 평가 에이전트 입력(spec_data) 형태"""
+        spec_data: Dict[str, Any] = {
+            "education": {},
+            "certifications": [],
+            "awards": [],
+            "skills": {},
+            "activities": [],
+            "projects": [],
+            "portfolio": {}
+        }
+        if profile is None:
+            return spec_data
+
+        if profile.educations:
+            first = profile.educations[0]
+            spec_data["education"] = {
+                "university": profile.institution,
+                "major": first.get("major_spec") or profile.major,
+                "degree": profile.degree_raw,
+                "gpa": profile.gpa or 0.0,
+                "start_date": profile.education_start_date,
+                "end_date": profile.education_end_date,
+            }
+        spec_data["certifications"] = [
+            f"{cert['name']} ({cert['date']})" if cert.get("date") else cert["name"]
+            for cert in profile.certificates or []
+        ]
+        for award in profile.awards or []:
+            text = award["title"]
+            if award.get("date"):
+                text = f"{text} ({award['date']})"
+            if award.get("description"):
+                text = f"{text} - {award['description']}"
+            spec_data["awards"].append(text)
+        if profile.skills:
+            spec_data["skills"]["programming_languages"] = list(profile.skills)
+        for experience in profile.experiences or []:
+            if experience["type"] == "activity":
+                keys = ("organization", "role", "period", "description")
+                spec_data["activities"].append({key: experience.get(key, "") for key in keys})
+            else:
+                keys = ("title", "role", "duration", "technologies", "description")
+                spec_data["projects"].append({key: experience.get(key, "") for key in keys})
+        return spec_data
+
+    @staticmethod
+    def to_education_entries(profile: Optional[ResumeProfile]) -> List[Dict[str, Any]]:
+        """지원서 상세 응답의 educations (응답 필드만)"""
+        if profile is None:
+            return []
+        return [
+            {key: education[key] for key in EDUCATION_RESPONSE_FIELDS if key in education}
+            for education in profile.educations or []
+        ]
+
+    @staticmethod
+    def to_applicant_summary(profile: Optional[ResumeProfile]) -> Dict[str, Any]:
+        """지원자 목록 응답의 학력/자격증 필드"""
+        if profile is None or not profile.spec_count:
+            return {"education": None, "degree": None, "major": None, "degree_type": None, "certificates": []}
+        return {
+            "education": profile.institution,
+            "degree": profile.degree_raw,
+            "major": profile.major or "",
+            "degree_type": profile.degree or "",
+            "certificates": [cert for cert in profile.certificates or [] if cert.get("name")],
+        }
+
+
+# ---------------------------------------------------------------------------
+# spec 이 ORM 으로 바뀌면 커밋 후 해당 이력서 프로필을 다시 만든다
+# ---------------------------------------------------------------------------
+
+_PENDING_KEY = "resume_profile_refresh"
+
+
+@event.listens_for(Spec, "after_insert")
+@event.listens_for(Spec, "after_update")
+@event.listens_for(Spec, "after_delete")
+def _mark_spec_changed(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None and target.resume_id is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.resume_id)
+
+
+@event.listens_for(Spec.resume_id, "set", active_history=True)
+def _mark_spec_moved(target, value, oldvalue, initiator):
+    """spec 이 다른 이력서로 옮겨지면 이전 이력서 프로필도 다시 만든다 (active_history 로 만료된 이전 값도 읽음)"""
+    session = Session.object_session(target)
+    if session is not None and isinstance(oldvalue, int) and oldvalue != value:
+        session.info.setdefault(_PENDING_KEY, set()).add(oldvalue)
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_commit(session):
+    resume_ids: Optional[Set[int]] = session.info.pop(_PENDING_KEY, None)
+    if not resume_ids:
+        return
+    db = SessionLocal()
+    try:
+        ResumeProfileService.refresh(db, resume_ids)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"이력서 프로필 갱신 실패 ({sorted(resume_ids)}): {e}")
+    finally:
+        db.close()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -1,5 +1,6 @@
 import logging
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from typing import List, Dict, Optional, Tuple
 import os
@@ -152,6 +153,29 @@ class ChromaDBManager:
             logger.error(f"유사 이력서 검색 실패: {e}")
             return []
     
+    def get_resume_embeddings(self, resume_ids: List[int], batch_size: int = 5000) -> Tuple[List[int], np.ndarray]:
+        """
+        저장된 이력서 임베딩을 하나의 float32 행렬로 조회
+        
+        Args:
+            resume_ids: 조회할 이력서 ID 리스트
+            batch_size: ChromaDB get 한 번에 조회할 ID 수
+            
+        Returns:
+            (임베딩이 있는 이력서 ID 리스트, (n, dim) float32 행렬) - 임베딩이 없는 ID 는 빠짐
+        """
+        found: Dict[int, np.ndarray] = {}
+        for start in range(0, len(resume_ids), batch_size):
+            batch = resume_ids[start:start + batch_size]
+            results = self.collection.get(ids=[f"resume_{resume_id}" for resume_id in batch], include=["embeddings"])
+            for doc_id, embedding in zip(results["ids"], results["embeddings"]):
+                found[int(doc_id.split("_", 1)[1])] = np.asarray(embedding, dtype=np.float32)
+        
+        ordered_ids = [resume_id for resume_id in resume_ids if resume_id in found]
+        if not ordered_ids:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        return ordered_ids, np.vstack([found[resume_id] for resume_id in ordered_ids])
+    
     def get_collection_stats(self) -> Dict:
         """컬렉션 통계 정보 반환"""
         try:
@@ -1,25 +1,40 @@
 import logging
-from typing import List, Union
+import threading
+from typing import Dict, List, Union
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
 class TextEmbedder:
-    """텍스트 임베딩을 위한 유틸리티 클래스"""
+    """텍스트 임베딩을 위한 유틸리티 클래스
+
+    sentence-transformers(torch) import 와 모델 로드는 수 초가 걸리므로 처음 임베딩할 때 한다.
+    """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME):
         """
         Args:
             model_name: HuggingFace sentence-transformers 모델명
         """
-        try:
-            self.model = SentenceTransformer(model_name)
-            logger.info(f"임베딩 모델 로드 완료: {model_name}")
-        except Exception as e:
-            logger.error(f"임베딩 모델 로드 실패: {e}")
-            raise
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                        self._model = SentenceTransformer(self.model_name)
+                        logger.info(f"임베딩 모델 로드 완료: {self.model_name}")
+                    except Exception as e:
+                        logger.error(f"임베딩 모델 로드 실패: {e}")
+                        raise
+        return self._model
     
     def embed_texts(self, texts: List[str]) -> np.ndarray:
         """
@@ -62,6 +77,7 @@ class TextEmbedder:
         Returns:
             코사인 유사도 (0~1)
         """
+        from sklearn.metrics.pairwise import cosine_similarity
         embeddings = self.embed_texts([text1, text2])
         similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
         return float(similarity)
@@ -78,6 +94,7 @@ class TextEmbedder:
         Returns:
             (텍스트, 유사도) 튜플 리스트, 유사도 내림차순
         """
+        from sklearn.metrics.pairwise import cosine_similarity
         query_embedding = self.embed_single_text(query_text)
         candidate_embeddings = self.embed_texts(candidate_texts)
         
@@ -89,6 +106,21 @@ class TextEmbedder:
         
         return similarity_pairs[:top_k]
 
+
+_embedders: Dict[str, TextEmbedder] = {}
+_embedders_lock = threading.Lock()
+
+
+def get_text_embedder(model_name: str = DEFAULT_MODEL_NAME) -> TextEmbedder:
+    """모델별 공용 TextEmbedder (요청마다 모델을 다시 로드하지 않도록)"""
+    embedder = _embedders.get(model_name)
+    if embedder is None:
+        with _embedders_lock:
+            embedder = _embedders.get(model_name)
+            if embedder is None:
+                embedder = _embedders[model_name] = TextEmbedder(model_name)
+    return embedder
+
 def create_career_text(high_performer_data: dict) -> str:
     """
     고성과자 데이터를 경력 텍스트로 변환
@@ -67,16 +67,27 @@ def generate_cache_key(func_name: str, args: tuple, kwargs: dict, prefix: str) -
     key_string = json.dumps(key_data, sort_keys=True, default=str)
     hash_value = hashlib.md5(key_string.encode()).hexdigest()
     
-    return f"{prefix}:{func_name}:{hash_value}"
+    # ID 인자는 키에 그대로 남겨 패턴으로 무효화할 수 있게 한다
+    # (예: api_cache:get_applicants_by_job:job_post_id_17:<hash> ← "api_cache:get_applicants_by_job:*job_post_id_17:*")
+    id_parts = [
+        f"{name}_{value}" for name, value in sorted(kwargs.items())
+        if name.endswith("_id") and isinstance(value, int) and not isinstance(value, bool)
+    ]
+    return ":".join([prefix, func_name, *id_parts, hash_value])
 
-def invalidate_cache(pattern: str = "*"):
-    """캐시 무효화"""
+def invalidate_cache(pattern: str = "*", batch_size: int = 500):
+    """캐시 무효화 (KEYS 대신 SCAN 으로 나눠 찾아 Redis 를 막지 않음)"""
     try:
-        keys = redis_client.keys(pattern)
-        if keys:
-            redis_client.delete(*keys)
-            return len(keys)
-        return 0
+        deleted = 0
+        batch = []
+        for key in redis_client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += redis_client.delete(*batch)
+                batch = []
+        if batch:
+            deleted += redis_client.delete(*batch)
+        return deleted
     except Exception as e:
         print(f"캐시 무효화 실패: {e}")
         return 0
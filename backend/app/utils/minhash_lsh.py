@@ -0,0 +1,425 @@
+"""
+MinHash / LSH 기반 근사 중복(표절) 탐지 인덱스
+
+외부 API 호출 없이 로컬에서 동작한다.
+
+- 문서를 내용 기반 경계(content-defined chunking)로 청크를 나누고, 청크마다 문자 k-gram shingle 의 MinHash 서명을 만든다.
+  (문서 전체가 아니라 청크 단위라서, 다른 내용 사이에 복사된 문단도 잡아낸다)
+- 서명을 band 로 나눈 해시를 band 별 정렬 배열에 저장하고, 조회는 searchsorted 로 한다.
+  1M 청크 기준 메모리는 band 해시(uint32) 행렬 + 정렬 인덱스 정도.
+- 추가/삭제는 append-only 저널에 기록하고, 다른 워커는 조회 전에 저널의 새 부분만 읽어 반영한다.
+  compact() 가 스냅샷(npz)을 새로 쓰고 저널을 비운다.
+"""
+import fcntl
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SHINGLE_SIZE = 5          # 문자 k-gram 길이
+NUM_PERM = 32             # MinHash 순열 수
+BANDS = 8                 # LSH band 수 (rows = NUM_PERM / BANDS = 4 → 청크 Jaccard 약 0.6 이상이 후보)
+CHUNK_CHARS = 64          # 내용 기반 청크의 평균 길이
+MIN_CHUNK_CHARS = 24      # 이보다 짧은 청크는 색인하지 않음 (상투적인 짧은 구절 배제)
+MAX_CHUNK_CHARS = 256
+MERGE_PENDING_CHUNKS = 2000  # 대기 청크가 이만큼 쌓이면 정렬 배열에 병합
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """소문자 + 연속 공백 하나로"""
+    return _WHITESPACE.sub(" ", (text or "").lower()).strip()
+
+
+def shingle_hashes(text: str, k: int = SHINGLE_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """정규화된 텍스트의 문자 k-gram 해시와 시작 위치"""
+    if len(text) < k:
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.int32)
+    count = len(text) - k + 1
+    hashes = np.fromiter(
+        (zlib.crc32(text[i:i + k].encode("utf-8")) for i in range(count)),
+        dtype=np.uint32, count=count
+    )
+    return hashes, np.arange(count, dtype=np.int32)
+
+
+def chunk_bounds(hashes: np.ndarray, average_chars: int = CHUNK_CHARS) -> List[Tuple[int, int]]:
+    """내용 기반 청크 경계 [(시작 shingle, 끝 shingle)]
+
+    shingle 해시가 average_chars 로 나누어떨어지는 위치를 경계로 삼는다.
+    경계가 앞 경계와 무관하게 내용만으로 정해지므로, 다른 글 안에 복사된 문단도
+    원본과 같은 청크로 잘려 같은 MinHash 를 갖는다. 너무 짧은 조각은 합치지 않고 버린다.
+    """
+    if hashes.size == 0:
+        return []
+    cuts = np.flatnonzero(hashes % np.uint32(average_chars) == 0).tolist()
+    bounds = []
+    for start, end in zip([0] + cuts, cuts + [int(hashes.size)]):
+        # 경계가 오래 나오지 않는 구간은 고정 길이로 나눔
+        for piece_start in range(start, end, MAX_CHUNK_CHARS):
+            piece_end = min(piece_start + MAX_CHUNK_CHARS, end)
+            if piece_end - piece_start >= MIN_CHUNK_CHARS:
+                bounds.append((piece_start, piece_end))
+    return bounds
+
+
+class MinHasher:
+    """(a·x + b) mod p 해시 계열을 이용한 MinHash"""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm 은 bands 의 배수여야 합니다.")
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._band_mult = rng.randint(1, 1 << 62, size=self.rows, dtype=np.uint64) | np.uint64(1)
+
+    def _permute(self, hashes: np.ndarray) -> np.ndarray:
+        # a, b < 2^32, x < 2^32 이므로 a·x + b 가 uint64 범위를 넘지 않음
+        return (np.outer(self.a, hashes.astype(np.uint64)) + self.b[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        if hashes.size == 0:
+            return np.full(self.num_perm, 0xFFFFFFFF, dtype=np.uint32)
+        return self._permute(hashes).min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """서명 (n, num_perm) → band 별 32bit 키 (n, bands)"""
+        bands = signatures.reshape(-1, self.bands, self.rows).astype(np.uint64)
+        mixed = (bands * self._band_mult).sum(axis=2)  # uint64 오버플로는 의도된 wrap-around
+        return ((mixed >> np.uint64(32)) ^ (mixed & _MAX_HASH)).astype(np.uint32)
+
+    def document_band_keys(self, text: str) -> np.ndarray:
+        """문서 → (청크 수, bands) band 키 행렬
+
+        문서의 shingle 을 한 번에 순열 해시하고 청크 구간별 최솟값을 reduceat 으로 구한다.
+        """
+        hashes, _ = shingle_hashes(normalize_text(text))
+        bounds = chunk_bounds(hashes)
+        if not bounds:
+            return np.zeros((0, self.bands), dtype=np.uint32)
+        permuted = self._permute(hashes)
+        # reduceat 은 [edges_i, edges_{i+1}) 구간을 줄이므로 시작/끝을 번갈아 넣고 짝수 번째만 사용
+        # (마지막 끝이 배열 끝이면 빼도 마지막 시작부터 끝까지 줄여짐)
+        edges = [edge for bound in bounds for edge in bound]
+        if edges[-1] == hashes.size:
+            edges.pop()
+        minima = np.minimum.reduceat(permuted, edges, axis=1)[:, ::2]
+        return self.band_keys(minima.T.astype(np.uint32))
+
+
+class LSHIndex:
+    """band 별 정렬 배열 + 소규모 대기 버퍼로 구성된 메모리 인덱스"""
+
+    def __init__(self, bands: int = BANDS):
+        self.bands = bands
+        self._reset()
+
+    def _reset(self):
+        # 병합된(정렬된) 부분
+        self._keys = np.zeros((0, self.bands), dtype=np.uint32)   # 청크 행 → band 키
+        self._owners = np.zeros(0, dtype=np.int64)                # 청크 행 → resume_id
+        self._sorted_keys: List[np.ndarray] = [np.zeros(0, dtype=np.uint32)] * self.bands
+        self._sorted_rows: List[np.ndarray] = [np.zeros(0, dtype=np.int32)] * self.bands
+        self._removed: set = set()                                 # 병합된 부분에서 지워진 resume_id
+        # 아직 병합되지 않은 부분
+        self._pending: Dict[int, np.ndarray] = {}
+        self._pending_lookup: List[Dict[int, set]] = [dict() for _ in range(self.bands)]
+        self._pending_chunks = 0
+
+    @property
+    def document_count(self) -> int:
+        merged = set(np.unique(self._owners).tolist()) - self._removed
+        return len(merged | set(self._pending))
+
+    @property
+    def chunk_count(self) -> int:
+        return int(self._owners.size) + self._pending_chunks
+
+    def add(self, resume_id: int, band_keys: np.ndarray):
+        self.remove(resume_id)
+        if band_keys.size == 0:
+            return
+        self._pending[resume_id] = band_keys
+        self._pending_chunks += band_keys.shape[0]
+        for band in range(self.bands):
+            lookup = self._pending_lookup[band]
+            for key in band_keys[:, band].tolist():
+                lookup.setdefault(key, set()).add(resume_id)
+        if self._pending_chunks >= MERGE_PENDING_CHUNKS:
+            self.merge()
+
+    def remove(self, resume_id: int):
+        self._removed.add(resume_id)
+        band_keys = self._pending.pop(resume_id, None)
+        if band_keys is None:
+            return
+        self._pending_chunks -= band_keys.shape[0]
+        for band in range(self.bands):
+            lookup = self._pending_lookup[band]
+            for key in band_keys[:, band].tolist():
+                owners = lookup.get(key)
+                if owners:
+                    owners.discard(resume_id)
+                    if not owners:
+                        del lookup[key]
+
+    def merge(self):
+        """대기 버퍼와 삭제 표시를 정렬 배열에 반영"""
+        alive = ~np.isin(self._owners, np.fromiter(self._removed, dtype=np.int64)) if self._removed else slice(None)
+        keys = [self._keys[alive]]
+        owners = [self._owners[alive]]
+        for resume_id, band_keys in self._pending.items():
+            keys.append(band_keys)
+            owners.append(np.full(band_keys.shape[0], resume_id, dtype=np.int64))
+        self.load(np.vstack(keys) if keys else self._keys, np.concatenate(owners))
+
+    def load(self, band_keys: np.ndarray, owners: np.ndarray):
+        """(청크 수, bands) 키 행렬과 소유 resume_id 로 정렬 배열 구성"""
+        self._reset()
+        self._keys = np.ascontiguousarray(band_keys, dtype=np.uint32)
+        self._owners = owners.astype(np.int64)
+        sorted_keys, sorted_rows = [], []
+        for band in range(self.bands):
+            order = np.argsort(self._keys[:, band], kind="stable").astype(np.int32)
+            sorted_rows.append(order)
+            sorted_keys.append(self._keys[order, band])
+        self._sorted_keys, self._sorted_rows = sorted_keys, sorted_rows
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        self.merge()
+        return self._keys, self._owners
+
+    def query(self, band_keys: np.ndarray, exclude: Optional[int] = None) -> Counter:
+        """질의 청크별로 band 가 하나라도 같은 청크를 찾아 resume_id 별 일치 청크 수 집계"""
+        matches: Counter = Counter()
+        for chunk_keys in band_keys:
+            owners_for_chunk = set()
+            for band in range(self.bands):
+                key = chunk_keys[band]
+                sorted_keys = self._sorted_keys[band]
+                left = np.searchsorted(sorted_keys, key, side="left")
+                right = np.searchsorted(sorted_keys, key, side="right")
+                if right > left:
+                    rows = self._sorted_rows[band][left:right]
+                    owners_for_chunk.update(
+                        owner for owner in self._owners[rows].tolist() if owner not in self._removed
+                    )
+                owners_for_chunk.update(self._pending_lookup[band].get(int(key), ()))
+            owners_for_chunk.discard(exclude)
+            for owner in owners_for_chunk:
+                matches[owner] += 1
+        return matches
+
+
+class PersistentLSHIndex:
+    """스냅샷(npz) + append-only 저널로 디스크에 저장되는 LSH 인덱스 (워커 간 공유)
+
+    저널 레코드: <resume_id:int64><chunk_count:int32> 뒤에 chunk_count × bands 개의 uint32
+    (chunk_count == -1 이면 삭제)
+    """
+
+    _HEADER = struct.Struct("<qi")
+
+    def __init__(self, directory: str, hasher: Optional[MinHasher] = None):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.snapshot_path = os.path.join(directory, "snapshot.npz")
+        self.journal_path = os.path.join(directory, "journal.bin")
+        self.lock_path = os.path.join(directory, "index.lock")
+        self.hasher = hasher or MinHasher()
+        self.index = LSHIndex(self.hasher.bands)
+        self._snapshot_version: Optional[Tuple[int, int]] = None
+        self._journal_offset = 0
+        self._lock = threading.RLock()
+
+    def _file_lock(self, exclusive: bool):
+        handle = open(self.lock_path, "a+")
+        fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return handle
+
+    def _snapshot_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.snapshot_path)
+            return stat.st_ino, stat.st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def has_snapshot(self) -> bool:
+        """rebuild/compact 로 스냅샷이 한 번이라도 쓰였는지 (저널만 있으면 전체 색인 전 상태)"""
+        return self._snapshot_stat() is not None
+
+    def sync(self):
+        """다른 워커가 쓴 스냅샷/저널 변경분 반영"""
+        with self._lock:
+            handle = self._file_lock(exclusive=False)
+            try:
+                version = self._snapshot_stat()
+                if version != self._snapshot_version:
+                    if version is None:
+                        self.index = LSHIndex(self.hasher.bands)
+                    else:
+                        with np.load(self.snapshot_path) as data:
+                            self.index.load(data["keys"], data["owners"])
+                    self._snapshot_version = version
+                    self._journal_offset = 0
+                self._replay_journal()
+            finally:
+                handle.close()
+
+    def _replay_journal(self):
+        try:
+            with open(self.journal_path, "rb") as journal:
+                journal.seek(self._journal_offset)
+                data = journal.read()
+        except FileNotFoundError:
+            return
+        position = 0
+        record_width = 4 * self.hasher.bands
+        while position + self._HEADER.size <= len(data):
+            resume_id, chunk_count = self._HEADER.unpack_from(data, position)
+            body_size = max(chunk_count, 0) * record_width
+            if position + self._HEADER.size + body_size > len(data):
+                break  # 기록 중인 레코드
+            body_start = position + self._HEADER.size
+            if chunk_count < 0:
+                self.index.remove(resume_id)
+            else:
+                keys = np.frombuffer(data, dtype="<u4", count=chunk_count * self.hasher.bands, offset=body_start)
+                self.index.add(resume_id, keys.reshape(chunk_count, self.hasher.bands).astype(np.uint32))
+            position = body_start + body_size
+        self._journal_offset += position
+
+    def _append(self, resume_id: int, band_keys: Optional[np.ndarray]):
+        payload = self._HEADER.pack(resume_id, -1 if band_keys is None else band_keys.shape[0])
+        if band_keys is not None:
+            payload += band_keys.astype("<u4").tobytes()
+        handle = self._file_lock(exclusive=True)
+        try:
+            with open(self.journal_path, "ab") as journal:
+                journal.write(payload)
+        finally:
+            handle.close()
+
+    def upsert(self, resume_id: int, text: str) -> int:
+        """문서 추가/갱신 (색인된 청크 수 반환)"""
+        band_keys = self.hasher.document_band_keys(text)
+        self._append(resume_id, band_keys)
+        self.sync()
+        return int(band_keys.shape[0])
+
+    def delete(self, resume_id: int):
+        self._append(resume_id, None)
+        self.sync()
+
+    def candidates(self, text: str, exclude: Optional[int] = None, limit: int = 10) -> List[Tuple[int, int, int]]:
+        """후보 문서 목록 [(resume_id, 일치 청크 수, 질의 청크 수)] (일치 청크 수 내림차순)"""
+        self.sync()
+        band_keys = self.hasher.document_band_keys(text)
+        if band_keys.shape[0] == 0:
+            return []
+        with self._lock:
+            matches = self.index.query(band_keys, exclude=exclude)
+        return [(resume_id, count, band_keys.shape[0]) for resume_id, count in matches.most_common(limit)]
+
+    def compact(self):
+        """현재 상태를 스냅샷으로 쓰고 저널 비우기"""
+        with self._lock:
+            self.sync()
+            handle = self._file_lock(exclusive=True)
+            try:
+                self._replay_journal()
+                keys, owners = self.index.snapshot()
+                tmp_path = self.snapshot_path + ".tmp.npz"
+                np.savez(tmp_path, keys=keys, owners=owners)
+                os.replace(tmp_path, self.snapshot_path)
+                open(self.journal_path, "wb").close()
+                self._snapshot_version = self._snapshot_stat()
+                self._journal_offset = 0
+            finally:
+                handle.close()
+
+    def rebuild(self, documents: Iterable[Tuple[int, str]]) -> int:
+        """전체 문서로 인덱스 재구성 (스냅샷 작성, 저널 초기화)"""
+        keys, owners = [], []
+        count = 0
+        for resume_id, text in documents:
+            band_keys = self.hasher.document_band_keys(text)
+            if band_keys.shape[0]:
+                keys.append(band_keys)
+                owners.append(np.full(band_keys.shape[0], resume_id, dtype=np.int64))
+                count += 1
+        with self._lock:
+            self.index = LSHIndex(self.hasher.bands)
+            if keys:
+                self.index.load(np.vstack(keys), np.concatenate(owners))
+            handle = self._file_lock(exclusive=True)
+            try:
+                keys_matrix, owner_ids = self.index.snapshot()
+                tmp_path = self.snapshot_path + ".tmp.npz"
+                np.savez(tmp_path, keys=keys_matrix, owners=owner_ids)
+                os.replace(tmp_path, self.snapshot_path)
+                open(self.journal_path, "wb").close()
+                self._snapshot_version = self._snapshot_stat()
+                self._journal_offset = 0
+            finally:
+                handle.close()
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        self.sync()
+        return {"documents": self.index.document_count, "chunks": self.index.chunk_count}
+
+
+def shingle_overlap(query_text: str, source_text: str, min_span_chars: int = 30) -> Dict:
+    """두 문서의 shingle 겹침 계산
+
+    Returns:
+        jaccard, containment(질의 shingle 중 원본에도 있는 비율), 일치 구간 목록
+    """
+    query = normalize_text(query_text)
+    source = normalize_text(source_text)
+    query_hashes, query_positions = shingle_hashes(query)
+    source_hashes, source_positions = shingle_hashes(source)
+    if query_hashes.size == 0 or source_hashes.size == 0:
+        return {"jaccard": 0.0, "containment": 0.0, "spans": [], "source_spans": []}
+
+    query_set = np.unique(query_hashes)
+    source_set = np.unique(source_hashes)
+    common = np.intersect1d(query_set, source_set, assume_unique=True)
+    union_size = query_set.size + source_set.size - common.size
+
+    return {
+        "jaccard": round(float(common.size / union_size), 4) if union_size else 0.0,
+        "containment": round(float(common.size / query_set.size), 4),
+        "spans": _merge_spans(query, query_positions[np.isin(query_hashes, common)], min_span_chars),
+        "source_spans": _merge_spans(source, source_positions[np.isin(source_hashes, common)], min_span_chars),
+    }
+
+
+def _merge_spans(text: str, positions: Sequence[int], min_span_chars: int, k: int = SHINGLE_SIZE) -> List[Dict]:
+    """일치 shingle 시작 위치 → 연속 구간 (정규화된 텍스트 기준 위치)"""
+    spans: List[Dict] = []
+    start = end = None
+    for position in positions:
+        position = int(position)
+        if start is not None and position <= end:
+            end = max(end, position + k)
+            continue
+        if start is not None and end - start >= min_span_chars:
+            spans.append({"start": start, "end": end, "text": text[start:end]})
+        start, end = position, position + k
+    if start is not None and end - start >= min_span_chars:
+        spans.append({"start": start, "end": end, "text": text[start:end]})
+    return spans
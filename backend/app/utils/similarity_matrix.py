@@ -0,0 +1,141 @@
+"""
+임베딩 전체 쌍(all-pairs) 코사인 유사도 계산
+
+공고 지원자 이력서 임베딩을 하나의 float32 행렬로 모아 블록 단위 행렬곱으로
+모든 쌍의 유사도를 구한다. n x n 행렬을 한 번에 만들지 않으므로 메모리는 블록 크기만큼만 쓴다.
+
+- 정규화된 행렬 X 에 대해 X[i 블록] @ X[j 블록].T 를 j >= i 인 블록만 계산 (대칭이므로 절반)
+- 각 이력서의 최대 유사도 / 가장 유사한 이력서
+- 임계값 이상인 쌍 목록과, 그 쌍으로 연결된 의심 그룹(연결 요소)
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# 블록 하나의 유사도 행렬 원소 수 상한 (float32 기준 약 64MB)
+BLOCK_ELEMENTS = 16 * 1024 * 1024
+# 임계값 이상 쌍을 이 개수까지만 보관 (거의 같은 이력서가 대량으로 있을 때 메모리 보호)
+MAX_PAIRS = 1_000_000
+
+
+@dataclass
+class SimilarityScreening:
+    best_similarity: np.ndarray            # (n,) 자신을 제외한 최대 유사도
+    best_match: np.ndarray                 # (n,) 가장 유사한 행 번호 (-1: 비교 대상 없음)
+    pairs: np.ndarray                      # (m, 2) 임계값 이상 쌍 (i < j)
+    pair_similarity: np.ndarray            # (m,)
+    pairs_truncated: bool = False
+    clusters: List[List[int]] = field(default_factory=list)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (float32, 영벡터는 그대로 0)"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _block_size(n: int) -> int:
+    return max(1, min(n, int(np.sqrt(BLOCK_ELEMENTS))))
+
+
+def _update_best(best_similarity: np.ndarray, best_match: np.ndarray, offset: int,
+                 values: np.ndarray, matches: np.ndarray):
+    target = slice(offset, offset + values.size)
+    improved = values > best_similarity[target]
+    best_similarity[target][improved] = values[improved]
+    best_match[target][improved] = matches[improved]
+
+
+def screen_pairs(embeddings: np.ndarray, threshold: float, block_size: int = 0) -> SimilarityScreening:
+    """정규화 코사인 유사도 전체 쌍 계산
+
+    Args:
+        embeddings: (n, d) 임베딩 행렬
+        threshold: 의심 쌍 / 그룹 판정 임계값
+        block_size: 블록 한 변의 크기 (0 이면 BLOCK_ELEMENTS 에 맞춰 자동)
+    """
+    matrix = normalize_rows(embeddings)
+    n = matrix.shape[0]
+    block = block_size or _block_size(n)
+
+    best_similarity = np.full(n, -np.inf, dtype=np.float32)
+    best_match = np.full(n, -1, dtype=np.int64)
+    pair_blocks, similarity_blocks = [], []
+    pair_count = 0
+    truncated = False
+
+    for row_start in range(0, n, block):
+        rows = matrix[row_start:row_start + block]
+        for col_start in range(row_start, n, block):
+            cols = matrix[col_start:col_start + block]
+            scores = rows @ cols.T
+            if col_start == row_start:
+                np.fill_diagonal(scores, -np.inf)
+
+            row_arg = scores.argmax(axis=1)
+            _update_best(best_similarity, best_match, row_start,
+                         scores[np.arange(scores.shape[0]), row_arg], row_arg + col_start)
+            if col_start != row_start:
+                col_arg = scores.argmax(axis=0)
+                _update_best(best_similarity, best_match, col_start,
+                             scores[col_arg, np.arange(scores.shape[1])], col_arg + row_start)
+
+            if truncated:
+                continue
+            hit_rows, hit_cols = np.nonzero(scores >= threshold)
+            if col_start == row_start:
+                upper = hit_rows < hit_cols
+                hit_rows, hit_cols = hit_rows[upper], hit_cols[upper]
+            if hit_rows.size == 0:
+                continue
+            if pair_count + hit_rows.size > MAX_PAIRS:
+                truncated = True
+                keep = MAX_PAIRS - pair_count
+                hit_rows, hit_cols = hit_rows[:keep], hit_cols[:keep]
+            pair_blocks.append(np.stack([hit_rows + row_start, hit_cols + col_start], axis=1))
+            similarity_blocks.append(scores[hit_rows, hit_cols])
+            pair_count += hit_rows.size
+
+    pairs = np.vstack(pair_blocks) if pair_blocks else np.zeros((0, 2), dtype=np.int64)
+    pair_similarity = np.concatenate(similarity_blocks) if similarity_blocks else np.zeros(0, dtype=np.float32)
+    best_similarity[best_match < 0] = 0.0
+
+    return SimilarityScreening(
+        best_similarity=best_similarity,
+        best_match=best_match,
+        pairs=pairs,
+        pair_similarity=pair_similarity,
+        pairs_truncated=truncated,
+        clusters=cluster_pairs(n, pairs),
+    )
+
+
+def cluster_pairs(n: int, pairs: np.ndarray) -> List[List[int]]:
+    """임계값 이상 쌍으로 연결된 그룹 (union-find, 2명 이상인 그룹만, 큰 그룹부터)"""
+    parent = np.arange(n)
+
+    def find(node: int) -> int:
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    for left, right in pairs.tolist():
+        left_root, right_root = find(left), find(right)
+        if left_root != right_root:
+            parent[max(left_root, right_root)] = min(left_root, right_root)
+
+    groups: Dict[int, List[int]] = {}
+    for node in np.unique(pairs).tolist():
+        groups.setdefault(find(node), []).append(node)
+    return sorted((sorted(members) for members in groups.values()), key=len, reverse=True)
+
+
+def label_clusters(clusters: Sequence[Sequence[int]], ids: Sequence[int]) -> List[List[int]]:
+    """행 번호 그룹 → ID 그룹"""
+    return [[ids[index] for index in cluster] for cluster in clusters]
@@ -17,3 +17,11 @@ export const markAllNotificationsAsRead = () => axios.put(`${BASE_URL}/read-all`
 export const markInterviewNotificationsAsRead = () => axios.put(`${BASE_URL}/read-interview`);
 export const deleteNotification = (id) => axios.delete(`${BASE_URL}/${id}`);
 export const deleteAllNotifications = () => axios.delete(`${BASE_URL}/all`);
+
+// 알림 서버 푸시 (SSE). EventSource 는 헤더를 못 보내므로 토큰을 쿼리로 전달하고,
+// 재접속 시에는 브라우저가 Last-Event-ID 를 자동으로 보내 놓친 이벤트를 받는다.
+export const openNotificationStream = () => {
+  const token = localStorage.getItem('token');
+  if (!token || typeof EventSource === 'undefined') return null;
+  return new EventSource(`${axios.defaults.baseURL}${BASE_URL}/stream?access_token=${encodeURIComponent(token)}`);
+};
@@ -8,7 +8,7 @@ import { IoSunny } from "react-icons/io5";
 import { FaRegBell } from "react-icons/fa";
 import { BsPersonCircle } from "react-icons/bs";
 import NotiBar from './NotiBar';
-import { fetchUnreadCount } from '../api/notificationApi';
+import { fetchUnreadCount, openNotificationStream } from '../api/notificationApi';
 
 function NavBar() {
   const { user, logout } = useAuth();
@@ -22,10 +22,14 @@ function NavBar() {
   const [notiOpen, setNotiOpen] = useState(false);
   const notiRef = useRef();
 
+  // 서버 푸시(SSE)로 받는 중이면 true - 이때는 개수를 다시 조회하지 않는다
+  const streamingRef = useRef(false);
+
   // Fetch unread notifications count
   useEffect(() => {
     let isMounted = true;
     let intervalId = null;
+    let stream = null;
 
     const fetchNotifications = async () => {
       if (!isGuest && user?.id) {
@@ -58,28 +62,50 @@ function NavBar() {
       }
     };
 
-    // 즉시 실행
-    fetchNotifications();
-    
-    // 30초마다 자동 새로고침 (사용자가 로그인한 경우에만)
+    // 로그인 사용자는 알림 스트림 구독: 접속 시 미읽음 개수 스냅샷, 이후 변경분만 수신
     if (!isGuest && user?.id) {
-      intervalId = setInterval(fetchNotifications, 30000);
+      stream = openNotificationStream();
     }
-    
-    // 윈도우 포커스 시 새로고침 (사용자가 로그인한 경우에만)
-    const handleFocus = () => {
+
+    if (stream) {
+      streamingRef.current = true;
+      const parse = (event) => {
+        try {
+          return JSON.parse(event.data);
+        } catch {
+          return {};
+        }
+      };
+      stream.addEventListener('unread_count', (event) => {
+        if (isMounted) setUnreadCount(parse(event).count || 0);
+      });
+      stream.addEventListener('unread_delta', (event) => {
+        const delta = parse(event).delta || 0;
+        if (isMounted) setUnreadCount((count) => Math.max(0, count + delta));
+      });
+      stream.addEventListener('notification', (event) => {
+        const delta = parse(event).unread_delta || 0;
+        if (isMounted) setUnreadCount((count) => Math.max(0, count + delta));
+      });
+      // 연결이 끊기면 EventSource 가 Last-Event-ID 로 자동 재접속한다
+    } else {
+      // SSE 를 쓸 수 없으면 기존 폴링으로 대체
+      streamingRef.current = false;
+      fetchNotifications();
       if (!isGuest && user?.id) {
-        fetchNotifications();
+        intervalId = setInterval(fetchNotifications, 30000);
       }
-    };
-    window.addEventListener('focus', handleFocus);
+    }
     
     return () => {
       isMounted = false;
+      streamingRef.current = false;
+      if (stream) {
+        stream.close();
+      }
       if (intervalId) {
         clearInterval(intervalId);
       }
-      window.removeEventListener('focus', handleFocus);
     };
   }, [isGuest, user?.id, user?.email]); // 사용자 ID나 email이 변경될 때마다 실행
 
@@ -109,6 +135,8 @@ function NavBar() {
   };
 
   const handleNotificationRead = () => {
+    // 스트림 구독 중이면 읽음 처리 결과가 unread_delta 이벤트로 들어온다
+    if (streamingRef.current) return;
     // Refresh the unread count when a notification is marked as read
     const refreshCount = async () => {
       try {
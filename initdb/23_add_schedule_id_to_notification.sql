@@ -0,0 +1,34 @@
+-- notification 테이블에 schedule_id 컬럼 + (user_id, type, schedule_id) 유니크 인덱스 추가
+-- 면접 리마인더 중복 방지를 메시지 LIKE 검색 대신 인덱스 키로 처리하기 위함
+
+USE kocruit;
+
+ALTER TABLE notification
+ADD COLUMN schedule_id INT NULL COMMENT '일정 기반 알림의 schedule.id (중복 방지 키)';
+
+-- 기존 리마인더 메시지에 숨겨 두었던 [ScheduleID:n] 값으로 채우고 메시지에서는 제거
+UPDATE notification
+SET schedule_id = CAST(REGEXP_SUBSTR(REGEXP_SUBSTR(message, 'ScheduleID:[0-9]+'), '[0-9]+') AS UNSIGNED),
+    message = REGEXP_REPLACE(message, ' ?\\[ScheduleID:[0-9]+\\]', '')
+WHERE type = 'INTERVIEW_REMINDER'
+AND message LIKE '%ScheduleID:%';
+
+-- 같은 (user_id, type, schedule_id) 중 가장 먼저 만든 알림만 남기기
+DELETE n FROM notification n
+JOIN notification keep
+  ON keep.user_id = n.user_id
+ AND keep.type = n.type
+ AND keep.schedule_id = n.schedule_id
+ AND keep.id < n.id
+WHERE n.schedule_id IS NOT NULL;
+
+ALTER TABLE notification
+ADD UNIQUE INDEX uq_notification_user_type_schedule (user_id, type, schedule_id);
+
+-- 변경사항 확인
+SELECT
+    type,
+    COUNT(*) AS total,
+    SUM(CASE WHEN schedule_id IS NOT NULL THEN 1 ELSE 0 END) AS with_schedule_id
+FROM notification
+GROUP BY type;
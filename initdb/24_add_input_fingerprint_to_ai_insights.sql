@@ -0,0 +1,18 @@
+-- ai_insights 테이블에 입력 통계 지문 컬럼 추가
+-- 집계 통계가 바뀌었을 때만 AI 인사이트를 다시 생성하기 위함
+
+USE kocruit;
+
+ALTER TABLE ai_insights
+ADD COLUMN input_fingerprint VARCHAR(64) NULL COMMENT '분석 입력 통계 지문 (같으면 기존 분석 재사용)' AFTER execution_time;
+
+ALTER TABLE ai_insights
+ADD INDEX ix_ai_insights_input_fingerprint (input_fingerprint);
+
+-- 변경사항 확인
+SELECT
+    analysis_status,
+    COUNT(*) AS total,
+    SUM(CASE WHEN input_fingerprint IS NOT NULL THEN 1 ELSE 0 END) AS with_fingerprint
+FROM ai_insights
+GROUP BY analysis_status;
@@ -0,0 +1,29 @@
+-- Application 테이블에 executive_score 컬럼 추가
+-- 임원진 평가 저장 시 점수를 기록하고, 최종 선발은 이 점수가 있는 서류 합격자 중에서 한다
+-- (일부 환경에는 수동으로 추가된 컬럼이 이미 있으므로 없을 때만 추가)
+
+USE kocruit;
+
+SET @has_executive_score := (
+    SELECT COUNT(*)
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+    AND TABLE_NAME = 'application'
+    AND COLUMN_NAME = 'executive_score'
+);
+
+SET @ddl := IF(
+    @has_executive_score = 0,
+    'ALTER TABLE application ADD COLUMN executive_score DECIMAL(5,2) NULL COMMENT ''임원 면접 점수''',
+    'SELECT ''application.executive_score 컬럼이 이미 존재합니다.'' AS message'
+);
+
+PREPARE add_executive_score FROM @ddl;
+EXECUTE add_executive_score;
+DEALLOCATE PREPARE add_executive_score;
+
+-- 변경사항 확인
+SELECT
+    COUNT(*) AS total,
+    SUM(CASE WHEN executive_score IS NOT NULL THEN 1 ELSE 0 END) AS with_executive_score
+FROM application;
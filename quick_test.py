@@ -104,19 +104,9 @@ async def test_realtime_interview():
     
     try:
         from app.api.v1.realtime_interview import process_audio_chunk
-        import tempfile
-        import os
         
-        # 테스트용 오디오 파일 생성
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_file.write(b"dummy audio data")
-            temp_audio_path = temp_file.name
-        
-        # 비동기 함수 실행
-        result = await process_audio_chunk(temp_audio_path, 1234567890.0)
-        
-        # 임시 파일 삭제
-        os.unlink(temp_audio_path)
+        # 비동기 함수 실행 (테스트용 오디오 바이트 사용)
+        result = await process_audio_chunk("quick_test_session", b"dummy audio data", 1234567890.0)
         
         if result.get('success'):
             print("✅ 실시간 면접 API 성공!")